@@ -1,95 +1,254 @@
 
 
-from typing import List, Dict, Set
+from functools import partial
+from typing import List, Dict, FrozenSet, Optional, Set, Iterable, Iterator
 import json
 import sys
 import os
+import time
 
 # Path ayarı
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from entities import DetectedEntity, AnonymizationResult
-from config import EntityType, PLACEHOLDERS
-
-# Detector'ları import et
-from detectors.tc_kimlik_detector import TCKimlikDetector
-from detectors.phone_detector import PhoneDetector
-from detectors.email_detector import EmailDetector
-from detectors.iban_detector import IBANDetector
-from detectors.credit_card_detector import CreditCardDetector
-from detectors.address_detector import AddressDetector
-from detectors.plate_detector import PlateDetector
-from detectors.date_detector import DateDetector
-from detectors.ip_detector import IPDetector
-from detectors.customer_id_detector import CustomerIDDetector
-from detectors.partial_data_detector import PartialDataDetector
-from detectors.extra_detectors import (
-    GenderDetector,
-    ParentNameDetector,
-    BankNameDetector,
-    CallRecordDetector,
+from config import (
+    EntityType, PLACEHOLDERS, TRIAGE_ENABLED, METRICS_ENABLED,
+    BATCH_TEXT_MAX_CHARS, BATCH_BUFFER_CHARS, DETECTOR_PROFILES, DETECTOR_PROFILE,
 )
 
-# NLP detector
-from nlp.name_detector import NameDetector
-from nlp.ai_ner import AINERDetector
+# Detector paketleri: sınıflar ilk erişimde (KVKKAnonymizer kurulurken)
+# kendi modüllerinden yüklenir; profilde olmayan detector'ların ve isim
+# tespiti kapalıysa AI NER / NER backend modüllerinin import'u hiç yapılmaz.
+import detectors
+import nlp
+
+# Pipeline motoru
+from engine.overlap import resolve_overlaps
+from engine.candidates import CandidateBuffer, collect
+from engine.substitution import OffsetMap, substitute
+from engine.streaming import DEFAULT_OVERLAP, DEFAULT_WINDOW_SIZE, stream_anonymize
+from engine.incremental import IncrementalUpdate, SessionState, incremental_detect
+from engine.result_cache import ResultCache, cache_key, config_fingerprint
+from engine.triage import Triage
+from engine.metrics import PipelineMetrics
+from engine.batching import PackedBatch, can_pack, chunk_indices, detect_packed, digit_order, packable
+
+
+def parse_entity_types(entity_types) -> Optional[FrozenSet[EntityType]]:
+    """Entity tipi listesi ("TC_ID", EntityType.BANK_INFO, ...) -> frozenset (None: filtre yok)"""
+    if entity_types is None:
+        return None
+    if isinstance(entity_types, (str, EntityType)):
+        entity_types = [entity_types]
+    parsed = set()
+    for value in entity_types:
+        if isinstance(value, EntityType):
+            parsed.add(value)
+            continue
+        try:
+            parsed.add(EntityType(value))
+        except ValueError:
+            raise ValueError(f"Bilinmeyen entity tipi: {value!r}")
+    return frozenset(parsed)
+
+
+def can_emit(detector, entity_types: Optional[FrozenSet[EntityType]]) -> bool:
+    """Detector (sınıf veya nesne) entity_types'tan en az birini üretebilir mi"""
+    emitted = getattr(detector, 'entity_types', None)
+    return entity_types is None or not emitted or bool(emitted & entity_types)
 
 
 class KVKKAnonymizer:
     
-    def __init__(self, enable_name_detection: bool = True):
+    # Öncelik sırası (düşük değer = yüksek öncelik)
+    priority_order = {
+        EntityType.TC_ID: 1,
+        EntityType.PHONE: 2,
+        EntityType.MOBILE_PHONE: 2,
+        EntityType.LANDLINE: 2,
+        EntityType.EMAIL: 3,
+        # Specific IDs should be high priority to avoid being caught as Address/Number
+        EntityType.CUSTOMER_ID: 4,
+        EntityType.SUBSCRIPTION_ID: 4,
+        EntityType.CONTRACT_ID: 4,
+        EntityType.CALL_RECORD_ID: 4,
+        
+        EntityType.BANK_INFO: 5,
+        EntityType.CARD_INFO: 6,
+        EntityType.FULL_NAME: 7,
+        EntityType.NAME: 8,
+        EntityType.SURNAME: 9,
+        EntityType.PARENT_NAME: 9,
+        EntityType.HOME_ADDRESS: 10,
+        EntityType.WORK_ADDRESS: 10,
+        EntityType.ADDRESS: 11,
+        EntityType.CITY_DISTRICT: 12,
+        EntityType.PLATE: 13,
+        EntityType.BIRTH_DATE: 14,
+        EntityType.BIRTH_YEAR: 14,
+        EntityType.IP_ADDRESS: 15,
+        EntityType.GENDER: 16,
+        EntityType.BANK_NAME: 17,
+    }
+    
+    def __init__(self, enable_name_detection: bool = True,
+                 cache: ResultCache = None, triage: bool = None, metrics: bool = None,
+                 profile: str = None):
         """
         Args:
             enable_name_detection: NLP tabanlı isim tespitini etkinleştir
+            cache: Sonuç önbelleği (ResultCache, ör. ResultCache.from_config())
+            triage: Bulamayacağı metinlerde detector'ları atla (None: config.TRIAGE_ENABLED)
+            metrics: Detector süre / sayaç metriklerini topla (None: config.METRICS_ENABLED)
+            profile: Detector profili, config.DETECTOR_PROFILES (None: config.DETECTOR_PROFILE).
+                Yalnızca profilin tiplerini üretebilen detector'lar kurulur ve
+                yalnızca bu tipler maskelenir.
         """
+        if profile is None:
+            profile = DETECTOR_PROFILE
+        if profile not in DETECTOR_PROFILES:
+            raise ValueError(f"Bilinmeyen detector profili: {profile!r} "
+                             f"(geçerli: {', '.join(DETECTOR_PROFILES)})")
+        self.profile = profile
+        self.entity_types = DETECTOR_PROFILES[profile]
+        
         self.detectors = []
+        add = self._add_detector
         
         # Kimlik detector'ları
-        self.detectors.append(TCKimlikDetector())
+        add(detectors.TCKimlikDetector)
         
         # İletişim detector'ları
-        self.detectors.append(PhoneDetector())
-        self.detectors.append(EmailDetector())
+        add(detectors.PhoneDetector)
+        add(detectors.EmailDetector)
         
         # Finansal detector'lar
-        self.detectors.append(IBANDetector())
-        self.detectors.append(CreditCardDetector())
-        self.detectors.append(BankNameDetector())
+        add(detectors.IBANDetector)
+        add(detectors.CreditCardDetector)
+        add(detectors.BankNameDetector)
         
         # Adres detector'ları
-        self.detectors.append(AddressDetector())
+        add(detectors.AddressDetector)
         
         # Tarih detector'ları
-        self.detectors.append(DateDetector())
+        add(detectors.DateDetector)
         
         # Müşteri ID detector'ları
-        self.detectors.append(CustomerIDDetector())
+        add(detectors.CustomerIDDetector)
         
         # Kısmi veri detector (doğrulama soruları için)
-        self.detectors.append(PartialDataDetector())
+        add(detectors.PartialDataDetector)
         
         # Ek detector'lar
-        self.detectors.append(PlateDetector())
-        self.detectors.append(IPDetector())
-        self.detectors.append(GenderDetector())
-        self.detectors.append(ParentNameDetector())
-        self.detectors.append(CallRecordDetector())
+        add(detectors.PlateDetector)
+        add(detectors.IPDetector)
+        add(detectors.GenderDetector)
+        add(detectors.ParentNameDetector)
+        add(detectors.CallRecordDetector)
         
         # NLP tabanlı isim detector (en son, çakışmaları önlemek için)
+        self._ner = None
         if enable_name_detection:
-            self.detectors.append(NameDetector())
+            add(nlp.NameDetector)
             # AI NER Detector (BERT) - En akıllı dedektör
-            self.detectors.append(AINERDetector())
+            self._ner = add(nlp.AINERDetector)
         
         self.placeholders = PLACEHOLDERS
+        
+        # Sonuç önbelleği: aynı metin + ayarlar için detector'lar tekrar çalışmaz.
+        # AI NER atlandığında (devre açık, API hatası) üretilen eksik sonuçlar
+        # önbelleğe alınmaz; servis düzelince aynı metin tekrar taranır.
+        self.cache = cache
+        self._config_version = None
+        self._detector_names = [detector.name for detector in self.detectors]
+        
+        # Triage: metin özelliklerine göre detector başına atlama maskesi
+        if triage is None:
+            triage = TRIAGE_ENABLED
+        self.triage = Triage(self.detectors) if triage else None
+        
+        # Metrikler: detector başına süre, aday / sonuç ve hata sayaçları
+        if metrics is None:
+            metrics = METRICS_ENABLED
+        self.metrics = PipelineMetrics(self._detector_names) if metrics else None
+        
+        # anonymize_many: ortak tamponda taranabilen detector'lar
+        self._packed = [can_pack(detector) for detector in self.detectors]
+        
+        # İstek başına entity_types filtresi: {tip kümesi: detector atlama maskesi}
+        self._type_masks = {}
+    
+    @property
+    def config_version(self) -> str:
+        """Pattern ve placeholder ayarlarının özeti (ilk erişimde hesaplanır)
+
+        Özet tüm pattern'leri derlediğinden önbellek, oturum veya manifest
+        kullanılmayan çalıştırmalarda hiç hesaplanmaz.
+        """
+        if self._config_version is None:
+            self._config_version = config_fingerprint(self.detectors, self.placeholders)
+        return self._config_version
+    
+    def _add_detector(self, detector_class):
+        """Profilin tiplerinden birini üretebilen detector'ı kurar (diğerleri için None)"""
+        if not can_emit(detector_class, self.entity_types):
+            return None
+        detector = detector_class()
+        self.detectors.append(detector)
+        return detector
+    
+    def _request_types(self, entity_types) -> Optional[FrozenSet[EntityType]]:
+        """İstekteki entity_types ile profilin kesişimi (None: tüm tipler)"""
+        requested = parse_entity_types(entity_types)
+        if requested is None:
+            return self.entity_types
+        if self.entity_types is None:
+            return requested
+        return requested & self.entity_types
+    
+    def _type_mask(self, types: Optional[FrozenSet[EntityType]]) -> Optional[tuple]:
+        """types'tan hiçbirini üretemeyen detector'lar için atlama maskesi"""
+        if types is None or types == self.entity_types:
+            return None
+        mask = self._type_masks.get(types)
+        if mask is None:
+            mask = tuple(not can_emit(detector, types) for detector in self.detectors)
+            self._type_masks[types] = mask
+        return mask
+    
+    def _skip_mask(self, text: str, type_mask: Optional[tuple]) -> Optional[tuple]:
+        """Triage maskesi ile tip maskesinin birleşimi (True = bu metinde çalıştırma)"""
+        skip = self.triage.mask(text) if self.triage else None
+        if type_mask is None:
+            return skip
+        if skip is None:
+            return type_mask
+        return tuple(a or b for a, b in zip(skip, type_mask))
+    
+    def _ner_skips(self) -> int:
+        """Bu thread'de AI NER'in atlandığı çağrı sayısı (tespit sırasında değiştiyse sonuç eksik)"""
+        return self._ner.skipped() if self._ner is not None else 0
+    
+    def _cache_key(self, text: str, min_confidence: float, types: Optional[FrozenSet[EntityType]]) -> str:
+        return cache_key(text, min_confidence, self._detector_names, self.config_version,
+                         sorted(t.value for t in types) if types is not None else None)
+    
+    def active_detectors(self, entity_types=None) -> list:
+        """entity_types isteğinde çalışabilecek detector'lar (triage öncesi)"""
+        mask = self._type_mask(self._request_types(entity_types))
+        if mask is None:
+            return list(self.detectors)
+        return [detector for detector, skip in zip(self.detectors, mask) if not skip]
     
-    def anonymize(self, text: str, min_confidence: float = 0.5) -> AnonymizationResult:
+    def anonymize(self, text: str, min_confidence: float = 0.5, entity_types=None) -> AnonymizationResult:
         """
         Metni analiz edip kişisel verileri anonimleştirir
         
         Args:
             text: Anonimleştirilecek metin
             min_confidence: Minimum güven eşiği (0-1)
+            entity_types: Yalnızca bu tipler maskelenir ("TC_ID", EntityType.BANK_INFO, ...);
+                hiçbirini üretemeyen detector'lar çalışmaz (None: profilin tüm tipleri)
             
         Returns:
             AnonymizationResult: Anonimleştirme sonucu
@@ -99,28 +258,92 @@ class KVKKAnonymizer:
                 is_personal_data_detected=False,
                 detected_data_types=[],
                 sanitized_text=text,
-                entities=[]
+                entities=[],
+                offset_map=OffsetMap([])
             )
         
-        # Tüm detector'ları çalıştır
-        all_entities = []
-        for detector in self.detectors:
-            try:
-                entities = detector.detect(text)
-                all_entities.extend(entities)
-            except Exception as e:
-                # Hata durumunda devam et
-                print(f"Warning: {detector.name} failed: {e}")
-                continue
+        started = time.perf_counter()
+        types = self._request_types(entity_types)
+        if self.cache is not None:
+            key = self._cache_key(text, min_confidence, types)
+            cached = self.cache.get(key)
+            if cached is not None:
+                if self.metrics is not None:
+                    self.metrics.record_document(time.perf_counter() - started, cached=True)
+                return cached
         
-        # Minimum confidence filtresi
-        filtered_entities = [e for e in all_entities if e.confidence >= min_confidence]
+        skips = self._ner_skips()
+        resolved_entities = self._detect_entities(text, min_confidence, types)
+        result = self._build_result(text, resolved_entities)
+        if self.cache is not None and self._ner_skips() == skips:
+            self.cache.put(key, result)
+        if self.metrics is not None:
+            self.metrics.record_document(time.perf_counter() - started)
+        return result
+    
+    def anonymize_many(self, texts: List[str], min_confidence: float = 0.5,
+                       entity_types=None) -> List[AnonymizationResult]:
+        """
+        Çok sayıda kısa metni toplu anonimleştirir (sohbet, SMS, bilet kuyrukları)
         
-        # Çakışan entity'leri çöz
-        resolved_entities = self._resolve_overlaps(filtered_entities)
+        Kısa metinler ayırıcıyla tek tampona birleştirilir ve batch_safe
+        detector'lar her parça için tamponu bir kez tarar; entity ofsetleri
+        kaynak metinlere geri eşlenir (bkz. engine/batching.py). Bulut NER
+        tahminleri parça başına toplu istekle önceden alınır. Uzun metinler
+        ve diğer detector'lar metin başına çalışır. Sonuçlar her metin için
+        anonymize() ile birebir aynıdır.
         
+        Args:
+            texts: Anonimleştirilecek metinler
+            min_confidence: Minimum güven eşiği (0-1)
+            entity_types: Yalnızca bu tipler maskelenir (bkz. anonymize)
+            
+        Returns:
+            List[AnonymizationResult]: Girdi sırasıyla sonuçlar
+        """
+        types = self._request_types(entity_types)
+        results = [None] * len(texts)
+        keys = {}
+        pending = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip() or len(text) > BATCH_TEXT_MAX_CHARS:
+                results[i] = self.anonymize(text, min_confidence, types)
+                continue
+            if self.cache is not None:
+                started = time.perf_counter()
+                key = self._cache_key(text, min_confidence, types)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    if self.metrics is not None:
+                        self.metrics.record_document(time.perf_counter() - started, cached=True)
+                    results[i] = cached
+                    continue
+                keys[i] = key
+            pending.append(i)
+        
+        for chunk in chunk_indices(pending, texts, BATCH_BUFFER_CHARS):
+            started = time.perf_counter()
+            chunk_texts = [texts[i] for i in chunk]
+            skips = self._ner_skips()
+            detected = self._detect_many(chunk_texts, min_confidence, types)
+            # Parçada NER atlandıysa parçanın hiçbir sonucu önbelleğe alınmaz
+            complete = self._ner_skips() == skips
+            for i, text, resolved_entities in zip(chunk, chunk_texts, detected):
+                result = self._build_result(text, resolved_entities)
+                if self.cache is not None and complete:
+                    self.cache.put(keys[i], result)
+                results[i] = result
+            if self.metrics is not None:
+                # Parça süresi metinlere eşit paylaştırılır
+                share = (time.perf_counter() - started) / len(chunk)
+                for _ in chunk:
+                    self.metrics.record_document(share)
+        return results
+    
+    def _build_result(self, text: str, resolved_entities: List[DetectedEntity]) -> AnonymizationResult:
+        """Çakışmaları çözülmüş entity'lerden sonuç nesnesini oluşturur"""
         # Metni anonimleştir
-        sanitized_text = self._apply_anonymization(text, resolved_entities)
+        sanitized_text, offset_map = substitute(text, resolved_entities, self.placeholders)
         
         # Tespit edilen veri tiplerini çıkar
         detected_types = list(set(e.entity_type.value for e in resolved_entities))
@@ -130,80 +353,228 @@ class KVKKAnonymizer:
             is_personal_data_detected=len(resolved_entities) > 0,
             detected_data_types=detected_types,
             sanitized_text=sanitized_text,
-            entities=resolved_entities
+            entities=resolved_entities,
+            offset_map=offset_map
         )
     
-    def _resolve_overlaps(self, entities: List[DetectedEntity]) -> List[DetectedEntity]:
-        """Çakışan entity'leri çöz"""
-        if not entities:
+    def _detect_entities(self, text: str, min_confidence: float = 0.5,
+                         types: Optional[FrozenSet[EntityType]] = None) -> List[DetectedEntity]:
+        """Tüm detector'ları çalıştırır, filtrelenmiş ve çakışmaları çözülmüş entity'leri döndürür"""
+        # Triage ve tip filtresi: bu metinde istenen bir şey bulamayacak detector'lar atlanır
+        skip = self._skip_mask(text, self._type_mask(types))
+        if skip is not None and all(skip):
             return []
         
-        # Öncelik sırası (düşük değer = yüksek öncelik)
-        priority_order = {
-            EntityType.TC_ID: 1,
-            EntityType.PHONE: 2,
-            EntityType.MOBILE_PHONE: 2,
-            EntityType.LANDLINE: 2,
-            EntityType.EMAIL: 3,
-            # Specific IDs should be high priority to avoid being caught as Address/Number
-            EntityType.CUSTOMER_ID: 4,
-            EntityType.SUBSCRIPTION_ID: 4,
-            EntityType.CONTRACT_ID: 4,
-            EntityType.CALL_RECORD_ID: 4,
+        # Tüm detector'ları çalıştır
+        metrics = self.metrics
+        clock = time.perf_counter
+        runs, errors = [], []
+        # Adaylar sütunlu tamponda toplanır; yalnızca kazananlar nesneye dönüşür
+        candidates = CandidateBuffer()
+        for i, detector in enumerate(self.detectors):
+            if skip is not None and skip[i]:
+                continue
+            started = clock()
+            size = len(candidates)
+            try:
+                collect(detector, text, candidates, i)
+            except Exception as e:
+                # Hata durumunda devam et
+                print(f"Warning: {detector.name} failed: {e}")
+                candidates.truncate(size)
+                errors.append(i)
+                continue
+            if metrics is not None:
+                runs.append((i, clock() - started, len(candidates) - size))
+        
+        # Minimum confidence filtresi ve çakışma çözümü
+        selected = self._select_candidates(candidates, min_confidence, types)
+        
+        if metrics is not None:
+            # Metin başına tek kilit: sayaçlar burada toplu yazılır
+            metrics.record_detection(runs, errors, self._count_sources(candidates, selected))
+        return candidates.entities(selected)
+    
+    def _detect_many(self, texts: List[str], min_confidence: float = 0.5,
+                     types: Optional[FrozenSet[EntityType]] = None) -> List[List[DetectedEntity]]:
+        """_detect_entities'in toplu hali: metin başına çakışmaları çözülmüş entity'ler"""
+        count = len(texts)
+        # Triage ve tip filtresi: metin başına atlama maskesi
+        type_mask = self._type_mask(types)
+        skips = [self._skip_mask(text, type_mask) for text in texts] if self.triage or type_mask else None
+        found = [CandidateBuffer() for _ in texts]
+        metrics = self.metrics
+        clock = time.perf_counter
+        runs, errors = [], []
+        # Tampon sırası: en uzun rakam zincirine göre azalan (bkz. engine/batching.py)
+        order, digits = digit_order(texts)
+        order = [k for k in order if packable(texts[k])]
+        for d, detector in enumerate(self.detectors):
+            active = [k for k in range(count) if skips is None or not skips[k][d]]
+            if not active:
+                continue
             
-            EntityType.BANK_INFO: 5,
-            EntityType.CARD_INFO: 6,
-            EntityType.FULL_NAME: 7,
-            EntityType.NAME: 8,
-            EntityType.SURNAME: 9,
-            EntityType.PARENT_NAME: 9,
-            EntityType.HOME_ADDRESS: 10,
-            EntityType.WORK_ADDRESS: 10,
-            EntityType.ADDRESS: 11,
-            EntityType.CITY_DISTRICT: 12,
-            EntityType.PLATE: 13,
-            EntityType.BIRTH_DATE: 14,
-            EntityType.BIRTH_YEAR: 14,
-            EntityType.IP_ADDRESS: 15,
-            EntityType.GENDER: 16,
-            EntityType.BANK_NAME: 17,
-        }
+            # Bulut NER: parçanın metinleri tek seferde (toplu istekle) önbelleğe alınır
+            prefetch = getattr(detector, 'prefetch_many', None)
+            if prefetch is not None:
+                prefetch([texts[k] for k in active])
+            
+            started = clock()
+            candidates = 0
+            per_text = {}
+            members = []
+            if self._packed[d]:
+                members = [k for k in order if skips is None or not skips[k][d]]
+            if len(members) > 1:
+                # Tampon yalnızca bu detector'ın triage'dan geçen metinlerinden kurulur
+                try:
+                    batch = PackedBatch([texts[k] for k in members], [digits[k] for k in members])
+                    shared, dirty = detect_packed(detector, batch)
+                except Exception:
+                    # Tampon taraması başarısız: metin başına denenir
+                    shared, dirty = {}, set(range(len(members)))
+                for j, k in enumerate(members):
+                    if j not in dirty:
+                        per_text[k] = shared.get(j, [])
+            
+            failed = False
+            for k in active:
+                if k in per_text:
+                    continue
+                try:
+                    per_text[k] = detector.detect(texts[k])
+                except Exception as e:
+                    # Hata durumunda devam et
+                    print(f"Warning: {detector.name} failed: {e}")
+                    failed = True
+            
+            for k, entities in per_text.items():
+                found[k].extend(entities, d)
+                candidates += len(entities)
+            if failed:
+                errors.append(d)
+            if metrics is not None:
+                runs.append((d, clock() - started, candidates))
         
-        def entity_key(e: DetectedEntity):
-            prio = priority_order.get(e.entity_type, 99)
-            return (e.start_pos, -len(e.value), -e.confidence, prio)
+        resolved = []
+        surviving = {}
+        for candidates in found:
+            # Minimum confidence filtresi ve çakışma çözümü (metin başına)
+            selected = self._select_candidates(candidates, min_confidence, types)
+            resolved.append(candidates.entities(selected))
+            if metrics is not None:
+                for index, count in self._count_sources(candidates, selected).items():
+                    surviving[index] = surviving.get(index, 0) + count
+        if metrics is not None:
+            metrics.record_detection(runs, errors, surviving)
+        return resolved
+    
+    def anonymize_stream(self, chunks: Iterable[str], min_confidence: float = 0.5,
+                         window_size: int = DEFAULT_WINDOW_SIZE,
+                         overlap: int = DEFAULT_OVERLAP, entity_types=None) -> Iterator[str]:
+        """
+        Parça parça gelen metni anonimleştirir (büyük dosyalar, CRM export'ları)
+        
+        Detector'lar kayan bir pencere üzerinde çalışır. Her pencerenin son
+        `overlap` karakteri bir sonraki pencereye devredilir ve önceki
+        satırlar bağlam olarak yeniden taranır; böylece parça sınırına denk
+        gelen entity'ler (IBAN, adres, çok satırlı doğrulama diyalogları)
+        kaçırılmaz. Bellek kullanımı pencere boyutuyla sınırlıdır.
         
-        sorted_entities = sorted(entities, key=entity_key)
+        Args:
+            chunks: Metin parçaları (ör. açık bir dosya nesnesi)
+            min_confidence: Minimum güven eşiği (0-1)
+            window_size: Bir seferde taranan yaklaşık karakter sayısı
+            overlap: Sınır çevresinde yeniden taranan karakter sayısı
+            entity_types: Yalnızca bu tipler maskelenir (bkz. anonymize)
+            
+        Yields:
+            str: Anonimleştirilmiş metin parçaları (birleştirildiğinde tam çıktı)
+        """
+        detect = partial(self._detect_entities, min_confidence=min_confidence,
+                         types=self._request_types(entity_types))
+        return stream_anonymize(chunks, detect, self.placeholders, window_size, overlap)
+    
+    def anonymize_incremental(self, text: str, previous: Optional[SessionState] = None,
+                              min_confidence: float = 0.5, entity_types=None):
+        """
+        Önceki sürümü bilinen metni artımlı anonimleştirir (büyüyen sohbet dökümleri)
         
-        result = []
-        used_ranges = []
+        Yalnızca önceki metne göre değişen bölge (sona eklenen mesajlar veya
+        düzenlenen satırlar) ve çevresindeki bağlam satırları yeniden taranır;
+        diğer entity'ler önceki durumdan taşınır (bkz. engine/incremental.py).
+        previous yoksa ya da seçenekler farklıysa tüm metin taranır.
         
-        for entity in sorted_entities:
-            overlap = False
-            for (start, end) in used_ranges:
-                if entity.start_pos < end and entity.end_pos > start:
-                    overlap = True
-                    break
+        Args:
+            text: Metnin güncel hali (tamamı)
+            previous: Önceki çağrının döndürdüğü durum
+            min_confidence: Minimum güven eşiği (0-1)
+            entity_types: Yalnızca bu tipler maskelenir (bkz. anonymize)
             
-            if not overlap:
-                result.append(entity)
-                used_ranges.append((entity.start_pos, entity.end_pos))
+        Returns:
+            (AnonymizationResult, SessionState, IncrementalUpdate): tam sonuç,
+            bir sonraki çağrıya verilecek durum ve yeni / kalkan entity'ler
+        """
+        started = time.perf_counter()
+        types = self._request_types(entity_types)
+        options = (float(min_confidence), types, self.config_version)
+        detect = partial(self._detect_entities, min_confidence=min_confidence, types=types)
+        skips = self._ner_skips()
         
-        return result
+        if previous is not None and previous.options == options:
+            update = incremental_detect(previous.text, previous.entities, text, detect)
+        else:
+            entities = detect(text) if text.strip() else []
+            removed = previous.entities if previous is not None else []
+            update = IncrementalUpdate(entities, entities, removed, 0, len(text))
+        
+        result = self._build_result(text, update.entities)
+        if self.metrics is not None:
+            self.metrics.record_document(time.perf_counter() - started)
+        if self._ner_skips() != skips:
+            # NER atlandı, entity'ler eksik: durum sonraki çağrıda kullanılmaz, tüm metin taranır
+            options = None
+        return result, SessionState(text, update.entities, options), update
+    
+    def _resolve_overlaps(self, entities: List[DetectedEntity]) -> List[DetectedEntity]:
+        """Çakışan entity'leri çöz"""
+        if not entities:
+            return []
+        
+        def entity_key(e: DetectedEntity):
+            prio = self.priority_order.get(e.entity_type, 99)
+            return (e.start_pos, -len(e.value), -e.confidence, prio)
+        
+        # Sıralı gezinti + aralık indeksi: O(n log n)
+        return resolve_overlaps(entities, key=entity_key)
+    
+    def _select_candidates(self, candidates: CandidateBuffer, min_confidence: float,
+                           types: Optional[FrozenSet[EntityType]] = None) -> List[int]:
+        """_resolve_overlaps'in sütunlu tampon karşılığı: kazanan adayların indeksleri
+        
+        types verilirse diğer tiplerdeki adaylar çakışma çözümüne hiç girmez.
+        """
+        if not len(candidates):
+            return []
+        return candidates.select(candidates.priority_key(self.priority_order), min_confidence, types)
+    
+    @staticmethod
+    def _count_sources(candidates: CandidateBuffer, selected: List[int]) -> Dict[int, int]:
+        """Detector başına kazanan aday sayısı (metrikler için)"""
+        sources = candidates.sources
+        counts = {}
+        for i in selected:
+            counts[sources[i]] = counts.get(sources[i], 0) + 1
+        return counts
     
     def _apply_anonymization(self, text: str, entities: List[DetectedEntity]) -> str:
         """Tespit edilen entity'leri placeholder'larla değiştir"""
         if not entities:
             return text
         
-        sorted_entities = sorted(entities, key=lambda e: e.start_pos, reverse=True)
-        
-        result = text
-        for entity in sorted_entities:
-            placeholder = self.placeholders.get(entity.entity_type, "[FİLTRELENDİ]")
-            result = result[:entity.start_pos] + placeholder + result[entity.end_pos:]
-        
-        return result
+        # Tek geçişte dilim + placeholder birleştirme
+        sanitized_text, _ = substitute(text, entities, self.placeholders)
+        return sanitized_text
     
     def get_statistics(self, text: str) -> Dict:
         """Metin hakkında istatistik bilgileri döndür"""
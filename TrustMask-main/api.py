@@ -10,36 +10,345 @@ Kullanım:
     
 Endpoints:
     POST /anonymize - Metin anonimleştir
+    POST /anonymize/stream - NDJSON akış (satır başına bir kayıt)
     GET /health - Sağlık kontrolü
-    GET /stats - İstatistikler
+    GET /stats - Önbellek ve triage istatistikleri
+    POST /stats - Metin istatistikleri
+    GET /metrics - Prometheus metrikleri
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
+import json
+import logging
+import secrets
 import sys
 import os
+import threading
+
+# Kütüphane modülleri kök logger'ı ayarlamaz; sunucu girişi (Flask / Vercel, asgi.py) burada ayarlar
+logging.basicConfig(level=logging.INFO)
 
 # Path ayarı
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from anonymizer import KVKKAnonymizer
+from anonymizer import KVKKAnonymizer, parse_entity_types
+from config import BATCH_WORKERS, BATCH_POOL_MIN_TEXTS, DETECTOR_PROFILES, STREAM_MAX_IN_FLIGHT, EntityType
+from engine.batch_pool import BatchPool, resolve_worker_count
+from engine.incremental import SessionStore
+from engine.metrics import PROMETHEUS_CONTENT_TYPE, merge_states, process_state, prometheus_text, summarize
+from engine.result_cache import ResultCache
 
 
 app = Flask(__name__)
 CORS(app)  # CORS desteği
 
-# Global anonymizer instance
-anonymizer = KVKKAnonymizer()
+# Global anonymizer instance (KVKK_RESULT_CACHE_SIZE > 0 ise sonuç önbelleği ile)
+result_cache = ResultCache.from_config()
+anonymizer = KVKKAnonymizer(cache=result_cache)
 
+# İstekte "profile" ile seçilen profillerin anonymizer'ları (ilk kullanımda kurulur)
+_profiles = {anonymizer.profile: anonymizer}
+_profiles_lock = threading.Lock()
 
-@app.route('/health', methods=['GET'])
-def health_check():
-    """Sağlık kontrolü endpoint'i"""
-    return jsonify({
+# Oturumlu /anonymize: sunucunun verdiği oturum kimliği -> son metin ve entity'ler (process içi)
+sessions = SessionStore()
+
+# /anonymize/batch için process havuzu (init_batch_pool ile başlatılır)
+batch_pool = None
+
+
+def init_batch_pool(workers=BATCH_WORKERS):
+    """Toplu işlem process havuzunu başlatır (workers: sayı veya "auto", 0 = kapalı)"""
+    global batch_pool
+    if batch_pool is None and resolve_worker_count(workers) > 0:
+        batch_pool = BatchPool(workers)
+    return batch_pool
+
+
+# ---- Flask ve ASGI (asgi.py) uygulamalarının ortak istek / yanıt mantığı ----
+
+class RequestError(ValueError):
+    """İstek gövdesi hatalı (400)"""
+
+
+INVALID_TEXT_RESULT = {
+    "error": "Invalid text (not a string)",
+    "is_personal_data_detected": False,
+    "detected_data_types": [],
+    "sanitized_text": ""
+}
+
+
+def parse_anonymize_request(data):
+    """POST /anonymize gövdesi -> (text, min_confidence, include_offsets)"""
+    if not data or 'text' not in data:
+        raise RequestError("Missing 'text' field in request body")
+    
+    text = data['text']
+    min_confidence = data.get('min_confidence', 0.5)
+    include_offsets = bool(data.get('include_offsets', False))
+    
+    if not isinstance(text, str):
+        raise RequestError("'text' must be a string")
+    
+    if not isinstance(min_confidence, (int, float)) or not 0 <= min_confidence <= 1:
+        raise RequestError("'min_confidence' must be a number between 0 and 1")
+    
+    return text, min_confidence, include_offsets
+
+
+def get_anonymizer(profile=None) -> KVKKAnonymizer:
+    """Profilin önceden kurulmuş anonymizer'ı (None: varsayılan profil)"""
+    if profile is None:
+        return anonymizer
+    instance = _profiles.get(profile)
+    if instance is None:
+        if profile not in DETECTOR_PROFILES:
+            raise RequestError(f"Unknown 'profile' (expected one of: {', '.join(DETECTOR_PROFILES)})")
+        with _profiles_lock:
+            instance = _profiles.get(profile)
+            if instance is None:
+                instance = KVKKAnonymizer(cache=result_cache, profile=profile)
+                _profiles[profile] = instance
+    return instance
+
+
+def parse_detection_options(data):
+    """İstekteki "profile" ve "entity_types" alanları -> (anonymizer, entity_types)"""
+    profile = data.get('profile')
+    entity_types = data.get('entity_types')
+    
+    if profile is not None and not isinstance(profile, str):
+        raise RequestError("'profile' must be a string")
+    
+    if entity_types is not None:
+        if not isinstance(entity_types, list) or not all(isinstance(t, str) for t in entity_types):
+            raise RequestError("'entity_types' must be an array of strings")
+        unknown = [t for t in entity_types if t not in EntityType.__members__]
+        if unknown:
+            raise RequestError(f"Unknown entity type(s): {', '.join(unknown)}")
+        entity_types = parse_entity_types(entity_types)
+    
+    return get_anonymizer(profile), entity_types
+
+
+def parse_session_options(data):
+    """İstekteki "session", "session_id" ve "end_session" alanları -> (session_id, start_session, end_session)"""
+    start_session = data.get('session', False)
+    session_id = data.get('session_id')
+    end_session = bool(data.get('end_session', False))
+    
+    if not isinstance(start_session, bool):
+        raise RequestError("'session' must be a boolean")
+    if session_id is not None:
+        if start_session:
+            raise RequestError("'session' and 'session_id' cannot be used together")
+        if not isinstance(session_id, str) or not 0 < len(session_id) <= 256:
+            raise RequestError("'session_id' must be a non-empty string of at most 256 characters")
+    
+    return session_id, start_session, end_session
+
+
+def anonymize_payload(instance, text, min_confidence, entity_types, include_offsets,
+                      session_id=None, end_session=False, start_session=False):
+    """POST /anonymize yanıt gövdesi; oturumlu isteklerde yalnızca değişen bölge taranır
+    
+    start_session yeni oturum açar; kimliği sunucu üretir ve yanıtta döner.
+    session_id yalnızca bu process'in aynı profil için verdiği, süresi
+    dolmamış bir oturumu sürdürür; bilinmeyen kimlik RequestError'dır
+    (istemciler birbirinin oturumunu okuyamaz). Aynı oturumun eşzamanlı
+    istekleri birbirini bozmaz (her sonuç tam metne göre doğrudur);
+    kaydedilen durum son tamamlanan isteğinkidir.
+    """
+    if session_id is None and not start_session:
+        return instance.anonymize(text, min_confidence, entity_types).to_dict(include_offsets=include_offsets)
+    
+    if start_session:
+        session_id = secrets.token_urlsafe(18)
+        previous = None
+    else:
+        previous = sessions.get(f"{instance.profile}:{session_id}")
+        if previous is None:
+            raise RequestError("Unknown or expired 'session_id' (start a new session with \"session\": true)")
+    
+    key = f"{instance.profile}:{session_id}"
+    result, state, update = instance.anonymize_incremental(text, previous, min_confidence, entity_types)
+    if end_session:
+        sessions.pop(key)
+    else:
+        sessions.put(key, state)
+    
+    offset_map = result.offset_map
+    payload = result.to_dict(include_offsets=include_offsets)
+    # Değerler yanıta konmaz; yeni entity'ler anonim metindeki konumlarıyla döner
+    payload["session"] = {
+        "id": session_id,
+        "rescanned": {"start": update.start, "end": update.end},
+        "added": [
+            {
+                "entity_type": entity.entity_type.value,
+                "start": entity.start_pos,
+                "end": entity.end_pos,
+                "sanitized_start": offset_map.to_sanitized(entity.start_pos),
+                "sanitized_end": offset_map.to_sanitized(entity.end_pos),
+            }
+            for entity in update.added
+        ],
+        "removed": [
+            {"entity_type": entity.entity_type.value, "start": entity.start_pos, "end": entity.end_pos}
+            for entity in update.removed
+        ],
+        "ended": end_session,
+    }
+    return payload
+
+
+def pool_options(instance, entity_types):
+    """Batch havuzuna geçirilen (profile, entity_types); varsayılanlar için None"""
+    profile = instance.profile if instance is not anonymizer else None
+    return profile, sorted(t.value for t in entity_types) if entity_types is not None else None
+
+
+def parse_batch_request(data):
+    """POST /anonymize/batch gövdesi -> (texts, min_confidence)"""
+    if not data or 'texts' not in data:
+        raise RequestError("Missing 'texts' field in request body")
+    
+    texts = data['texts']
+    min_confidence = data.get('min_confidence', 0.5)
+    
+    if not isinstance(texts, list):
+        raise RequestError("'texts' must be an array")
+    
+    return texts, min_confidence
+
+
+def use_batch_pool(valid_texts) -> bool:
+    """Batch process havuzda mı işlenmeli"""
+    return batch_pool is not None and len(valid_texts) >= BATCH_POOL_MIN_TEXTS
+
+
+def merge_batch_results(texts, valid_results):
+    """Geçerli metinlerin sonuçlarını girdi sırasına yerleştirir (geçersizler hata kaydı alır)"""
+    valid_results = iter(valid_results)
+    return [next(valid_results) if isinstance(text, str) else dict(INVALID_TEXT_RESULT) for text in texts]
+
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+
+def parse_stream_line(line, defaults=None):
+    """NDJSON girdi satırı -> (text, min_confidence, id, anonymizer, entity_types)
+    
+    Satır bir JSON string ("metin") ya da {"text": ..., "min_confidence": ...,
+    "profile": ..., "entity_types": [...], "id": ...} nesnesidir; verilmeyen
+    alanlar defaults'tan (parse_stream_options) gelir, id çıktı satırına
+    aynen kopyalanır.
+    """
+    min_confidence, instance, entity_types = defaults or (0.5, anonymizer, None)
+    try:
+        record = json.loads(line)
+    except ValueError:
+        raise RequestError("Invalid JSON line")
+    if isinstance(record, str):
+        return record, min_confidence, None, instance, entity_types
+    if not isinstance(record, dict):
+        raise RequestError("Line must be a JSON object or string")
+    record.setdefault('min_confidence', min_confidence)
+    text, min_confidence, _ = parse_anonymize_request(record)
+    if 'profile' in record:
+        instance, _ = parse_detection_options({'profile': record['profile']})
+    if 'entity_types' in record:
+        _, entity_types = parse_detection_options({'entity_types': record['entity_types']})
+    return text, min_confidence, record.get('id'), instance, entity_types
+
+
+def parse_stream_options(args):
+    """Akış sorgu parametreleri -> satırların varsayılanı (min_confidence, anonymizer, entity_types)
+    
+    ?min_confidence=0.5&profile=contact&entity_types=PHONE,EMAIL
+    (satırlar kendi değerlerini verebilir)
+    """
+    value = args.get('min_confidence')
+    try:
+        min_confidence = float(value) if value is not None else 0.5
+    except ValueError:
+        min_confidence = -1
+    if not 0 <= min_confidence <= 1:
+        raise RequestError("'min_confidence' must be a number between 0 and 1")
+    entity_types = args.get('entity_types')
+    if entity_types is not None:
+        entity_types = [name.strip() for name in entity_types.split(',') if name.strip()]
+    instance, entity_types = parse_detection_options({'profile': args.get('profile'), 'entity_types': entity_types})
+    return min_confidence, instance, entity_types
+
+
+def stream_line(payload, line_no, record_id=None) -> bytes:
+    """NDJSON çıktı satırı (girdi satır numarası ve varsa id ile)"""
+    payload = dict(payload, line=line_no)
+    if record_id is not None:
+        payload['id'] = record_id
+    return (app.json.dumps(payload, separators=(',', ':')) + "\n").encode('utf-8')
+
+
+def health_info():
+    return {
         "status": "healthy",
         "service": "KVKK Anonymizer API",
         "version": "1.0.0"
-    })
+    }
+
+
+def service_info():
+    """GET /info gövdesi"""
+    return {
+        "name": "KVKK Veri Anonimleştirme API",
+        "version": "1.0.0",
+        "description": "Türkçe metin içindeki kişisel verileri tespit edip anonimleştirir",
+        "supported_entity_types": [
+            "NAME", "SURNAME", "FULL_NAME", "TC_ID", "BIRTH_DATE",
+            "PHONE", "EMAIL", "ADDRESS", "PLATE", "BANK_INFO",
+            "CARD_INFO", "CUSTOMER_ID", "IP_ADDRESS"
+        ],
+        "profiles": {
+            name: sorted(t.value for t in types) if types is not None else "all"
+            for name, types in DETECTOR_PROFILES.items()
+        },
+        "default_profile": anonymizer.profile,
+        "endpoints": {
+            "POST /anonymize": "Tek metin anonimleştir",
+            "POST /anonymize/batch": "Toplu metin anonimleştir",
+            "POST /anonymize/stream": "NDJSON akış (satır başına bir kayıt)",
+            "GET /stats": "Önbellek ve triage istatistikleri",
+            "POST /stats": "Metin istatistikleri",
+            "GET /metrics": "Prometheus metrikleri",
+            "GET /health": "Sağlık kontrolü",
+            "GET /info": "API bilgileri"
+        }
+    }
+
+
+def worker_states():
+    """Batch havuzu worker'larının son bildirdiği metrik durumları (havuz kapalıysa boş)"""
+    return batch_pool.worker_states() if batch_pool is not None else []
+
+
+def service_stats():
+    """GET /stats gövdesi: tüm profillerin ve batch worker'larının toplamı"""
+    totals = summarize(merge_states([process_state(list(_profiles.values())), *worker_states()]))
+    return dict(totals, sessions=sessions.stats())
+
+
+def service_metrics() -> str:
+    """GET /metrics gövdesi (profil etiketli, worker sayaçları dahil)"""
+    return prometheus_text(list(_profiles.values()), worker_states())
+
+
+@app.route('/health', methods=['GET'])
+def health_check():
+    """Sağlık kontrolü endpoint'i"""
+    return jsonify(health_info())
 
 
 @app.route('/anonymize', methods=['POST'])
@@ -50,42 +359,51 @@ def anonymize():
     Request Body:
         {
             "text": "Anonimleştirilecek metin",
-            "min_confidence": 0.5  // Opsiyonel
+            "min_confidence": 0.5,  // Opsiyonel
+            "include_offsets": false,  // Opsiyonel - pozisyon eşlemesini döndür
+            "profile": "financial",  // Opsiyonel - detector profili (GET /info)
+            "entity_types": ["TC_ID", "BANK_INFO"],  // Opsiyonel - yalnızca bu tipler
+            "session": true,  // Opsiyonel - oturum aç (büyüyen metin, sonraki isteklerde
+                              // yalnızca değişen bölge taranır); kimlik yanıtta döner
+            "session_id": "Xq3...",  // Opsiyonel - önceki yanıttaki oturum kimliğiyle devam et
+            "end_session": false  // Opsiyonel - oturum durumunu bu istekten sonra sil
         }
     
     Response:
         {
             "is_personal_data_detected": true/false,
             "detected_data_types": [...],
-            "sanitized_text": "..."
+            "sanitized_text": "...",
+            "offset_map": [  // Sadece include_offsets: true ise
+                {"original_start": 0, "original_end": 11,
+                 "sanitized_start": 0, "sanitized_end": 12},
+                ...
+            ],
+            "session": {  // Sadece oturumlu isteklerde
+                "id": "Xq3...",  // sunucunun verdiği kimlik (bilinmeyen / süresi dolmuş kimlik: 400)
+                "rescanned": {"start": 812, "end": 1040},
+                "added": [{"entity_type": "TC_ID", "start": 950, "end": 961,
+                           "sanitized_start": 901, "sanitized_end": 913}],
+                "removed": [],
+                "ended": false
+            }
         }
     """
     try:
         # JSON body al
         data = request.get_json()
         
-        if not data or 'text' not in data:
-            return jsonify({
-                "error": "Missing 'text' field in request body"
-            }), 400
-        
-        text = data['text']
-        min_confidence = data.get('min_confidence', 0.5)
-        
-        if not isinstance(text, str):
-            return jsonify({
-                "error": "'text' must be a string"
-            }), 400
+        try:
+            text, min_confidence, include_offsets = parse_anonymize_request(data)
+            instance, entity_types = parse_detection_options(data)
+            session_id, start_session, end_session = parse_session_options(data)
+            # Anonimleştir
+            payload = anonymize_payload(instance, text, min_confidence, entity_types, include_offsets,
+                                        session_id, end_session, start_session)
+        except RequestError as e:
+            return jsonify({"error": str(e)}), 400
         
-        if not isinstance(min_confidence, (int, float)) or not 0 <= min_confidence <= 1:
-            return jsonify({
-                "error": "'min_confidence' must be a number between 0 and 1"
-            }), 400
-        
-        # Anonimleştir
-        result = anonymizer.anonymize(text, min_confidence)
-        
-        return jsonify(result.to_dict())
+        return jsonify(payload)
     
     except Exception as e:
         return jsonify({
@@ -101,7 +419,9 @@ def anonymize_batch():
     Request Body:
         {
             "texts": ["metin1", "metin2", ...],
-            "min_confidence": 0.5  // Opsiyonel
+            "min_confidence": 0.5,  // Opsiyonel
+            "profile": "contact",  // Opsiyonel
+            "entity_types": ["PHONE", "EMAIL"]  // Opsiyonel
         }
     
     Response:
@@ -115,33 +435,23 @@ def anonymize_batch():
     try:
         data = request.get_json()
         
-        if not data or 'texts' not in data:
-            return jsonify({
-                "error": "Missing 'texts' field in request body"
-            }), 400
+        try:
+            texts, min_confidence = parse_batch_request(data)
+            instance, entity_types = parse_detection_options(data)
+        except RequestError as e:
+            return jsonify({"error": str(e)}), 400
         
-        texts = data['texts']
-        min_confidence = data.get('min_confidence', 0.5)
+        valid_texts = [text for text in texts if isinstance(text, str)]
         
-        if not isinstance(texts, list):
-            return jsonify({
-                "error": "'texts' must be an array"
-            }), 400
-        
-        results = []
-        for text in texts:
-            if isinstance(text, str):
-                result = anonymizer.anonymize(text, min_confidence)
-                results.append(result.to_dict())
-            else:
-                results.append({
-                    "error": "Invalid text (not a string)",
-                    "is_personal_data_detected": False,
-                    "detected_data_types": [],
-                    "sanitized_text": ""
-                })
+        # Büyük batch'ler process havuzunda, sıra korunarak işlenir
+        if use_batch_pool(valid_texts):
+            valid_results = batch_pool.anonymize_batch(valid_texts, min_confidence,
+                                                       *pool_options(instance, entity_types))
+        else:
+            valid_results = [result.to_dict() for result in
+                             instance.anonymize_many(valid_texts, min_confidence, entity_types)]
         
-        return jsonify({"results": results})
+        return jsonify({"results": merge_batch_results(texts, valid_results)})
     
     except Exception as e:
         return jsonify({
@@ -149,10 +459,89 @@ def anonymize_batch():
         }), 500
 
 
-@app.route('/stats', methods=['POST'])
+@app.route('/anonymize/stream', methods=['POST'])
+def anonymize_stream():
+    """
+    NDJSON akış endpoint'i
+    
+    Girdi: satır başına bir kayıt (Content-Type: application/x-ndjson)
+        {"text": "metin1", "id": "a1"}
+        {"text": "metin2", "min_confidence": 0.7, "profile": "contact"}
+        "metin3"
+    
+    Çıktı: girdi sırasıyla satır başına bir sonuç, hazır oldukça gönderilir
+        {"line":1,"id":"a1","is_personal_data_detected":true,"sanitized_text":"...",...}
+        {"line":2,...}
+        {"line":3,"error":"..."}  // hatalı satır akışı kesmez
+    
+    Satırlar STREAM_MAX_IN_FLIGHT'lık pencerelerle işlenir (batch havuzu
+    açıksa pencere havuza gider); bellek kullanımı pencere boyutuyla sınırlıdır.
+    Satır nesneleri "profile" ve "entity_types" alanlarını da alır (bkz. /anonymize).
+    Sorgu parametreleri (satırların varsayılanı):
+        ?min_confidence=0.5&profile=contact&entity_types=PHONE,EMAIL
+    """
+    try:
+        defaults = parse_stream_options(request.args)
+    except RequestError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    stream = request.stream
+    
+    def flush(window):
+        # Aynı eşik, profil ve tip filtreli geçerli satırlar birlikte (havuz açıksa
+        # tek çağrıda) işlenir
+        results = {}
+        groups = {}
+        for i, (line_no, parsed, error) in enumerate(window):
+            if parsed is not None:
+                _, min_confidence, _, instance, entity_types = parsed
+                groups.setdefault((min_confidence, instance, entity_types), []).append(i)
+        for (min_confidence, instance, entity_types), indexes in groups.items():
+            texts = [window[i][1][0] for i in indexes]
+            if use_batch_pool(texts):
+                outputs = batch_pool.anonymize_batch(texts, min_confidence, *pool_options(instance, entity_types))
+            else:
+                outputs = [result.to_dict() for result in
+                           instance.anonymize_many(texts, min_confidence, entity_types)]
+            results.update(zip(indexes, outputs))
+        for i, (line_no, parsed, error) in enumerate(window):
+            if parsed is None:
+                yield stream_line({"error": error}, line_no)
+            else:
+                yield stream_line(results[i], line_no, parsed[2])
+    
+    def generate():
+        window = []
+        for line_no, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                window.append((line_no, parse_stream_line(line, defaults), None))
+            except RequestError as e:
+                window.append((line_no, None, str(e)))
+            if len(window) >= STREAM_MAX_IN_FLIGHT:
+                yield from flush(window)
+                window = []
+        yield from flush(window)
+    
+    return Response(stream_with_context(generate()), content_type=NDJSON_CONTENT_TYPE)
+
+
+@app.route('/stats', methods=['GET', 'POST'])
 def get_stats():
     """
-    Metin istatistikleri endpoint'i
+    İstatistik endpoint'i
+    
+    GET: Sonuç / NER önbelleği, triage sayaçları ve detector metrikleri; tüm
+    profillerin ve batch havuzu worker'larının toplamı (profil ayrımı /metrics'te)
+        {
+            "result_cache": {"hits": 10, "misses": 3, "hit_rate": 0.77, ...},  // kapalıysa null
+            "ner_cache": {"entries": 3, "hits": 4, "misses": 3},  // AI NER yoksa null
+            "triage": {"documents": 20, "fully_skipped": 12, "skipped": {"PhoneDetector": 15, ...}},
+            "metrics": {"documents": 20, "detectors": {"PhoneDetector": {"duration": {...}, "candidates": 3, ...}}}
+        }
+    
+    POST: Metin istatistikleri
     
     Request Body:
         {
@@ -168,6 +557,9 @@ def get_stats():
             "reduction_ratio": 0.2
         }
     """
+    if request.method == 'GET':
+        return jsonify(service_stats())
+    
     try:
         data = request.get_json()
         
@@ -187,26 +579,24 @@ def get_stats():
         }), 500
 
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    Prometheus metrikleri (text/plain; version=0.0.4)
+    
+    İstekle kurulan tüm profillerin ("profile" etiketi) detector başına süre
+    histogramları, aday / sonuç / hata sayaçları ve triage atlamaları; sonuç /
+    NER önbelleği ve bulut NER istemcisi sayaçları. Batch havuzu açıksa
+    worker process'lerin sayaçları (son tamamlanan parçadaki hâliyle) aynı
+    serilere eklenir. KVKK_METRICS=0 ile detector metrikleri kapatılır.
+    """
+    return Response(service_metrics(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @app.route('/info', methods=['GET'])
 def get_info():
     """API bilgileri"""
-    return jsonify({
-        "name": "KVKK Veri Anonimleştirme API",
-        "version": "1.0.0",
-        "description": "Türkçe metin içindeki kişisel verileri tespit edip anonimleştirir",
-        "supported_entity_types": [
-            "NAME", "SURNAME", "FULL_NAME", "TC_ID", "BIRTH_DATE",
-            "PHONE", "EMAIL", "ADDRESS", "PLATE", "BANK_INFO",
-            "CARD_INFO", "CUSTOMER_ID", "IP_ADDRESS"
-        ],
-        "endpoints": {
-            "POST /anonymize": "Tek metin anonimleştir",
-            "POST /anonymize/batch": "Toplu metin anonimleştir",
-            "POST /stats": "Metin istatistikleri",
-            "GET /health": "Sağlık kontrolü",
-            "GET /info": "API bilgileri"
-        }
-    })
+    return jsonify(service_info())
 
 
 if __name__ == "__main__":
@@ -216,14 +606,20 @@ if __name__ == "__main__":
     parser.add_argument('--host', default='0.0.0.0', help='Host adresi (varsayılan: 0.0.0.0)')
     parser.add_argument('--port', type=int, default=5000, help='Port numarası (varsayılan: 5000)')
     parser.add_argument('--debug', action='store_true', help='Debug modu')
+    parser.add_argument('--batch-workers', default=BATCH_WORKERS,
+                        help='Toplu işlem worker sayısı ("auto" = çekirdek sayısı, 0 = kapalı)')
     
     args = parser.parse_args()
+    init_batch_pool(args.batch_workers)
     
     print(f"KVKK Anonymizer API başlatılıyor: http://{args.host}:{args.port}")
     print("Endpoints:")
     print("  POST /anonymize - Metin anonimleştir")
     print("  POST /anonymize/batch - Toplu anonimleştir")
+    print("  POST /anonymize/stream - NDJSON akış")
+    print("  GET /stats - Önbellek ve triage istatistikleri")
     print("  POST /stats - Metin istatistikleri")
+    print("  GET /metrics - Prometheus metrikleri")
     print("  GET /health - Sağlık kontrolü")
     print("  GET /info - API bilgileri")
     
@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+KVKK Veri Anonimleştirme Sistemi - Async (ASGI) API
+
+api.py ile aynı endpoint'ler ve aynı yanıtlar, event loop üzerinde:
+
+- Bağlantılar event loop'ta tutulur; bekleyen istek thread işgal etmez
+- Detector işleri (CPU) sınırlı bir thread havuzunda çalışır
+  (KVKK_ASGI_CPU_THREADS, varsayılan çekirdek sayısı)
+- Bulut NER çağrıları (ağ beklemesi) ayrı, geniş bir I/O havuzunda
+  önceden yapılır ve beklenir (KVKK_ASGI_IO_THREADS); CPU havuzundaki
+  detect() yanıtı NER önbelleğinden okur. Yavaş bir NER API'si diğer
+  isteklerin detector işlerini bekletmez.
+- Büyük batch'ler api.py'deki gibi process havuzuna gider
+
+Herhangi bir framework gerektirmez; bir ASGI sunucusu ile çalıştırılır:
+    uvicorn asgi:app --host 0.0.0.0 --port 5001
+    python run_production.py --asgi
+
+Endpoints:
+    POST /anonymize - Metin anonimleştir
+    POST /anonymize/batch - Toplu anonimleştir
+    POST /anonymize/stream - NDJSON akış (satır başına bir kayıt, geri basınçlı)
+    GET /health - Sağlık kontrolü
+    GET /stats - Önbellek ve triage istatistikleri
+    POST /stats - Metin istatistikleri
+    GET /metrics - Prometheus metrikleri
+    GET /info - API bilgileri
+"""
+
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+# Path ayarı
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import api
+from api import (
+    NDJSON_CONTENT_TYPE, RequestError, anonymize_payload, merge_batch_results, parse_anonymize_request,
+    parse_batch_request, parse_detection_options, parse_session_options, parse_stream_line,
+    parse_stream_options, pool_options, stream_line,
+)
+from config import ASGI_CPU_THREADS, ASGI_IO_THREADS, ASGI_MAX_BODY, STREAM_MAX_IN_FLIGHT
+from engine.metrics import PROMETHEUS_CONTENT_TYPE
+from engine.triage import DocumentFeatures
+from nlp.ai_ner import AINERDetector
+
+
+# api.py ile aynı anonymizer (önbellek, triage, metrikler ve batch havuzu paylaşılır)
+anonymizer = api.anonymizer
+
+cpu_executor = ThreadPoolExecutor(max_workers=ASGI_CPU_THREADS or os.cpu_count() or 1,
+                                  thread_name_prefix='kvkk-cpu')
+io_executor = ThreadPoolExecutor(max_workers=ASGI_IO_THREADS, thread_name_prefix='kvkk-io')
+
+JSON_CONTENT_TYPE = 'application/json'
+
+_ner = next((d for d in anonymizer.detectors if isinstance(d, AINERDetector)), None)
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _dumps(payload) -> bytes:
+    # Flask jsonify ile aynı JSON (anahtar sırası, ASCII kaçışları)
+    return (api.app.json.dumps(payload, separators=(',', ':')) + "\n").encode('utf-8')
+
+
+async def _run(executor, fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+
+
+async def _prefetch_ner(texts, instance=None, entity_types=None) -> None:
+    """Bulut NER tahminlerini I/O havuzunda alıp NER önbelleğine koyar
+
+    instance / entity_types: istekteki profil ve tip filtresi; NER'i
+    çalıştırmayacak isteklerde API çağrılmaz.
+    """
+    if _ner is None or not _ner.backend.io_bound:
+        return
+    if instance is not None and _ner not in instance.active_detectors(entity_types):
+        return
+    if anonymizer.triage is not None:
+        # Triage'ın NER'i atlayacağı metinler için API çağrılmaz
+        texts = [text for text in texts if _ner.can_match(DocumentFeatures(text))]
+    # NERClient eşzamanlı çağrıları tek istekte birleştirir
+    await asyncio.gather(*(_run(io_executor, _ner.prefetch, text) for text in texts))
+
+
+def _anonymize_many(texts, min_confidence, instance=None, entity_types=None):
+    instance = instance or anonymizer
+    return [result.to_dict() for result in instance.anonymize_many(texts, min_confidence, entity_types)]
+
+
+# ---- Endpoint'ler: (status, content_type, body) veya (status, payload) döndürür ----
+
+async def health_check(data):
+    return 200, api.health_info()
+
+
+async def anonymize(data):
+    """POST /anonymize (bkz. api.anonymize)"""
+    text, min_confidence, include_offsets = parse_anonymize_request(data)
+    instance, entity_types = parse_detection_options(data)
+    session_id, start_session, end_session = parse_session_options(data)
+    # Oturumlu isteklerde taranacak pencere durum okunmadan bilinmez; NER önceden alınmaz
+    if session_id is None and text.strip():
+        await _prefetch_ner([text], instance, entity_types)
+    payload = await _run(cpu_executor, anonymize_payload, instance, text, min_confidence, entity_types,
+                         include_offsets, session_id, end_session, start_session)
+    return 200, payload
+
+
+async def anonymize_batch(data):
+    """POST /anonymize/batch (bkz. api.anonymize_batch)"""
+    texts, min_confidence = parse_batch_request(data)
+    instance, entity_types = parse_detection_options(data)
+    valid_texts = [text for text in texts if isinstance(text, str)]
+
+    if api.use_batch_pool(valid_texts):
+        # Worker process'lerini beklemek I/O'dur
+        valid_results = await _run(io_executor, api.batch_pool.anonymize_batch, valid_texts, min_confidence,
+                                   *pool_options(instance, entity_types))
+    else:
+        await _prefetch_ner([text for text in valid_texts if text.strip()], instance, entity_types)
+        valid_results = await _run(cpu_executor, _anonymize_many, valid_texts, min_confidence,
+                                   instance, entity_types)
+
+    return 200, {"results": merge_batch_results(texts, valid_results)}
+
+
+async def get_stats(data):
+    return 200, api.service_stats()
+
+
+async def post_stats(data):
+    """POST /stats (bkz. api.get_stats)"""
+    if not data or 'text' not in data:
+        raise RequestError("Missing 'text' field in request body")
+    return 200, await _run(cpu_executor, anonymizer.get_statistics, data['text'])
+
+
+async def metrics(data):
+    return 200, PROMETHEUS_CONTENT_TYPE, api.service_metrics().encode('utf-8')
+
+
+async def get_info(data):
+    return 200, api.service_info()
+
+
+async def anonymize_stream(scope, receive, send):
+    """POST /anonymize/stream (bkz. api.anonymize_stream)
+
+    Girdi okunurken satırlar işlenmeye başlar, sonuçlar girdi sırasıyla
+    hazır oldukça yazılır. Akış kontrolü:
+    - En fazla STREAM_MAX_IN_FLIGHT satır aynı anda işlenir; sınır dolunca
+      istek gövdesi okunmaz (TCP penceresi istemciyi yavaşlatır)
+    - İstemci çıktıyı okumazsa send() bekler, yazıcı yeni sonuç almaz ve
+      sınır dolar; bellek kullanımı bağlantı başına sabittir
+    """
+    query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+    try:
+        defaults = parse_stream_options({key: values[0] for key, values in query.items()})
+    except RequestError as e:
+        await _send(send, 400, JSON_CONTENT_TYPE, _dumps({"error": str(e)}))
+        return
+
+    pending = asyncio.Queue(maxsize=STREAM_MAX_IN_FLIGHT)
+
+    async def process(line_no, line):
+        try:
+            text, min_confidence, record_id, instance, entity_types = parse_stream_line(line, defaults)
+        except RequestError as e:
+            return stream_line({"error": str(e)}, line_no)
+        try:
+            if text.strip():
+                await _prefetch_ner([text], instance, entity_types)
+            result = await _run(cpu_executor, instance.anonymize, text, min_confidence, entity_types)
+            return stream_line(result.to_dict(), line_no, record_id)
+        except Exception as e:
+            return stream_line({"error": str(e)}, line_no, record_id)
+
+    async def read():
+        # Satırları okur ve işleme alır; kuyruk doluysa put() bekler
+        buffer = b''
+        line_no = 0
+        more = True
+        while more:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                break
+            more = message.get('more_body', False)
+            buffer += message.get('body', b'')
+            if not more:
+                buffer += b'\n'
+            *lines, buffer = buffer.split(b'\n')
+            for line in lines:
+                line_no += 1
+                if line.strip():
+                    await pending.put(asyncio.ensure_future(process(line_no, line)))
+            if len(buffer) > ASGI_MAX_BODY:
+                await pending.put(asyncio.ensure_future(_error_line("Line too long", line_no + 1)))
+                break
+        await pending.put(None)
+
+    reader = asyncio.ensure_future(read())
+    try:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [
+            (b'content-type', NDJSON_CONTENT_TYPE.encode('latin-1')),
+            (b'access-control-allow-origin', b'*'),
+        ]})
+        while True:
+            task = await pending.get()
+            if task is None:
+                break
+            await send({'type': 'http.response.body', 'body': await task, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+    finally:
+        reader.cancel()
+        while not pending.empty():
+            task = pending.get_nowait()
+            if task is not None:
+                task.cancel()
+
+
+async def _error_line(message, line_no):
+    return stream_line({"error": message}, line_no)
+
+
+# Gövdeyi kendisi okuyan (akış) endpoint'ler
+STREAM_ROUTES = {
+    '/anonymize/stream': {'POST': anonymize_stream},
+}
+
+ROUTES = {
+    '/health': {'GET': health_check},
+    '/anonymize': {'POST': anonymize},
+    '/anonymize/batch': {'POST': anonymize_batch},
+    '/stats': {'GET': get_stats, 'POST': post_stats},
+    '/metrics': {'GET': metrics},
+    '/info': {'GET': get_info},
+}
+
+
+# ---- ASGI ----
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            raise ConnectionError("İstemci bağlantıyı kapattı")
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > ASGI_MAX_BODY:
+            raise HTTPError(413, "Request body too large")
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+async def _send(send, status: int, content_type: str, body: bytes, extra_headers=()) -> None:
+    headers = [
+        (b'content-type', content_type.encode('latin-1')),
+        (b'content-length', str(len(body)).encode('latin-1')),
+        # flask_cors varsayılanı ile aynı: tüm origin'ler
+        (b'access-control-allow-origin', b'*'),
+    ]
+    headers.extend(extra_headers)
+    await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _lifespan(receive, send) -> None:
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            cpu_executor.shutdown(wait=False)
+            io_executor.shutdown(wait=False)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI giriş noktası"""
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    path = scope['path'].rstrip('/') or '/'
+    method = scope['method']
+    stream_handler = STREAM_ROUTES.get(path, {}).get(method)
+    if stream_handler is not None:
+        await stream_handler(scope, receive, send)
+        return
+
+    methods = ROUTES.get(path) or STREAM_ROUTES.get(path)
+    try:
+        if methods is None:
+            raise HTTPError(404, "Not Found")
+        if method == 'OPTIONS':
+            # CORS preflight
+            allowed = ', '.join(sorted(methods) + ['OPTIONS']).encode('latin-1')
+            await _send(send, 200, 'text/plain', b'', [
+                (b'access-control-allow-methods', allowed),
+                (b'access-control-allow-headers', b'*'),
+            ])
+            return
+        handler = methods.get(method)
+        if handler is None:
+            raise HTTPError(405, "Method Not Allowed")
+
+        data = None
+        if method == 'POST':
+            body = await _read_body(receive)
+            try:
+                data = json.loads(body) if body else None
+            except ValueError:
+                raise HTTPError(400, "Invalid JSON body")
+
+        response = await handler(data)
+    except ConnectionError:
+        return
+    except RequestError as e:
+        response = (400, {"error": str(e)})
+    except HTTPError as e:
+        response = (e.status, {"error": str(e)})
+    except Exception as e:
+        response = (500, {"error": str(e)})
+
+    if len(response) == 2:
+        status, payload = response
+        await _send(send, status, JSON_CONTENT_TYPE, _dumps(payload))
+    else:
+        await _send(send, *response)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="KVKK Anonymizer async (ASGI) API Server")
+    parser.add_argument('--host', default='0.0.0.0', help='Host adresi (varsayılan: 0.0.0.0)')
+    parser.add_argument('--port', type=int, default=5000, help='Port numarası (varsayılan: 5000)')
+    parser.add_argument('--batch-workers', default=api.BATCH_WORKERS,
+                        help='Toplu işlem worker sayısı ("auto" = çekirdek sayısı, 0 = kapalı)')
+    args = parser.parse_args()
+
+    try:
+        import uvicorn
+    except ImportError:
+        sys.exit("Async mod için bir ASGI sunucusu gerekir: pip install uvicorn")
+
+    api.init_batch_pool(args.batch_workers)
+    print(f"KVKK Anonymizer async API başlatılıyor: http://{args.host}:{args.port}")
+    uvicorn.run(app, host=args.host, port=args.port)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Toplu Anonimleştirme Benchmark (KVKKAnonymizer.anonymize_many)
+
+- Doğruluk: anonymize_many her metin için anonymize() ile aynı sonucu
+  (maskeli metin, entity'ler, ofset haritası) vermeli. Korpus satırları,
+  örnek transkript satırları, kısa mesajlar ve metin sınırına denk gelen
+  eşleşmeler üreten rastgele metinlerle; triage açık / kapalı kontrol
+  edilir.
+- Hız: 100 - 10.000 kısa mesajda metin başına anonymize() döngüsü ile
+  anonymize_many karşılaştırması
+- Bulut NER: yavaş stub NER servisi (bench_ner_client.py) arkasında
+  döngü ve anonymize_many için süre ve API istek sayısı
+
+Kullanım:
+    python benchmarks/bench_anonymize_many.py
+    python benchmarks/bench_anonymize_many.py --messages 100 1000 10000 --fuzz 5000 --no-names
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_detectors import SAMPLE_LINES
+from bench_ner_client import StubHandler, StubState, reset
+from bench_triage import FUZZ_TOKENS, TRIVIAL_MESSAGES
+from corpus import generate_corpus
+
+# Metin başında / sonunda ayırıcıyla etkileşebilecek parçalar
+EDGE_TOKENS = FUZZ_TOKENS + [
+    "Erkek", "hesap bilgileriniz", "müşteri numaranız 12345678", "bankam Ziraat", "  ", " \n",
+    "TR330006100519786457841326", "32303010429", "ev adresim", "çağrı kayıt", "t.c", "no:",
+]
+
+
+def edge_text(rng: random.Random) -> str:
+    text = " ".join(rng.choice(EDGE_TOKENS) for _ in range(rng.randint(1, 6)))
+    return text + rng.choice(["", "", " ", "\n", ".", "  "])
+
+
+def snapshot(result):
+    """Karşılaştırılan sonuç alanları"""
+    return (
+        result.to_dict(include_offsets=True),
+        [(e.entity_type, e.value, e.start_pos, e.end_pos, e.confidence, e.context) for e in result.entities],
+    )
+
+
+def verify(anonymizer, texts):
+    expected = [snapshot(anonymizer.anonymize(text)) for text in texts]
+    actual = [snapshot(result) for result in anonymizer.anonymize_many(texts)]
+    for text, want, got in zip(texts, expected, actual):
+        if want != got:
+            sys.exit(f"HATA: anonymize_many farklı sonuç verdi: {text[:80]!r}\n  beklenen: {want}\n  bulunan: {got}")
+    return len(texts)
+
+
+def short_messages(count, seed=5):
+    """Kısa mesaj akışı: korpus satırları ve PII içermeyen mesajlar karışık"""
+    rng = random.Random(seed)
+    lines = [line for doc in generate_corpus(50, 2000, density=0.3, seed=seed) for line in doc.split("\n")]
+    return [rng.choice(lines) if rng.random() < 0.6 else rng.choice(TRIVIAL_MESSAGES) for _ in range(count)]
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="anonymize_many benchmark")
+    parser.add_argument('--messages', type=int, nargs='+', default=[100, 1000, 10000], help='Mesaj sayıları')
+    parser.add_argument('--fuzz', type=int, default=3000, help='Doğruluk için rastgele metin sayısı')
+    parser.add_argument('--repeat', type=int, default=3, help='Ölçüm tekrarı (en iyisi alınır)')
+    parser.add_argument('--no-names', action='store_true', help='İsim / AI NER tespiti olmadan çalıştır')
+    parser.add_argument('--ner-messages', type=int, default=500, help='Bulut NER ölçümündeki mesaj sayısı')
+    parser.add_argument('--ner-delay', type=float, default=0.02, help='Stub NER servisinin yanıt süresi (s)')
+    args = parser.parse_args()
+
+    logging.getLogger('AINERDetector').setLevel(logging.CRITICAL)
+    from anonymizer import KVKKAnonymizer
+
+    names = not args.no_names
+    rng = random.Random(11)
+    texts = (short_messages(1000) + SAMPLE_LINES + TRIVIAL_MESSAGES + generate_corpus(20, 600, density=0.5, seed=2)
+             + [edge_text(rng) for _ in range(args.fuzz)])
+    rng.shuffle(texts)
+    checked = 0
+    for triage in (True, False):
+        anonymizer = KVKKAnonymizer(enable_name_detection=names, triage=triage)
+        checked += verify(anonymizer, texts)
+    print(f"Doğruluk: {checked} karşılaştırma, anonymize_many ve anonymize() aynı")
+
+    anonymizer = KVKKAnonymizer(enable_name_detection=names)
+    print(f"{'mesaj':>7} {'döngü (ms)':>11} {'toplu (ms)':>11} {'hızlanma':>9}")
+    for count in args.messages:
+        messages = short_messages(count)
+        loop = best_of(lambda: [anonymizer.anonymize(text) for text in messages], args.repeat)
+        many = best_of(lambda: anonymizer.anonymize_many(messages), args.repeat)
+        print(f"{count:>7} {loop * 1000:>11.1f} {many * 1000:>11.1f} {loop / many:>8.2f}x")
+
+    if names:
+        bench_cloud_ner(anonymizer, args)
+
+
+def bench_cloud_ner(anonymizer, args):
+    """Yavaş bulut NER arkasında döngü / anonymize_many (NER önbelleği her turda boş)"""
+    from nlp.ai_ner import AINERDetector
+    from nlp.ner_backends import CloudBackend
+    from nlp.ner_client import NERClient
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    ner = AINERDetector()
+    ner.set_backend(CloudBackend(client=NERClient(f"http://127.0.0.1:{server.server_address[1]}/models/stub")))
+
+    messages = [f"{text} (Sayın Ahmet Yılmaz {i})" for i, text in enumerate(short_messages(args.ner_messages, seed=8))]
+    rows = []
+    for mode, run in (("döngü", lambda: [anonymizer.anonymize(text) for text in messages]),
+                      ("toplu", lambda: anonymizer.anonymize_many(messages))):
+        ner.response_cache.clear()
+        reset("slow", delay=args.ner_delay)
+        start = time.perf_counter()
+        results = run()
+        rows.append((mode, time.perf_counter() - start, StubState.requests, [r.sanitized_text for r in results]))
+    server.shutdown()
+
+    if rows[0][3] != rows[1][3]:
+        sys.exit("HATA: bulut NER ile anonymize_many farklı sonuç verdi")
+    print(f"Bulut NER: {len(messages)} mesaj, NER gecikmesi {args.ner_delay}s")
+    print(f"{'mod':>7} {'süre (s)':>9} {'API isteği':>11}")
+    for mode, elapsed, requests, _ in rows:
+        print(f"{mode:>7} {elapsed:>9.2f} {requests:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Async (ASGI) API Benchmark
+
+Yavaş bir bulut NER servisi (stub sunucu, bkz. bench_ner_client.py)
+arkasında Flask uygulamasını waitress benzeri sabit thread havuzuyla ve
+asgi.app'i event loop üzerinde aynı yük altında çalıştırır:
+
+- Doğruluk: iki uygulama korpus belgelerinde aynı JSON gövdesini döndürmeli
+- Açlık: NER bekleyen istekler sürerken NER gerektirmeyen isteklerin
+  (büyük harf içermeyen, triage ile NER atlanan metinler) gecikmesi
+- Toplam süre: eşzamanlı NER gerektiren istekler
+
+ASGI sunucusu gerekmez; uygulama ASGI protokolüyle doğrudan çağrılır.
+
+Kullanım:
+    python benchmarks/bench_asgi.py
+    python benchmarks/bench_asgi.py --requests 200 --delay 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_ner_client import StubHandler, reset
+from corpus import generate_corpus
+
+
+async def asgi_request(app, method, path, payload=None):
+    """ASGI uygulamasını tek istekle çağırır; (status, gövde)"""
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    sent = False
+    response = {}
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            await asyncio.sleep(3600)
+        sent = True
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            response['status'] = message['status']
+        else:
+            response['body'] = message['body']
+
+    scope = {'type': 'http', 'method': method, 'path': path, 'headers': []}
+    await app(scope, receive, send)
+    return response['status'], response['body']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Async (ASGI) API benchmark")
+    parser.add_argument('--requests', type=int, default=64, help='Eşzamanlı NER gerektiren istek sayısı')
+    parser.add_argument('--delay', type=float, default=0.3, help='Stub NER servisinin yanıt süresi (s)')
+    parser.add_argument('--threads', type=int, default=8, help='Senkron sunucu thread sayısı (waitress)')
+    args = parser.parse_args()
+
+    logging.getLogger('AINERDetector').setLevel(logging.WARNING)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/models/stub"
+
+    import asgi
+    import api
+    from nlp.ai_ner import AINERDetector
+    from nlp.ner_backends import CloudBackend
+    from nlp.ner_client import NERClient
+
+    AINERDetector().set_backend(CloudBackend(client=NERClient(url)))
+    client = api.app.test_client()
+
+    # Doğruluk (metinler her ölçümde farklıdır; NER önbelleği sonucu etkilemez)
+    reset()
+    corpus = generate_corpus(20, 600, density=0.5, seed=3)
+    for text in corpus:
+        expected = client.post('/anonymize', json={"text": text})
+        status, body = asyncio.run(asgi_request(asgi.app, 'POST', '/anonymize', {"text": text}))
+        if status != expected.status_code or body != expected.data:
+            sys.exit(f"HATA: Flask ve ASGI yanıtları farklı: {text[:60]!r}")
+    for path, payload in (('/anonymize', {"text": 5}), ('/anonymize/batch', {"texts": ["a", 3]}),
+                          ('/anonymize/batch', {"texts": "x"})):
+        expected = client.post(path, json=payload)
+        status, body = asyncio.run(asgi_request(asgi.app, 'POST', path, payload))
+        if status != expected.status_code or body != expected.data:
+            sys.exit(f"HATA: Flask ve ASGI yanıtları farklı: {payload!r}")
+    print(f"Doğruluk: {len(corpus)} belgede Flask ve ASGI yanıtları aynı")
+
+    reset("slow", delay=args.delay)
+    slow_texts = lambda tag: [f"Müşteri {tag}{i}: Bugün Ahmet Yılmaz ile görüştüm." for i in range(args.requests)]
+    quick_texts = [f"bugün {i} kez aradım, sonuç yok" for i in range(args.threads)]
+
+    # Senkron: sabit thread havuzu, her istek bir thread işgal eder
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        start = time.perf_counter()
+        slow = [pool.submit(client.post, '/anonymize', json={"text": text}) for text in slow_texts("s")]
+        quick_start = time.perf_counter()
+        quick = [pool.submit(client.post, '/anonymize', json={"text": text}) for text in quick_texts]
+        for future in quick:
+            future.result()
+        sync_quick = time.perf_counter() - quick_start
+        for future in slow:
+            future.result()
+        sync_total = time.perf_counter() - start
+
+    # Async: bağlantılar event loop'ta, NER I/O havuzunda beklenir
+    async def run_async():
+        start = time.perf_counter()
+        slow = [asyncio.create_task(asgi_request(asgi.app, 'POST', '/anonymize', {"text": text}))
+                for text in slow_texts("a")]
+        await asyncio.sleep(0)
+        quick_start = time.perf_counter()
+        await asyncio.gather(*(asgi_request(asgi.app, 'POST', '/anonymize', {"text": text})
+                               for text in quick_texts))
+        quick_elapsed = time.perf_counter() - quick_start
+        await asyncio.gather(*slow)
+        return quick_elapsed, time.perf_counter() - start
+
+    async_quick, async_total = asyncio.run(run_async())
+
+    print(f"{args.requests} NER isteği, NER gecikmesi {args.delay}s, senkron havuz {args.threads} thread")
+    print(f"{'mod':>8} {'NER gerektirmeyen istekler (s)':>31} {'toplam (s)':>11}")
+    print(f"{'senkron':>8} {sync_quick:>31.3f} {sync_total:>11.3f}")
+    print(f"{'async':>8} {async_quick:>31.3f} {async_total:>11.3f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
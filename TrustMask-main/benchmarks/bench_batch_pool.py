@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Batch Process Havuzu Benchmark
+
+Aynı batch'i tek process'te (mevcut /anonymize/batch döngüsü) ve farklı
+worker sayılarıyla BatchPool üzerinde çalıştırır; sonuçların aynı ve
+aynı sırada olduğunu doğrular, throughput'u yazdırır.
+
+Kullanım:
+    python benchmarks/bench_batch_pool.py
+    python benchmarks/bench_batch_pool.py --texts 512 --size 2000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from anonymizer import KVKKAnonymizer
+from engine.batch_pool import BatchPool
+from bench_detectors import build_document
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BatchPool benchmark")
+    parser.add_argument('--texts', type=int, default=256, help='Batch içindeki metin sayısı')
+    parser.add_argument('--size', type=int, default=1000, help='Metin boyutu (karakter)')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, os.cpu_count() or 1}), help='Worker sayıları')
+    parser.add_argument('--no-names', action='store_true', help='NameDetector olmadan çalıştır')
+    args = parser.parse_args()
+
+    texts = [build_document(args.size, seed=i) for i in range(args.texts)]
+    enable_names = not args.no_names
+
+    anonymizer = KVKKAnonymizer(enable_name_detection=enable_names)
+    start = time.perf_counter()
+    expected = [anonymizer.anonymize(text).to_dict() for text in texts]
+    serial = time.perf_counter() - start
+    print(f"{'mod':>12} {'süre (s)':>10} {'metin/s':>10} {'hızlanma':>10}")
+    print(f"{'tek process':>12} {serial:>10.2f} {len(texts) / serial:>10.1f} {1.0:>9.2f}x")
+
+    for workers in args.workers:
+        pool = BatchPool(workers, enable_name_detection=enable_names)
+        try:
+            start = time.perf_counter()
+            results = pool.anonymize_batch(texts)
+            elapsed = time.perf_counter() - start
+        finally:
+            pool.close()
+        if results != expected:
+            sys.exit(f"HATA: {workers} worker ile sonuçlar farklı")
+        print(f"{f'{workers} worker':>12} {elapsed:>10.2f} {len(texts) / elapsed:>10.1f} "
+              f"{serial / elapsed:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
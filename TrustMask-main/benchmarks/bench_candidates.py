@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Entity Bellek / Sütunlu Aday Tamponu Benchmark
+
+- Eşdeğerlik: CandidateBuffer.select, rastgele entity kümelerinde
+  KVKKAnonymizer._resolve_overlaps ile aynı entity'leri aynı sırada seçmeli
+- Entity boyutu: __slots__ DetectedEntity ile eski @dataclass sürümünün
+  örnek başına belleği (tracemalloc)
+- Korpus: belge başına süre, tepe bellek ve GC (0. nesil) toplama sayısı
+
+Kullanım:
+    python benchmarks/bench_candidates.py
+    python benchmarks/bench_candidates.py --docs 200 --size 5000 --rounds 5000
+"""
+
+import argparse
+import gc
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_overlap import ENTITY_TYPES, random_entities, same
+from config import EntityType
+from corpus import generate_corpus
+from engine.candidates import CandidateBuffer
+from entities import DetectedEntity
+
+
+# ---- Eski (@dataclass, __dict__'li) sürüm - referans olarak korunmuştur ----
+
+@dataclass
+class LegacyDetectedEntity:
+    entity_type: EntityType
+    value: str
+    start_pos: int
+    end_pos: int
+    confidence: float = 1.0
+    context: Optional[str] = None
+
+
+def check_equivalence(anonymizer, rounds: int, seed: int) -> None:
+    rng = random.Random(seed)
+    for round_no in range(rounds):
+        count = rng.choice([0, 1, 2, 5, 20, 100, 400])
+        span = rng.choice([10, 50, 500, 5000])
+        min_confidence = rng.choice([0.0, 0.5, 0.8])
+        entities = random_entities(rng, count, span, ENTITY_TYPES)
+
+        expected = anonymizer._resolve_overlaps([e for e in entities if e.confidence >= min_confidence])
+        candidates = CandidateBuffer()
+        candidates.extend(entities)
+        actual = candidates.entities(anonymizer._select_candidates(candidates, min_confidence))
+        if not same(expected, actual):
+            sys.exit(f"HATA: CandidateBuffer.select farklı sonuç verdi (tur {round_no})")
+    print(f"Eşdeğerlik: {rounds} rastgele tur OK")
+
+
+def bytes_per_entity(cls, count: int) -> float:
+    """count entity oluşturup tutmanın örnek başına maliyeti (değerler paylaşılır)"""
+    value = "01.01.1990"
+    tracemalloc.start()
+    entities = [cls(EntityType.BIRTH_DATE, value, i, i + 10, 0.75) for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    return size / count
+
+
+def measure(anonymizer, corpus):
+    """(süre, gen0 GC toplama sayısı, belge başına en yüksek tepe bellek)"""
+    anonymize = anonymizer.anonymize
+    collections = gc.get_stats()[0]['collections']
+    start = time.perf_counter()
+    for text in corpus:
+        anonymize(text)
+    elapsed = time.perf_counter() - start
+    collections = gc.get_stats()[0]['collections'] - collections
+
+    peak = 0
+    tracemalloc.start()
+    for text in corpus:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        anonymize(text)
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    return elapsed, collections, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Entity bellek / aday tamponu benchmark")
+    parser.add_argument('--docs', type=int, default=100, help='Belge sayısı')
+    parser.add_argument('--size', type=int, default=3000, help='Belge başına yaklaşık karakter')
+    parser.add_argument('--rounds', type=int, default=2000, help='Rastgele eşdeğerlik turu')
+    parser.add_argument('--entities', type=int, default=100_000, help='Boyut ölçümündeki entity sayısı')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    logging.getLogger('AINERDetector').setLevel(logging.CRITICAL)
+    from anonymizer import KVKKAnonymizer
+
+    anonymizer = KVKKAnonymizer()
+    check_equivalence(anonymizer, args.rounds, args.seed)
+
+    legacy = bytes_per_entity(LegacyDetectedEntity, args.entities)
+    slotted = bytes_per_entity(DetectedEntity, args.entities)
+    print(f"Entity başına bellek: @dataclass {legacy:.0f} B, __slots__ {slotted:.0f} B "
+          f"({1 - slotted / legacy:.0%} daha az)")
+
+    corpus = generate_corpus(args.docs, args.size, density=0.5, seed=args.seed)
+    anonymizer.anonymize(corpus[0])
+    elapsed, collections, peak = measure(anonymizer, corpus)
+    print(f"Korpus: {args.docs} belge x ~{args.size} karakter")
+    print(f"  süre {elapsed * 1000 / args.docs:.2f} ms/belge, gen0 GC {collections}, "
+          f"belge başına tepe {peak / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Detector Benchmark
+
+Regex tabanlı detector'ları farklı boyutlardaki transkriptlerde tek tek
+çalıştırır; detector başına süreyi ve toplamı raporlar. Diğer benchmark'lar
+örnek satırları (SAMPLE_LINES) ve build_document / best_of yardımcılarını
+buradan kullanır.
+
+Kullanım:
+    python benchmarks/bench_detectors.py
+    python benchmarks/bench_detectors.py --sizes 1000 10000 100000 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from anonymizer import KVKKAnonymizer
+from detectors.base_detector import BaseDetector
+
+
+# Çağrı merkezi transkriptlerine benzer satırlar
+SAMPLE_LINES = [
+    "Temsilci: Merhaba, ben Ayşe. Size nasıl yardımcı olabilirim?",
+    "Müşteri: Merhaba, ben Ahmet Yılmaz. TC kimlik numaram 32303010429.",
+    "Müşteri: Telefon numaram 0532 123 45 67, mail adresim ahmet@gmail.com",
+    "Temsilci: Doğrulama için TC kimlik numaranızın son 4 hanesini alabilir miyim?",
+    "Müşteri: 0429.",
+    "Müşteri: IBAN: TR330006100519786457841326, Bankam Garanti",
+    "Müşteri: Plakam 34 ABC 123, doğum tarihim 12/03/1988",
+    "Temsilci: Ev adresiniz: Kadıköy Mahallesi Atatürk Caddesi No:15 İstanbul",
+    "Temsilci: Müşteri numaranız VOD-123456789, çağrı kayıt no: CRM-2024-001",
+    "Müşteri: Tamam, teşekkür ederim.",
+    "Temsilci: Paketinizde kalan internet miktarını kontrol ediyorum, lütfen hatta kalın.",
+    "Müşteri: Faturam bu ay neden yüksek geldi anlamadım.",
+]
+
+
+def build_document(size: int, seed: int = 42) -> str:
+    """Yaklaşık `size` karakterlik transkript üretir"""
+    rng = random.Random(seed)
+    lines = []
+    length = 0
+    while length < size:
+        line = rng.choice(SAMPLE_LINES)
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detector başına süre benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000],
+                        help='Doküman boyutları (karakter)')
+    parser.add_argument('--repeat', type=int, default=3, help='Tekrar sayısı (en iyisi alınır)')
+    parser.add_argument('--no-names', action='store_true', help='NameDetector olmadan çalıştır')
+    args = parser.parse_args()
+
+    anonymizer = KVKKAnonymizer(enable_name_detection=not args.no_names)
+    # Sadece regex tabanlı detector'lar ölçülür (AI NER ayrı bir servis / model)
+    detectors = [d for d in anonymizer.detectors if isinstance(d, BaseDetector)]
+    texts = [build_document(size) for size in args.sizes]
+
+    print(f"{'detector':>22}" + ''.join(f"{len(text):>12}" for text in texts) + "  (ms)")
+    totals = [0.0] * len(texts)
+    for detector in detectors:
+        timings = [best_of(lambda: detector.detect(text), args.repeat) for text in texts]
+        totals = [total + timing for total, timing in zip(totals, timings)]
+        print(f"{detector.name:>22}" + ''.join(f"{timing * 1000:>12.2f}" for timing in timings))
+    print(f"{'toplam':>22}" + ''.join(f"{total * 1000:>12.2f}" for total in totals))
+
+
+if __name__ == "__main__":
+    main()
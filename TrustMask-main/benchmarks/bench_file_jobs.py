@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Toplu Dosya İşleme (main.py --inputs) Benchmark
+
+Gece işi senaryosu: bir dizindeki transkript dosyaları.
+
+- Dosya başına process: her dosya için `main.py --file ... --stream`
+- --inputs, tek worker ve --workers auto
+- Manifest ile ikinci çalıştırma (değişmeyen dosyalar atlanır)
+
+Doğruluk: --inputs çıktıları dosya başına anonymize() ile aynı olmalı.
+
+Kullanım:
+    python benchmarks/bench_file_jobs.py
+    python benchmarks/bench_file_jobs.py --files 200 --size 20000 --per-file-limit 20
+"""
+
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import generate_corpus
+
+
+def run_cli(*args) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, os.path.join(ROOT, 'main.py'), *args], check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Toplu dosya işleme benchmark")
+    parser.add_argument('--files', type=int, default=40, help='Dosya sayısı')
+    parser.add_argument('--size', type=int, default=10000, help='Dosya başına yaklaşık karakter')
+    parser.add_argument('--workers', default='auto', help='Paralel çalıştırmadaki worker sayısı')
+    parser.add_argument('--per-file-limit', type=int, default=10,
+                        help='Dosya başına process yönteminde ölçülen dosya sayısı (süre orantılanır)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    logging.getLogger('AINERDetector').setLevel(logging.CRITICAL)
+    from anonymizer import KVKKAnonymizer
+
+    corpus = generate_corpus(args.files, args.size, density=0.5, seed=args.seed)
+    total_mb = sum(len(text.encode('utf-8')) for text in corpus) / (1024 * 1024)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'in')
+        os.makedirs(source)
+        paths = []
+        for i, text in enumerate(corpus):
+            path = os.path.join(source, f'call_{i:05d}.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            paths.append(path)
+
+        rows = []
+        sample = paths[:args.per_file_limit]
+        elapsed = sum(run_cli('--file', path, '--output', path + '.out', '--stream') for path in sample)
+        rows.append(("dosya başına process", elapsed * len(paths) / len(sample)))
+
+        for label, workers in (("--inputs, 1 worker", '1'), (f"--inputs, {args.workers} worker", args.workers)):
+            output = os.path.join(tmp, f'out_{workers}')
+            rows.append((label, run_cli('--inputs', source, '--output-dir', output, '--workers', workers)))
+        rows.append(("tekrar (manifest)", run_cli('--inputs', source, '--output-dir', output,
+                                                  '--workers', args.workers)))
+
+        anonymizer = KVKKAnonymizer()
+        for i, (path, text) in enumerate(zip(paths, corpus)):
+            with open(os.path.join(output, os.path.basename(path)), encoding='utf-8') as f:
+                if f.read() != anonymizer.anonymize(text).sanitized_text:
+                    sys.exit(f"HATA: {path} çıktısı anonymize() sonucundan farklı")
+        print(f"Doğruluk: {len(paths)} dosyanın çıktısı anonymize() ile aynı")
+
+    print(f"{args.files} dosya, {total_mb:.2f} MB")
+    print(f"{'yöntem':>24} {'süre (s)':>10} {'dosya/s':>10} {'MB/s':>8}")
+    for label, seconds in rows:
+        print(f"{label:>24} {seconds:>10.2f} {args.files / seconds:>10.1f} {total_mb / seconds:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
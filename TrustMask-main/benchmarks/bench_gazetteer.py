@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Derlenmiş Sözlük (KVKK_GAZETTEER) Benchmark
+
+Yerleşik listelere nüfus kaydı ölçeğinde sentetik isim / soyisim eklenir
+(--names). Bellekteki Gazetteer ile mmap'lenen CompiledGazetteer için:
+
+- Doğruluk: korpus taramasında aynı eşleşmeler, tüm ifadelerde aynı lookup
+- Kurulum: process başına kurulum / açılış süresi ve Python heap'i
+- Paylaşım: --workers process'in her birinde sözlük yüklenip korpus
+  tarandıktan sonra process'e özel bellek (Linux: /proc/self/smaps_rollup)
+- Hız: korpus taraması (MB/s)
+
+Kullanım:
+    python benchmarks/bench_gazetteer.py
+    python benchmarks/bench_gazetteer.py --names 500000 --workers 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import generate_corpus
+from nlp.compiled_gazetteer import CompiledGazetteer, write_gazetteer
+from nlp.gazetteer import FIRST_NAME, SURNAME, Gazetteer, default_entries, entries_digest
+
+SYLLABLES = ["ay", "be", "can", "de", "el", "fer", "gül", "han", "il", "kan", "le", "mer", "nur",
+             "öz", "ra", "se", "taş", "ul", "ver", "ya", "zer", "çi", "şen", "ko", "mu"]
+
+
+def synthetic_names(count: int, seed: int):
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < count:
+        names.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))))
+    return sorted(names)
+
+
+def build_entries(names: int, seed: int):
+    builtin = default_entries()
+    entries = {kind: list(phrases) for kind, phrases in builtin.items()}
+    entries[FIRST_NAME].extend(synthetic_names(names // 2, seed))
+    entries[SURNAME].extend(synthetic_names(names - names // 2, seed + 1))
+    return builtin, entries
+
+
+def private_mb():
+    """Process'e özel bellek (MB); Linux dışında None"""
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line)
+    except OSError:
+        return None
+    return sum(int(fields[name].split()[0]) for name in ('Private_Clean', 'Private_Dirty')) / 1024
+
+
+def _worker(args):
+    mode, source, docs = args
+    # Bellekteki sözlük worker'da listelerden kurulur (process başına bir kopya)
+    gazetteer = Gazetteer(source) if mode == 'bellek' else CompiledGazetteer(source)
+    for text in docs:
+        gazetteer.scan(text)
+    return private_mb()
+
+
+def measure(load):
+    tracemalloc.start()
+    start = time.perf_counter()
+    gazetteer = load()
+    elapsed = time.perf_counter() - start
+    heap = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+    tracemalloc.stop()
+    return gazetteer, elapsed, heap
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Derlenmiş sözlük benchmark")
+    parser.add_argument('--names', type=int, default=200_000, help='Eklenecek sentetik isim + soyisim')
+    parser.add_argument('--docs', type=int, default=200, help='Korpus belge sayısı')
+    parser.add_argument('--workers', type=int, default=2, help='Paylaşım ölçümündeki process sayısı')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    builtin, entries = build_entries(args.names, args.seed)
+    docs = generate_corpus(args.docs, 3000, density=0.5, seed=args.seed)
+    megabytes = sum(len(text.encode('utf-8')) for text in docs) / (1024 * 1024)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'gazetteer.bin')
+        memory, build_time, build_heap = measure(lambda: Gazetteer(entries))
+        write_gazetteer(path, memory, entries_digest(builtin))
+        compiled, open_time, open_heap = measure(lambda: CompiledGazetteer(path))
+
+        for number, text in enumerate(docs):
+            if memory.scan(text).hits != compiled.scan(text).hits:
+                sys.exit(f"HATA: {number}. belgede eşleşmeler farklı")
+        for phrase, kinds in memory._phrases.items():
+            if compiled.lookup(phrase) != kinds:
+                sys.exit(f"HATA: {phrase!r} için lookup farklı")
+        print(f"Doğruluk: {len(docs)} belge ve {len(memory)} ifade aynı sonuç")
+
+        rows = []
+        for label, gazetteer, load_time, heap in (("bellek", memory, build_time, build_heap),
+                                                  ("mmap", compiled, open_time, open_heap)):
+            start = time.perf_counter()
+            for text in docs:
+                gazetteer.scan(text)
+            scan_time = time.perf_counter() - start
+            source = entries if label == "bellek" else path
+            with multiprocessing.get_context('spawn').Pool(args.workers) as pool:
+                private = pool.map(_worker, [(label, source, docs)] * args.workers)
+            rows.append((label, load_time, heap, megabytes / scan_time, private))
+
+        print(f"{len(memory)} ifade, dosya {os.path.getsize(path) / (1024 * 1024):.1f} MB")
+    print(f"{'':>8} {'yükleme (ms)':>13} {'heap (MB)':>10} {'tarama MB/s':>12} {'worker özel bellek (MB)':>24}")
+    for label, load_time, heap, speed, private in rows:
+        memory_col = ', '.join(f"{value:.0f}" for value in private) if None not in private else '-'
+        print(f"{label:>8} {load_time * 1000:>13.1f} {heap:>10.1f} {speed:>12.2f} {memory_col:>24}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Cloud NER İstemcisi Benchmark
+
+Hugging Face Inference API'yi taklit eden yerel bir stub HTTP sunucusu
+başlatır ve CloudBackend / NERClient davranışını doğrular:
+
+- Eşzamanlı metinlerin tek `inputs: [...]` isteğinde birleştirilmesi
+  ve her metne kendi sonucunun dönmesi
+- Yavaş serviste birden fazla birleştirilmiş isteğin aynı anda uçuşta
+  olması (pool_size)
+- Okuma zaman aşımı (asılı sunucu thread'i bloklamaz)
+- Devre kesici (servis çöktüğünde istek atılmadan NER atlanır, süre
+  dolunca tek deneme ile toparlanır)
+- 503 "model yükleniyor" yanıtında uyumadan atlama
+- Havuzlu Session ile istek başına yeni bağlantı arasındaki gecikme farkı
+
+Kullanım:
+    python benchmarks/bench_ner_client.py
+    python benchmarks/bench_ner_client.py --threads 64 --requests 500
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlp.ner_backends import CloudBackend
+from nlp.ner_client import CircuitBreaker, NERClient
+
+
+WORD = re.compile(r'\b[A-ZÇĞİÖŞÜ][a-zçğıöşü]+\b')
+
+
+class StubState:
+    mode = "ok"      # ok | slow | down | loading
+    delay = 0.0
+    requests = 0
+    batch_sizes = []
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+
+def fake_ner(text):
+    """Büyük harfle başlayan her kelimeyi PER olarak döndürür"""
+    return [{'entity_group': 'PER', 'score': 0.99, 'word': m.group(), 'start': m.start(), 'end': m.end()}
+            for m in WORD.finditer(text)]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        inputs = json.loads(body)['inputs']
+        with StubState.lock:
+            StubState.requests += 1
+            StubState.batch_sizes.append(len(inputs) if isinstance(inputs, list) else 1)
+            StubState.active += 1
+            StubState.max_active = max(StubState.max_active, StubState.active)
+        try:
+            self._respond(inputs)
+        finally:
+            with StubState.lock:
+                StubState.active -= 1
+
+    def _respond(self, inputs):
+        if StubState.mode == "slow":
+            time.sleep(StubState.delay)
+        if StubState.mode == "down":
+            return self._send(500, {'error': 'internal'})
+        if StubState.mode == "loading":
+            return self._send(503, {'error': 'loading', 'estimated_time': 0.3})
+
+        if isinstance(inputs, list):
+            payload = [fake_ner(text) for text in inputs]
+        else:
+            payload = fake_ner(inputs)
+        self._send(200, payload)
+
+    def _send(self, status, payload):
+        data = json.dumps(payload).encode('utf-8')
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except OSError:
+            pass
+
+
+def reset(mode="ok", delay=0.0):
+    StubState.mode = mode
+    StubState.delay = delay
+    StubState.requests = 0
+    StubState.batch_sizes = []
+    StubState.max_active = 0
+
+
+def check(condition, message):
+    print(f"  {'OK  ' if condition else 'HATA'} {message}")
+    if not condition:
+        sys.exit(1)
+
+
+def run_concurrent(backend, texts):
+    results = [None] * len(texts)
+
+    def worker(i):
+        results[i] = backend.predict(texts[i])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(texts))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cloud NER istemcisi benchmark (stub sunucu)")
+    parser.add_argument('--threads', type=int, default=32, help='Eşzamanlı istek sayısı')
+    parser.add_argument('--requests', type=int, default=200, help='Gecikme ölçümü için sıralı istek sayısı')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/models/stub"
+
+    print("Birleştirme:")
+    reset()
+    backend = CloudBackend(client=NERClient(url, batch_window=0.02, max_batch=16))
+    texts = [f"Kayıt {i}: Ahmet Yılmaz aradı" for i in range(args.threads)]
+    results = run_concurrent(backend, texts)
+    sizes = list(StubState.batch_sizes)
+    check(all(r == fake_ner(t) for r, t in zip(results, texts)), "her metne kendi sonucu döndü")
+    print(f"  {args.threads} eşzamanlı metin -> {len(sizes)} istek (batch boyutları: {sizes})")
+    check(len(sizes) < args.threads, "istekler birleştirildi")
+
+    print("Paralel istekler:")
+    reset("slow", delay=0.2)
+    backend = CloudBackend(client=NERClient(url, batch_window=0.01, max_batch=4, pool_size=8))
+    texts = [f"Kayıt {i}: Ayşe Demir aradı" for i in range(args.threads)]
+    start = time.perf_counter()
+    results = run_concurrent(backend, texts)
+    elapsed = time.perf_counter() - start
+    check(all(r == fake_ner(t) for r, t in zip(results, texts)), "her metne kendi sonucu döndü")
+    print(f"  {args.threads} metin, {StubState.requests} istek, aynı anda en fazla "
+          f"{StubState.max_active} istek, {elapsed:.2f}s (istek başına 0.2s)")
+    check(1 < StubState.max_active <= 8, "birden fazla istek uçuşta, pool_size aşılmadı")
+
+    print("Zaman aşımı:")
+    reset("slow", delay=2.0)
+    backend = CloudBackend(client=NERClient(url, read_timeout=0.2, batch_window=0))
+    start = time.perf_counter()
+    result = backend.predict("Ahmet Yılmaz")
+    elapsed = time.perf_counter() - start
+    check(result is None and elapsed < 1.0, f"asılı sunucu {elapsed:.2f}s sonra atlandı")
+
+    print("Devre kesici:")
+    reset("down")
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.5)
+    backend = CloudBackend(client=NERClient(url, batch_window=0, breaker=breaker))
+    for _ in range(10):
+        backend.predict("Ahmet Yılmaz")
+    check(StubState.requests == 3, f"3 hatadan sonra devre açıldı (10 çağrı, {StubState.requests} istek)")
+    check(backend.client.stats()['skipped'] == 7, "açık devrede 7 çağrı atlandı")
+    reset("ok")
+    time.sleep(0.6)
+    check(backend.predict("Ahmet Yılmaz") != [] and breaker.state == CircuitBreaker.CLOSED,
+          "süre dolunca deneme isteği başarılı, devre kapandı")
+
+    print("503 (model yükleniyor):")
+    reset("loading")
+    backend = CloudBackend(client=NERClient(url, batch_window=0))
+    start = time.perf_counter()
+    for _ in range(5):
+        backend.predict("Ahmet Yılmaz")
+    elapsed = time.perf_counter() - start
+    check(StubState.requests == 1 and elapsed < 0.3, f"uyumadan atlandı ({elapsed:.3f}s, {StubState.requests} istek)")
+
+    print("Gecikme (sıralı):")
+    import requests
+    reset()
+    start = time.perf_counter()
+    for i in range(args.requests):
+        requests.post(url, json={"inputs": f"Ahmet {i}"})
+    fresh = time.perf_counter() - start
+    client = NERClient(url, batch_window=0)
+    start = time.perf_counter()
+    for i in range(args.requests):
+        client.predict(f"Ahmet {i}")
+    pooled = time.perf_counter() - start
+    print(f"  requests.post (yeni bağlantı): {fresh / args.requests * 1000:.2f} ms/istek")
+    print(f"  NERClient (havuzlu Session):   {pooled / args.requests * 1000:.2f} ms/istek")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Çakışma Çözümü Benchmark + Eşdeğerlik Kontrolü
+
+KVKKAnonymizer._resolve_overlaps ve NameDetector._remove_duplicates'in
+sweep-line sürümlerini eski O(n²) döngülerle karşılaştırır:
+- Rastgele entity kümelerinde iki sürümün birebir aynı sonucu verdiği
+  doğrulanır (aynı entity'ler, aynı sırada).
+- Büyük kümelerde süreler ölçülür.
+
+Kullanım:
+    python benchmarks/bench_overlap.py
+    python benchmarks/bench_overlap.py --rounds 5000 --sizes 1000 5000 20000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from anonymizer import KVKKAnonymizer
+from config import EntityType
+from entities import DetectedEntity
+from nlp.name_detector import NameDetector
+
+
+# ---- Eski (O(n²)) sürümler - referans olarak birebir korunmuştur ----
+
+def legacy_resolve_overlaps(entities, entity_key):
+    sorted_entities = sorted(entities, key=entity_key)
+
+    result = []
+    used_ranges = []
+
+    for entity in sorted_entities:
+        overlap = False
+        for (start, end) in used_ranges:
+            if entity.start_pos < end and entity.end_pos > start:
+                overlap = True
+                break
+
+        if not overlap:
+            result.append(entity)
+            used_ranges.append((entity.start_pos, entity.end_pos))
+
+    return result
+
+
+def legacy_remove_duplicates(entities):
+    if not entities:
+        return entities
+
+    entities.sort(key=lambda e: (e.start_pos, -e.confidence, -len(e.value)))
+
+    result = []
+    for entity in entities:
+        overlaps_with_better = False
+
+        for i, existing in enumerate(result):
+            if (entity.start_pos < existing.end_pos and
+                    entity.end_pos > existing.start_pos):
+                if existing.entity_type == EntityType.FULL_NAME:
+                    overlaps_with_better = True
+                    break
+                elif entity.entity_type == EntityType.FULL_NAME:
+                    result[i] = entity
+                    overlaps_with_better = True
+                    break
+                else:
+                    if existing.confidence >= entity.confidence:
+                        overlaps_with_better = True
+                        break
+                    else:
+                        result[i] = entity
+                        overlaps_with_better = True
+                        break
+
+        if not overlaps_with_better:
+            result.append(entity)
+
+    return result
+
+
+# ---- Rastgele entity üretimi ----
+
+ENTITY_TYPES = list(EntityType)
+NAME_TYPES = [EntityType.NAME, EntityType.SURNAME, EntityType.FULL_NAME]
+CONFIDENCES = [0.5, 0.7, 0.75, 0.85, 0.9, 0.95, 0.98]
+
+
+def random_entities(rng: random.Random, count: int, span: int, types) -> list:
+    entities = []
+    for _ in range(count):
+        start = rng.randrange(span)
+        length = rng.choice([0, 1, 2, 3, 5, 8, 13, 30]) if rng.random() < 0.95 else -rng.randrange(1, 4)
+        end = start + length
+        # value uzunluğu her zaman aralık uzunluğuna eşit olmayabilir
+        value_len = max(0, length) if rng.random() < 0.9 else rng.randrange(0, 20)
+        entities.append(DetectedEntity(
+            entity_type=rng.choice(types),
+            value='x' * value_len,
+            start_pos=start,
+            end_pos=end,
+            confidence=rng.choice(CONFIDENCES),
+        ))
+    return entities
+
+
+def same(a, b) -> bool:
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+
+def check_equivalence(anonymizer, name_detector, rounds: int, seed: int) -> None:
+    rng = random.Random(seed)
+    entity_key = anonymizer_entity_key(anonymizer)
+    for round_no in range(rounds):
+        count = rng.choice([0, 1, 2, 5, 20, 100, 400])
+        span = rng.choice([10, 50, 500, 5000])
+
+        entities = random_entities(rng, count, span, ENTITY_TYPES)
+        expected = legacy_resolve_overlaps(list(entities), entity_key)
+        actual = anonymizer._resolve_overlaps(list(entities))
+        if not same(expected, actual):
+            sys.exit(f"HATA: _resolve_overlaps farklı sonuç verdi (tur {round_no})")
+
+        entities = random_entities(rng, count, span, NAME_TYPES)
+        expected = legacy_remove_duplicates(list(entities))
+        actual = name_detector._remove_duplicates(list(entities))
+        if not same(expected, actual):
+            sys.exit(f"HATA: NameDetector._remove_duplicates farklı sonuç verdi (tur {round_no})")
+
+    print(f"Eşdeğerlik: {rounds} rastgele tur OK")
+
+
+def anonymizer_entity_key(anonymizer):
+    """_resolve_overlaps ile aynı sıralama anahtarı"""
+    def entity_key(e):
+        prio = anonymizer.priority_order.get(e.entity_type, 99)
+        return (e.start_pos, -len(e.value), -e.confidence, prio)
+    return entity_key
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Çakışma çözümü benchmark")
+    parser.add_argument('--rounds', type=int, default=2000, help='Rastgele eşdeğerlik turu')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 5_000, 20_000],
+                        help='Entity sayıları')
+    parser.add_argument('--repeat', type=int, default=3, help='Tekrar sayısı (en iyisi alınır)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    anonymizer = KVKKAnonymizer(enable_name_detection=False)
+    name_detector = NameDetector()
+
+    check_equivalence(anonymizer, name_detector, args.rounds, args.seed)
+
+    entity_key = anonymizer_entity_key(anonymizer)
+    rng = random.Random(args.seed)
+    print(f"{'entity':>8} {'eski (ms)':>12} {'yeni (ms)':>12} {'isim eski':>12} {'isim yeni':>12}")
+    for size in args.sizes:
+        # Uzun transkript benzeri dağılım: ortalama 40 karakterde bir aday
+        entities = random_entities(rng, size, size * 40, ENTITY_TYPES)
+        names = random_entities(rng, size, size * 40, NAME_TYPES)
+
+        old = best_of(lambda: legacy_resolve_overlaps(list(entities), entity_key), args.repeat)
+        new = best_of(lambda: anonymizer._resolve_overlaps(list(entities)), args.repeat)
+        old_names = best_of(lambda: legacy_remove_duplicates(list(names)), args.repeat)
+        new_names = best_of(lambda: name_detector._remove_duplicates(list(names)), args.repeat)
+        print(f"{size:>8} {old * 1000:>12.2f} {new * 1000:>12.2f} "
+              f"{old_names * 1000:>12.2f} {new_names * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+PartialDataDetector Ölçeklenme Benchmark
+
+Satır bazlı doğrulama cevabı taraması eskiden her satır için satır
+başlangıcını önceki tüm satırların uzunluklarını toplayarak hesaplıyordu
+(satır sayısında karesel). Yeni sürüm diyalog indeksini
+(detectors/dialogue_index.py) kullanır ve yalnızca cevap olabilecek
+satırlara bakar.
+
+- Doğruluk: rastgele doğrulama diyalogları, korpus belgeleri ve kenar
+  durumlarında (CRLF, satır sonu boşlukları, noktalama) eski sürümle aynı
+  entity'ler
+- Hız: satır sayısına göre süre (eski sürüm --legacy-limit satıra kadar)
+
+Kullanım:
+    python benchmarks/bench_partial_data.py
+    python benchmarks/bench_partial_data.py --lines 1000 10000 100000 200000 --legacy-limit 20000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import EntityType
+from corpus import generate_corpus
+from detectors.digit_runs import scan_digits
+from detectors.partial_data_detector import PartialDataDetector
+from entities import DetectedEntity
+
+
+QUESTIONS = [
+    "Temsilci: Doğum yılınızı öğrenebilir miyim?",
+    "Temsilci: TC kimlik numaranızın son 4 hanesini alabilir miyim?",
+    "Temsilci: Telefon numaranızın son iki hanesi nedir?",
+    "Temsilci: Ek doğrulama için bir bilgi daha alacağım.",
+    "Temsilci: Kartınızın son 4 hanesi nedir?",
+    "Temsilci: Hattınız kimin adına kayıtlı?",
+]
+ANSWERS = [
+    "Müşteri: 1987.", "Müşteri: 2109.", "Müşteri: 45", "1990", "Müşteri: 12!",
+    "Müşteri: 345 ", "Müşteri: 2031?\r", "Müşteri: kartımın son 4 hanesi 4421",
+    "Müşteri: doğum yılım 1975", "Müşteri: TC son 4 hane 0912 olarak",
+    "Müşteri: telefonumun son 2 hanesi: 67", "Müşteri: 1985 doğumluyum",
+]
+FILLER = [
+    "Müşteri: Bir saniye bakayım.",
+    "Temsilci: Paketinizde kalan internet miktarını kontrol ediyorum.",
+    "Müşteri: Faturam 250 TL geldi",
+    "",
+    "Temsilci: Teşekkürler, hatta kalın lütfen.",
+]
+
+
+class LegacyPartialDataDetector(PartialDataDetector):
+    """Eski satır döngüsü (satır başına önceki satırların toplamı) - referans"""
+
+    def detect_matches(self, text, matches):
+        if not scan_digits(text).has_digits:
+            return []
+        entities = []
+        year_answer, = self.compiled_extra_patterns['year_answer']
+        tc_answer, = self.compiled_extra_patterns['tc_answer']
+        phone_answer, = self.compiled_extra_patterns['phone_answer']
+        lines = text.split('\n')
+        for i, line in enumerate(lines):
+            line_start = sum(len(l) + 1 for l in lines[:i])
+            context_lines = []
+            for k in range(1, 5):
+                if i - k >= 0:
+                    context_lines.append(lines[i - k].lower())
+            prev_line = lines[i - 1].lower() if i > 0 else ""
+            context = " ".join(context_lines).lower()
+
+            match = year_answer.search(line)
+            if match and ('doğum' in context or 'dogum' in context or 'yıl' in prev_line
+                          or 'yil' in prev_line or 'doğum yılınızı' in prev_line or 'doğum yılı' in prev_line):
+                entities.append(DetectedEntity(EntityType.BIRTH_YEAR, match.group(1), line_start + match.start(1),
+                                               line_start + match.end(1), 0.98, "birth_year_answer"))
+            match = tc_answer.search(line)
+            if match:
+                is_year = 1950 <= int(match.group(1)) <= 2025
+                if not is_year and ('tc' in context or 't.c' in context or 'kimlik' in context
+                                    or 'kimlik numaranızın son' in prev_line
+                                    or 'son' in prev_line and 'hane' in prev_line
+                                    or 'doğrulama' in prev_line or 'ek doğrulama' in prev_line):
+                    entities.append(DetectedEntity(EntityType.TC_ID, match.group(1), line_start + match.start(1),
+                                                   line_start + match.end(1), 0.98, "tc_partial_answer"))
+            match = phone_answer.search(line)
+            if match and ('telefon' in context or 'numara' in context or 'tel' in context or 'cep' in context
+                          or 'hat' in context or 'telefon numaranızın son' in prev_line
+                          or ('son' in prev_line and 'hane' in prev_line) or 'doğrulama' in prev_line):
+                entities.append(DetectedEntity(EntityType.PHONE, match.group(1), line_start + match.start(1),
+                                               line_start + match.end(1), 0.98, "phone_partial_answer"))
+
+        for name, entity_type, context in (('year_inline', EntityType.BIRTH_YEAR, "birth_year_inline"),
+                                           ('tc_inline', EntityType.TC_ID, "tc_partial_inline"),
+                                           ('phone_inline', EntityType.PHONE, "phone_partial_inline"),
+                                           ('card', EntityType.CARD_INFO, "card_partial")):
+            for match in matches[name]:
+                entities.append(DetectedEntity(entity_type, match.group(1), match.start(1), match.end(1),
+                                               0.95, context))
+
+        entities.sort(key=lambda e: (e.start_pos, -e.confidence, -len(e.value)))
+        result = []
+        for entity in entities:
+            if not any(entity.start_pos < e.end_pos and entity.end_pos > e.start_pos for e in result):
+                result.append(entity)
+        return result
+
+
+def build_transcript(rng: random.Random, lines: int) -> str:
+    out = []
+    while len(out) < lines:
+        if rng.random() < 0.3:
+            out.append(rng.choice(QUESTIONS))
+            out.extend(rng.choice(FILLER) for _ in range(rng.randint(0, 4)))
+            out.append(rng.choice(ANSWERS))
+        else:
+            out.append(rng.choice(FILLER + ANSWERS))
+    return '\n'.join(out[:lines])
+
+
+def keys(entities):
+    return [(e.entity_type, e.value, e.start_pos, e.end_pos, e.confidence, e.context) for e in entities]
+
+
+def verify(new, legacy, texts) -> int:
+    found = 0
+    for number, text in enumerate(texts):
+        expected = keys(legacy.detect(text))
+        if keys(new.detect(text)) != expected:
+            sys.exit(f"HATA: {number}. metinde eski sürümden farklı sonuç")
+        found += len(expected)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PartialDataDetector ölçeklenme benchmark")
+    parser.add_argument('--lines', type=int, nargs='+', default=[1_000, 10_000, 100_000],
+                        help='Transkript satır sayıları')
+    parser.add_argument('--legacy-limit', type=int, default=10_000,
+                        help='Eski sürümün çalıştırılacağı en büyük satır sayısı')
+    parser.add_argument('--rounds', type=int, default=500, help='Rastgele doğruluk metni sayısı')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    new, legacy = PartialDataDetector(), LegacyPartialDataDetector()
+
+    texts = [build_transcript(rng, rng.randint(1, 40)) for _ in range(args.rounds)]
+    texts += generate_corpus(50, 3000, density=0.5, seed=args.seed)
+    texts += ["", "\n", "1990", "\n\n45", "Doğum yılı?\r\n1990.\r\n", "tc\n 45 ", "tel\n12\x0b"]
+    found = verify(new, legacy, texts)
+    print(f"Doğruluk: {len(texts)} metin, {found} entity eski sürümle aynı")
+
+    print(f"{'satır':>8} {'karakter':>10} {'eski (ms)':>12} {'yeni (ms)':>12} {'entity':>8}")
+    for count in args.lines:
+        text = build_transcript(rng, count)
+        start = time.perf_counter()
+        entities = new.detect(text)
+        new_time = time.perf_counter() - start
+
+        old_col = f"{'-':>12}"
+        if count <= args.legacy_limit:
+            start = time.perf_counter()
+            expected = legacy.detect(text)
+            old_col = f"{(time.perf_counter() - start) * 1000:>12.1f}"
+            if keys(expected) != keys(entities):
+                sys.exit(f"HATA: {count} satırda eski sürümden farklı sonuç")
+        print(f"{count:>8} {len(text):>10} {old_col} {new_time * 1000:>12.1f} {len(entities):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Detector Profilleri Benchmark
+
+- Doğruluk: KVKKAnonymizer(profile=P) ile tam profildeki anonymizer'a
+  anonymize(text, entity_types=P'nin tipleri) verildiğinde korpusun her
+  belgesinde aynı sonuç alınmalı (anonymize ve anonymize_many)
+- Hız: profil başına docs/s ve çalışan detector sayısı; tam profilde
+  istek başına entity_types filtresinin hızı
+
+Kullanım:
+    python benchmarks/bench_profiles.py
+    python benchmarks/bench_profiles.py --docs 300 --size 3000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import generate_corpus
+
+
+def docs_per_second(fn, corpus) -> float:
+    start = time.perf_counter()
+    for text in corpus:
+        fn(text)
+    return len(corpus) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detector profilleri benchmark")
+    parser.add_argument('--docs', type=int, default=100, help='Belge sayısı')
+    parser.add_argument('--size', type=int, default=2000, help='Belge başına yaklaşık karakter')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    logging.getLogger('AINERDetector').setLevel(logging.CRITICAL)
+    from anonymizer import KVKKAnonymizer
+    from config import DETECTOR_PROFILES
+
+    corpus = generate_corpus(args.docs, args.size, density=0.5, seed=args.seed)
+    full = KVKKAnonymizer(profile='full')
+
+    # Doğruluk
+    for name, types in DETECTOR_PROFILES.items():
+        if types is None:
+            continue
+        profiled = KVKKAnonymizer(profile=name)
+        expected = [profiled.anonymize(text).to_dict() for text in corpus]
+        filtered = [full.anonymize(text, entity_types=types).to_dict() for text in corpus]
+        many = [result.to_dict() for result in full.anonymize_many(corpus, entity_types=types)]
+        if expected != filtered or expected != many:
+            sys.exit(f"HATA: '{name}' profili ile entity_types filtresi farklı sonuç verdi")
+        masked = {t for result in expected for t in result['detected_data_types']}
+        if not masked <= {t.value for t in types}:
+            sys.exit(f"HATA: '{name}' profili profil dışı tip maskeledi: {sorted(masked)}")
+    print(f"Doğruluk: {len(corpus)} belgede profiller ve entity_types filtresi aynı")
+
+    # Hız
+    print(f"{'profil':>10} {'detector':>9} {'profil docs/s':>14} {'filtre docs/s':>14}")
+    full.anonymize(corpus[0])
+    base = docs_per_second(full.anonymize, corpus)
+    print(f"{'full':>10} {len(full.detectors):>9} {base:>14.1f} {'-':>14}")
+    for name, types in DETECTOR_PROFILES.items():
+        if types is None:
+            continue
+        profiled = KVKKAnonymizer(profile=name)
+        rate = docs_per_second(profiled.anonymize, corpus)
+        filtered = docs_per_second(lambda text: full.anonymize(text, entity_types=types), corpus)
+        print(f"{name:>10} {len(profiled.detectors):>9} {rate:>14.1f} {filtered:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Yapılandırılmış Kayıt (main.py --records) Benchmark
+
+Sentetik destek kaydı export'u: kimlik / tarih / tutar kolonları ve serbest
+metinli not alanları. JSONL ve CSV için:
+
+- Doğruluk: seçilen alanlar anonymize(değer) ile aynı; diğer alanlar ham
+  metinde bayt bayt aynı (seçilen alanlar çıkarılınca kayıtlar eşit)
+- Hız: aynı process ve BatchPool ile kayıt/s, MB/s
+- Bellek: farklı kayıt sayılarında tepe bellek (tracemalloc) sabit kalmalı
+
+Kullanım:
+    python benchmarks/bench_records.py
+    python benchmarks/bench_records.py --records 20000 --workers 4
+"""
+
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import generate_document
+from engine.batch_pool import BatchPool
+from engine.records import anonymize_records
+
+
+def build_records(count: int, seed: int):
+    """(jsonl satırları, csv metni) - aynı kayıtlar iki formatta"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        rows.append({
+            "ticket_id": 100000 + i,
+            "created_at": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "amount": f"{rng.randint(10, 5000)}.{rng.randint(0, 99):02d}",
+            "note": generate_document(rng, rng.randint(80, 600), density=0.5),
+            "customer": {"comment": generate_document(rng, rng.randint(40, 200), density=0.3),
+                         "segment": rng.choice(["bireysel", "kurumsal"])},
+        })
+    jsonl = [json.dumps(row, ensure_ascii=i % 2 == 0) + '\n' for i, row in enumerate(rows)]
+    buffer = io.StringIO(newline='')
+    writer = csv.writer(buffer, lineterminator='\r\n')
+    writer.writerow(["ticket_id", "created_at", "amount", "note", "segment"])
+    for row in rows:
+        writer.writerow([row["ticket_id"], row["created_at"], row["amount"], row["note"],
+                         row["customer"]["segment"]])
+    return jsonl, buffer.getvalue()
+
+
+def run(lines, record_format, fields, anonymizer=None, pool=None):
+    out = io.StringIO(newline='')
+    stats = anonymize_records(lines, out.write, record_format, fields, anonymizer=anonymizer, pool=pool)
+    return out.getvalue(), stats
+
+
+def verify_jsonl(anonymizer, lines, output):
+    out_lines = output.splitlines(keepends=True)
+    if len(out_lines) != len(lines):
+        sys.exit("HATA: JSONL kayıt sayısı farklı")
+    for number, (raw, new) in enumerate(zip(lines, out_lines), 1):
+        before, after = json.loads(raw), json.loads(new)
+        pairs = ((before["note"], after["note"]),
+                 (before["customer"]["comment"], after["customer"]["comment"]))
+        if any(anonymizer.anonymize(old).sanitized_text != value for old, value in pairs):
+            sys.exit(f"HATA: JSONL {number}. kayıt anonymize() sonucundan farklı")
+        # Seçilen değerler geri konunca satır bayt bayt aynı olmalı
+        restored = new
+        for old, value in pairs:
+            restored = restored.replace(json.dumps(value, ensure_ascii=raw.isascii()),
+                                        json.dumps(old, ensure_ascii=raw.isascii()), 1)
+        if restored != raw:
+            sys.exit(f"HATA: JSONL {number}. kayıtta seçilmeyen alanlar değişmiş")
+
+
+def verify_csv(anonymizer, text, output):
+    before = list(csv.reader(io.StringIO(text, newline='')))
+    after = list(csv.reader(io.StringIO(output, newline='')))
+    if len(before) != len(after) or before[0] != after[0]:
+        sys.exit("HATA: CSV kayıt sayısı veya başlık farklı")
+    note = before[0].index("note")
+    for number, (old, new) in enumerate(zip(before[1:], after[1:]), 1):
+        if new[note] != anonymizer.anonymize(old[note]).sanitized_text:
+            sys.exit(f"HATA: CSV {number}. kayıt anonymize() sonucundan farklı")
+        if old[:note] + old[note + 1:] != new[:note] + new[note + 1:]:
+            sys.exit(f"HATA: CSV {number}. kayıtta seçilmeyen kolonlar değişmiş")
+    if output.count('\r\n') < len(after):
+        sys.exit("HATA: CSV satır sonları korunmamış")
+
+
+def peak_memory(anonymizer, lines) -> float:
+    tracemalloc.start()
+    anonymize_records(iter(lines), lambda chunk: None, 'jsonl', ["note"], anonymizer=anonymizer)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yapılandırılmış kayıt benchmark")
+    parser.add_argument('--records', type=int, default=3000, help='Kayıt sayısı')
+    parser.add_argument('--workers', default='auto', help='BatchPool worker sayısı')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    logging.getLogger('AINERDetector').setLevel(logging.CRITICAL)
+    from anonymizer import KVKKAnonymizer
+    anonymizer = KVKKAnonymizer()
+
+    jsonl, csv_text = build_records(args.records, args.seed)
+    jsonl_fields = ["note", "customer.comment"]
+    output, _ = run(jsonl, 'jsonl', jsonl_fields, anonymizer=anonymizer)
+    verify_jsonl(anonymizer, jsonl, output)
+    csv_lines = csv_text.splitlines(keepends=True)
+    output, _ = run(csv_lines, 'csv', ["note"], anonymizer=anonymizer)
+    verify_csv(anonymizer, csv_text, output)
+    print(f"Doğruluk: {args.records} JSONL ve CSV kaydı anonymize() ile aynı, diğer alanlar korunmuş")
+
+    rows = []
+    pool = BatchPool(args.workers, enable_name_detection=True)
+    try:
+        for label, lines, record_format, fields in (("jsonl", jsonl, 'jsonl', jsonl_fields),
+                                                    ("csv", csv_lines, 'csv', ["note"])):
+            megabytes = sum(len(line.encode('utf-8')) for line in lines) / (1024 * 1024)
+            expected = None
+            for mode, kwargs in (("1 process", {"anonymizer": anonymizer}),
+                                 (f"pool ({pool.workers})", {"pool": pool})):
+                start = time.perf_counter()
+                output, stats = run(lines, record_format, fields, **kwargs)
+                rows.append((f"{label}, {mode}", time.perf_counter() - start, stats["records"], megabytes))
+                if expected is not None and output != expected:
+                    sys.exit(f"HATA: {label} pool çıktısı sıralı / aynı değil")
+                expected = output
+    finally:
+        pool.close()
+
+    print(f"{'yöntem':>18} {'süre (s)':>10} {'kayıt/s':>10} {'MB/s':>8}")
+    for label, seconds, count, megabytes in rows:
+        print(f"{label:>18} {seconds:>10.2f} {count / seconds:>10.1f} {megabytes / seconds:>8.2f}")
+
+    print(f"{'kayıt':>8} {'tepe bellek (MB)':>18}")
+    for count in (args.records // 4, args.records, args.records * 4):
+        lines = [jsonl[i % len(jsonl)] for i in range(count)]
+        print(f"{count:>8} {peak_memory(anonymizer, lines):>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
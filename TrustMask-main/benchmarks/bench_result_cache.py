@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Sonuç Önbelleği Benchmark
+
+Tekrarlı trafik (IVR anonsları, şablon SMS'ler) senaryosunda
+KVKKAnonymizer'ı önbelleksiz, process içi LRU ile ve paylaşımlı SQLite
+katmanıyla çalıştırır. Önbellekten dönen sonuçların önbelleksiz
+sonuçlarla aynı olduğu (entity'ler ve OffsetMap dahil) doğrulanır.
+
+Kullanım:
+    python benchmarks/bench_result_cache.py
+    python benchmarks/bench_result_cache.py --requests 20000 --templates 200 --repeat-ratio 0.9
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from anonymizer import KVKKAnonymizer
+from engine.result_cache import ResultCache, SQLiteCache
+from bench_detectors import build_document
+
+
+def build_traffic(requests: int, templates: int, repeat_ratio: float, size: int, seed: int = 7):
+    """repeat_ratio oranında şablon tekrarı, kalanı benzersiz metin"""
+    rng = random.Random(seed)
+    pool = [build_document(size, seed=1000 + i) for i in range(templates)]
+    traffic = []
+    for i in range(requests):
+        if rng.random() < repeat_ratio:
+            traffic.append(rng.choice(pool))
+        else:
+            traffic.append(build_document(size, seed=100000 + i))
+    return traffic
+
+
+def snapshot(result):
+    return (result.to_dict(include_offsets=True),
+            [(e.entity_type, e.value, e.start_pos, e.end_pos, e.confidence, e.context) for e in result.entities])
+
+
+def run(anonymizer, traffic):
+    start = time.perf_counter()
+    results = [anonymizer.anonymize(text) for text in traffic]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sonuç önbelleği benchmark")
+    parser.add_argument('--requests', type=int, default=3000, help='İstek sayısı')
+    parser.add_argument('--templates', type=int, default=50, help='Tekrarlanan şablon sayısı')
+    parser.add_argument('--repeat-ratio', type=float, default=0.8, help='Şablon tekrarı oranı')
+    parser.add_argument('--size', type=int, default=400, help='Metin boyutu (karakter)')
+    parser.add_argument('--names', action='store_true', help='NameDetector / AI NER ile çalıştır')
+    args = parser.parse_args()
+
+    traffic = build_traffic(args.requests, args.templates, args.repeat_ratio, args.size)
+    enable_names = args.names
+
+    expected, plain = run(KVKKAnonymizer(enable_name_detection=enable_names), traffic)
+    expected = [snapshot(result) for result in expected]
+    print(f"{'mod':>16} {'süre (s)':>10} {'istek/s':>10} {'hit oranı':>10}")
+    print(f"{'önbelleksiz':>16} {plain:>10.2f} {len(traffic) / plain:>10.1f} {'-':>10}")
+
+    memory_cache = ResultCache(max_entries=1000)
+    results, elapsed = run(KVKKAnonymizer(enable_name_detection=enable_names, cache=memory_cache), traffic)
+    if [snapshot(result) for result in results] != expected:
+        sys.exit("HATA: LRU önbellek sonuçları farklı")
+    stats = memory_cache.stats()
+    print(f"{'LRU':>16} {elapsed:>10.2f} {len(traffic) / elapsed:>10.1f} {stats['hit_rate']:>10.2f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite')
+        writer = KVKKAnonymizer(enable_name_detection=enable_names,
+                                cache=ResultCache(1000, shared=SQLiteCache(path, 100000)))
+        run(writer, traffic)
+
+        # Yeni process'i taklit et: boş bellek katmanı, dolu paylaşımlı katman
+        shared_cache = ResultCache(1000, shared=SQLiteCache(path, 100000))
+        results, elapsed = run(KVKKAnonymizer(enable_name_detection=enable_names, cache=shared_cache), traffic)
+        if [snapshot(result) for result in results] != expected:
+            sys.exit("HATA: paylaşımlı önbellek sonuçları farklı")
+        stats = shared_cache.stats()
+        print(f"{'LRU + SQLite':>16} {elapsed:>10.2f} {len(traffic) / elapsed:>10.1f} {stats['hit_rate']:>10.2f}"
+              f"  (paylaşımlı katmandan: {stats['shared_hits']})")
+
+    small = ResultCache(max_entries=1000, max_bytes=256 * 1024)
+    run(KVKKAnonymizer(enable_name_detection=enable_names, cache=small), traffic)
+    stats = small.stats()
+    if stats['bytes'] > 256 * 1024:
+        sys.exit("HATA: bellek sınırı aşıldı")
+    print(f"256 KB sınırlı LRU: {stats['entries']} kayıt, {stats['bytes']} bayt, {stats['evictions']} atılan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Oturumlu (Artımlı) Anonimleştirme Benchmark
+
+Büyüyen sohbet dökümü senaryosu: her yeni mesajdan sonra dökümün tamamı
+anonimleştirilir.
+
+- Doğruluk: anonymize_incremental her adımda anonymize() ile aynı sonucu
+  vermeli (sanitized metin, tipler, entity'ler); added / removed delta'sı
+  önceki ve yeni entity kümelerinin farkıyla aynı olmalı. Eklemelerin
+  yanında rastgele satır düzenlemeleri ve silmeleri de denenir.
+- Hız: oturum başına toplam süre ve taranan karakter; tam tarama
+  (her adımda anonymize) ile artımlı mod karşılaştırılır.
+
+Kullanım:
+    python benchmarks/bench_sessions.py
+    python benchmarks/bench_sessions.py --sessions 20 --size 20000 --edits 0.1
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import generate_corpus
+
+
+# Önceki satırlardaki soruya bağlı cevaplar (PartialDataDetector)
+DIALOGUES = [
+    ["Temsilci: Doğum yılınızı öğrenebilir miyim?", "Müşteri: 1987."],
+    ["Temsilci: TC kimlik numaranızın son 4 hanesini alabilir miyim?", "Müşteri: Bir saniye bakayım.",
+     "Müşteri: 2109."],
+    ["Temsilci: Telefon numaranızın son iki hanesi nedir?", "Müşteri: 45"],
+]
+
+
+def transcript_messages(rng: random.Random, document: str):
+    """Belgeyi 1-3 satırlık mesajlara böler, araya doğrulama diyalogları ekler"""
+    lines = document.split('\n')
+    messages = []
+    i = 0
+    while i < len(lines):
+        if rng.random() < 0.1:
+            messages.extend(rng.choice(DIALOGUES))
+        step = rng.randint(1, 3)
+        messages.append('\n'.join(lines[i:i + step]))
+        i += step
+    return messages
+
+
+def session_steps(rng: random.Random, messages, edits: float):
+    """Her adımda dökümün tamamı; edits oranında adımda önceki bir satır düzenlenir / silinir"""
+    lines = []
+    for message in messages:
+        lines.extend(message.split('\n'))
+        if len(lines) > 2 and rng.random() < edits:
+            i = rng.randrange(len(lines) - 1)
+            if rng.random() < 0.5:
+                del lines[i]
+            else:
+                lines[i] = rng.choice(messages).split('\n')[0]
+        yield '\n'.join(lines)
+
+
+def entity_keys(entities):
+    return [(e.entity_type, e.value, e.start_pos, e.end_pos, e.confidence, e.context) for e in entities]
+
+
+def check(anonymizer, sessions, min_confidence: float) -> int:
+    steps = 0
+    for number, session in enumerate(sessions):
+        state = None
+        previous = []
+        for text in session:
+            result, state, update = anonymizer.anonymize_incremental(text, state, min_confidence)
+            expected = anonymizer.anonymize(text, min_confidence)
+            if (result.to_dict() != expected.to_dict()
+                    or entity_keys(result.entities) != entity_keys(expected.entities)):
+                sys.exit(f"HATA: oturum {number}, adım {steps}: artımlı sonuç tam taramadan farklı")
+            added = set(entity_keys(update.added))
+            current = set(entity_keys(result.entities))
+            if not added <= current or len(update.removed) > len(previous):
+                sys.exit(f"HATA: oturum {number}, adım {steps}: delta tutarsız")
+            previous = result.entities
+            steps += 1
+    return steps
+
+
+def run_full(anonymizer, sessions, min_confidence: float):
+    chars = 0
+    start = time.perf_counter()
+    for session in sessions:
+        for text in session:
+            anonymizer.anonymize(text, min_confidence)
+            chars += len(text)
+    return time.perf_counter() - start, chars
+
+
+def run_incremental(anonymizer, sessions, min_confidence: float):
+    chars = 0
+    start = time.perf_counter()
+    for session in sessions:
+        state = None
+        for text in session:
+            _, state, update = anonymizer.anonymize_incremental(text, state, min_confidence)
+            chars += update.end - update.start
+    return time.perf_counter() - start, chars
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Oturumlu (artımlı) anonimleştirme benchmark")
+    parser.add_argument('--sessions', type=int, default=10, help='Oturum sayısı')
+    parser.add_argument('--size', type=int, default=8000, help='Oturum sonundaki yaklaşık döküm uzunluğu')
+    parser.add_argument('--edits', type=float, default=0.05, help='Önceki bir satırın düzenlendiği adım oranı')
+    parser.add_argument('--min-confidence', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    logging.getLogger('AINERDetector').setLevel(logging.CRITICAL)
+    from anonymizer import KVKKAnonymizer
+
+    rng = random.Random(args.seed)
+    documents = generate_corpus(args.sessions, args.size, density=0.4, seed=args.seed)
+    sessions = [list(session_steps(rng, transcript_messages(rng, document), args.edits))
+                for document in documents]
+    anonymizer = KVKKAnonymizer()
+
+    steps = check(anonymizer, sessions, args.min_confidence)
+    print(f"Doğruluk: {args.sessions} oturum, {steps} adımda artımlı sonuç tam taramayla aynı")
+
+    appends = [list(session_steps(rng, transcript_messages(rng, document), 0.0)) for document in documents]
+    for name, group in (("yalnızca ekleme", appends), (f"ekleme + %{args.edits * 100:.0f} düzenleme", sessions)):
+        full_time, full_chars = run_full(anonymizer, group, args.min_confidence)
+        inc_time, inc_chars = run_incremental(anonymizer, group, args.min_confidence)
+        steps = sum(len(session) for session in group)
+        print(f"{name}: {steps} adım")
+        print(f"  tam tarama  {full_time * 1000 / len(group):9.1f} ms/oturum, {full_chars / len(group):>10,.0f} karakter/oturum")
+        print(f"  artımlı     {inc_time * 1000 / len(group):9.1f} ms/oturum, {inc_chars / len(group):>10,.0f} karakter/oturum"
+              f"  ({full_time / inc_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Soğuk Başlangıç Benchmark
+
+CLI ve serverless (vercel.json) çağrılarında her istek yeni bir process'te
+başlayabilir. Her ölçüm yeni bir yorumlayıcıda yapılır:
+
+- python: boş yorumlayıcı başlangıcı (referans)
+- import: `import anonymizer`
+- kurulum: + KVKKAnonymizer()
+- ilk sonuç: + ilk anonymize() (pattern'ler ilk kullanımda derlenir)
+- CLI: `main.py --text ...` toplam süresi
+
+"ilk sonuç" ve CLI, tools/build_snapshot.py ile üretilen snapshot
+(KVKK_SNAPSHOT) ile tekrar ölçülür. Değerler tekrarların medyanıdır.
+
+Kullanım:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE = ("Merhaba Ahmet Yılmaz, TC 10000000146, Kadıköy İstanbul, "
+          "tel 0532 123 45 67, müşteri numaranız 12345678")
+
+# Yeni process'te çalışır; aşama bitiş zamanlarını (ms) JSON olarak yazar
+PROBE = f"""
+import json, logging, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {ROOT!r})
+logging.disable(logging.CRITICAL)
+import anonymizer
+imported = time.perf_counter()
+instance = anonymizer.KVKKAnonymizer()
+built = time.perf_counter()
+instance.anonymize({SAMPLE!r})
+done = time.perf_counter()
+print(json.dumps([(imported - start) * 1000, (built - start) * 1000, (done - start) * 1000]))
+"""
+
+
+def wall(command, env) -> float:
+    start = time.perf_counter()
+    subprocess.run(command, check=True, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def probe(env, repeat: int):
+    runs = [json.loads(subprocess.run([sys.executable, '-c', PROBE], check=True, env=env,
+                                      capture_output=True, text=True).stdout)
+            for _ in range(repeat)]
+    return [statistics.median(stage) for stage in zip(*runs)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soğuk başlangıç benchmark")
+    parser.add_argument('--repeat', type=int, default=10, help='Ölçüm başına tekrar')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.pop('KVKK_SNAPSHOT', None)
+    cli = [sys.executable, os.path.join(ROOT, 'main.py'), '--text', SAMPLE]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = os.path.join(tmp, 'kvkk_snapshot.pkl')
+        subprocess.run([sys.executable, os.path.join(ROOT, 'tools', 'build_snapshot.py'), '-o', snapshot],
+                       check=True, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        snapshot_env = dict(env, KVKK_SNAPSHOT=snapshot)
+
+        python = statistics.median(wall([sys.executable, '-c', 'pass'], env) for _ in range(args.repeat))
+        rows = []
+        for label, run_env in (("snapshot yok", env), ("snapshot", snapshot_env)):
+            stages = probe(run_env, args.repeat)
+            stages.append(statistics.median(wall(cli, run_env) for _ in range(args.repeat)))
+            rows.append((label, stages))
+
+    print(f"python başlangıcı: {python:.1f} ms (aşağıdaki süreler process içi, CLI hariç)")
+    print(f"{'':>14} {'import':>10} {'kurulum':>10} {'ilk sonuç':>10} {'CLI (wall)':>12}")
+    for label, (imported, built, done, cli_ms) in rows:
+        print(f"{label:>14} {imported:>10.1f} {built:>10.1f} {done:>10.1f} {cli_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+NDJSON Akış Benchmark (POST /anonymize/stream)
+
+- Doğruluk: Flask ve ASGI akış çıktısı, aynı girdiyle /anonymize/batch
+  sonuçlarıyla satır satır aynı olmalı
+- Geri basınç: çıktıyı okumayan istemcide ASGI uygulaması en fazla
+  STREAM_MAX_IN_FLIGHT (+ küçük sabit) satır okuyup durmalı
+- Sabit bellek: kayıt sayısı arttıkça tepe bellek (tracemalloc) sabit
+  kalmalı; /anonymize/batch ise tüm yanıtı bellekte kurar
+
+Kullanım:
+    python benchmarks/bench_stream.py
+    python benchmarks/bench_stream.py --records 2000 10000 20000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import generate_corpus
+
+
+def ndjson_chunks(texts, chunk_size=16 * 1024):
+    """Girdi satırlarını istemcinin göndereceği parçalara böler (üreteç, bellekte tutulmaz)"""
+    buffer = []
+    size = 0
+    for i, text in enumerate(texts):
+        line = json.dumps({"text": text, "id": i}, ensure_ascii=False) + "\n"
+        buffer.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield ''.join(buffer).encode('utf-8')
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+
+def records(corpus, count):
+    for i in range(count):
+        yield corpus[i % len(corpus)]
+
+
+async def stream(app, chunks, on_line, stall=None):
+    """ASGI akış isteği; stall verilirse ilk satırdan sonra çıktı okunmaz (istemci durdu)"""
+    chunks = iter(chunks)
+    received = 0
+
+    async def receive():
+        nonlocal received
+        chunk = next(chunks, None)
+        if chunk is None:
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        received += 1
+        return {'type': 'http.request', 'body': chunk, 'more_body': True}
+
+    async def send(message):
+        if message['type'] == 'http.response.body' and message['body']:
+            on_line(message['body'])
+            if stall is not None:
+                stall.set()
+                await asyncio.sleep(3600)
+
+    scope = {'type': 'http', 'method': 'POST', 'path': '/anonymize/stream', 'query_string': b'', 'headers': []}
+    task = asyncio.ensure_future(app(scope, receive, send))
+    if stall is not None:
+        await stall.wait()
+        await asyncio.sleep(0.5)
+        task.cancel()
+        return received
+    await task
+    return received
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NDJSON akış benchmark")
+    parser.add_argument('--records', type=int, nargs='+', default=[500, 2000, 5000], help='Kayıt sayıları')
+    args = parser.parse_args()
+
+    logging.getLogger('AINERDetector').setLevel(logging.CRITICAL)
+    import api
+    import asgi
+    from config import STREAM_MAX_IN_FLIGHT
+
+    client = api.app.test_client()
+    corpus = generate_corpus(200, 300, density=0.5, seed=9)
+
+    # Doğruluk
+    texts = corpus[:100]
+    expected = client.post('/anonymize/batch', json={"texts": texts}).json['results']
+    flask_lines = client.post('/anonymize/stream', data=b''.join(ndjson_chunks(texts))).data.splitlines()
+    asgi_lines = []
+    asyncio.run(stream(asgi.app, ndjson_chunks(texts, chunk_size=333), asgi_lines.append))
+    asgi_lines = b''.join(asgi_lines).splitlines()
+    for i, (result, flask_line, asgi_line) in enumerate(zip(expected, flask_lines, asgi_lines)):
+        row = json.loads(flask_line)
+        if flask_line != asgi_line or row.pop('line') != i + 1 or row.pop('id') != i or row != result:
+            sys.exit(f"HATA: satır {i + 1} farklı")
+    if not len(expected) == len(flask_lines) == len(asgi_lines):
+        sys.exit("HATA: satır sayısı farklı")
+    print(f"Doğruluk: {len(texts)} kayıt, Flask / ASGI akışı ve /anonymize/batch aynı")
+
+    # Geri basınç: küçük parçalar, istemci ilk satırdan sonra okumayı bırakır
+    stall = None
+
+    async def stalled():
+        nonlocal stall
+        stall = asyncio.Event()
+        return await stream(asgi.app, ndjson_chunks(records(corpus, 100_000), chunk_size=1), lambda _: None, stall)
+
+    read_lines = asyncio.run(stalled())
+    print(f"Geri basınç: istemci durduğunda 100000 kayıttan {read_lines} satır okundu "
+          f"(STREAM_MAX_IN_FLIGHT={STREAM_MAX_IN_FLIGHT})")
+    if read_lines > STREAM_MAX_IN_FLIGHT + 4:
+        sys.exit("HATA: girdi okuma durmadı")
+
+    # Bellek ve hız
+    print(f"{'kayıt':>7} {'akış satır/s':>13} {'akış tepe (KB)':>15} {'batch tepe (KB)':>16}")
+    for count in args.records:
+        tracemalloc.start()
+        start = time.perf_counter()
+        lines = 0
+
+        def on_line(_):
+            nonlocal lines
+            lines += 1
+
+        asyncio.run(stream(asgi.app, ndjson_chunks(records(corpus, count)), on_line))
+        elapsed = time.perf_counter() - start
+        stream_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        client.post('/anonymize/batch', json={"texts": list(records(corpus, count))})
+        batch_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{count:>7} {lines / elapsed:>13.0f} {stream_peak / 1024:>15.0f} {batch_peak / 1024:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Placeholder Yerleştirme Benchmark
+
+Eski sağdan sola dilimleme ile tek geçişli substitute() sürümünü
+karşılaştırır. Her boyutta çıktıların aynı olduğu ve OffsetMap'in
+entity sınırlarını doğru eşlediği doğrulanır.
+
+Kullanım:
+    python benchmarks/bench_substitution.py
+    python benchmarks/bench_substitution.py --sizes 100000 1000000 --density 50
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import EntityType, PLACEHOLDERS
+from entities import DetectedEntity
+from engine.substitution import substitute, _splice
+
+
+def build_case(size: int, density: int, seed: int = 42):
+    """size karakterlik metin ve her `density` karakterde bir çakışmayan entity"""
+    rng = random.Random(seed)
+    text = ''.join(rng.choice('abcçdefgğhıijklmnoöprsştuüvyz 0123456789\n') for _ in range(size))
+    types = list(PLACEHOLDERS)
+    entities = []
+    for start in range(0, size - density, density):
+        end = start + rng.randrange(1, density)
+        entities.append(DetectedEntity(
+            entity_type=rng.choice(types),
+            value=text[start:end],
+            start_pos=start,
+            end_pos=end,
+        ))
+    rng.shuffle(entities)
+    return text, entities
+
+
+def check_offsets(text: str, sanitized: str, entities, offset_map) -> None:
+    for entity in entities:
+        new_start = offset_map.to_sanitized(entity.start_pos)
+        placeholder = PLACEHOLDERS.get(entity.entity_type, "[FİLTRELENDİ]")
+        if sanitized[new_start:new_start + len(placeholder)] != placeholder:
+            sys.exit(f"HATA: {entity} için offset eşlemesi yanlış")
+        if offset_map.to_original(new_start) != entity.start_pos:
+            sys.exit(f"HATA: {entity} için ters eşleme yanlış")
+        if text[entity.end_pos:entity.end_pos + 1] != sanitized[offset_map.to_sanitized(entity.end_pos):][:1]:
+            sys.exit(f"HATA: {entity} sonrası metin kaydı")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Placeholder yerleştirme benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help='Metin boyutları (karakter)')
+    parser.add_argument('--density', type=int, default=50, help='Kaç karakterde bir entity')
+    parser.add_argument('--legacy-limit', type=int, default=200_000,
+                        help='Eski yöntemin çalıştırılacağı en büyük boyut')
+    args = parser.parse_args()
+
+    print(f"{'boyut':>10} {'entity':>8} {'eski (ms)':>12} {'yeni (ms)':>12}")
+    for size in args.sizes:
+        text, entities = build_case(size, args.density)
+
+        start = time.perf_counter()
+        sanitized, offset_map = substitute(text, entities, PLACEHOLDERS)
+        new_time = time.perf_counter() - start
+        check_offsets(text, sanitized, entities, offset_map)
+
+        old_time = None
+        if size <= args.legacy_limit:
+            start = time.perf_counter()
+            legacy = _splice(text, entities, PLACEHOLDERS)
+            old_time = time.perf_counter() - start
+            if legacy != sanitized:
+                sys.exit(f"HATA: {size} boyutunda çıktılar farklı")
+
+        old_col = f"{old_time * 1000:>12.2f}" if old_time is not None else f"{'-':>12}"
+        print(f"{size:>10} {len(entities):>8} {old_col} {new_time * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Triage Benchmark
+
+- Doğruluk: triage'ın atladığı her regex detector'ı, o metin üzerinde
+  çalıştırıldığında gerçekten boş sonuç döndürmeli. Kısa mesajlar,
+  transkript satırları ve anahtar kelime / isim / rakam karışımı rastgele
+  metinlerle kontrol edilir.
+- Hız: PII içermeyen kısa mesajlarda (bot karşılamaları, "evet",
+  bekletme anonsları) triage açık / kapalı anonymize() süresi
+- Atlama oranları: detector başına atlanan metin sayısı
+
+Kullanım:
+    python benchmarks/bench_triage.py
+    python benchmarks/bench_triage.py --messages 20000 --fuzz 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from anonymizer import KVKKAnonymizer
+from engine.triage import Triage
+from bench_detectors import SAMPLE_LINES
+
+
+TRIVIAL_MESSAGES = [
+    "evet", "Evet.", "hayır", "teşekkürler", "Teşekkür ederim, iyi günler.",
+    "tamam", "Anladım.", "bir dakika lütfen", "Hatta kalın lütfen.",
+    "Merhaba, size nasıl yardımcı olabilirim?", "görüşmek üzere",
+    "Çağrınız sıraya alınmıştır, lütfen bekleyiniz.", "olur", "peki",
+    "Başka bir isteğiniz var mı?", "yok, teşekkürler",
+]
+
+# Rastgele metin için parçalar: detector anahtar kelimeleri, isimler,
+# şehirler, bankalar, rakamlar ve ayraçlar
+FUZZ_TOKENS = [
+    "adresim", "mahallesi", "Cad.", "sok", "no", "daire", "il", "ilçe", "Kadıköy", "İSTANBUL",
+    "ankara", "Ataşehir", "/", ",", ".", ":", "@", "at", "dot", "gmail", "mail",
+    "müşteri", "numaram", "abone", "VOD", "TC", "CRM", "tt", "soz", "çağrı", "kayıt",
+    "cinsiyet", "erkek", "KADIN", "bay", "ben", "annem", "anne", "adı", "baba", "kızlık", "soyadı",
+    "banka", "Garanti", "ING", "iş", "bankası", "ziraat", "Ahmet", "Yılmaz", "ahmet", "bey",
+    "hanım", "adım", "Sayın", "dr", "merhaba", "evet", "tamam", "teşekkürler", "fe80::1",
+    "::", "12", "0532", "123", "45", "67", "1990", "12.03.1988", "34", "ABC", "hesap",
+    "ticket", "CR-2024-001234", "ABCD-EFGH", "kart", "son", "hane", "\n",
+]
+
+
+def random_text(rng: random.Random) -> str:
+    return " ".join(rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(1, 8)))
+
+
+def verify(anonymizer, texts):
+    """Atlanan her regex detector'ı gerçekten boş dönmeli"""
+    triage = Triage(anonymizer.detectors)
+    checked = 0
+    for text in texts:
+        for detector, skipped in zip(anonymizer.detectors, triage.mask(text)):
+            if skipped and detector.name != 'AINERDetector':
+                checked += 1
+                found = detector.detect(text)
+                if found:
+                    sys.exit(f"HATA: {detector.name} atlandı ama {found[0].value!r} buldu: {text!r}")
+    return checked
+
+
+def run(anonymizer, messages):
+    start = time.perf_counter()
+    for text in messages:
+        anonymizer.anonymize(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Triage benchmark")
+    parser.add_argument('--messages', type=int, default=5000, help='Kısa mesaj sayısı')
+    parser.add_argument('--fuzz', type=int, default=3000, help='Rastgele doğruluk metni sayısı')
+    args = parser.parse_args()
+
+    anonymizer = KVKKAnonymizer(enable_name_detection=True, triage=False)
+    rng = random.Random(12)
+    texts = TRIVIAL_MESSAGES + SAMPLE_LINES + [random_text(rng) for _ in range(args.fuzz)]
+    checked = verify(anonymizer, texts)
+    print(f"Doğruluk: {len(texts)} metin, atlanan {checked} detector çalıştırması boş döndü")
+
+    messages = [rng.choice(TRIVIAL_MESSAGES) for _ in range(args.messages)]
+    # AI NER modeli bu ortamda yüklü olmayabilir; karşılaştırma regex detector'larıyla yapılır
+    plain = run(KVKKAnonymizer(enable_name_detection=False, triage=False), messages)
+    gated = KVKKAnonymizer(enable_name_detection=False, triage=True)
+    elapsed = run(gated, messages)
+    print(f"{'mod':>14} {'toplam (s)':>11} {'mesaj başı (µs)':>16}")
+    print(f"{'triage kapalı':>14} {plain:>11.3f} {plain / len(messages) * 1e6:>16.1f}")
+    print(f"{'triage açık':>14} {elapsed:>11.3f} {elapsed / len(messages) * 1e6:>16.1f}")
+
+    stats = gated.triage.stats()
+    print(f"Tamamen atlanan: {stats['fully_skipped']}/{stats['documents']}")
+
+    full = KVKKAnonymizer(enable_name_detection=True, triage=True)
+    for text in TRIVIAL_MESSAGES + SAMPLE_LINES:
+        full.triage.mask(text)
+    stats = full.triage.stats()
+    print(f"Detector başına atlama ({stats['documents']} kısa mesaj + transkript satırı):")
+    for name, count in stats['skipped'].items():
+        print(f"  {name:<22} {count:>4}")
+
+
+if __name__ == "__main__":
+    main()
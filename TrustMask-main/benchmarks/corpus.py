@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Sentetik Çağrı Merkezi Korpusu
+
+Benchmark'lar için gerçekçi Türkçe çağrı merkezi transkriptleri üretir.
+Belge boyutu ve PII yoğunluğu (kişisel veri içeren satırların oranı)
+ayarlanabilir; aynı seed her zaman aynı korpusu üretir.
+
+- İsim / soyisim: nlp/turkish_names_db.py
+- İl / ilçe: detectors/address_detector.py
+- TC kimlik, IBAN ve kart numaraları rastgele üretilir ve detector'ların
+  kendi validate() metotlarından geçenler kullanılır (checksum'ı geçerli)
+
+Kullanım:
+    python benchmarks/corpus.py --docs 100 --size 2000 --density 0.3 -o corpus.jsonl
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from detectors.address_detector import ALL_DISTRICTS, TURKEY_CITIES
+from detectors.credit_card_detector import CreditCardDetector
+from detectors.iban_detector import IBANDetector
+from detectors.tc_kimlik_detector import TCKimlikDetector
+from nlp.turkish_names_db import TURKISH_FIRST_NAMES, TURKISH_SURNAMES
+
+
+_TC = TCKimlikDetector()
+_IBAN = IBANDetector()
+_CARD = CreditCardDetector()
+
+FIRST_NAMES = sorted(TURKISH_FIRST_NAMES)
+SURNAMES = sorted(TURKISH_SURNAMES)
+CITIES = sorted(set(TURKEY_CITIES))
+DISTRICTS = sorted(set(ALL_DISTRICTS))
+
+MONTHS = ["Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", "Temmuz",
+          "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık"]
+STREETS = ["Atatürk", "Cumhuriyet", "İnönü", "Gazi", "Barış", "Çiçek", "Lale", "Fatih Sultan"]
+BANKS = ["Garanti", "Ziraat Bankası", "İş Bankası", "Akbank", "Yapı Kredi", "Halkbank"]
+MAIL_DOMAINS = ["gmail.com", "hotmail.com", "yahoo.com", "outlook.com", "firma.com.tr"]
+PLATE_LETTERS = "ABCDEFGHJKLMNPRSTUVYZ"
+
+# Kişisel veri içermeyen satırlar
+FILLER_LINES = [
+    "Temsilci: Merhaba, size nasıl yardımcı olabilirim?",
+    "Müşteri: Faturam bu ay neden yüksek geldi anlamadım.",
+    "Temsilci: Paketinizde kalan internet miktarını kontrol ediyorum, lütfen hatta kalın.",
+    "Temsilci: Kampanya koşullarını sizin için tekrar özetleyebilirim.",
+    "Müşteri: Tamam, teşekkür ederim.",
+    "Temsilci: Başka yardımcı olabileceğim bir konu var mı?",
+    "Müşteri: Hayır, bu kadardı. İyi günler.",
+    "Temsilci: Talebiniz ilgili birime iletildi, en kısa sürede dönüş yapılacak.",
+    "Müşteri: Geçen ay da aynı sorunu yaşamıştım, çözülmedi.",
+    "Temsilci: Anlıyorum, kaydınızı kontrol ediyorum.",
+    "Müşteri: Modemin ışıkları yanıp sönüyor, internet kesik.",
+    "Temsilci: Çağrınız kalite standartları gereği kayıt altına alınmaktadır.",
+]
+
+
+def _title(word: str) -> str:
+    """Türkçe baş harf büyütme (i -> İ)"""
+    head = 'İ' if word[0] == 'i' else word[0].upper()
+    return head + word[1:]
+
+
+def _digits(rng: random.Random, count: int) -> str:
+    return ''.join(rng.choice('0123456789') for _ in range(count))
+
+
+def tc_kimlik(rng: random.Random) -> str:
+    """TCKimlikDetector.validate'ten geçen 11 haneli numara"""
+    while True:
+        head = rng.choice('123456789') + _digits(rng, 8)
+        for check in range(100):
+            candidate = f"{head}{check:02d}"
+            if _TC.validate(candidate):
+                return candidate
+
+
+def iban(rng: random.Random) -> str:
+    """IBANDetector.validate'ten geçen TR IBAN"""
+    # 5 haneli banka kodu, 1 rezerv hane, 16 haneli hesap numarası
+    body = _digits(rng, 5) + '0' + _digits(rng, 16)
+    for check in range(100):
+        candidate = f"TR{check:02d}{body}"
+        if _IBAN.validate(candidate):
+            return candidate
+    raise AssertionError("IBAN kontrol hanesi bulunamadı")
+
+
+def card_number(rng: random.Random) -> str:
+    """CreditCardDetector.validate'ten geçen (Luhn) 16 haneli kart numarası"""
+    while True:
+        head = rng.choice('3456') + _digits(rng, 14)
+        for check in '0123456789':
+            if _CARD.validate(head + check):
+                return head + check
+
+
+def full_name(rng: random.Random) -> str:
+    return f"{_title(rng.choice(FIRST_NAMES))} {_title(rng.choice(SURNAMES))}"
+
+
+def phone(rng: random.Random) -> str:
+    return f"05{rng.randint(30, 59)} {_digits(rng, 3)} {_digits(rng, 2)} {_digits(rng, 2)}"
+
+
+def email(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)}.{rng.choice(SURNAMES)}{rng.randint(1, 99)}@{rng.choice(MAIL_DOMAINS)}"
+
+
+def address(rng: random.Random) -> str:
+    return (f"{_title(rng.choice(DISTRICTS))} Mahallesi {rng.choice(STREETS)} Caddesi "
+            f"No:{rng.randint(1, 200)} Daire:{rng.randint(1, 30)} {_title(rng.choice(CITIES))}")
+
+
+def plate(rng: random.Random) -> str:
+    letters = ''.join(rng.choice(PLATE_LETTERS) for _ in range(rng.randint(1, 3)))
+    return f"{rng.randint(1, 81):02d} {letters} {rng.randint(10, 9999)}"
+
+
+def birth_date(rng: random.Random) -> str:
+    day, month, year = rng.randint(1, 28), rng.randint(1, 12), rng.randint(1950, 2005)
+    if rng.random() < 0.5:
+        return f"{day:02d}.{month:02d}.{year}"
+    return f"{day} {MONTHS[month - 1]} {year}"
+
+
+# Kişisel veri içeren satır şablonları
+PII_LINES = [
+    lambda rng: f"Müşteri: Merhaba, ben {full_name(rng)}.",
+    lambda rng: f"Müşteri: TC kimlik numaram {tc_kimlik(rng)}.",
+    lambda rng: f"Müşteri: Telefon numaram {phone(rng)}, mail adresim {email(rng)}",
+    lambda rng: f"Müşteri: IBAN: {iban(rng)}, bankam {rng.choice(BANKS)}",
+    lambda rng: f"Müşteri: Kart numaram {card_number(rng)}",
+    lambda rng: f"Temsilci: Ev adresiniz: {address(rng)}",
+    lambda rng: f"Müşteri: Plakam {plate(rng)}, doğum tarihim {birth_date(rng)}",
+    lambda rng: f"Temsilci: Müşteri numaranız VOD-{_digits(rng, 9)}, çağrı kayıt no: CR-2024-{_digits(rng, 6)}",
+    lambda rng: f"Müşteri: Annemin adı {_title(rng.choice(FIRST_NAMES))}, babamın adı {_title(rng.choice(FIRST_NAMES))}.",
+    lambda rng: f"Temsilci: Sayın {full_name(rng)}, {_title(rng.choice(CITIES))} şubemize yönlendiriyorum.",
+]
+
+
+def generate_document(rng: random.Random, size: int, density: float = 0.3) -> str:
+    """Yaklaşık `size` karakterlik transkript (density: PII içeren satır oranı, 0-1)"""
+    lines = []
+    length = 0
+    while length < size:
+        if rng.random() < density:
+            line = rng.choice(PII_LINES)(rng)
+        else:
+            line = rng.choice(FILLER_LINES)
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+def generate_corpus(docs: int, size: int, density: float = 0.3, seed: int = 42) -> List[str]:
+    """Aynı seed ile her zaman aynı belgeleri üretir"""
+    rng = random.Random(seed)
+    return [generate_document(rng, size, density) for _ in range(docs)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik çağrı merkezi korpusu üretir")
+    parser.add_argument('--docs', type=int, default=100, help='Belge sayısı')
+    parser.add_argument('--size', type=int, default=2000, help='Belge başına yaklaşık karakter')
+    parser.add_argument('--density', type=float, default=0.3, help='PII içeren satır oranı (0-1)')
+    parser.add_argument('--seed', type=int, default=42, help='Rastgelelik tohumu')
+    parser.add_argument('--output', '-o', help='JSONL çıktı dosyası (varsayılan: stdout)')
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.docs, args.size, args.density, args.seed)
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for text in corpus:
+            out.write(json.dumps({"text": text}, ensure_ascii=False) + "\n")
+    finally:
+        if args.output:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Paketi
+
+Sentetik çağrı merkezi korpusu (benchmarks/corpus.py) üzerinde üç giriş
+noktasını ölçer ve sonuçları JSON olarak yazar:
+
+- anonymize: KVKKAnonymizer.anonymize() (süreç içi)
+- api:       POST /anonymize (belge başına) ve POST /anonymize/batch (Flask test istemcisi)
+- cli:       main.py --file ve main.py --file --stream (ayrı process, başlatma dahil)
+
+Her hedef için: docs/s, MB/s (UTF-8), gecikme yüzdelikleri (p50/p90/p99/max),
+tepe bellek (tracemalloc ile ayrı bir geçişte; CLI için process max RSS).
+anonymize hedefi ayrıca detector başına süre, aday ve sonuç sayılarını
+(engine/metrics.py) ve triage atlamalarını raporlar.
+
+--baseline ile önceki bir sonuç dosyası verilirse docs/s değeri
+--tolerance oranından fazla düşen hedefler listelenir ve çıkış kodu 1 olur.
+
+Kullanım:
+    python benchmarks/run_suite.py --output results.json
+    python benchmarks/run_suite.py --docs 500 --size 5000 --density 0.5 --targets anonymize api
+    python benchmarks/run_suite.py --baseline results.json --tolerance 0.15
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import generate_corpus
+
+
+TARGETS = ('anonymize', 'api', 'cli')
+MB = 1024 * 1024
+
+
+def percentiles(latencies):
+    """Gecikme yüzdelikleri (ms)"""
+    ordered = sorted(latencies)
+    if not ordered:
+        return {}
+
+    def at(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "p50_ms": at(0.50),
+        "p90_ms": at(0.90),
+        "p99_ms": at(0.99),
+        "max_ms": ordered[-1] * 1000,
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+    }
+
+
+def throughput(docs, size_bytes, elapsed):
+    return {
+        "docs": docs,
+        "bytes": size_bytes,
+        "seconds": elapsed,
+        "docs_per_s": docs / elapsed if elapsed else None,
+        "mb_per_s": size_bytes / MB / elapsed if elapsed else None,
+    }
+
+
+def timed(fn, items):
+    """fn'i her öğe için çalıştırır; (toplam süre, öğe başına gecikmeler)"""
+    latencies = []
+    clock = time.perf_counter
+    start = clock()
+    for item in items:
+        begin = clock()
+        fn(item)
+        latencies.append(clock() - begin)
+    return clock() - start, latencies
+
+
+def peak_memory(fn, items):
+    """Python yığınındaki tepe bellek (tracemalloc, bayt)"""
+    tracemalloc.start()
+    try:
+        for item in items:
+            fn(item)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_anonymize(corpus, args):
+    from anonymizer import KVKKAnonymizer
+
+    anonymizer = KVKKAnonymizer(enable_name_detection=not args.no_names, metrics=True)
+    anonymizer.anonymize(corpus[0])
+    anonymizer.metrics.reset()
+    anonymize = anonymizer.anonymize
+
+    elapsed, latencies = timed(anonymize, corpus)
+    snapshot = anonymizer.metrics.snapshot()
+    detector_total = sum(d["duration"]["sum"] for d in snapshot["detectors"].values()) or 1.0
+    detectors = {
+        name: {
+            "seconds": stats["duration"]["sum"],
+            "share": stats["duration"]["sum"] / detector_total,
+            "runs": stats["duration"]["count"],
+            "candidates": stats["candidates"],
+            "entities": stats["entities"],
+            "errors": stats["errors"],
+        }
+        for name, stats in snapshot["detectors"].items()
+    }
+    result = throughput(len(corpus), sum(len(text.encode('utf-8')) for text in corpus), elapsed)
+    result.update(percentiles(latencies))
+    result["peak_memory_bytes"] = peak_memory(anonymize, corpus[:args.memory_docs])
+    result["detectors"] = detectors
+    if anonymizer.triage is not None:
+        result["triage"] = anonymizer.triage.stats()
+    return result
+
+
+def bench_api(corpus, args):
+    import api
+
+    client = api.app.test_client()
+    size_bytes = sum(len(text.encode('utf-8')) for text in corpus)
+
+    def post_one(text):
+        response = client.post('/anonymize', json={"text": text})
+        assert response.status_code == 200, response.data
+
+    post_one(corpus[0])
+    elapsed, latencies = timed(post_one, corpus)
+    single = throughput(len(corpus), size_bytes, elapsed)
+    single.update(percentiles(latencies))
+    single["peak_memory_bytes"] = peak_memory(post_one, corpus[:args.memory_docs])
+
+    batches = [corpus[i:i + args.batch_size] for i in range(0, len(corpus), args.batch_size)]
+
+    def post_batch(texts):
+        response = client.post('/anonymize/batch', json={"texts": texts})
+        assert response.status_code == 200, response.data
+
+    elapsed, latencies = timed(post_batch, batches)
+    batch = throughput(len(corpus), size_bytes, elapsed)
+    batch.update({f"batch_{key}": value for key, value in percentiles(latencies).items()})
+    batch["batch_size"] = args.batch_size
+    return {"anonymize": single, "batch": batch}
+
+
+def run_process(command):
+    """Komutu çalıştırır; (süre, tepe RSS bayt veya None)"""
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if hasattr(os, 'wait4'):
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        # Linux'ta ru_maxrss KB, macOS'ta bayt
+        rss = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    else:
+        process.wait()
+        rss = None
+    elapsed = time.perf_counter() - start
+    if process.returncode != 0:
+        raise RuntimeError(f"Komut başarısız ({process.returncode}): {' '.join(command)}")
+    return elapsed, rss
+
+
+def bench_cli(corpus, args):
+    main_py = os.path.join(ROOT, 'main.py')
+    flags = ['--no-names'] if args.no_names else []
+    files = corpus[:args.cli_docs]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = []
+        for i, text in enumerate(files):
+            path = os.path.join(workdir, f'doc_{i}.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            paths.append(path)
+
+        # Belge başına bir process: başlatma maliyeti dahil
+        latencies, peak = [], 0
+        for path in paths:
+            elapsed, rss = run_process([sys.executable, main_py, '--file', path,
+                                        '--output', path + '.out'] + flags)
+            latencies.append(elapsed)
+            peak = max(peak, rss or 0)
+        per_file = throughput(len(paths), sum(len(t.encode('utf-8')) for t in files), sum(latencies))
+        per_file.update(percentiles(latencies))
+        per_file["peak_rss_bytes"] = peak or None
+
+        # Tüm korpus tek dosyada, --stream ile
+        joined = os.path.join(workdir, 'corpus.txt')
+        with open(joined, 'w', encoding='utf-8') as f:
+            f.write("\n".join(corpus))
+        elapsed, rss = run_process([sys.executable, main_py, '--file', joined,
+                                    '--output', joined + '.out', '--stream'] + flags)
+        stream = throughput(len(corpus), os.path.getsize(joined), elapsed)
+        stream["peak_rss_bytes"] = rss
+
+    return {"file": per_file, "stream": stream}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def headline(results):
+    """Hedef başına karşılaştırılan docs/s değerleri"""
+    values = {}
+    for target, result in results.items():
+        if "docs_per_s" in result:
+            values[target] = result["docs_per_s"]
+        else:
+            for mode, sub in result.items():
+                values[f"{target}.{mode}"] = sub["docs_per_s"]
+    return values
+
+
+def compare(baseline_path, results, tolerance):
+    """docs/s değeri tolerance oranından fazla düşen hedefler"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = headline(json.load(f)["results"])
+    regressions = []
+    for name, value in headline(results).items():
+        before = baseline.get(name)
+        if before and value is not None and value < before * (1 - tolerance):
+            regressions.append({"target": name, "baseline_docs_per_s": before,
+                                "docs_per_s": value, "change": value / before - 1})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KVKK Anonymizer benchmark paketi")
+    parser.add_argument('--docs', type=int, default=200, help='Belge sayısı')
+    parser.add_argument('--size', type=int, default=2000, help='Belge başına yaklaşık karakter')
+    parser.add_argument('--density', type=float, default=0.3, help='PII içeren satır oranı (0-1)')
+    parser.add_argument('--seed', type=int, default=42, help='Korpus tohumu')
+    parser.add_argument('--targets', nargs='+', choices=TARGETS, default=list(TARGETS),
+                        help='Ölçülecek giriş noktaları')
+    parser.add_argument('--batch-size', type=int, default=32, help='/anonymize/batch istek başına belge')
+    parser.add_argument('--cli-docs', type=int, default=5, help='CLI için ayrı process ile işlenecek belge sayısı')
+    parser.add_argument('--memory-docs', type=int, default=20, help='Tepe bellek geçişindeki belge sayısı')
+    parser.add_argument('--no-names', action='store_true', help='İsim / AI NER tespiti olmadan çalıştır')
+    parser.add_argument('--output', '-o', help='JSON sonuç dosyası (varsayılan: stdout)')
+    parser.add_argument('--baseline', help='Karşılaştırılacak önceki sonuç dosyası')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='İzin verilen docs/s düşüşü (varsayılan: 0.10)')
+    args = parser.parse_args()
+
+    # Model yüklü değilse AI NER her metinde hata loglar; ölçüm çıktısını kirletmesin
+    logging.getLogger('AINERDetector').setLevel(logging.CRITICAL)
+
+    corpus = generate_corpus(args.docs, args.size, args.density, args.seed)
+    benches = {'anonymize': bench_anonymize, 'api': bench_api, 'cli': bench_cli}
+    results = {}
+    for target in args.targets:
+        print(f"[{target}] {len(corpus)} belge ölçülüyor...", file=sys.stderr)
+        results[target] = benches[target](corpus, args)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "corpus": {"docs": args.docs, "size": args.size, "density": args.density, "seed": args.seed,
+                       "bytes": sum(len(text.encode('utf-8')) for text in corpus)},
+            "names": not args.no_names,
+        },
+        "results": results,
+    }
+    if args.baseline:
+        report["regressions"] = compare(args.baseline, results, args.tolerance)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for name, value in headline(results).items():
+        print(f"{name:<20} {value:>10.1f} docs/s", file=sys.stderr)
+    if report.get("regressions"):
+        for regression in report["regressions"]:
+            print(f"GERİLEME: {regression['target']} {regression['change']:+.1%}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 # KVKK Veri Anonimleştirme Sistemi Konfigürasyonu - Genişletilmiş
 
+import os
 from enum import Enum
-from typing import Dict
+from typing import Dict, FrozenSet, Optional
 
 class EntityType(Enum):
     """Tespit edilebilecek kişisel veri tipleri - TAM LİSTE"""
@@ -220,3 +221,115 @@ GENDER_KEYWORDS = [
     "male", "female", "man", "woman",
     "e", "k",  # kısaltmalar (context ile)
 ]
+
+# Detector profilleri: profilin maskelediği entity tipleri (None = tümü).
+# KVKKAnonymizer(profile=...) yalnızca bu tipleri üretebilen detector'ları kurar.
+DETECTOR_PROFILES: Dict[str, Optional[FrozenSet[EntityType]]] = {
+    "full": None,
+    # Kimlik, IBAN ve kart kontrolleri (ödeme / fatura akışları)
+    "financial": frozenset({
+        EntityType.TC_ID, EntityType.BANK_INFO, EntityType.BANK_NAME, EntityType.CARD_INFO,
+    }),
+    # Telefon, e-posta ve adres
+    "contact": frozenset({
+        EntityType.PHONE, EntityType.MOBILE_PHONE, EntityType.LANDLINE, EntityType.EMAIL,
+        EntityType.ADDRESS, EntityType.HOME_ADDRESS, EntityType.WORK_ADDRESS, EntityType.CITY_DISTRICT,
+    }),
+    # Kişi kimliği: ad / soyad, TC, doğum bilgileri, cinsiyet
+    "identity": frozenset({
+        EntityType.NAME, EntityType.SURNAME, EntityType.FULL_NAME, EntityType.PARENT_NAME,
+        EntityType.TC_ID, EntityType.PASSPORT, EntityType.BIRTH_DATE, EntityType.BIRTH_YEAR,
+        EntityType.GENDER,
+    }),
+}
+
+
+# ---- Çalışma zamanı ayarları (ortam değişkenleri ile değiştirilebilir) ----
+
+# /anonymize/batch process havuzu worker sayısı: "0" = kapalı, "auto" = çekirdek sayısı
+BATCH_WORKERS = os.environ.get("KVKK_BATCH_WORKERS", "0")
+
+# Havuzun devreye girdiği en küçük batch boyutu (küçük batch'lerde IPC maliyeti baskın)
+BATCH_POOL_MIN_TEXTS = int(os.environ.get("KVKK_BATCH_POOL_MIN_TEXTS", "4"))
+
+# /anonymize/stream (NDJSON): aynı anda işlenen en fazla satır; dolunca girdi okunmaz
+STREAM_MAX_IN_FLIGHT = int(os.environ.get("KVKK_STREAM_MAX_IN_FLIGHT", "64"))
+
+# KVKKAnonymizer.anonymize_many (engine/batching.py): bu uzunluğa kadar olan metinler
+# ortak tamponda taranır; tampon başına en fazla BATCH_BUFFER_CHARS karakter
+BATCH_TEXT_MAX_CHARS = int(os.environ.get("KVKK_BATCH_TEXT_MAX_CHARS", "4096"))
+BATCH_BUFFER_CHARS = int(os.environ.get("KVKK_BATCH_BUFFER_CHARS", "32768"))
+
+# AI NER backend'i: "transformers" (yerel torch), "onnx" / "numpy" (torch'suz yerel CPU),
+# "cloud" (Hugging Face Inference API), "none" (kapalı)
+NER_BACKEND = os.environ.get("KVKK_NER_BACKEND", "transformers")
+NER_MODEL_NAME = "savasy/bert-base-turkish-ner-cased"
+# onnx / numpy backend'lerinin model klasörü (tools/export_ner_model.py çıktısı)
+NER_MODEL_DIR = os.environ.get(
+    "KVKK_NER_MODEL_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "ner")
+)
+# cloud backend
+NER_API_URL = os.environ.get(
+    "KVKK_NER_API_URL",
+    "https://api-inference.huggingface.co/models/" + NER_MODEL_NAME
+)
+NER_API_TOKEN = os.environ.get("KVKK_NER_API_TOKEN")
+# cloud istemcisi: (bağlantı, okuma) zaman aşımları (saniye) ve bağlantı havuzu boyutu
+NER_API_CONNECT_TIMEOUT = float(os.environ.get("KVKK_NER_API_CONNECT_TIMEOUT", "3.05"))
+NER_API_READ_TIMEOUT = float(os.environ.get("KVKK_NER_API_READ_TIMEOUT", "10"))
+NER_API_POOL_SIZE = int(os.environ.get("KVKK_NER_API_POOL_SIZE", "10"))
+# Eşzamanlı metinler tek `inputs: [...]` isteğinde birleştirilir
+NER_API_MAX_BATCH = int(os.environ.get("KVKK_NER_API_MAX_BATCH", "16"))
+NER_API_BATCH_WINDOW_MS = float(os.environ.get("KVKK_NER_API_BATCH_WINDOW_MS", "5"))
+# Devre kesici: art arda bu kadar hata -> NER bu süre (saniye) boyunca atlanır
+NER_BREAKER_FAILURES = int(os.environ.get("KVKK_NER_BREAKER_FAILURES", "3"))
+NER_BREAKER_RESET = float(os.environ.get("KVKK_NER_BREAKER_RESET", "30"))
+
+# Sonuç önbelleği (engine/result_cache.py): kayıt sayısı, 0 = kapalı
+RESULT_CACHE_SIZE = int(os.environ.get("KVKK_RESULT_CACHE_SIZE", "0"))
+# Kayıt ömrü (saniye, 0 = süresiz) ve process içi bellek sınırı (MB)
+RESULT_CACHE_TTL = float(os.environ.get("KVKK_RESULT_CACHE_TTL", "3600"))
+RESULT_CACHE_MAX_MB = float(os.environ.get("KVKK_RESULT_CACHE_MAX_MB", "64"))
+# Opsiyonel paylaşımlı katman: process'ler arası ortak SQLite dosyası
+RESULT_CACHE_PATH = os.environ.get("KVKK_RESULT_CACHE_PATH") or None
+
+# AI NER ham yanıt önbelleği (aynı metin için model / API tekrar çağrılmaz), 0 = kapalı
+NER_CACHE_SIZE = int(os.environ.get("KVKK_NER_CACHE_SIZE", "2048"))
+NER_CACHE_TTL = float(os.environ.get("KVKK_NER_CACHE_TTL", "3600"))
+
+# Triage (engine/triage.py): metinde hiçbir şey bulamayacak detector'lar atlanır, "0" = kapalı
+TRIAGE_ENABLED = os.environ.get("KVKK_TRIAGE", "1") != "0"
+# AI NER triage'ı: varsayılan olarak yalnızca büyük harf içermeyen metinler atlanır.
+# "1": cümle başı dışında büyük harfli kelime veya sözlük adı yoksa da atlanır;
+# daha az model çağrısı ama KAYIPLI (sözlükte olmayan cümle başı adlar kaçabilir)
+NER_TRIAGE_HEURISTIC = os.environ.get("KVKK_NER_TRIAGE_HEURISTIC", "0") == "1"
+
+# Async sunucu (asgi.py): detector işleri CPU havuzunda, bulut NER çağrıları
+# ayrı I/O havuzunda bekler; bağlantılar event loop'ta tutulur
+ASGI_CPU_THREADS = int(os.environ.get("KVKK_ASGI_CPU_THREADS", "0"))  # 0 = çekirdek sayısı
+ASGI_IO_THREADS = int(os.environ.get("KVKK_ASGI_IO_THREADS", "64"))
+ASGI_MAX_BODY = int(os.environ.get("KVKK_ASGI_MAX_BODY", str(64 * 1024 * 1024)))  # bayt
+
+# Pipeline metrikleri (engine/metrics.py, /metrics): detector süreleri ve sayaçlar, "0" = kapalı
+METRICS_ENABLED = os.environ.get("KVKK_METRICS", "1") != "0"
+
+# Varsayılan detector profili (DETECTOR_PROFILES); API isteklerde "profile" ile değiştirilebilir
+DETECTOR_PROFILE = os.environ.get("KVKK_DETECTOR_PROFILE", "full")
+
+# Oturumlu (artımlı) /anonymize (engine/incremental.py): process içi oturum sayısı,
+# boşta kalma ömrü (saniye, 0 = süresiz) ve bellek sınırı (MB)
+SESSION_MAX = int(os.environ.get("KVKK_SESSION_MAX", "1024"))
+SESSION_TTL = float(os.environ.get("KVKK_SESSION_TTL", "1800"))
+SESSION_MAX_MB = float(os.environ.get("KVKK_SESSION_MAX_MB", "256"))
+# Değişen bölgenin her iki yanında yeniden taranan satır sayısı
+# (PartialDataDetector 4 satır geriye bakar)
+SESSION_CONTEXT_LINES = int(os.environ.get("KVKK_SESSION_CONTEXT_LINES", "6"))
+
+# Başlangıç snapshot'ı (engine/snapshot.py, tools/build_snapshot.py): derlenmiş
+# pattern'ler ve sözlük trie'si tek dosyadan okunur; boş = kapalı
+SNAPSHOT_PATH = os.environ.get("KVKK_SNAPSHOT") or None
+
+# Derlenmiş sözlük dosyası (nlp/compiled_gazetteer.py, tools/build_gazetteer.py):
+# isim / il / ilçe / banka sözlükleri mmap ile açılır ve process'ler arasında paylaşılır
+GAZETTEER_PATH = os.environ.get("KVKK_GAZETTEER") or None
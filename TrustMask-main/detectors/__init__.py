@@ -1,25 +1,30 @@
 """
 KVKK Veri Anonimleştirme - Detector Modülleri - TAM LİSTE
+
+Paket import edilince detector modülleri yüklenmez; aşağıdaki adlar ilk
+erişimde kendi modüllerinden alınır.
 """
 
-from detectors.base_detector import BaseDetector
-from detectors.tc_kimlik_detector import TCKimlikDetector
-from detectors.phone_detector import PhoneDetector
-from detectors.email_detector import EmailDetector
-from detectors.iban_detector import IBANDetector
-from detectors.credit_card_detector import CreditCardDetector
-from detectors.address_detector import AddressDetector
-from detectors.plate_detector import PlateDetector
-from detectors.date_detector import DateDetector
-from detectors.ip_detector import IPDetector
-from detectors.customer_id_detector import CustomerIDDetector
-from detectors.partial_data_detector import PartialDataDetector
-from detectors.extra_detectors import (
-    GenderDetector,
-    ParentNameDetector,
-    BankNameDetector,
-    CallRecordDetector,
-)
+import importlib
+
+_EXPORTS = {
+    'BaseDetector': 'detectors.base_detector',
+    'TCKimlikDetector': 'detectors.tc_kimlik_detector',
+    'PhoneDetector': 'detectors.phone_detector',
+    'EmailDetector': 'detectors.email_detector',
+    'IBANDetector': 'detectors.iban_detector',
+    'CreditCardDetector': 'detectors.credit_card_detector',
+    'AddressDetector': 'detectors.address_detector',
+    'PlateDetector': 'detectors.plate_detector',
+    'DateDetector': 'detectors.date_detector',
+    'IPDetector': 'detectors.ip_detector',
+    'CustomerIDDetector': 'detectors.customer_id_detector',
+    'PartialDataDetector': 'detectors.partial_data_detector',
+    'GenderDetector': 'detectors.extra_detectors',
+    'ParentNameDetector': 'detectors.extra_detectors',
+    'BankNameDetector': 'detectors.extra_detectors',
+    'CallRecordDetector': 'detectors.extra_detectors',
+}
 
 __all__ = [
     'BaseDetector',
@@ -39,3 +44,12 @@ __all__ = [
     'BankNameDetector',
     'CallRecordDetector',
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
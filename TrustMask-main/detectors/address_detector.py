@@ -18,6 +18,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from detectors.base_detector import BaseDetector
 from entities import DetectedEntity
 from config import EntityType, ADDRESS_KEYWORDS
+from nlp.gazetteer import CITY, DISTRICT, fold, get_gazetteer
 
 
 # Türkiye'nin 81 ili
@@ -105,200 +106,218 @@ ALL_DISTRICTS = ISTANBUL_DISTRICTS + ANKARA_DISTRICTS + IZMIR_DISTRICTS + \
 class AddressDetector(BaseDetector):
     """Adres bilgileri tespit edicisi - Genişletilmiş"""
     
-    def __init__(self):
-        super().__init__()
-        self.cities = set(TURKEY_CITIES)
-        self.districts = set(ALL_DISTRICTS)
-        self.keywords = ADDRESS_KEYWORDS
+    entity_types = frozenset({
+        EntityType.HOME_ADDRESS,
+        EntityType.WORK_ADDRESS,
+        EntityType.ADDRESS,
+        EntityType.CITY_DISTRICT,
+    })
     
-    def detect(self, text: str) -> List[DetectedEntity]:
-        entities = []
-        text_lower = text.lower()
-        
-        # Pattern 1: Ev adresi context
-        home_address_patterns = [
+    patterns = {
+        # Ev adresi context
+        'home_address': ([
             r'(?:ev\s*adres|ev\s*adresi|evimin\s*adresi|ikametgah|ikamet\s*adres)[\s:ıi\.]+(.{15,200}?)(?=\.|,|\n|$)',
             r'Ev\s*adresiniz[\s:]*\n?([A-Za-zÇçĞğİıÖöŞşÜü\s,\.:No\d]+?)(?=\n|$)',
             r'Ev\s*adresiniz[\s:]*([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)?\s+(?:mahallesi|mah\.?)[\s,]+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)?\s+(?:sokak|sokağı|sok\.?|cadde|caddesi|cad\.?)[\s,]+(?:No|no)[\s:\.]*\d+[\s,]+(?:Daire|daire|d\.)[\s:\.]*\d+)',
-        ]
-        
-        for pattern in home_address_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.HOME_ADDRESS,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.98
-                ))
-        
-        # Pattern 2: İş adresi context
-        work_address_patterns = [
+        ], re.IGNORECASE),
+        # İş adresi context
+        'work_address': ([
             r'(?:iş\s*adres|iş\s*adresi|işyeri\s*adres|ofis\s*adres|şirket\s*adres)[\s:ıi\.]+(.{15,200}?)(?=\.|,|\n|telefon|tel|e-?posta|mail|@|$)',
             r'İş\s*adresiniz[\s:]*\n?([A-Za-zÇçĞğİıÖöŞşÜü\s,\.:No\d]+?)(?=\n|$)',
             r'İş\s*adresiniz[\s:]*([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)?\s+(?:caddesi|cad\.?)[\s,]+(?:No|no)[\s:\.]*\d+[\s,]+(?:Ofis|ofis)[\s:\.]*\d+)',
-        ]
-        
-        for pattern in work_address_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.WORK_ADDRESS,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.98
-                ))
-        
-        # Ofis/Bina No pattern
-        office_patterns = [
+        ], re.IGNORECASE),
+        # Ofis/Bina No
+        'office': ([
             r'\b(?:Ofis|Büro|Daire|Kat)[\s:\.]*(\d+)\b',
-        ]
-        
-        for pattern in office_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.WORK_ADDRESS,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.90
-                ))
-        
-        # Pattern 3: Genel adres context
-        address_context_patterns = [
+        ], re.IGNORECASE),
+        # Genel adres context
+        'address_context': ([
             # @ işaretine kadar al (e-posta karışmasın)
             r'(?:adres|adresim|adresimiz|teslimat\s*adres|fatura\s*adres)[\s:ıi\.]+(.{15,200}?)(?=\.|,|\n|telefon|tel|e-?posta|mail|@|$)',
             # Tam adres formatı: "Barbaros Mahallesi, Deniz Sokak No:12 Daire:5"
             r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)?\s+(?:mahallesi|mah\.?)[\s,]+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)?\s+(?:sokak|sokağı|sok\.?|cadde|caddesi|cad\.?)[\s,]+(?:No|no)[\s:\.]*\d+[\s,]+(?:Daire|daire|d\.)[\s:\.]*\d+)',
             # İş adresi formatı: "Teknopark Caddesi No:45, Ofis:302"
             r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)?\s+(?:caddesi|cad\.?)[\s,]+(?:No|no)[\s:\.]*\d+[\s,]+(?:Ofis|ofis)[\s:\.]*\d+)',
-        ]
-        
-        for pattern in address_context_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                # E-posta check: eğer yakalanan değer "@" içeriyorsa veya bir domain ise atla
-                val = match.group(0) if match.groups() == () else match.group(1)
-                if '@' in val or '.com' in val:
-                    continue
-                    
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.ADDRESS,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.95
-                ))
-        
-        # Pattern 4: Mahalle pattern'leri
-        mahalle_patterns = [
+        ], re.IGNORECASE),
+        # Mahalle pattern'leri
+        'mahalle': ([
             r'([A-Za-zÇçĞğİıÖöŞşÜü\s]+)\s+(?:mahallesi|mah\.?)\b',
             r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)?)\s+(?:mahallesi|mah\.?)[\s,]+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)?)\s+(?:sokak|sokağı|sok\.?|cadde|caddesi|cad\.?)[\s,]+',  # "Barbaros Mahallesi, Deniz Sokak"
-        ]
-        
-        for pattern in mahalle_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.ADDRESS,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.90
-                ))
-        
-        # Pattern 5: Cadde/Sokak pattern'leri
-        street_patterns = [
+        ], re.IGNORECASE),
+        # Cadde/Sokak pattern'leri
+        'street': ([
             r'([A-Za-zÇçĞğİıÖöŞşÜü\s]+)\s+(?:caddesi|cad\.?|sokağı|sok\.?|bulvarı|blv\.?)\b',
             r'([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)?)\s+(?:sokak|sokağı|sok\.?)[\s,]+(?:No|no)[\s:\.]*(\d+)[\s,]+(?:Daire|daire|d\.)[\s:\.]*(\d+)',  # "Deniz Sokak No:12 Daire:5"
-        ]
-        
-        for pattern in street_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.ADDRESS,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.90
-                ))
-        
-        # Pattern 6: No/Daire pattern'leri
-        number_patterns = [
+        ], re.IGNORECASE),
+        # No/Daire pattern'leri
+        'number': ([
             r'\b(?:no|numara)[\s:\.]*(\d+)[\s/,]*(?:daire|d\.?|kat|k\.?)[\s:\.]*(\d+)',
             r'\bno[\s:\.]*(\d+)',
             r'\bdaire[\s:\.]*(\d+)',
-        ]
+        ], re.IGNORECASE),
+        # Posta kodu
+        'postal': ([
+            r'\b(\d{5})\s+([A-Za-zÇçĞğİıÖöŞşÜü]+(?:/[A-Za-zÇçĞğİıÖöŞşÜü]+)?)\b',
+            r'(?:posta\s*kodu|pk)[\s:\.]*(\d{5})',
+        ], re.IGNORECASE),
+        # İl/İlçe bilgisi
+        'city_district': ([
+            r'(?:il|ilçe|şehir)[\s:\.]+([A-Za-zÇçĞğİıÖöŞşÜü]+)',
+        ], re.IGNORECASE),
+        # İl/İlçe formatı: Kadıköy/İstanbul veya İstanbul / Ataşehir
+        'location_format': ([
+            r'\b([A-Za-zÇçĞğİıÖöŞşÜü]+)[\s/]+([A-Za-zÇçĞğİıÖöŞşÜü]+)\b',
+            r'([A-Za-zÇçĞğİıÖöŞşÜü]+)\s*/\s*([A-Za-zÇçĞğİıÖöŞşÜü]+)',
+        ], 0),
+        # Kadıköy/İstanbul, Çankaya, Ankara
+        'direct_location': ([r'\b([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)?)\s*(?:/|,)\s*([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\b'], 0),
+    }
+    
+    # Triage: rakamsız adres pattern'lerinin anahtar kelimeleri
+    trigger_keywords = ('adres', 'ikamet', 'mah', 'cad', 'sok', 'bulvar', 'blv')
+    
+    # Toplu tarama (engine/batching.py): eşleşme dışında metne bakılmaz
+    batch_safe = True
+    # İl/ilçe pattern'lerinin kelime sınıfı
+    _letter_run = re.compile(r'[A-Za-zÇçĞğİıÖöŞşÜü]+', re.IGNORECASE)
+    
+    def __init__(self):
+        super().__init__()
+        self.keywords = ADDRESS_KEYWORDS
+        # İl/ilçe sorguları paylaşılan sözlükten ("İstanbul", "ISPARTA" gibi yazımlar dahil);
+        # KVKK_GAZETTEER ile derlenmiş dosyadan (nlp/compiled_gazetteer.py)
+        self.gazetteer = get_gazetteer()
+        self.location_words = self.gazetteer.first_words(CITY | DISTRICT)
+    
+    def can_match(self, doc) -> bool:
+        # No/daire/posta kodu rakam, diğer pattern'ler anahtar kelime gerektirir
+        if doc.has_digits or doc.contains(self.trigger_keywords):
+            return True
+        # İl/ilçe pattern'leri ancak eşleşen kelime bir il/ilçe ise entity üretir
+        return any(fold(word) in self.location_words for word in self._letter_run.findall(doc.text))
+    
+    def _is_location(self, word: str) -> bool:
+        return bool(self.gazetteer.lookup(word) & (CITY | DISTRICT))
+    
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
+        entities = []
+        text_lower = text.lower()
+        
+        # Pattern 1: Ev adresi context
+        for match in matches['home_address']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.HOME_ADDRESS,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.98
+            ))
+        
+        # Pattern 2: İş adresi context
+        for match in matches['work_address']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.WORK_ADDRESS,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.98
+            ))
+        
+        # Ofis/Bina No pattern
+        for match in matches['office']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.WORK_ADDRESS,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.90
+            ))
+        
+        # Pattern 3: Genel adres context
+        for match in matches['address_context']:
+            # E-posta check: eğer yakalanan değer "@" içeriyorsa veya bir domain ise atla
+            val = match.group(0) if match.groups() == () else match.group(1)
+            if '@' in val or '.com' in val:
+                continue
+                
+            entities.append(DetectedEntity(
+                entity_type=EntityType.ADDRESS,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.95
+            ))
+        
+        # Pattern 4: Mahalle pattern'leri
+        for match in matches['mahalle']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.ADDRESS,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.90
+            ))
+        
+        # Pattern 5: Cadde/Sokak pattern'leri
+        for match in matches['street']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.ADDRESS,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.90
+            ))
+        
+        # Pattern 6: No/Daire pattern'leri
+        for match in matches['number']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.ADDRESS,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.85
+            ))
+        
+        # Pattern 7: Posta kodu
+        for match in matches['postal']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.ADDRESS,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.88
+            ))
         
-        for pattern in number_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        # Pattern 8: İl/İlçe bilgisi
+        for match in matches['city_district']:
+            if self._is_location(match.group(1)):
                 entities.append(DetectedEntity(
-                    entity_type=EntityType.ADDRESS,
+                    entity_type=EntityType.CITY_DISTRICT,
                     value=match.group(0),
                     start_pos=match.start(),
                     end_pos=match.end(),
-                    confidence=0.85
+                    confidence=0.95
                 ))
         
-        # Pattern 7: Posta kodu
-        postal_patterns = [
-            r'\b(\d{5})\s+([A-Za-zÇçĞğİıÖöŞşÜü]+(?:/[A-Za-zÇçĞğİıÖöŞşÜü]+)?)\b',
-            r'(?:posta\s*kodu|pk)[\s:\.]*(\d{5})',
-        ]
-        
-        for pattern in postal_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        # Pattern 9: İl/İlçe formatı: Kadıköy/İstanbul veya İstanbul / Ataşehir
+        # "/" ile ayrılan çiftte tek il/ilçe yeter; yalnız boşlukla ayrılan
+        # çiftte ("Kadıköy İstanbul") iki kelime de il/ilçe olmalı, yoksa
+        # "İSTANBUL erkek", "Garanti İSTANBUL" gibi komşu kelimeler yutulur
+        for match in matches['location_format']:
+            first = self._is_location(match.group(1))
+            second = self._is_location(match.group(2))
+            if (first and second) or ((first or second) and '/' in text[match.end(1):match.start(2)]):
                 entities.append(DetectedEntity(
-                    entity_type=EntityType.ADDRESS,
+                    entity_type=EntityType.CITY_DISTRICT,
                     value=match.group(0),
                     start_pos=match.start(),
                     end_pos=match.end(),
-                    confidence=0.88
+                    confidence=0.85
                 ))
         
-        # Pattern 8: İl/İlçe bilgisi
-        city_district_patterns = [
-            r'(?:il|ilçe|şehir)[\s:\.]+([A-Za-zÇçĞğİıÖöŞşÜü]+)',
-        ]
-        
-        for pattern in city_district_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                location = match.group(1).lower()
-                if location in self.cities or location in self.districts:
-                    entities.append(DetectedEntity(
-                        entity_type=EntityType.CITY_DISTRICT,
-                        value=match.group(0),
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                        confidence=0.95
-                    ))
-        
-        # Pattern 9: İl/İlçe formatı: Kadıköy/İstanbul veya İstanbul / Ataşehir
-        location_format_patterns = [
-            r'\b([A-Za-zÇçĞğİıÖöŞşÜü]+)[\s/]+([A-Za-zÇçĞğİıÖöŞşÜü]+)\b',
-            r'([A-Za-zÇçĞğİıÖöŞşÜü]+)\s*/\s*([A-Za-zÇçĞğİıÖöŞşÜü]+)',
-        ]
-        
-        for pattern in location_format_patterns:
-            for match in re.finditer(pattern, text):
-                first = match.group(1).lower()
-                second = match.group(2).lower()
-                
-                if (first in self.cities or first in self.districts or 
-                    second in self.cities or second in self.districts):
-                    entities.append(DetectedEntity(
-                        entity_type=EntityType.CITY_DISTRICT,
-                        value=match.group(0),
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                        confidence=0.85
-                    ))
-        
         # Pattern 10: Direkt şehir/ilçe isimleri (büyük harfle başlayan)
-        direct_location_pattern = r'\b([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)?)\s*(?:/|,)\s*([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\b'
-        for match in re.finditer(direct_location_pattern, text):
-            first = match.group(1).lower()
-            second = match.group(2).lower()
-            if (first in self.cities or first in self.districts or 
-                second in self.cities or second in self.districts):
+        for match in matches['direct_location']:
+            if self._is_location(match.group(1)) or self._is_location(match.group(2)):
                 entities.append(DetectedEntity(
                     entity_type=EntityType.CITY_DISTRICT,
                     value=match.group(0),
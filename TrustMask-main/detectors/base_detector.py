@@ -1,32 +1,187 @@
 
-
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, FrozenSet, List, Pattern, Sequence, Tuple
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from config import SNAPSHOT_PATH, EntityType
 from entities import DetectedEntity
+from detectors.digit_runs import match_at, scan_digits
+from engine.snapshot import compile_pattern
+
+
+# Pattern grubu: (regex listesi, re flag'leri)
+PatternGroup = Tuple[Sequence[str], int]
+
+
+def compile_groups(groups: Dict[str, PatternGroup]) -> Dict[str, Tuple[Pattern, ...]]:
+    """{grup: ([pattern, ...], flags)} kaydını derlenmiş pattern'lere çevirir"""
+    return {
+        group: tuple(compile_pattern(pattern, flags) for pattern in pattern_list)
+        for group, (pattern_list, flags) in groups.items()
+    }
+
+
+class _CompiledGroups:
+    """compiled_patterns / compiled_extra_patterns: ilk erişimde derlenir
+
+    Yalnızca snapshot (KVKK_SNAPSHOT) verilmişse kullanılır: dosya ilk
+    derlemede okunur ve profilde olmayan veya hiç çalışmayan detector'ların
+    pattern'leri hiç kurulmaz. Snapshot yoksa pattern'ler sınıf
+    tanımlanırken derlenir; ilk istek derleme maliyeti ödemez.
+    """
+
+    __slots__ = ('source', 'compiled')
+
+    def __init__(self, source: str):
+        self.source = source
+        self.compiled = None
+
+    def __get__(self, instance, owner) -> Dict[str, Tuple[Pattern, ...]]:
+        if self.compiled is None:
+            self.compiled = compile_groups(getattr(owner, self.source))
+        return self.compiled
 
 
 class BaseDetector(ABC):
-    
+
+    # Detector'ın tam metin üzerinde çalıştırdığı regex grupları.
+    # {grup_adı: ([pattern, ...], flags)} - toplu mod (engine/batching.py) bu kaydı kullanır.
+    patterns: Dict[str, PatternGroup] = {}
+
+    # Tam metin taramasına girmeyen, detector'ın kendi çağırdığı pattern'ler
+    # (satır bazlı aramalar, küçük harfli metin üzerinde aramalar vb.)
+    extra_patterns: Dict[str, PatternGroup] = {}
+
+    # {grup_adı: (re.Pattern, ...)}, sınıf başına bir kez derlenir (bkz. _CompiledGroups)
+    compiled_patterns: Dict[str, Tuple[Pattern, ...]] = {}
+    compiled_extra_patterns: Dict[str, Tuple[Pattern, ...]] = {}
+    requires_digits: bool = False
+
+    # Rakam gerektiren gruplar: {grup_adı: en az rakam sayısı}. Gruptaki her
+    # eşleşme, tek bir rakam zincirinde (boşluk/tire/nokta/eğik çizgi ile
+    # gruplanmış) en az bu kadar rakam içermelidir; belgede böyle bir zincir
+    # yoksa grup çalıştırılmaz.
+    digit_groups: Dict[str, int] = {}
+
+    # Tüm pattern'leri \b + rakamla başlayan gruplar (digit_groups içinde
+    # olmalı). Bu gruplar yalnızca rakam dizisi başlangıçlarında denenir.
+    digit_anchored: FrozenSet[str] = frozenset()
+
+    # Triage (engine/triage.py): pattern'lerin eşleşebilmesi için metinde
+    # geçmesi gereken anahtar kelimeler (herhangi biri, büyük/küçük harf duyarsız)
+    trigger_keywords: Tuple[str, ...] = ()
+
+    # Toplu mod (engine/batching.py): detector, ayırıcıyla birleştirilmiş
+    # kısa metinler üzerinde tek seferde çalıştırılabilir mi. Yalnızca
+    # eşleşmeleri ve kararları eşleşme çevresindeki en fazla context_chars
+    # karaktere bağlı olan detector'lar işaretlenir; satır / diyalog bağlamı
+    # kullananlar metin başına çalışır.
+    batch_safe: bool = False
+    context_chars: int = 0
+
+    # Detector'ın üretebildiği entity tipleri. Profiller ve istek başına
+    # entity_types filtresi (KVKKAnonymizer) bu kümeyle kesişmeyen
+    # detector'ları hiç çalıştırmaz; boş küme "bilinmiyor" demektir ve
+    # detector her zaman çalışır.
+    entity_types: FrozenSet[EntityType] = frozenset()
+
+    # Tüm detector sınıfları: {sınıf adı: sınıf}
+    registry: Dict[str, type] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Pattern'ler sınıf başına bir kez derlenir; re cache'ine bağımlı değildir
+        if SNAPSHOT_PATH:
+            cls.compiled_patterns = _CompiledGroups('patterns')
+            cls.compiled_extra_patterns = _CompiledGroups('extra_patterns')
+        else:
+            cls.compiled_patterns = compile_groups(cls.patterns)
+            cls.compiled_extra_patterns = compile_groups(cls.extra_patterns)
+        # Tüm grupları rakam gerektiren detector rakamsız metinde hiçbir şey bulamaz
+        cls.requires_digits = bool(cls.digit_groups) and set(cls.digit_groups) >= set(cls.patterns)
+        BaseDetector.registry[cls.__name__] = cls
+
     def __init__(self):
         self.name = self.__class__.__name__
-    
-    @abstractmethod
+
+    @classmethod
+    def describe_patterns(cls) -> Dict[str, List[Tuple[str, int]]]:
+        """Kayıtlı pattern'leri (pattern, flags) olarak listeler"""
+        return {
+            group: [(compiled.pattern, compiled.flags) for compiled in compiled_list]
+            for registry in (cls.compiled_patterns, cls.compiled_extra_patterns)
+            for group, compiled_list in registry.items()
+        }
+
+    def can_match(self, doc) -> bool:
+        """Triage: bu metinde entity bulunması mümkün mü? (opsiyonel override)
+
+        doc: engine.triage.DocumentFeatures. False yalnızca eşleşme kesin
+        olarak imkânsızsa dönülmelidir; detector o metin için hiç çalışmaz.
+        """
+        if self.requires_digits:
+            return doc.has_digits
+        if self.trigger_keywords:
+            return doc.contains(self.trigger_keywords)
+        return True
+
     def detect(self, text: str) -> List[DetectedEntity]:
+        return self.detect_matches(text, self.scan(text))
+
+    def detect_into(self, text: str, buffer, source: int = -1, matches: Dict[str, list] = None) -> None:
+        """Adayları sütunlu tampona yazar (engine/candidates.py, CandidateBuffer)
+
+        matches verilmezse metin taranır. Varsayılan: detect / detect_matches
+        sonucu nesne olarak eklenir. Çok aday üreten detector'lar override
+        ederek adayları nesne oluşturmadan ekleyebilir.
+        """
+        entities = self.detect(text) if matches is None else self.detect_matches(text, matches)
+        buffer.extend(entities, source)
+
+    def scan(self, text: str) -> Dict[str, list]:
+        """Kayıtlı pattern gruplarını metin üzerinde tek tek çalıştırır
+
+        Her grup için eşleşmeler pattern sırasına göre (önce 1. pattern'in
+        tüm eşleşmeleri, sonra 2. pattern'in...) listelenir. digit_groups
+        tanımlayan detector'larda rakam indeksiyle gereksiz aramalar atlanır.
+        """
+        if not self.digit_groups:
+            return {
+                group: [match for compiled in compiled_list for match in compiled.finditer(text)]
+                for group, compiled_list in self.compiled_patterns.items()
+            }
+
+        index = scan_digits(text)
+        tables = {}
+        for group, compiled_list in self.compiled_patterns.items():
+            min_digits = self.digit_groups.get(group)
+            if min_digits is None:
+                tables[group] = [match for compiled in compiled_list for match in compiled.finditer(text)]
+            elif index.max_digits < min_digits:
+                tables[group] = []
+            elif group in self.digit_anchored:
+                starts = index.starts(min_digits)
+                tables[group] = [match for compiled in compiled_list for match in match_at(compiled, text, starts)]
+            else:
+                tables[group] = [match for compiled in compiled_list for match in compiled.finditer(text)]
+        return tables
+
+    @abstractmethod
+    def detect_matches(self, text: str, matches: Dict[str, list]) -> List[DetectedEntity]:
+        """Eşleşme tablosundan (scan() çıktısı) entity üret"""
         pass
-    
+
     def preprocess(self, text: str) -> str:
         """Metin ön işleme (opsiyonel override)"""
         return text
-    
+
     def validate(self, value: str) -> bool:
         """Tespit edilen değeri doğrula (opsiyonel override)"""
         return True
-    
+
     def normalize(self, value: str) -> str:
         """Değeri normalize et (opsiyonel override)"""
         return value.strip()
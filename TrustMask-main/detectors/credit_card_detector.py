@@ -19,6 +19,43 @@ from config import EntityType
 class CreditCardDetector(BaseDetector):
     """Kredi kartı numarası tespit edicisi"""
     
+    entity_types = frozenset({EntityType.CARD_INFO})
+    
+    patterns = {
+        # Düz 16 haneli
+        'number': ([
+            r'\b(\d{16})\b',
+            # 1234 5678 9012 3456
+            r'\b(\d{4})\s+(\d{4})\s+(\d{4})\s+(\d{4})\b',
+            # 1234-5678-9012-3456
+            r'\b(\d{4})[\-](\d{4})[\-](\d{4})[\-](\d{4})\b',
+            # 1234.5678.9012.3456
+            r'\b(\d{4})\.(\d{4})\.(\d{4})\.(\d{4})\b',
+        ], 0),
+        # Kart context ile
+        'context': ([
+            r'(?:kart|kredi\s*kart|banka\s*kart)[\s:\.ıi]*(?:no|numarası|numaram)?[\s:\.]*(\d{4}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{4})',
+            r'(?:kart|kredi\s*kart|banka\s*kart)[\s:\.ıi]*(?:no|numarası|numaram)?[\s:\.]*(\d{16})',
+        ], re.IGNORECASE),
+        # Maskelenmiş kart numaraları: 1234****5678, 1234-****-****-5678
+        'masked': ([
+            r'\b\d{4}[\s\-]?\*{4}[\s\-]?\*{4}[\s\-]?\d{4}\b',
+            r'\b\d{6}\*+\d{4}\b',
+        ], 0),
+        # Son kullanma tarihi ve CVV
+        'expiry': ([
+            r'(?:son\s*kullanma|SKT|s\.k\.t)[\s:\.]*(\d{2}[\s/\-]\d{2,4})',
+            r'(?:CVV|cvv|CVC|cvc|güvenlik\s*kodu)[\s:\.]*(\d{3,4})',
+        ], re.IGNORECASE),
+    }
+    
+    # Rakam indeksi (bkz. BaseDetector.digit_groups)
+    digit_groups = {'number': 16, 'context': 16, 'masked': 4, 'expiry': 3}
+    digit_anchored = frozenset({'number', 'masked'})
+    
+    # Toplu tarama (engine/batching.py): eşleşme dışında metne bakılmaz
+    batch_safe = True
+    
     def __init__(self):
         super().__init__()
         # Kart BIN numaraları (ilk 6 hane)
@@ -31,80 +68,51 @@ class CreditCardDetector(BaseDetector):
             '9792': 'Troy',  # Türk kartı
         }
     
-    def detect(self, text: str) -> List[DetectedEntity]:
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
         entities = []
         
         # Pattern 1: Düz 16 haneli
-        patterns = [
-            r'\b(\d{16})\b',
-            # 1234 5678 9012 3456
-            r'\b(\d{4})\s+(\d{4})\s+(\d{4})\s+(\d{4})\b',
-            # 1234-5678-9012-3456
-            r'\b(\d{4})[\-](\d{4})[\-](\d{4})[\-](\d{4})\b',
-            # 1234.5678.9012.3456
-            r'\b(\d{4})\.(\d{4})\.(\d{4})\.(\d{4})\b',
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, text):
-                card_num = self._extract_digits(match.group(0))
-                if len(card_num) == 16 and self.validate(card_num):
-                    entities.append(DetectedEntity(
-                        entity_type=EntityType.CARD_INFO,
-                        value=match.group(0),
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                        confidence=0.95
-                    ))
-        
-        # Pattern 2: Kart context ile
-        context_patterns = [
-            r'(?:kart|kredi\s*kart|banka\s*kart)[\s:\.ıi]*(?:no|numarası|numaram)?[\s:\.]*(\d{4}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{4})',
-            r'(?:kart|kredi\s*kart|banka\s*kart)[\s:\.ıi]*(?:no|numarası|numaram)?[\s:\.]*(\d{16})',
-        ]
-        
-        for pattern in context_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for match in matches['number']:
+            card_num = self._extract_digits(match.group(0))
+            if len(card_num) == 16 and self.validate(card_num):
                 entities.append(DetectedEntity(
                     entity_type=EntityType.CARD_INFO,
                     value=match.group(0),
                     start_pos=match.start(),
                     end_pos=match.end(),
-                    confidence=0.97
+                    confidence=0.95
                 ))
         
+        # Pattern 2: Kart context ile
+        for match in matches['context']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.CARD_INFO,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.97
+            ))
+        
         # Pattern 3: Maskelenmiş kart numaraları
         # 1234****5678, 1234-****-****-5678
-        masked_patterns = [
-            r'\b\d{4}[\s\-]?\*{4}[\s\-]?\*{4}[\s\-]?\d{4}\b',
-            r'\b\d{6}\*+\d{4}\b',
-        ]
-        
-        for pattern in masked_patterns:
-            for match in re.finditer(pattern, text):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.CARD_INFO,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.90
-                ))
+        for match in matches['masked']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.CARD_INFO,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.90
+            ))
         
         # Pattern 4: Son kullanma tarihi ve CVV (card ile birlikte)
-        expiry_patterns = [
-            r'(?:son\s*kullanma|SKT|s\.k\.t)[\s:\.]*(\d{2}[\s/\-]\d{2,4})',
-            r'(?:CVV|cvv|CVC|cvc|güvenlik\s*kodu)[\s:\.]*(\d{3,4})',
-        ]
-        
-        for pattern in expiry_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.CARD_INFO,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.85
-                ))
+        for match in matches['expiry']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.CARD_INFO,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.85
+            ))
         
         return self._remove_duplicates(entities)
     
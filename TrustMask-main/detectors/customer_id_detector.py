@@ -14,86 +14,43 @@ from config import EntityType, CUSTOMER_ID_KEYWORDS
 
 class CustomerIDDetector(BaseDetector):
     
-    def __init__(self):
-        super().__init__()
-        self.keywords = CUSTOMER_ID_KEYWORDS
+    entity_types = frozenset({
+        EntityType.CUSTOMER_ID,
+        EntityType.SUBSCRIPTION_ID,
+        EntityType.CONTRACT_ID,
+        EntityType.CALL_RECORD_ID,
+    })
     
-    def detect(self, text: str) -> List[DetectedEntity]:
-        entities = []
-        
-        # Pattern 1: Müşteri numarası
-        customer_patterns = [
+    patterns = {
+        # Müşteri numarası
+        'customer': ([
             r'(?:müşteri\s*(?:no|numarası|numaram|numaranız))[\s:\.#]*([A-Z0-9\-]{4,20})',
             r'(?:müşteri\s*(?:no|numarası|numaram|numaranız))[\s:\.#]*(\d{6,20})',  # Sadece sayı
             r'(?:hesap\s*bilgilerinize|hesap\s*bilgileriniz)[\s:\.]+[^\.]*?müşteri\s*numaranız[\s:\.]*(\d{6,20})',  # "Hesap bilgilerinize geçiyorum. Müşteri numaranız 78451236"
             r'müşteri\s*numaranız\s+(\d{6,20})',  # Direkt format
-        ]
-        
-        for pattern in customer_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.CUSTOMER_ID,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.98
-                ))
-        
-        # Pattern 2: Abonelik numarası
-        subscription_patterns = [
+        ], re.IGNORECASE),
+        # Abonelik numarası
+        'subscription': ([
             r'(?:abone\s*(?:no|numarası|numaram|numaranız))[\s:\.#]*([A-Z0-9\-]{4,20})',
             r'(?:abonelik\s*(?:no|numarası|numaram|numaranız))[\s:\.#]*([A-Z0-9\-]{4,20})',
             r'(?:abonelik\s*(?:no|numarası|numaram|numaranız))[\s:\.#]*([A-Z]{2,4}[\-]?[A-Z0-9]{4,15})',  # ABN-556789 formatı
-        ]
-        
-        for pattern in subscription_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.SUBSCRIPTION_ID,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.98
-                ))
-        
-        # Pattern 3: Sözleşme numarası
-        contract_patterns = [
+        ], re.IGNORECASE),
+        # Sözleşme numarası
+        'contract': ([
             r'(?:sözleşme\s*(?:no|numarası|numaram|numaranız))[\s:\.#]*([A-Z0-9\-]{4,20})',
             r'(?:kontrat\s*(?:no|numarası|numaram|numaranız))[\s:\.#]*([A-Z0-9\-]{4,20})',
             r'(?:sözleşme\s*(?:no|numarası|numaram))[\s:\.#]*([A-Z]{2,4}[\-]?\d{4}[\-]?[A-Z0-9]{4,15})',  # SOZ-2024-99128 formatı
-        ]
-        
-        for pattern in contract_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.CONTRACT_ID,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.98
-                ))
-        
-        # Pattern 4: Çağrı kayıt numarası
-        call_patterns = [
+        ], re.IGNORECASE),
+        # Çağrı kayıt numarası
+        'call': ([
             r'(?:çağrı\s*kayıt|çağrı\s*kaydı|çağrı\s*(?:no|numarası|numaram|numaranız))[\s:\.#]*([A-Z0-9\-]{4,20})',
             r'(?:arama\s*kayıt|arama\s*(?:no|numarası|numaram|numaranız))[\s:\.#]*([A-Z0-9\-]{4,20})',
             r'(?:görüşme\s*(?:no|numarası|kaydı|numaranız))[\s:\.#]*([A-Z0-9\-]{4,20})',
             r'(?:çağrı\s*kayıt|görüşmeye\s*ait)[\s:\.#]*([A-Z]{2}[\-]?\d{4}[\-]?[A-Z0-9]{4,15})',  # CR-2026-847291 formatı
             r'\b(CR[\-]?\d{4}[\-]?[A-Z0-9]{4,15})\b',  # Direkt format
-        ]
-        
-        for pattern in call_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.CALL_RECORD_ID,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.98
-                ))
-        
-        # Pattern 5: Diğer numara türleri (genel CUSTOMER_ID)
-        other_patterns = [
+        ], re.IGNORECASE),
+        # Diğer numara türleri (genel CUSTOMER_ID)
+        'other': ([
             r'(?:hesap\s*(?:no|numarası|numaram))[\s:\.#]*([A-Z0-9\-]{4,20})',
             r'(?:referans\s*(?:no|numarası))[\s:\.#]*([A-Z0-9\-]{4,20})',
             r'(?:sipariş\s*(?:no|numarası))[\s:\.#]*([A-Z0-9\-]{4,20})',
@@ -102,20 +59,9 @@ class CustomerIDDetector(BaseDetector):
             r'(?:hizmet\s*(?:no|numarası))[\s:\.#]*([A-Z0-9\-]{4,20})',
             r'(?:hat\s*(?:no|numarası|numaram))[\s:\.#]*([A-Z0-9\-]{4,20})',
             r'(?:ticket|tiket|talep\s*(?:no|numarası))[\s:\.#]*([A-Z0-9\-]{4,20})',
-        ]
-        
-        for pattern in other_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.CUSTOMER_ID,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.95
-                ))
-        
-        # Pattern 6: Operatör-spesifik ve Özel formatlar
-        operator_patterns = [
+        ], re.IGNORECASE),
+        # Operatör-spesifik ve özel formatlar
+        'operator': ([
             r'\b(VOD[\-]?[A-Z0-9]{6,15})\b',  # Vodafone
             r'\b(TC[\-]?[A-Z0-9]{6,15})\b',   # Turkcell
             r'\b(TT[\-]?[A-Z0-9]{6,15})\b',   # Türk Telekom
@@ -124,17 +70,91 @@ class CustomerIDDetector(BaseDetector):
             r'\b(ABN[\-]?[A-Z0-9]{6,15})\b',  # Abonelik
             r'\b(SOZ[\-]?[A-Z0-9]{6,15})\b',  # Sözleşme
             r'\b(CR[\-]?[A-Z0-9]{6,15})\b',   # Call Record
-        ]
+        ], re.IGNORECASE),
+    }
+    
+    # Triage: context pattern'lerinin anahtar kelimeleri
+    trigger_keywords = tuple(sorted({keyword.split()[0] for keyword in CUSTOMER_ID_KEYWORDS})) + (
+        'kontrat', 'arama', 'görüşme', 'hat', 'ticket', 'tiket', 'talep',
+    )
+    # Operatör formatlarının kelime başı önekleri (VOD..., TC..., CRM... - CR'yi kapsar)
+    trigger_prefixes = ('vod', 'tc', 'tt', 'cr', 'tkt', 'abn', 'soz')
+    
+    # Toplu tarama (engine/batching.py): eşleşme dışında metne bakılmaz
+    batch_safe = True
+    
+    def __init__(self):
+        super().__init__()
+        self.keywords = CUSTOMER_ID_KEYWORDS
+    
+    def can_match(self, doc) -> bool:
+        if doc.contains(self.trigger_keywords):
+            return True
+        prefixes = self.trigger_prefixes
+        return any(word.startswith(prefixes) for word in doc.words)
+    
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
+        entities = []
+        
+        # Pattern 1: Müşteri numarası
+        for match in matches['customer']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.CUSTOMER_ID,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.98
+            ))
+        
+        # Pattern 2: Abonelik numarası
+        for match in matches['subscription']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.SUBSCRIPTION_ID,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.98
+            ))
+        
+        # Pattern 3: Sözleşme numarası
+        for match in matches['contract']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.CONTRACT_ID,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.98
+            ))
         
-        for pattern in operator_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.CUSTOMER_ID,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.90
-                ))
+        # Pattern 4: Çağrı kayıt numarası
+        for match in matches['call']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.CALL_RECORD_ID,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.98
+            ))
+        
+        # Pattern 5: Diğer numara türleri (genel CUSTOMER_ID)
+        for match in matches['other']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.CUSTOMER_ID,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.95
+            ))
+        
+        # Pattern 6: Operatör-spesifik ve Özel formatlar
+        for match in matches['operator']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.CUSTOMER_ID,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.90
+            ))
         
         return self._remove_duplicates(entities)
     
@@ -0,0 +1,111 @@
+"""
+Diyalog İndeksi - Satır ofsetleri ve konuşmacı / tur bilgisi
+
+Satır bazlı çalışan detector'lar (ör. PartialDataDetector) için belge
+başına bir kez kurulan paylaşılan indeks:
+
+- lines / starts: '\\n' ile ayrılmış satırlar ve her satırın metindeki
+  başlangıç ofseti; bir pozisyonun satırı ikili aramayla bulunur
+- lower(i): küçük harfe çevrilmiş satır (ilk kullanımda hesaplanır)
+- speaker(i) / turn_of(i): satırın konuşmacısı ("agent", "customer") ve
+  tur numarası. "Temsilci:" / "Müşteri:" gibi etiketle başlayan satır yeni
+  tur açar; etiketsiz satırlar önceki turun devamıdır. Tur bilgisi ilk
+  kullanımda hesaplanır.
+
+Kurulum maliyeti metin boyuyla doğrusaldır (satır bölme ve ofsetler C
+düzeyinde hesaplanır).
+"""
+
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+
+# Rol -> satır başındaki konuşmacı etiketleri
+SPEAKER_LABELS: Dict[str, Tuple[str, ...]] = {
+    'agent': ('temsilci', 'operatör', 'operator', 'agent'),
+    'customer': ('müşteri', 'musteri', 'customer', 'arayan'),
+}
+
+_SPEAKER = re.compile(
+    r'\s*(?:' + '|'.join(f'(?P<{role}>{"|".join(labels)})' for role, labels in SPEAKER_LABELS.items())
+    + r')\s*:',
+    re.IGNORECASE
+)
+
+
+class DialogueIndex:
+    """Bir belgenin satır ve konuşmacı indeksi"""
+
+    __slots__ = ('text', 'lines', 'starts', '_lower', '_speakers', '_turns')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lines: List[str] = text.split('\n')
+        # i. satırın başlangıcı = önceki satır uzunlukları + ayırıcılar
+        self.starts = array('l', [0])
+        self.starts.extend(accumulate(map((1).__add__, map(len, self.lines[:-1]))))
+        self._lower: Dict[int, str] = {}
+        self._speakers: Optional[List[Optional[str]]] = None
+        self._turns: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def line_of(self, position: int) -> int:
+        """Pozisyonun bulunduğu satırın numarası"""
+        return bisect_right(self.starts, position) - 1
+
+    def lower(self, i: int) -> str:
+        line = self._lower.get(i)
+        if line is None:
+            line = self.lines[i].lower()
+            self._lower[i] = line
+        return line
+
+    def previous_lower(self, i: int, count: int) -> List[str]:
+        """i. satırdan önceki en fazla count satır (küçük harf, yakından uzağa)"""
+        return [self.lower(k) for k in range(i - 1, max(i - count, 0) - 1, -1)]
+
+    def speaker(self, i: int) -> Optional[str]:
+        """Satırın ait olduğu turun konuşmacı rolü (etiketsiz belge başında None)"""
+        if self._speakers is None:
+            self._index_turns()
+        return self._speakers[i]
+
+    def turn_of(self, i: int) -> int:
+        """Satırın tur numarası (ilk etiketli satırdan önceki satırlar 0. tur)"""
+        if self._turns is None:
+            self._index_turns()
+        return self._turns[i]
+
+    def _index_turns(self) -> None:
+        speakers = []
+        turns = array('l')
+        speaker, turn = None, 0
+        match = _SPEAKER.match
+        for line in self.lines:
+            label = match(line)
+            if label:
+                speaker = label.lastgroup
+                turn += 1
+            speakers.append(speaker)
+            turns.append(turn)
+        self._speakers = speakers
+        self._turns = turns
+
+
+_last_index = threading.local()
+
+
+def scan_dialogue(text: str) -> DialogueIndex:
+    """Diyalog indeksi; aynı metin için sonuç thread başına tekrar kullanılır"""
+    last = getattr(_last_index, 'result', None)
+    if last is not None and last.text is text:
+        return last
+    result = DialogueIndex(text)
+    _last_index.result = result
+    return result
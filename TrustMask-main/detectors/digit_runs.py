@@ -0,0 +1,102 @@
+"""
+Rakam Dizisi İndeksi - Sayısal detector'lar için paylaşılan ön tarama
+
+Metindeki tüm rakam dizileri (\\d+) ve boşluk, tire, nokta veya eğik çizgi
+ile gruplanmış zincirler ("0532 123 45 67", "12.03.1988", "4111-1111-...")
+belge başına tek geçişte indekslenir; her zincirin pozisyonu ve normalize
+edilmiş rakamları tutulur.
+
+Sayısal detector'lar bu indeksi BaseDetector.scan() üzerinden kullanır:
+- Belgede yeterince uzun rakam zinciri yoksa (hiç rakam yoksa tümü)
+  rakam gerektiren pattern grupları hiç çalıştırılmaz
+- Rakamla başlayan pattern'ler (\\b\\d...) tüm metinde aranmak yerine
+  yalnızca aday dizi başlangıçlarında denenir; sonuç re.finditer ile
+  birebir aynıdır
+"""
+
+import re
+import threading
+from typing import Iterator, List, Pattern, Sequence, Tuple
+
+
+# Rakam parçalarını aynı zincirde birleştiren ayraçlar. Sayısal pattern'lerin
+# parçalar arasında izin verdiği tüm ayraçları kapsamalıdır.
+_CHAIN = re.compile(r'\d+(?:[\s\-\./]+\d+)*')
+_RUN = re.compile(r'\d+')
+
+
+class DigitIndex:
+    """Bir belgenin rakam dizisi indeksi
+
+    chains:     gruplanmış zincirler [(start, end, rakamlar), ...]
+    runs:       kesintisiz rakam dizileri [(start, end, kalan), ...];
+                kalan = dizinin başından zincir sonuna kadarki rakam sayısı
+    max_digits: en uzun zincirdeki rakam sayısı (rakam yoksa 0)
+    """
+
+    __slots__ = ('text', 'chains', 'runs', 'max_digits')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.chains: List[Tuple[int, int, str]] = []
+        self.runs: List[Tuple[int, int, int]] = []
+        self.max_digits = 0
+
+        for chain in _CHAIN.finditer(text):
+            parts = [run.span() for run in _RUN.finditer(text, chain.start(), chain.end())]
+            digits = ''.join(text[start:end] for start, end in parts)
+            self.chains.append((chain.start(), chain.end(), digits))
+            remaining = len(digits)
+            for start, end in parts:
+                self.runs.append((start, end, remaining))
+                remaining -= end - start
+            if len(digits) > self.max_digits:
+                self.max_digits = len(digits)
+
+    @property
+    def has_digits(self) -> bool:
+        return self.max_digits > 0
+
+    def starts(self, min_digits: int = 1) -> List[int]:
+        """Zincir sonuna kadar en az `min_digits` rakam içeren dizi başlangıçları"""
+        return [start for start, _, remaining in self.runs if remaining >= min_digits]
+
+
+def match_at(compiled: Pattern, text: str, starts: Sequence[int]) -> Iterator:
+    """Pattern'i yalnızca aday pozisyonlarda dener (re.finditer semantiği)
+
+    Eşleşmeleri yalnızca adaylardan birinde başlayabilen pattern'ler için
+    compiled.finditer(text) ile aynı sonucu verir: eşleşmeler örtüşmez ve
+    bir sonraki eşleşme önceki eşleşmenin bittiği yerden sonra aranır.
+    """
+    end = 0
+    for start in starts:
+        if start < end:
+            continue
+        match = compiled.match(text, start)
+        if match:
+            yield match
+            end = match.end()
+
+
+def max_digits(text: str) -> int:
+    """En uzun zincirdeki rakam sayısı (DigitIndex(text).max_digits, indeks kurmadan)"""
+    best = 0
+    for chain in _CHAIN.findall(text):
+        count = sum(map(len, _RUN.findall(chain)))
+        if count > best:
+            best = count
+    return best
+
+
+_last_index = threading.local()
+
+
+def scan_digits(text: str) -> DigitIndex:
+    """Rakam indeksi; aynı metin için sonuç thread başına tekrar kullanılır"""
+    last = getattr(_last_index, 'result', None)
+    if last is not None and last.text is text:
+        return last
+    result = DigitIndex(text)
+    _last_index.result = result
+    return result
@@ -17,6 +17,27 @@ from config import EntityType
 class EmailDetector(BaseDetector):
     """E-posta adresi tespit edicisi"""
     
+    entity_types = frozenset({EntityType.EMAIL})
+    
+    patterns = {
+        # username@domain.tld formatı - Türkçe karakterleri de destekler
+        'email': ([r'\b[A-ZÇĞİÖŞÜa-zçğıöşü0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'], re.IGNORECASE),
+        # "mail adresim xxx@xxx.com" gibi
+        'context': ([
+            r'(?:e-?posta|mail|email|eposta)[\s:\.]*(?:adres|adresi|adresim)?[\s:\.]*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})',
+        ], re.IGNORECASE),
+        # ahmet[at]gmail[dot]com, ahmet (at) gmail (dot) com
+        'obfuscated': ([
+            r'\b[A-Za-z0-9._%+-]+\s*[\[\(]?\s*(?:at|@)\s*[\]\)]?\s*[A-Za-z0-9.-]+\s*[\[\(]?\s*(?:dot|\.)\s*[\]\)]?\s*[A-Za-z]{2,}\b',
+        ], re.IGNORECASE),
+    }
+    
+    def can_match(self, doc) -> bool:
+        # '@' ya da gizlenmiş yazım için "at" + ("dot" veya '.') gerekir
+        if '@' in doc.text:
+            return True
+        return doc.contains(('at',)) and ('.' in doc.text or doc.contains(('dot',)))
+    
     def __init__(self):
         super().__init__()
         # Yaygın e-posta domain'leri
@@ -30,15 +51,13 @@ class EmailDetector(BaseDetector):
             'vodafone.com.tr', 'turkcell.com.tr', 'turktelekom.com.tr'
         }
     
-    def detect(self, text: str) -> List[DetectedEntity]:
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
         entities = []
         
         # E-posta pattern'i
         # username@domain.tld formatı
         # Türkçe karakterleri de destekleyen regex
-        email_pattern = r'\b[A-ZÇĞİÖŞÜa-zçğıöşü0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
-        
-        for match in re.finditer(email_pattern, text, re.IGNORECASE):
+        for match in matches['email']:
             email = match.group(0)
             if self.validate(email):
                 entities.append(DetectedEntity(
@@ -51,38 +70,28 @@ class EmailDetector(BaseDetector):
         
         # E-posta context ile
         # "mail adresim xxx@xxx.com" gibi
-        context_patterns = [
-            r'(?:e-?posta|mail|email|eposta)[\s:\.]*(?:adres|adresi|adresim)?[\s:\.]*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})',
-        ]
-        
-        for pattern in context_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                email = match.group(1)
-                if self.validate(email):
-                    entities.append(DetectedEntity(
-                        entity_type=EntityType.EMAIL,
-                        value=match.group(0),
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                        confidence=0.99
-                    ))
-        
-        # E-posta benzeri yazımlar
-        # ahmet[at]gmail[dot]com, ahmet (at) gmail (dot) com
-        obfuscated_patterns = [
-            r'\b[A-Za-z0-9._%+-]+\s*[\[\(]?\s*(?:at|@)\s*[\]\)]?\s*[A-Za-z0-9.-]+\s*[\[\(]?\s*(?:dot|\.)\s*[\]\)]?\s*[A-Za-z]{2,}\b',
-        ]
-        
-        for pattern in obfuscated_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for match in matches['context']:
+            email = match.group(1)
+            if self.validate(email):
                 entities.append(DetectedEntity(
                     entity_type=EntityType.EMAIL,
                     value=match.group(0),
                     start_pos=match.start(),
                     end_pos=match.end(),
-                    confidence=0.85
+                    confidence=0.99
                 ))
         
+        # E-posta benzeri yazımlar
+        # ahmet[at]gmail[dot]com, ahmet (at) gmail (dot) com
+        for match in matches['obfuscated']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.EMAIL,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.85
+            ))
+        
         return self._remove_duplicates(entities)
     
     def validate(self, email: str) -> bool:
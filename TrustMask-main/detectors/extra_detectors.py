@@ -13,21 +13,18 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from detectors.base_detector import BaseDetector
 from entities import DetectedEntity
-from config import EntityType, GENDER_KEYWORDS, TURKISH_BANKS
+from config import EntityType, GENDER_KEYWORDS
+from nlp.gazetteer import BANK, get_gazetteer, scan_document
 
 
 class GenderDetector(BaseDetector):
     """Cinsiyet bilgisi tespit edicisi - Geliştirilmiş"""
     
-    def __init__(self):
-        super().__init__()
-        self.gender_keywords = GENDER_KEYWORDS
+    entity_types = frozenset({EntityType.GENDER})
     
-    def detect(self, text: str) -> List[DetectedEntity]:
-        entities = []
-        
-        # Pattern 1: Cinsiyet context ile
-        gender_patterns = [
+    patterns = {
+        # Cinsiyet context ile
+        'gender': ([
             # "cinsiyet: erkek", "cinsiyeti kadın"
             r'(?:cinsiyet|cinsiyeti|cinsiyetim)[\s:\.]+([eE]rkek|[kK]adın|[bB]ay|[bB]ayan|[eE]|[kK])\b',
             # "cinsiyet: E", "cinsiyet: K"
@@ -38,22 +35,37 @@ class GenderDetector(BaseDetector):
             r'(?:^|[\s,\.])([eE]rkek|[kK]adın|[bB]ay|[bB]ayan)\b',
             # "E/K" (kısaltma, context ile)
             r'(?:cinsiyet|cinsiyeti)[\s:\.]*([EeKk])\b',
-        ]
+        ], re.IGNORECASE),
+    }
+    
+    # Triage ("bayan" "bay"ı içerir)
+    trigger_keywords = ('cinsiyet', 'erkek', 'kadın', 'bay')
+    
+    # Toplu tarama (engine/batching.py): metin başındaki "^" eşleşmesi
+    # ayırıcıyı tükettiği için o metin ayrıca taranır
+    batch_safe = True
+    
+    def __init__(self):
+        super().__init__()
+        self.gender_keywords = GENDER_KEYWORDS
+    
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
+        entities = []
         
-        for pattern in gender_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                # Çok kısa eşleşmeleri filtrele (sadece "E" veya "K" gibi)
-                matched_text = match.group(0).strip()
-                if len(matched_text) <= 2 and matched_text.upper() not in ['E', 'K']:
-                    continue
-                
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.GENDER,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.95
-                ))
+        # Pattern 1: Cinsiyet context ile
+        for match in matches['gender']:
+            # Çok kısa eşleşmeleri filtrele (sadece "E" veya "K" gibi)
+            matched_text = match.group(0).strip()
+            if len(matched_text) <= 2 and matched_text.upper() not in ['E', 'K']:
+                continue
+            
+            entities.append(DetectedEntity(
+                entity_type=EntityType.GENDER,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.95
+            ))
         
         return entities
 
@@ -61,51 +73,58 @@ class GenderDetector(BaseDetector):
 class ParentNameDetector(BaseDetector):
     """Anne/Baba adı tespit edicisi - Geliştirilmiş"""
     
-    def __init__(self):
-        super().__init__()
+    entity_types = frozenset({EntityType.PARENT_NAME})
     
-    def detect(self, text: str) -> List[DetectedEntity]:
-        entities = []
-        
-        # Pattern: Anne adı context ile - HER kelimeyi yakala
-        mother_patterns = [
+    patterns = {
+        # Anne adı context ile - HER kelimeyi yakala
+        'mother': ([
             # "anne adı X", "annenizin adı X"
             r'(?:anne\s*adı|annenin\s*adı|annemin\s*adı|annenizin\s*adı|valide\s*adı)[\s:\.]+([A-ZÇĞİÖŞÜa-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜa-zçğıöşü]+)?)',
             # "anne kızlık soyadı X"
             r'(?:anne\s*kızlık\s*soyad|annemin\s*kızlık\s*soyad|kızlık\s*soyad)[ıi]?[\s:\.]+([A-ZÇĞİÖŞÜa-zçğıöşü]+)',
             # "annem X", "annemizin adı X"
             r'(?:annem|annemiz)[\s:\.]+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
-        ]
-        
-        for pattern in mother_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.PARENT_NAME,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.98,
-                    context="anne_adi"
-                ))
-        
-        # Pattern: Baba adı context ile - HER kelimeyi yakala
-        father_patterns = [
+        ], re.IGNORECASE),
+        # Baba adı context ile - HER kelimeyi yakala
+        'father': ([
             # "baba adı X", "babanızın adı X"
             r'(?:baba\s*adı|babanın\s*adı|babamın\s*adı|babanızın\s*adı|peder\s*adı)[\s:\.]+([A-ZÇĞİÖŞÜa-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜa-zçğıöşü]+)?)',
             # "babam X", "babamızın adı X"
             r'(?:babam|babamız)[\s:\.]+([A-ZÇĞİÖŞÜ][a-zçğıöşü]+)',
-        ]
+        ], re.IGNORECASE),
+    }
+    
+    # Triage ("kızlık soyadı" için "soyad")
+    trigger_keywords = ('anne', 'valide', 'soyad', 'baba', 'peder')
+    batch_safe = True
+    
+    def __init__(self):
+        super().__init__()
+    
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
+        entities = []
         
-        for pattern in father_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.PARENT_NAME,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.98,
-                    context="baba_adi"
-                ))
+        # Pattern: Anne adı context ile - HER kelimeyi yakala
+        for match in matches['mother']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.PARENT_NAME,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.98,
+                context="anne_adi"
+            ))
+        
+        # Pattern: Baba adı context ile - HER kelimeyi yakala
+        for match in matches['father']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.PARENT_NAME,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.98,
+                context="baba_adi"
+            ))
         
         return entities
 
@@ -113,41 +132,49 @@ class ParentNameDetector(BaseDetector):
 class BankNameDetector(BaseDetector):
     """Banka adı tespit edicisi"""
     
+    entity_types = frozenset({EntityType.BANK_NAME})
+    
+    patterns = {
+        # Banka context ile
+        'bank_context': ([
+            r'(?:banka|bankası|bankam|bankanız)[\s:\.]+([A-ZÇĞİÖŞÜa-zçğıöşü\s]+?)(?=\s*[,\.\n]|$)',
+        ], re.IGNORECASE),
+    }
+    
+    # Triage: bank_context anahtar kelimesi ("bankası", "bankam" dahil)
+    trigger_keywords = ('banka',)
+    batch_safe = True
+    
     def __init__(self):
         super().__init__()
-        self.banks = TURKISH_BANKS
+        self.bank_words = get_gazetteer().first_words(BANK)
     
-    def detect(self, text: str) -> List[DetectedEntity]:
+    def can_match(self, doc) -> bool:
+        # Sözlük eşleşmesi için banka adının ilk kelimesi metinde geçmeli
+        return doc.contains(self.trigger_keywords) or doc.has_word(self.bank_words)
+    
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
         entities = []
-        text_lower = text.lower()
         
-        # Pattern 1: Banka adlarını doğrudan ara
-        for bank in self.banks:
-            # Kelime sınırları ile ara
-            pattern = r'\b' + re.escape(bank) + r'\b'
-            for match in re.finditer(pattern, text_lower):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.BANK_NAME,
-                    value=text[match.start():match.end()],
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.90
-                ))
+        # Pattern 1: Banka adları (paylaşılan sözlük taramasından, çok kelimeliler dahil)
+        for start, end in scan_document(text).of_kind(BANK):
+            entities.append(DetectedEntity(
+                entity_type=EntityType.BANK_NAME,
+                value=text[start:end],
+                start_pos=start,
+                end_pos=end,
+                confidence=0.90
+            ))
         
         # Pattern 2: Banka context ile
-        bank_context_patterns = [
-            r'(?:banka|bankası|bankam|bankanız)[\s:\.]+([A-ZÇĞİÖŞÜa-zçğıöşü\s]+?)(?=\s*[,\.\n]|$)',
-        ]
-        
-        for pattern in bank_context_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.BANK_NAME,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.85
-                ))
+        for match in matches['bank_context']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.BANK_NAME,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.85
+            ))
         
         return self._remove_duplicates(entities)
     
@@ -175,14 +202,11 @@ class BankNameDetector(BaseDetector):
 class CallRecordDetector(BaseDetector):
     """Çağrı kayıt numarası tespit edicisi - Geliştirilmiş"""
     
-    def __init__(self):
-        super().__init__()
+    entity_types = frozenset({EntityType.CALL_RECORD_ID})
     
-    def detect(self, text: str) -> List[DetectedEntity]:
-        entities = []
-        
-        # Pattern: Çağrı kayıt numarası
-        call_patterns = [
+    patterns = {
+        # Çağrı kayıt numarası
+        'call': ([
             r'(?:çağrı\s*kayıt|çağrı\s*kaydı|çağrı\s*no|çağrı\s*numarası|görüşmeye\s*ait)[\s:\.#]*([A-Z0-9\-]{5,20})',
             # Specific context with intervening words "görüşmeye ait ... numaranız"
             r'(?:görüşmeye\s*ait\s*çağrı\s*kayıt\s*numara[a-z]*)[\s:\.#]*([A-Z0-9\-]{5,20})',
@@ -196,26 +220,40 @@ class CallRecordDetector(BaseDetector):
             r'\b((?:CR|AC|TR|CN)[\-]?\d{4}[\-]?[A-Z0-9]{4,15})\b',
             # Genel format: 2 Harf - 4 Rakam - 6+ Rakam/Harf (örn: AB-2024-123456)
             r'\b([A-Z]{2}[\-]\d{4}[\-][A-Z0-9]{5,15})\b',
-        ]
+        ], re.IGNORECASE),
+    }
+    
+    # Triage: context pattern'leri (direkt formatlar rakam gerektirir)
+    trigger_keywords = ('çağrı', 'görüşme', 'arama', 'ticket', 'tiket', 'talep')
+    batch_safe = True
+    
+    def can_match(self, doc) -> bool:
+        return doc.has_digits or doc.contains(self.trigger_keywords)
+    
+    def __init__(self):
+        super().__init__()
+    
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
+        entities = []
         
-        for pattern in call_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                # Use group(1) if available to catch only the ID, else fall back to group(0)
-                if match.groups():
-                    val = match.group(1)
-                    start = match.start(1)
-                    end = match.end(1)
-                else:
-                    val = match.group(0)
-                    start = match.start()
-                    end = match.end()
+        # Pattern: Çağrı kayıt numarası
+        for match in matches['call']:
+            # Use group(1) if available to catch only the ID, else fall back to group(0)
+            if match.groups():
+                val = match.group(1)
+                start = match.start(1)
+                end = match.end(1)
+            else:
+                val = match.group(0)
+                start = match.start()
+                end = match.end()
 
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.CALL_RECORD_ID,
-                    value=val,
-                    start_pos=start,
-                    end_pos=end,
-                    confidence=0.95
-                ))
+            entities.append(DetectedEntity(
+                entity_type=EntityType.CALL_RECORD_ID,
+                value=val,
+                start_pos=start,
+                end_pos=end,
+                confidence=0.95
+            ))
         
         return entities
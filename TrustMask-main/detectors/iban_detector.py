@@ -19,15 +19,11 @@ from config import EntityType, TURKISH_BANK_CODES
 class IBANDetector(BaseDetector):
     """IBAN ve banka bilgileri tespit edicisi"""
     
-    def __init__(self):
-        super().__init__()
-        self.bank_codes = set(TURKISH_BANK_CODES)
+    entity_types = frozenset({EntityType.BANK_INFO})
     
-    def detect(self, text: str) -> List[DetectedEntity]:
-        entities = []
-        
-        # Pattern 1: Düz IBAN (TR ile başlayan 26 karakter)
-        iban_patterns = [
+    patterns = {
+        # Düz IBAN (TR ile başlayan 26 karakter)
+        'iban': ([
             # TR330006100519786457841326
             r'\bTR\d{24}\b',
             # TR33 0006 1005 1978 6457 8413 26
@@ -38,66 +34,79 @@ class IBANDetector(BaseDetector):
             r'\bTR\d{2}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{2}\b',
             # TR34 0006 2000 0000 4589 1234 56 (tire ile)
             r'\bTR\d{2}[\s\-]+\d{4}[\s\-]+\d{4}[\s\-]+\d{4}[\s\-]+\d{4}[\s\-]+\d{4}[\s\-]+\d{2}\b',
-        ]
-        
-        for pattern in iban_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                iban = match.group(0).upper()
-                normalized = self.normalize(iban)
-                # Validate etmeye çalış, başarısız olsa bile context varsa yakala
-                if self.validate(normalized):
-                    entities.append(DetectedEntity(
-                        entity_type=EntityType.BANK_INFO,
-                        value=match.group(0),
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                        confidence=0.98
-                    ))
-                else:
-                    # Context kontrolü - IBAN kelimesi yakında var mı?
-                    context_start = max(0, match.start() - 50)
-                    context_end = min(len(text), match.end() + 20)
-                    context = text[context_start:context_end].lower()
-                    if 'iban' in context or 'banka' in context or 'hesap' in context:
-                        entities.append(DetectedEntity(
-                            entity_type=EntityType.BANK_INFO,
-                            value=match.group(0),
-                            start_pos=match.start(),
-                            end_pos=match.end(),
-                            confidence=0.90
-                        ))
-        
-        # Pattern 2: IBAN prefix ile
-        iban_context_patterns = [
+        ], re.IGNORECASE),
+        # IBAN prefix ile
+        'iban_context': ([
             r'(?:IBAN|iban)[\s:\.]*([A-Za-z]{2}\d{2}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{2})',
             r'(?:IBAN|iban)[\s:\.]*([A-Za-z]{2}\d{24})',
-        ]
-        
-        for pattern in iban_context_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.BANK_INFO,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.99
-                ))
-        
-        # Pattern 3: Banka hesap numarası (context ile)
-        account_patterns = [
+        ], re.IGNORECASE),
+        # Banka hesap numarası (context ile)
+        'account': ([
             r'(?:hesap\s*(?:no|numarası|numaram))[\s:\.]*(\d{10,20})',
             r'(?:banka\s*hesab)[\s:\.ıi]*(\d{10,20})',
-        ]
+        ], re.IGNORECASE),
+    }
+    
+    # Rakam indeksi (bkz. BaseDetector.digit_groups)
+    digit_groups = {'iban': 24, 'iban_context': 24, 'account': 10}
+    
+    # Toplu tarama: context kontrolü eşleşmenin en fazla 50 karakter gerisine bakar
+    batch_safe = True
+    context_chars = 50
+    
+    def __init__(self):
+        super().__init__()
+        self.bank_codes = set(TURKISH_BANK_CODES)
+    
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
+        entities = []
         
-        for pattern in account_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        # Pattern 1: Düz IBAN (TR ile başlayan 26 karakter)
+        for match in matches['iban']:
+            iban = match.group(0).upper()
+            normalized = self.normalize(iban)
+            # Validate etmeye çalış, başarısız olsa bile context varsa yakala
+            if self.validate(normalized):
                 entities.append(DetectedEntity(
                     entity_type=EntityType.BANK_INFO,
                     value=match.group(0),
                     start_pos=match.start(),
                     end_pos=match.end(),
-                    confidence=0.90
+                    confidence=0.98
                 ))
+            else:
+                # Context kontrolü - IBAN kelimesi yakında var mı?
+                context_start = max(0, match.start() - 50)
+                context_end = min(len(text), match.end() + 20)
+                context = text[context_start:context_end].lower()
+                if 'iban' in context or 'banka' in context or 'hesap' in context:
+                    entities.append(DetectedEntity(
+                        entity_type=EntityType.BANK_INFO,
+                        value=match.group(0),
+                        start_pos=match.start(),
+                        end_pos=match.end(),
+                        confidence=0.90
+                    ))
+        
+        # Pattern 2: IBAN prefix ile
+        for match in matches['iban_context']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.BANK_INFO,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.99
+            ))
+        
+        # Pattern 3: Banka hesap numarası (context ile)
+        for match in matches['account']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.BANK_INFO,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.90
+            ))
         
         return self._remove_duplicates(entities)
     
@@ -19,17 +19,46 @@ from config import EntityType
 class IPDetector(BaseDetector):
     """IP adresi tespit edicisi"""
     
+    entity_types = frozenset({EntityType.IP_ADDRESS})
+    
+    patterns = {
+        # 192.168.1.1, 10.0.0.1
+        'ipv4': ([r'\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\b'], 0),
+        # IPv6 (basitleştirilmiş)
+        'ipv6': ([
+            # Full IPv6
+            r'\b(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}\b',
+            # Compressed IPv6
+            r'\b(?:[0-9a-fA-F]{1,4}:){1,7}:\b',
+            r'\b(?:[0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}\b',
+            r'\b::(?:[0-9a-fA-F]{1,4}:){0,5}[0-9a-fA-F]{1,4}\b',
+        ], re.IGNORECASE),
+        # IP context ile
+        'context': ([
+            r'(?:IP|ip\s*adres|ip\s*adresi)[\s:\.]+(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})',
+        ], re.IGNORECASE),
+    }
+    
+    # Rakam indeksi (bkz. BaseDetector.digit_groups)
+    digit_groups = {'ipv4': 4, 'context': 4}
+    digit_anchored = frozenset({'ipv4'})
+    
+    # Toplu tarama (engine/batching.py): eşleşme dışında metne bakılmaz
+    batch_safe = True
+    
+    def can_match(self, doc) -> bool:
+        # IPv4 rakam, IPv6 ':' gerektirir
+        return doc.has_digits or ':' in doc.text
+    
     def __init__(self):
         super().__init__()
     
-    def detect(self, text: str) -> List[DetectedEntity]:
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
         entities = []
         
         # Pattern 1: IPv4
         # 192.168.1.1, 10.0.0.1
-        ipv4_pattern = r'\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\b'
-        
-        for match in re.finditer(ipv4_pattern, text):
+        for match in matches['ipv4']:
             ip = match.group(0)
             # Bazı özel IP'leri hariç tut (opsiyonel)
             if not self._is_special_ip(ip):
@@ -42,39 +71,24 @@ class IPDetector(BaseDetector):
                 ))
         
         # Pattern 2: IPv6 (basitleştirilmiş)
-        ipv6_patterns = [
-            # Full IPv6
-            r'\b(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}\b',
-            # Compressed IPv6
-            r'\b(?:[0-9a-fA-F]{1,4}:){1,7}:\b',
-            r'\b(?:[0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}\b',
-            r'\b::(?:[0-9a-fA-F]{1,4}:){0,5}[0-9a-fA-F]{1,4}\b',
-        ]
-        
-        for pattern in ipv6_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.IP_ADDRESS,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.90
-                ))
+        for match in matches['ipv6']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.IP_ADDRESS,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.90
+            ))
         
         # Pattern 3: IP context ile
-        context_patterns = [
-            r'(?:IP|ip\s*adres|ip\s*adresi)[\s:\.]+(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})',
-        ]
-        
-        for pattern in context_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.IP_ADDRESS,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.98
-                ))
+        for match in matches['context']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.IP_ADDRESS,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.98
+            ))
         
         return self._remove_duplicates(entities)
     
@@ -16,129 +16,158 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from detectors.base_detector import BaseDetector
+from detectors.digit_runs import scan_digits
+from detectors.dialogue_index import scan_dialogue
 from entities import DetectedEntity
 from config import EntityType
 
 
+# Satır bazlı cevap pattern'lerinin ortak sonu: rakam, en fazla bir noktalama, satır sonu
+_ANSWER_END = re.compile(r'\d[.,!?]?[^\S\n]*$', re.MULTILINE)
+
+
 class PartialDataDetector(BaseDetector):
     """Kısmi kişisel veri tespit edicisi - Doğrulama soruları için"""
     
+    entity_types = frozenset({
+        EntityType.BIRTH_YEAR,
+        EntityType.TC_ID,
+        EntityType.PHONE,
+        EntityType.CARD_INFO,
+    })
+    
+    patterns = {
+        # Doğum yılı (aynı satırda explicit context)
+        'year_inline': ([
+            r'(?:doğum|dogum)\s*(?:yılı|yili|yılınız|yiliniz)[\s:]*(\d{4})',
+            r'(\d{4})\s*(?:doğumluyum|dogumluyum)',
+            r'(?:yılı|yili|yılınız|yiliniz)[\s:]+(\d{4})',
+        ], re.IGNORECASE),
+        # TC son hane (aynı satırda explicit context) - 2-4 hane
+        'tc_inline': ([
+            r'(?:TC|T\.C\.|kimlik).*?(?:son\s*[234]?\s*hane).*?(?:\s+|:|dır|dir|dur|dür|ise|olarak)?\s*(\d{2,4})\b',
+            r'(?:son\s*[234]?\s*hane).*?(?:\s+|:|dır|dir|dur|dür|ise|olarak)?\s*(\d{2,4})\b',
+        ], re.IGNORECASE),
+        # Telefon son hane (aynı satırda explicit context) - 2-3 hane
+        'phone_inline': ([
+            r'(?:telefon|tel|cep|numara).*?(?:son\s*[23]?\s*hane).*?[\s:]+(\d{2,3})',
+            r'(?:son\s*[23]?\s*hane)[\s:]+(\d{2,3})',
+        ], re.IGNORECASE),
+        # Kart son 4 hane
+        'card': ([
+            r'(?:kart|kredi\s*kart).*?(?:son\s*4\s*hane).*?[:\s]+(\d{4})\b',
+            r'(?:son\s*4\s*hane)[:\s]*(\d{4})\b',
+        ], re.IGNORECASE),
+    }
+    
+    # Rakam indeksi (bkz. BaseDetector.digit_groups)
+    digit_groups = {'year_inline': 4, 'tc_inline': 2, 'phone_inline': 2, 'card': 4}
+    
+    # Satır bazlı cevap pattern'leri (her satırda ayrı ayrı aranır)
+    extra_patterns = {
+        # "Musteri: 1990." veya "1990" formatı (1950-2029)
+        'year_answer': ([r'(?:^|[:\s]+)(19[5-9]\d|20[0-2]\d)[.,!?]?\s*$'], 0),
+        # "Musteri: 1234." veya "2109." formatı
+        'tc_answer': ([r'(?:^|[:\s]+)(\d{2,4})[.,!?]?\s*$'], 0),
+        # 2-3 haneli cevap
+        'phone_answer': ([r'(?:^|[:\s]+)(\d{2,3})[.,!?]?\s*$'], 0),
+    }
+    
     def __init__(self):
         super().__init__()
     
-    def detect(self, text: str) -> List[DetectedEntity]:
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
+        # Tüm kısmi veri kalıpları (satır bazlı cevaplar dahil) rakam içerir
+        if not scan_digits(text).has_digits:
+            return []
+        
         entities = []
+        year_answer, = self.compiled_extra_patterns['year_answer']
+        tc_answer, = self.compiled_extra_patterns['tc_answer']
+        phone_answer, = self.compiled_extra_patterns['phone_answer']
         
-        # Satır bazlı analiz
-        lines = text.split('\n')
+        # Satır bazlı analiz: yalnızca rakamla (ve en fazla bir noktalama
+        # işaretiyle) biten satırlar cevap olabilir, diğerlerine bakılmaz
+        dialogue = scan_dialogue(text)
+        lines = dialogue.lines
+        candidates = sorted({dialogue.line_of(match.start()) for match in _ANSWER_END.finditer(text)})
         
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            line_start = sum(len(l) + 1 for l in lines[:i])
+        for i in candidates:
+            line = lines[i]
+            line_start = dialogue.starts[i]
             
             # Önceki satırları al (soru için context) - 4 satıra kadar bak (diyalog boşlukları için)
-            context_lines = []
-            for k in range(1, 5):
-                if i - k >= 0:
-                    context_lines.append(lines[i-k].lower())
-            
-            prev_line = lines[i-1].lower() if i > 0 else ""
-            context = " ".join(context_lines)
+            prev_line = dialogue.lower(i - 1) if i > 0 else ""
+            context = " ".join(dialogue.previous_lower(i, 4))
             
             # ------ DOĞUM YILI TESPİTİ ------
             # Pattern: Satırda 4 haneli yıl (1950-2025 arası) - "Musteri: 1990." veya "1990" formatı
-            year_match = re.search(r'(?:^|[:\s]+)(19[5-9]\d|20[0-2]\d)[.,!?]?\s*$', line)
+            year_match = year_answer.search(line)
             if year_match:
                 # Context kontrolü: önceki satırlarda "doğum" veya "yıl" var mı?
-                context_lower = context.lower()
-                prev_line_lower = prev_line.lower()
-                
                 has_birth_context = (
-                    'doğum' in context_lower or 'dogum' in context_lower or 
-                    'yıl' in prev_line_lower or 'yil' in prev_line_lower or
-                    'doğum yılınızı' in prev_line_lower or
-                    'doğum yılı' in prev_line_lower
+                    'doğum' in context or 'dogum' in context or 
+                    'yıl' in prev_line or 'yil' in prev_line or
+                    'doğum yılınızı' in prev_line or
+                    'doğum yılı' in prev_line
                 )
                 
                 if has_birth_context:
-                    year_value = year_match.group(1)
-                    # Match start hesaplaması düzeltildi
-                    full_match_start = year_match.start()
-                    group_start = year_match.start(1)
-                    match_start = line_start + group_start
-                    match_end = line_start + year_match.end(1)
-                    
                     entities.append(DetectedEntity(
                         entity_type=EntityType.BIRTH_YEAR,
-                        value=year_value,
-                        start_pos=match_start,
-                        end_pos=match_end,
+                        value=year_match.group(1),
+                        start_pos=line_start + year_match.start(1),
+                        end_pos=line_start + year_match.end(1),
                         confidence=0.98,
                         context="birth_year_answer"
                     ))
             
             # ------ TC SON 2-4 HANE TESPİTİ ------
             # Pattern: Satırda 2-4 haneli sayı - "Musteri: 1234." veya "2109." formatı  
-            tc_match = re.search(r'(?:^|[:\s]+)(\d{2,4})[.,!?]?\s*$', line)
+            tc_match = tc_answer.search(line)
             if tc_match:
                 value = tc_match.group(1)
                 # Yıl mı kontrol et (1950-2025 arası değilse TC olabilir)
-                try:
-                    num = int(value)
-                    is_year = 1950 <= num <= 2025
-                except:
-                    is_year = False
+                is_year = 1950 <= int(value) <= 2025
                 
                 # Context kontrolü - daha geniş
-                context_lower = context.lower()
-                prev_line_lower = prev_line.lower()
-                line_lower = line.lower()
-                
                 has_tc_context = (
-                    'tc' in context_lower or 't.c' in context_lower or 'kimlik' in context_lower or
-                    'kimlik numaranızın son' in prev_line_lower or
-                    'son' in prev_line_lower and 'hane' in prev_line_lower or
-                    'doğrulama' in prev_line_lower or
-                    'ek doğrulama' in prev_line_lower
+                    'tc' in context or 't.c' in context or 'kimlik' in context or
+                    'kimlik numaranızın son' in prev_line or
+                    'son' in prev_line and 'hane' in prev_line or
+                    'doğrulama' in prev_line or
+                    'ek doğrulama' in prev_line
                 )
                 
                 if not is_year and has_tc_context:
-                    match_start = line_start + tc_match.start(1)
-                    match_end = line_start + tc_match.end(1)
                     entities.append(DetectedEntity(
                         entity_type=EntityType.TC_ID,
                         value=value,
-                        start_pos=match_start,
-                        end_pos=match_end,
+                        start_pos=line_start + tc_match.start(1),
+                        end_pos=line_start + tc_match.end(1),
                         confidence=0.98,
                         context="tc_partial_answer"
                     ))
             
             # ------ TELEFON SON 2-3 HANE TESPİTİ ------
             # Pattern: Satırda 2-3 haneli sayı
-            phone_match = re.search(r'(?:^|[:\s]+)(\d{2,3})[.,!?]?\s*$', line)
+            phone_match = phone_answer.search(line)
             if phone_match:
                 # Context kontrolü - daha geniş
-                context_lower = context.lower()
-                prev_line_lower = prev_line.lower()
-                
                 has_phone_context = (
-                    'telefon' in context_lower or 'numara' in context_lower or 'tel' in context_lower or
-                    'cep' in context_lower or 'hat' in context_lower or
-                    'telefon numaranızın son' in prev_line_lower or
-                    ('son' in prev_line_lower and 'hane' in prev_line_lower) or
-                    'doğrulama' in prev_line_lower
+                    'telefon' in context or 'numara' in context or 'tel' in context or
+                    'cep' in context or 'hat' in context or
+                    'telefon numaranızın son' in prev_line or
+                    ('son' in prev_line and 'hane' in prev_line) or
+                    'doğrulama' in prev_line
                 )
                 
                 if has_phone_context:
-                    value = phone_match.group(1)
-                    match_start = line_start + phone_match.start(1)
-                    match_end = line_start + phone_match.end(1)
                     entities.append(DetectedEntity(
                         entity_type=EntityType.PHONE,
-                        value=value,
-                        start_pos=match_start,
-                        end_pos=match_end,
+                        value=phone_match.group(1),
+                        start_pos=line_start + phone_match.start(1),
+                        end_pos=line_start + phone_match.end(1),
                         confidence=0.98,
                         context="phone_partial_answer"
                     ))
@@ -146,73 +175,48 @@ class PartialDataDetector(BaseDetector):
         # ---- INLINE PATTERNS ----
         
         # Doğum yılı (aynı satırda explicit context)
-        year_inline_patterns = [
-            r'(?:doğum|dogum)\s*(?:yılı|yili|yılınız|yiliniz)[\s:]*(\d{4})',
-            r'(\d{4})\s*(?:doğumluyum|dogumluyum)',
-            r'(?:yılı|yili|yılınız|yiliniz)[\s:]+(\d{4})',
-        ]
-        
-        for pattern in year_inline_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.BIRTH_YEAR,
-                    value=match.group(1),
-                    start_pos=match.start(1),
-                    end_pos=match.end(1),
-                    confidence=0.95,
-                    context="birth_year_inline"
-                ))
+        for match in matches['year_inline']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.BIRTH_YEAR,
+                value=match.group(1),
+                start_pos=match.start(1),
+                end_pos=match.end(1),
+                confidence=0.95,
+                context="birth_year_inline"
+            ))
         
         # TC son hane (aynı satırda explicit context) - 2-4 hane
-        tc_inline_patterns = [
-            r'(?:TC|T\.C\.|kimlik).*?(?:son\s*[234]?\s*hane).*?(?:\s+|:|dır|dir|dur|dür|ise|olarak)?\s*(\d{2,4})\b',
-            r'(?:son\s*[234]?\s*hane).*?(?:\s+|:|dır|dir|dur|dür|ise|olarak)?\s*(\d{2,4})\b',
-        ]
-        
-        for pattern in tc_inline_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.TC_ID,
-                    value=match.group(1),
-                    start_pos=match.start(1),
-                    end_pos=match.end(1),
-                    confidence=0.95,
-                    context="tc_partial_inline"
-                ))
+        for match in matches['tc_inline']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.TC_ID,
+                value=match.group(1),
+                start_pos=match.start(1),
+                end_pos=match.end(1),
+                confidence=0.95,
+                context="tc_partial_inline"
+            ))
         
         # Telefon son hane (aynı satırda explicit context) - 2-3 hane
-        phone_inline_patterns = [
-            r'(?:telefon|tel|cep|numara).*?(?:son\s*[23]?\s*hane).*?[\s:]+(\d{2,3})',
-            r'(?:son\s*[23]?\s*hane)[\s:]+(\d{2,3})',
-        ]
-        
-        for pattern in phone_inline_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.PHONE,
-                    value=match.group(1),
-                    start_pos=match.start(1),
-                    end_pos=match.end(1),
-                    confidence=0.95,
-                    context="phone_partial_inline"
-                ))
+        for match in matches['phone_inline']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.PHONE,
+                value=match.group(1),
+                start_pos=match.start(1),
+                end_pos=match.end(1),
+                confidence=0.95,
+                context="phone_partial_inline"
+            ))
         
         # Kart son 4 hane
-        card_patterns = [
-            r'(?:kart|kredi\s*kart).*?(?:son\s*4\s*hane).*?[:\s]+(\d{4})\b',
-            r'(?:son\s*4\s*hane)[:\s]*(\d{4})\b',
-        ]
-        
-        for pattern in card_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.CARD_INFO,
-                    value=match.group(1),
-                    start_pos=match.start(1),
-                    end_pos=match.end(1),
-                    confidence=0.95,
-                    context="card_partial"
-                ))
+        for match in matches['card']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.CARD_INFO,
+                value=match.group(1),
+                start_pos=match.start(1),
+                end_pos=match.end(1),
+                confidence=0.95,
+                context="card_partial"
+            ))
         
         return self._remove_duplicates(entities)
     
@@ -222,16 +226,11 @@ class PartialDataDetector(BaseDetector):
         
         entities.sort(key=lambda e: (e.start_pos, -e.confidence, -len(e.value)))
         
+        # Kabul edilenler başlangıca göre sıralı ve çakışmasız: yeni entity
+        # yalnızca sonuncuyla çakışabilir
         result = []
         for entity in entities:
-            overlaps = False
-            for existing in result:
-                if (entity.start_pos < existing.end_pos and 
-                    entity.end_pos > existing.start_pos):
-                    overlaps = True
-                    break
-            
-            if not overlaps:
+            if not result or entity.start_pos >= result[-1].end_pos:
                 result.append(entity)
         
         return result
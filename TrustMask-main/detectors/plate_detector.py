@@ -22,51 +22,61 @@ from config import EntityType, TURKEY_CITY_CODES
 class PlateDetector(BaseDetector):
     """Araç plakası tespit edicisi"""
     
-    def __init__(self):
-        super().__init__()
-        self.city_codes = set(TURKEY_CITY_CODES)
+    entity_types = frozenset({EntityType.PLATE})
     
-    def detect(self, text: str) -> List[DetectedEntity]:
-        entities = []
-        
-        # Pattern 1: Standart format: 34 ABC 123, 34ABC123
+    patterns = {
         # İl kodu (01-81) + 1-3 harf + 2-4 rakam
-        plate_patterns = [
+        'plate': ([
             # 34 ABC 123, 34 ABC 12
             r'\b(0[1-9]|[1-7][0-9]|8[01])\s*([A-Za-z]{1,3})\s*(\d{2,4})\b',
             # 34ABC123
             r'\b(0[1-9]|[1-7][0-9]|8[01])([A-Za-z]{1,3})(\d{2,4})\b',
             # 34-ABC-123
             r'\b(0[1-9]|[1-7][0-9]|8[01])[\s\-]([A-Za-z]{1,3})[\s\-](\d{2,4})\b',
-        ]
-        
-        for pattern in plate_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                city_code = match.group(1)
-                if city_code in self.city_codes:
-                    entities.append(DetectedEntity(
-                        entity_type=EntityType.PLATE,
-                        value=match.group(0),
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                        confidence=0.95
-                    ))
-        
-        # Pattern 2: Plaka context ile
-        context_patterns = [
+        ], re.IGNORECASE),
+        # Plaka context ile
+        'context': ([
             r'(?:plaka|araç\s*plaka|plakası|plakam)[\s:\.]*((0[1-9]|[1-7][0-9]|8[01])[\s\-]?[A-Za-z]{1,3}[\s\-]?\d{2,4})',
-        ]
+        ], re.IGNORECASE),
+    }
+    
+    # Rakam indeksi (bkz. BaseDetector.digit_groups)
+    digit_groups = {'plate': 2, 'context': 2}
+    digit_anchored = frozenset({'plate'})
+    
+    # Toplu tarama (engine/batching.py): eşleşme dışında metne bakılmaz
+    batch_safe = True
+    
+    def __init__(self):
+        super().__init__()
+        self.city_codes = set(TURKEY_CITY_CODES)
+    
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
+        entities = []
         
-        for pattern in context_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        # Pattern 1: Standart format: 34 ABC 123, 34ABC123
+        # İl kodu (01-81) + 1-3 harf + 2-4 rakam
+        for match in matches['plate']:
+            city_code = match.group(1)
+            if city_code in self.city_codes:
                 entities.append(DetectedEntity(
                     entity_type=EntityType.PLATE,
                     value=match.group(0),
                     start_pos=match.start(),
                     end_pos=match.end(),
-                    confidence=0.98
+                    confidence=0.95
                 ))
         
+        # Pattern 2: Plaka context ile
+        for match in matches['context']:
+            entities.append(DetectedEntity(
+                entity_type=EntityType.PLATE,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.98
+            ))
+        
         return self._remove_duplicates(entities)
     
     def _remove_duplicates(self, entities: List[DetectedEntity]) -> List[DetectedEntity]:
@@ -20,6 +20,29 @@ from config import EntityType
 class TCKimlikDetector(BaseDetector):
     """TC Kimlik Numarası tespit edicisi - Geliştirilmiş"""
     
+    entity_types = frozenset({EntityType.TC_ID})
+    
+    patterns = {
+        # Pattern 1: TC/T.C./Kimlik prefix ile - HER 11 haneli sayıyı yakala (context güçlü)
+        'tc_context': ([
+            r'(?:TC|T\.C\.|T\.C|tc|t\.c\.|t\.c)[\s:\.]*(?:No|NO|no|Kimlik|kimlik|numara|numarası|numaram)?[\s:\.]*(\d{11})',
+            r'(?:kimlik)[\s:\.]*(?:numara|no|numarası|numaram)?[\s:\.]*(\d{11})',
+            r'(?:kimlik|TC|T\.C\.?)[\s:\.]*(\d{3})[\s\-]*(\d{3})[\s\-]*(\d{3})[\s\-]*(\d{2})',
+        ], re.IGNORECASE),
+        # Pattern 2: Boşluklu format: 323 030 104 29
+        'spaced': ([r'\b(\d{3})[\s\-]+(\d{3})[\s\-]+(\d{3})[\s\-]+(\d{2})\b'], 0),
+        # Pattern 3: Düz 11 haneli
+        'plain': ([r'\b(\d{11})\b'], 0),
+    }
+    
+    # Rakam indeksi (bkz. BaseDetector.digit_groups)
+    digit_groups = {'tc_context': 11, 'spaced': 11, 'plain': 11}
+    digit_anchored = frozenset({'spaced', 'plain'})
+    
+    # Toplu tarama: context kontrolü eşleşmenin en fazla 50 karakter gerisine bakar
+    batch_safe = True
+    context_chars = 50
+    
     def __init__(self, strict_validation: bool = False):
         """
         Args:
@@ -29,30 +52,23 @@ class TCKimlikDetector(BaseDetector):
         super().__init__()
         self.strict_validation = strict_validation
     
-    def detect(self, text: str) -> List[DetectedEntity]:
+    def detect_matches(self, text: str, matches) -> List[DetectedEntity]:
         entities = []
         
-        # Pattern 1: TC/T.C./Kimlik prefix ile - HER 11 haneli sayıyı yakala (context güçlü)
-        tc_context_patterns = [
-            r'(?:TC|T\.C\.|T\.C|tc|t\.c\.|t\.c)[\s:\.]*(?:No|NO|no|Kimlik|kimlik|numara|numarası|numaram)?[\s:\.]*(\d{11})',
-            r'(?:kimlik)[\s:\.]*(?:numara|no|numarası|numaram)?[\s:\.]*(\d{11})',
-            r'(?:kimlik|TC|T\.C\.?)[\s:\.]*(\d{3})[\s\-]*(\d{3})[\s\-]*(\d{3})[\s\-]*(\d{2})',
-        ]
-        
-        for pattern in tc_context_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                # Context ile bulundu - checksum kontrolü yapmadan yakala
-                entities.append(DetectedEntity(
-                    entity_type=EntityType.TC_ID,
-                    value=match.group(0),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.98,
-                    context="tc_context"
-                ))
+        # Pattern 1: TC/T.C./Kimlik prefix ile
+        for match in matches['tc_context']:
+            # Context ile bulundu - checksum kontrolü yapmadan yakala
+            entities.append(DetectedEntity(
+                entity_type=EntityType.TC_ID,
+                value=match.group(0),
+                start_pos=match.start(),
+                end_pos=match.end(),
+                confidence=0.98,
+                context="tc_context"
+            ))
         
         # Pattern 2: Boşluklu format: 323 030 104 29
-        for match in re.finditer(r'\b(\d{3})[\s\-]+(\d{3})[\s\-]+(\d{3})[\s\-]+(\d{2})\b', text):
+        for match in matches['spaced']:
             tc_no = match.group(1) + match.group(2) + match.group(3) + match.group(4)
             # Context kontrolü - yakınında TC/kimlik kelimesi var mı?
             context_start = max(0, match.start() - 30)
@@ -77,7 +93,7 @@ class TCKimlikDetector(BaseDetector):
                 ))
         
         # Pattern 3: Düz 11 haneli - context veya çok esnek
-        for match in re.finditer(r'\b(\d{11})\b', text):
+        for match in matches['plain']:
             tc_no = match.group(1)
             
             # Zaten yukarıda yakalandı mı kontrol et
@@ -0,0 +1,50 @@
+"""
+KVKK Veri Anonimleştirme - Pipeline Motoru
+
+Alt modüller ilk erişimde yüklenir: `from engine.x import Y` yalnızca x'i
+import eder, paket düzeyindeki adlar (`engine.Y`) ilk kullanımda çözülür.
+"""
+
+import importlib
+
+# Dışa açılan ad -> tanımlandığı modül (ilk erişimde import edilir)
+_EXPORTS = {
+    'IntervalIndex': 'engine.overlap',
+    'resolve_overlaps': 'engine.overlap',
+    'OffsetMap': 'engine.substitution',
+    'substitute': 'engine.substitution',
+    'stream_anonymize': 'engine.streaming',
+    'BatchPool': 'engine.batch_pool',
+    'ResultCache': 'engine.result_cache',
+    'Triage': 'engine.triage',
+    'PipelineMetrics': 'engine.metrics',
+    'prometheus_text': 'engine.metrics',
+    'PackedBatch': 'engine.batching',
+    'CandidateBuffer': 'engine.candidates',
+    'SessionStore': 'engine.incremental',
+}
+
+__all__ = [
+    'IntervalIndex',
+    'resolve_overlaps',
+    'OffsetMap',
+    'substitute',
+    'stream_anonymize',
+    'BatchPool',
+    'ResultCache',
+    'Triage',
+    'PipelineMetrics',
+    'prometheus_text',
+    'PackedBatch',
+    'CandidateBuffer',
+    'SessionStore',
+]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
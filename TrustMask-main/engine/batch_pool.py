@@ -0,0 +1,216 @@
+"""
+Toplu İşlem Process Havuzu
+
+Detector'lar saf Python regex işi yaptığı için GIL, aynı process içindeki
+thread'lerin CPU paralelliği kazanmasını engeller. BatchPool önceden
+başlatılmış worker process'ler kullanır:
+
+- Her worker KVKKAnonymizer'ı bir kez oluşturur (pattern'ler, sözlükler,
+  AI modeli worker başına bir kez yüklenir).
+- Batch, çekirdek sayısına göre parçalara bölünür; sonuçlar giriş
+  sırasıyla döner.
+- Worker her parçanın sonucuyla birlikte kendi metrik sayaçlarını
+  (engine.metrics.process_state) gönderir; havuz worker başına son durumu
+  tutar, /metrics ve /stats bunları ana process'inkilere ekler.
+- Bir worker ölürse (OOM killer, segfault) havuz BrokenProcessPool ile
+  kullanılamaz hale gelir; havuz bir kez yeniden kurulur ve parça tekrar
+  gönderilir, yeni havuz da çökerse parça ana process'te işlenir.
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Union
+import logging
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+
+# Worker process içindeki anonymizer (initializer ile oluşturulur) ve
+# istekle gelen diğer profiller için ilk kullanımda kurulanlar
+_worker_anonymizer = None
+_worker_profiles = {}
+_worker_names = True
+# Havuz çöktüğünde parçaları ana process'te işleyen anonymizer'ların kurulumu
+_local_lock = threading.Lock()
+
+
+def _init_worker(enable_name_detection: bool) -> None:
+    global _worker_anonymizer, _worker_names
+    from anonymizer import KVKKAnonymizer
+    from engine.result_cache import ResultCache
+    # Paylaşımlı önbellek (KVKK_RESULT_CACHE_PATH) ayarlıysa worker'lar aynı dosyayı kullanır
+    _worker_names = enable_name_detection
+    _worker_anonymizer = KVKKAnonymizer(enable_name_detection=enable_name_detection,
+                                        cache=ResultCache.from_config())
+    _worker_profiles[_worker_anonymizer.profile] = _worker_anonymizer
+
+
+def _worker_for(profile: Optional[str]):
+    """Profilin worker içindeki anonymizer'ı (None: varsayılan profil)"""
+    if profile is None:
+        return _worker_anonymizer
+    anonymizer = _worker_profiles.get(profile)
+    if anonymizer is None:
+        from anonymizer import KVKKAnonymizer
+        anonymizer = KVKKAnonymizer(enable_name_detection=_worker_names, cache=_worker_anonymizer.cache,
+                                    profile=profile)
+        _worker_profiles[profile] = anonymizer
+    return anonymizer
+
+
+def _ping(_) -> int:
+    return os.getpid()
+
+
+def _anonymize_chunk(texts: List[str], min_confidence: float, profile: Optional[str] = None,
+                     entity_types: Optional[List[str]] = None):
+    """-> (pid, worker'ın metrik durumu, to_dict() listesi)"""
+    from engine.metrics import process_state
+    anonymizer = _worker_for(profile)
+    results = [result.to_dict() for result in anonymizer.anonymize_many(texts, min_confidence, entity_types)]
+    return os.getpid(), process_state(list(_worker_profiles.values())), results
+
+
+def _anonymize_local(enable_name_detection: bool, *args):
+    """_anonymize_chunk'ı ana process'te çalıştırır (worker'lar kullanılamıyorsa)"""
+    with _local_lock:
+        if _worker_anonymizer is None:
+            _init_worker(enable_name_detection)
+        _worker_for(args[2])
+    return _anonymize_chunk(*args)
+
+
+def resolve_worker_count(value: Union[str, int, None]) -> int:
+    """Worker sayısı ayarını çözer: 'auto' / None -> çekirdek sayısı, 0 -> kapalı"""
+    if value is None or str(value).strip().lower() == 'auto':
+        return os.cpu_count() or 1
+    return max(int(value), 0)
+
+
+class BatchPool:
+    """KVKKAnonymizer worker'larından oluşan process havuzu
+
+    Kullanım:
+        pool = BatchPool(workers=4)
+        results = pool.anonymize_batch(["metin1", "metin2"])
+        pool.close()
+    """
+
+    # Worker başına düşen parça sayısı (yük dengesi için birden fazla)
+    CHUNKS_PER_WORKER = 4
+
+    def __init__(self, workers: Optional[int] = None, enable_name_detection: bool = True):
+        self.workers = resolve_worker_count(workers)
+        if self.workers < 1:
+            raise ValueError("BatchPool en az 1 worker gerektirir")
+
+        self.enable_name_detection = enable_name_detection
+        self._executor = self._new_executor()
+        self._executor_lock = threading.Lock()
+        # Worker pid -> son bildirilen metrik durumu (sayaçlar worker başına kümülatif)
+        self._states: Dict[int, Dict] = {}
+        self._states_lock = threading.Lock()
+        # Worker'ları şimdi başlat; ilk istek başlatma maliyetini ödemesin
+        list(self._executor.map(_ping, range(self.workers)))
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.enable_name_detection,),
+        )
+
+    def anonymize_batch(self, texts: List[str], min_confidence: float = 0.5, profile: Optional[str] = None,
+                        entity_types: Optional[List[str]] = None) -> List[dict]:
+        """Metinleri worker'lara dağıtır, AnonymizationResult.to_dict() listesini sırayla döndürür
+
+        profile / entity_types: bkz. KVKKAnonymizer (worker'lar profil başına bir anonymizer kurar)
+        """
+        if not texts:
+            return []
+
+        parts = self.workers * self.CHUNKS_PER_WORKER
+        chunk_size = max(1, -(-len(texts) // parts))
+        futures = [
+            self.submit(texts[i:i + chunk_size], min_confidence, profile, entity_types)
+            for i in range(0, len(texts), chunk_size)
+        ]
+
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def submit(self, texts: List[str], min_confidence: float = 0.5, profile: Optional[str] = None,
+               entity_types: Optional[List[str]] = None) -> Future:
+        """Metinleri tek parça olarak bir worker'a verir (Future -> to_dict() listesi)
+
+        Sırayı ve eşzamanlı parça sayısını kendisi yöneten çağıranlar için
+        (ör. engine/records.py).
+        """
+        results = Future()
+        self._dispatch((texts, min_confidence, profile, entity_types), results, retry=True)
+        return results
+
+    def _dispatch(self, args: tuple, results: Future, retry: bool) -> None:
+        """Parçayı havuza verir; sonucu (veya hatayı) results'a yazar"""
+        executor = self._executor
+        try:
+            future = executor.submit(_anonymize_chunk, *args)
+        except BrokenProcessPool:
+            self._recover(executor, args, results, retry)
+            return
+
+        def unpack(done: Future) -> None:
+            try:
+                pid, state, outputs = done.result()
+            except BrokenProcessPool:
+                self._recover(executor, args, results, retry)
+                return
+            except BaseException as e:
+                results.set_exception(e)
+                return
+            self._finish(results, pid, state, outputs)
+
+        future.add_done_callback(unpack)
+
+    def _recover(self, broken: ProcessPoolExecutor, args: tuple, results: Future, retry: bool) -> None:
+        """Çöken havuzdaki parça: havuzu yeniden kurup bir kez tekrar dene, sonra ana process'te işle"""
+        if retry:
+            self._restart(broken)
+            self._dispatch(args, results, retry=False)
+            return
+        logger.warning("Worker havuzu tekrar çöktü; parça ana process'te işleniyor")
+        try:
+            pid, state, outputs = _anonymize_local(self.enable_name_detection, *args)
+        except BaseException as e:
+            results.set_exception(e)
+            return
+        self._finish(results, pid, state, outputs)
+
+    def _restart(self, broken: ProcessPoolExecutor) -> None:
+        with self._executor_lock:
+            # Aynı çöküşü gören diğer parçalar havuzu tekrar kurmaz
+            if self._executor is not broken:
+                return
+            logger.warning("Worker process beklenmedik şekilde sonlandı; havuz yeniden kuruluyor")
+            broken.shutdown(wait=False)
+            self._executor = self._new_executor()
+
+    def _finish(self, results: Future, pid: int, state: Dict, outputs: List[dict]) -> None:
+        with self._states_lock:
+            self._states[pid] = state
+        results.set_result(outputs)
+
+    def worker_states(self) -> List[Dict]:
+        """Worker'ların son bildirdiği metrik durumları (bkz. engine.metrics.merge_states)"""
+        with self._states_lock:
+            return list(self._states.values())
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,200 @@
+"""
+Toplu Tarama - Kısa metinleri tek tampon üzerinde tarama
+
+Sohbet / SMS / bilet trafiği binlerce kısa mesajdan oluşur ve mesaj başına
+her detector'ın her regex'ini ayrı ayrı çağırmanın sabit maliyeti mesajın
+kendisini taramaktan büyüktür. PackedBatch metinleri SENTINEL ile
+ayrılmış tek bir tampona yerleştirir; batch_safe işaretli detector'lar
+tamponu bir kez tarar ve entity'ler ofsetleri kaydırılarak kaynak
+metinlere dağıtılır.
+
+Ayırıcı satır sonuyla başlar ve biter (lookahead'ler ve \\b için metin sonu /
+başı gibi görünür); arasındaki '\\x00' rakam zincirlerini ve kelimeleri,
+'.' ise [^\\.] gibi karakter sınıflarını keser. Metinler en uzun rakam
+zincirine göre azalan sırada dizilir: en az N rakam gerektiren pattern
+grupları (BaseDetector.digit_groups) tamponun yalnızca bu kadar rakam
+içeren metinlerden oluşan baş kısmında çalışır; metin başına taramadaki
+rakam indeksi atlamaları korunur.
+
+Sonuçlar metin başına çalıştırmayla birebir aynıdır: ayırıcıya taşan
+eşleşme veya entity'nin dokunduğu metinler ve context penceresi
+(context_chars) metin dışına taşan entity'lerin metinleri "kirli" sayılır;
+detector bu metinlerde tek tek çalıştırılır. Satır sonu olmayan bir
+boşlukla biten metinler (lookahead'ler metin sonunu ayırıcının satır
+sonundan ayıramaz) tampona alınmaz.
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Sequence, Set, Tuple
+
+from detectors.digit_runs import match_at, max_digits, scan_digits
+
+SENTINEL = '\n\x00.\x00\n'
+
+
+def packable(text: str) -> bool:
+    """Metin tampona alınabilir mi (sonundaki boşluk satır sonu değilse hayır)"""
+    last = text[-1:]
+    return not last.isspace() or last == '\n'
+
+
+def can_pack(detector) -> bool:
+    """Detector tampon üzerinde çalıştırılabilir mi"""
+    return getattr(detector, 'batch_safe', False)
+
+
+def chunk_indices(indices: Sequence[int], texts: Sequence[str], max_chars: int) -> Iterator[List[int]]:
+    """Metin indekslerini toplam uzunluğu max_chars'ı aşmayan parçalara böler"""
+    chunk, size = [], 0
+    for i in indices:
+        length = len(texts[i]) + len(SENTINEL)
+        if chunk and size + length > max_chars:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(i)
+        size += length
+    if chunk:
+        yield chunk
+
+
+def digit_order(texts: Sequence[str]) -> Tuple[List[int], List[int]]:
+    """Metin indekslerini en uzun rakam zincirine göre azalan sıralar; (sıra, rakam sayıları)"""
+    digits = [max_digits(text) for text in texts]
+    order = sorted(range(len(texts)), key=lambda i: -digits[i])
+    return order, digits
+
+
+class PackedBatch:
+    """SENTINEL ile birleştirilmiş metinler ve tampondaki başlangıç / bitiş ofsetleri
+
+    digits: metin başına en uzun rakam zinciri; metinler bu değere göre
+    azalan sırada verilmelidir (bkz. digit_order)
+    """
+
+    __slots__ = ('texts', 'digits', 'buffer', 'starts', 'ends')
+
+    def __init__(self, texts: Sequence[str], digits: Sequence[int]):
+        self.texts = texts
+        self.digits = digits
+        self.buffer = SENTINEL.join(texts)
+        starts, ends = [], []
+        position = 0
+        for text in texts:
+            starts.append(position)
+            position += len(text)
+            ends.append(position)
+            position += len(SENTINEL)
+        self.starts = starts
+        self.ends = ends
+
+    def locate(self, position: int) -> int:
+        """position'dan önce (veya position'da) başlayan son metnin indeksi"""
+        return bisect_right(self.starts, position) - 1
+
+    def _prefix_end(self, min_digits: int) -> int:
+        """En az min_digits rakamlı zincir içeren metinleri (ve ayırıcılarını) kapsayan tampon sonu"""
+        digits = self.digits
+        count = 0
+        while count < len(digits) and digits[count] >= min_digits:
+            count += 1
+        if count == 0:
+            return 0
+        return min(self.ends[count - 1] + len(SENTINEL), len(self.buffer))
+
+    def scan(self, detector) -> Dict[str, list]:
+        """BaseDetector.scan'in tampon karşılığı (rakam grupları yalnızca uygun metinlerde)"""
+        buffer = self.buffer
+        if not detector.digit_groups:
+            return {
+                group: [match for compiled in compiled_list for match in compiled.finditer(buffer)]
+                for group, compiled_list in detector.compiled_patterns.items()
+            }
+
+        index = None
+        tables = {}
+        for group, compiled_list in detector.compiled_patterns.items():
+            min_digits = detector.digit_groups.get(group)
+            if min_digits is None:
+                tables[group] = [match for compiled in compiled_list for match in compiled.finditer(buffer)]
+                continue
+            end = self._prefix_end(min_digits)
+            if end == 0:
+                tables[group] = []
+            elif group in detector.digit_anchored:
+                if index is None:
+                    index = scan_digits(buffer)
+                starts = index.starts(min_digits)
+                tables[group] = [match for compiled in compiled_list for match in match_at(compiled, buffer, starts)]
+            else:
+                tables[group] = [match for compiled in compiled_list for match in compiled.finditer(buffer, 0, end)]
+        return tables
+
+    def _touch(self, start: int, end: int, dirty: Set[int]) -> None:
+        """[start, end) aralığının kapladığı metinleri kirli işaretler"""
+        first = self.locate(start)
+        if start > self.ends[first]:
+            first += 1
+        last = self.locate(max(start, end - 1))
+        dirty.update(range(first, last + 1))
+
+    def filter_tables(self, tables: Dict[str, list], dirty: Set[int]) -> Dict[str, list]:
+        """Tek metnin içinde kalmayan eşleşmeleri çıkarır
+
+        Ayırıcıya taşan eşleşmelerin dokunduğu metinler dirty'e eklenir;
+        tamamen ayırıcının içindeki eşleşmeler atılır.
+        """
+        starts, ends = self.starts, self.ends
+        filtered = {}
+        for group, matches in tables.items():
+            kept = []
+            for match in matches:
+                start, end = match.start(), match.end()
+                i = bisect_right(starts, start) - 1
+                if end <= ends[i]:
+                    kept.append(match)
+                elif start > ends[i] and (i + 1 == len(starts) or end <= starts[i + 1]):
+                    continue
+                else:
+                    self._touch(start, end, dirty)
+            filtered[group] = kept
+        return filtered
+
+    def distribute(self, entities, dirty: Set[int], context_chars: int = 0) -> Dict[int, list]:
+        """Tampon ofsetli entity'leri metinlere dağıtır ve ofsetleri metne göre kaydırır
+
+        context_chars: detector'ın entity çevresinde baktığı karakter sayısı;
+        penceresi metin dışına taşan entity'lerin metni kirli sayılır.
+        """
+        starts, ends = self.starts, self.ends
+        per_text = {}
+        for entity in entities:
+            start, end = entity.start_pos, entity.end_pos
+            i = bisect_right(starts, start) - 1
+            if end > ends[i] or start > ends[i]:
+                self._touch(start, end, dirty)
+                continue
+            offset = starts[i]
+            if context_chars and (start - context_chars < offset or end + context_chars > ends[i]):
+                dirty.add(i)
+                continue
+            entity.start_pos = start - offset
+            entity.end_pos = end - offset
+            per_text.setdefault(i, []).append(entity)
+        return per_text
+
+
+def detect_packed(detector, batch: PackedBatch) -> Tuple[Dict[int, list], Set[int]]:
+    """batch_safe detector'ı tampon üzerinde bir kez çalıştırır
+
+    Returns:
+        ({metin indeksi: entity listesi}, kirli metin indeksleri). Kirli
+        metinlerin entity'leri dönmez; detector bu metinlerde tek tek
+        çalıştırılmalıdır. Listede olmayan temiz metinlerde entity yoktur.
+    """
+    dirty = set()
+    tables = batch.filter_tables(batch.scan(detector), dirty)
+    entities = detector.detect_matches(batch.buffer, tables)
+    per_text = batch.distribute(entities, dirty, detector.context_chars)
+    for i in dirty:
+        per_text.pop(i, None)
+    return per_text, dirty
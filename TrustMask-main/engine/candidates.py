@@ -0,0 +1,167 @@
+"""
+Sütunlu Aday Tamponu - Entity adayları için paralel diziler
+
+Detector'lar metin başına çoğu çakışma çözümünde elenecek çok sayıda aday
+üretir. CandidateBuffer adayları nesne yerine paralel dizilerde tutar:
+başlangıç, bitiş, tip kimliği, güven ve kaynak detector (array modülü;
+değer ve context için listeler). Çakışma çözümü bu diziler üzerinde
+çalışır ve yalnızca kazanan adaylar DetectedEntity'ye dönüştürülür; elenen
+adaylar için nesne hiç oluşturulmaz.
+
+Nesne olarak eklenen adaylar (extend) aynen korunur: çözüm sonucu aynı
+nesneleri döndürür. Sıralama ve seçim kuralları engine/overlap.py ile
+aynıdır; sonuç nesne listesi üzerinde çalışan sürümle birebir aynıdır.
+"""
+
+from array import array
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import EntityType
+from entities import DetectedEntity
+from engine.overlap import IntervalIndex
+
+
+# Tip kimlikleri: EntityType tanım sırası
+ENTITY_TYPES: Sequence[EntityType] = tuple(EntityType)
+TYPE_IDS: Dict[EntityType, int] = {entity_type: i for i, entity_type in enumerate(ENTITY_TYPES)}
+
+
+class CandidateBuffer:
+    """Entity adaylarının sütunlu (paralel dizi) kaydı
+
+    Her aday bir indekstir; sütunlar starts, ends, types (TYPE_IDS),
+    confidences ve sources'tur (adayı üreten detector'ın indeksi, yoksa -1).
+    """
+
+    __slots__ = ('starts', 'ends', 'types', 'confidences', 'sources', 'values', 'contexts', '_objects')
+
+    def __init__(self):
+        self.starts = array('l')
+        self.ends = array('l')
+        self.types = array('B')
+        self.confidences = array('d')
+        self.sources = array('h')
+        self.values: List[str] = []
+        self.contexts: List[Optional[str]] = []
+        # Nesne olarak eklenen adaylar; sütunlardan eklenenler için None
+        self._objects: List[Optional[DetectedEntity]] = []
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def add(self, entity_type: EntityType, value: str, start: int, end: int,
+            confidence: float = 1.0, context: Optional[str] = None, source: int = -1) -> None:
+        """Nesne oluşturmadan aday ekler"""
+        self.starts.append(start)
+        self.ends.append(end)
+        self.types.append(TYPE_IDS[entity_type])
+        self.confidences.append(confidence)
+        self.sources.append(source)
+        self.values.append(value)
+        self.contexts.append(context)
+        self._objects.append(None)
+
+    def add_match(self, entity_type: EntityType, match, confidence: float = 1.0,
+                  context: Optional[str] = None, source: int = -1) -> None:
+        """Regex eşleşmesinin tamamını aday olarak ekler"""
+        start, end = match.span()
+        self.add(entity_type, match.group(0), start, end, confidence, context, source)
+
+    def extend(self, entities: Iterable[DetectedEntity], source: int = -1) -> None:
+        """Hazır entity nesnelerini ekler (çözüm sonucunda aynı nesneler döner)"""
+        entities = list(entities)
+        if not entities:
+            return
+        # Sütun başına tek toplu ekleme (aday başına metot çağrısı yok)
+        self.starts.extend([entity.start_pos for entity in entities])
+        self.ends.extend([entity.end_pos for entity in entities])
+        self.types.extend([TYPE_IDS[entity.entity_type] for entity in entities])
+        self.confidences.extend([entity.confidence for entity in entities])
+        self.sources.extend([source] * len(entities))
+        self.values.extend([entity.value for entity in entities])
+        self.contexts.extend([entity.context for entity in entities])
+        self._objects.extend(entities)
+
+    def copy_from(self, other: 'CandidateBuffer', indices: Iterable[int], source: int = -1) -> None:
+        """Başka bir tampondaki adayları (ör. detector'ın kendi çözdüğü) sırasıyla ekler"""
+        for i in indices:
+            self.starts.append(other.starts[i])
+            self.ends.append(other.ends[i])
+            self.types.append(other.types[i])
+            self.confidences.append(other.confidences[i])
+            self.sources.append(source)
+            self.values.append(other.values[i])
+            self.contexts.append(other.contexts[i])
+            self._objects.append(other._objects[i])
+
+    def truncate(self, size: int) -> None:
+        """İlk size aday dışındakileri siler (yarıda kalan detector'ın adayları)"""
+        for column in (self.starts, self.ends, self.types, self.confidences, self.sources,
+                       self.values, self.contexts, self._objects):
+            del column[size:]
+
+    def entity(self, i: int) -> DetectedEntity:
+        """i. adayın DetectedEntity karşılığı (gerekirse oluşturulur)"""
+        entity = self._objects[i]
+        if entity is None:
+            entity = DetectedEntity(ENTITY_TYPES[self.types[i]], self.values[i], self.starts[i],
+                                    self.ends[i], self.confidences[i], self.contexts[i])
+            self._objects[i] = entity
+        return entity
+
+    def entities(self, indices: Iterable[int]) -> List[DetectedEntity]:
+        return [self.entity(i) for i in indices]
+
+    def select(self, key: Callable[[int], object], min_confidence: float = 0.0,
+               entity_types: Optional[FrozenSet[EntityType]] = None) -> List[int]:
+        """Adayları key sırasıyla gezer, kabul edilenlerle çakışmayanların indekslerini döndürür
+
+        resolve_overlaps'in (engine/overlap.py) dizi karşılığı; key aday
+        indeksini alır ve başlangıç pozisyonu ile başlamalıdır.
+        min_confidence altındaki ve (verilmişse) entity_types dışındaki
+        adaylar hiç değerlendirilmez.
+        """
+        confidences = self.confidences
+        if entity_types is not None:
+            allowed = [entity_type in entity_types for entity_type in ENTITY_TYPES]
+            types = self.types
+            candidates = [i for i in range(len(confidences))
+                          if confidences[i] >= min_confidence and allowed[types[i]]]
+        elif min_confidence > 0.0:
+            candidates = [i for i in range(len(confidences)) if confidences[i] >= min_confidence]
+        else:
+            candidates = range(len(confidences))
+        starts, ends = self.starts, self.ends
+        selected = []
+        index = IntervalIndex(len(candidates))
+        for i in sorted(candidates, key=key):
+            start, end = starts[i], ends[i]
+            if index.first_overlap(start, end) is None:
+                index.append(start, end)
+                selected.append(i)
+        return selected
+
+    def priority_key(self, priority: Dict[EntityType, int], default: int = 99) -> Callable[[int], tuple]:
+        """KVKKAnonymizer çakışma sırası: (başlangıç, -uzunluk, -güven, tip önceliği)"""
+        ranks = [priority.get(entity_type, default) for entity_type in ENTITY_TYPES]
+        starts, values, confidences, types = self.starts, self.values, self.confidences, self.types
+        return lambda i: (starts[i], -len(values[i]), -confidences[i], ranks[types[i]])
+
+
+def collect(detector, text: str, buffer: CandidateBuffer, source: int = -1, matches=None) -> None:
+    """Detector'ın adaylarını tampona yazar
+
+    BaseDetector.detect_into kullanılır; tanımlamayan detector'larda
+    (ör. AINERDetector) detect / detect_matches sonucu nesne olarak eklenir.
+    """
+    detect_into = getattr(detector, 'detect_into', None)
+    if detect_into is not None:
+        detect_into(text, buffer, source, matches)
+    elif matches is not None:
+        buffer.extend(detector.detect_matches(text, matches), source)
+    else:
+        buffer.extend(detector.detect(text), source)
@@ -0,0 +1,273 @@
+"""
+Dizin / Glob Toplu Dosya İşleme
+
+Gece işleri her dosya için ayrı `main.py --file` çağırdığında yorumlayıcı
+başlatma ve KVKKAnonymizer kurulumu dosya başına tekrar ödenir. Bu modül
+dosya listesini tek çağrıda işler:
+
+- Girdiler dizin (include kalıbına uyan dosyalar, alt dizinler dahil),
+  glob ("exports/**/*.txt") veya dosya yolu olabilir.
+- Dosyalar BatchPool worker'larıyla aynı başlatıcıyı kullanan bir process
+  havuzunda işlenir (worker başına bir KVKKAnonymizer, büyük dosyalar
+  önce). Her dosya anonymize_stream ile parça parça okunup yazılır;
+  bellek kullanımı dosya boyutundan bağımsızdır.
+- Çıktı önce geçici dosyaya yazılır, tamamlanınca yerine taşınır.
+- Manifest (JSON) her girdinin boyutunu, mtime'ını, SHA-256 özetini ve
+  sonucu etkileyen ayarların özetini tutar. Boyut ve mtime aynıysa dosya
+  hiç okunmadan, değişmişse içerik özeti aynı olduğunda atlanır.
+
+DİKKAT: Manifest dosya yollarını ve içerik özetlerini içerir; girdiler
+gibi erişimi kısıtlı bir yerde tutulmalıdır.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+MANIFEST_NAME = '.kvkk_manifest.json'
+# Manifest kayıt formatı değişirse artırılır
+MANIFEST_FORMAT = 1
+OUTPUT_SUFFIX = '_anonymized'
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def expand_inputs(inputs: Iterable[str], include: str = '*.txt') -> List[Tuple[str, str]]:
+    """Dizin, glob ve dosya yollarını (dosya yolu, göreli yol) listesine açar
+
+    Göreli yol, --output-dir altında aynı yapıyı kurmak için kullanılır:
+    dizinlerde dizine, glob'larda glob'un sabit önekine göre. Daha önce
+    üretilmiş çıktılar (*_anonymized.*) girdi sayılmaz.
+    """
+    found = {}
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                for name in sorted(files):
+                    if fnmatch.fnmatch(name, include):
+                        path = os.path.join(root, name)
+                        found.setdefault(os.path.abspath(path), os.path.relpath(path, item))
+        elif glob.has_magic(item):
+            root = _glob_root(item)
+            for path in sorted(glob.glob(item, recursive=True)):
+                if os.path.isfile(path):
+                    found.setdefault(os.path.abspath(path), os.path.relpath(path, root))
+        elif os.path.isfile(item):
+            found.setdefault(os.path.abspath(item), os.path.basename(item))
+        else:
+            raise FileNotFoundError(f"Girdi bulunamadı: {item}")
+    return [(path, relative) for path, relative in found.items()
+            if not os.path.splitext(os.path.basename(path))[0].endswith(OUTPUT_SUFFIX)
+            and os.path.basename(path) != MANIFEST_NAME]
+
+
+def _glob_root(pattern: str) -> str:
+    """Glob kalıbının joker içermeyen dizin öneki"""
+    parts = []
+    for part in os.path.normpath(pattern).split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or os.curdir
+
+
+def output_path_for(path: str, relative: str, output_dir: Optional[str]) -> str:
+    """--output-dir altında aynı göreli yol, yoksa girdinin yanında <ad>_anonymized<uzantı>"""
+    if output_dir:
+        return os.path.abspath(os.path.join(output_dir, relative))
+    stem, ext = os.path.splitext(path)
+    return stem + OUTPUT_SUFFIX + (ext or '.txt')
+
+
+def options_fingerprint(anonymizer, min_confidence: float) -> str:
+    """Çıktıyı etkileyen ayarların özeti (konfigürasyon sürümü ve güven eşiği)"""
+    return f"{MANIFEST_FORMAT}:{anonymizer.config_version}:{float(min_confidence)!r}"
+
+
+def file_digest(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Manifest:
+    """Girdi yolu -> {size, mtime_ns, sha256, output, options} kayıtları"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, dict] = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('files', {})
+
+    def get(self, path: str) -> Optional[dict]:
+        return self.entries.get(path)
+
+    def update(self, path: str, entry: dict) -> None:
+        self.entries[path] = entry
+
+    def save(self) -> None:
+        """Geçici dosyaya yazıp yerine taşır (yarıda kalan yazım eski manifesti bozmaz)"""
+        directory = os.path.dirname(self.path) or os.curdir
+        os.makedirs(directory, exist_ok=True)
+        temp = self.path + '.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump({'format': MANIFEST_FORMAT, 'files': self.entries}, f, ensure_ascii=False, indent=1)
+        os.replace(temp, self.path)
+
+
+def anonymize_file(anonymizer, input_path: str, output_path: str, min_confidence: float = 0.5,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, known_digest: Optional[str] = None) -> dict:
+    """Dosyayı parça parça anonimleştirir; içerik özeti known_digest ile aynıysa atlar
+
+    Returns:
+        {"input", "output", "status" ("done" / "unchanged"), "size", "mtime_ns", "sha256", "seconds"}
+    """
+    started = time.perf_counter()
+    stat = os.stat(input_path)
+    digest = file_digest(input_path, chunk_size)
+    result = {
+        "input": input_path,
+        "output": output_path,
+        "status": "unchanged",
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest,
+    }
+    if digest != known_digest or not os.path.exists(output_path):
+        os.makedirs(os.path.dirname(output_path) or os.curdir, exist_ok=True)
+        temp = f"{output_path}.{os.getpid()}.tmp"
+        try:
+            with open(input_path, 'r', encoding='utf-8') as src, \
+                    open(temp, 'w', encoding='utf-8') as dst:
+                chunks = iter(lambda: src.read(chunk_size), '')
+                for sanitized_chunk in anonymizer.anonymize_stream(chunks, min_confidence):
+                    dst.write(sanitized_chunk)
+            os.replace(temp, output_path)
+        finally:
+            if os.path.exists(temp):
+                os.remove(temp)
+        result["status"] = "done"
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def _try_anonymize_file(anonymizer, *args) -> dict:
+    """anonymize_file; hata diğer dosyaları durdurmaz, sonuçta "error" olarak döner"""
+    try:
+        return anonymize_file(anonymizer, *args)
+    except Exception as e:
+        return {"input": args[0], "output": args[1], "status": "error", "error": f"{type(e).__name__}: {e}"}
+
+
+def _process_file(profile: Optional[str], *args) -> dict:
+    """Worker process: profilin anonymizer'ı ile anonymize_file"""
+    from engine.batch_pool import _worker_for
+
+    return _try_anonymize_file(_worker_for(profile), *args)
+
+
+def process_files(anonymizer, inputs: Iterable[str], output_dir: Optional[str] = None,
+                  include: str = '*.txt', workers=None, manifest_path: Optional[str] = None,
+                  min_confidence: float = 0.5, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  force: bool = False, enable_name_detection: bool = True,
+                  on_result: Optional[Callable[[dict], None]] = None) -> dict:
+    """Girdileri (dizin / glob / dosya) işler, özet istatistikleri döndürür
+
+    Args:
+        anonymizer: Tek worker'da kullanılan ve ayar özeti alınan anonymizer
+        inputs: Dizin, glob veya dosya yolları
+        output_dir: Çıktı kök dizini (None: girdilerin yanına *_anonymized)
+        include: Dizinlerde işlenecek dosya adı kalıbı
+        workers: Process sayısı ("auto" / None: çekirdek sayısı, 1: aynı process)
+        manifest_path: Manifest dosyası (None: output_dir ya da çalışma dizininde MANIFEST_NAME)
+        min_confidence: Minimum güven eşiği (0-1)
+        chunk_size: Okuma parçası (karakter)
+        force: Manifesti yok say, tüm dosyaları yeniden işle
+        enable_name_detection: Worker anonymizer'larında isim tespiti
+        on_result: Her dosya bittiğinde sonuç sözlüğüyle çağrılır
+    """
+    # multiprocessing yalnızca toplu işlemde yüklenir (tek dosyalık CLI çağrıları için değil)
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from engine.batch_pool import _init_worker, resolve_worker_count
+
+    started = time.perf_counter()
+    files = expand_inputs(inputs, include)
+    manifest = Manifest(manifest_path or os.path.join(output_dir or os.curdir, MANIFEST_NAME))
+    options = options_fingerprint(anonymizer, min_confidence)
+    profile = anonymizer.profile
+    summary = {"files": 0, "done": 0, "unchanged": 0, "skipped": 0, "errors": 0,
+               "bytes": 0, "workers": 1}
+
+    # Çıktı dizinindeki ve bu çalıştırmada yazılacak dosyalar girdi sayılmaz
+    output_root = os.path.join(os.path.abspath(output_dir), '') if output_dir else None
+    outputs = {output_path_for(path, relative, output_dir) for path, relative in files}
+    files = [(path, relative) for path, relative in files
+             if path not in outputs and not (output_root and path.startswith(output_root))]
+    summary["files"] = len(files)
+    jobs = []
+    for path, relative in files:
+        output = output_path_for(path, relative, output_dir)
+        entry = None if force else manifest.get(path)
+        known = None
+        if entry is not None and entry.get("options") == options and entry.get("output") == output:
+            stat = os.stat(path)
+            if (entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+                    and os.path.exists(output)):
+                summary["skipped"] += 1
+                if on_result is not None:
+                    on_result({"input": path, "output": output, "status": "skipped"})
+                continue
+            known = entry.get("sha256")
+        jobs.append((os.path.getsize(path), path, output, known))
+    # Büyük dosyalar önce: son dosyayı tek worker'ın beklemesi kısalır
+    jobs.sort(key=lambda job: -job[0])
+
+    def record(result: dict) -> None:
+        status = result["status"]
+        summary["errors" if status == "error" else status] += 1
+        if status == "done":
+            summary["bytes"] += result["size"]
+        if status != "error":
+            manifest.update(result["input"], {
+                "size": result["size"],
+                "mtime_ns": result["mtime_ns"],
+                "sha256": result["sha256"],
+                "output": result["output"],
+                "options": options,
+            })
+        if on_result is not None:
+            on_result(result)
+
+    count = min(resolve_worker_count(workers), len(jobs))
+    try:
+        if count <= 1:
+            for _, path, output, known in jobs:
+                record(_try_anonymize_file(anonymizer, path, output, min_confidence, chunk_size, known))
+        else:
+            summary["workers"] = count
+            with ProcessPoolExecutor(max_workers=count, initializer=_init_worker,
+                                     initargs=(enable_name_detection,)) as executor:
+                futures = [
+                    executor.submit(_process_file, profile, path, output, min_confidence, chunk_size, known)
+                    for _, path, output, known in jobs
+                ]
+                for future in as_completed(futures):
+                    record(future.result())
+    finally:
+        # Yarıda kesilen çalıştırmada bitmiş dosyalar bir sonrakinde atlanır
+        manifest.save()
+
+    summary["seconds"] = time.perf_counter() - started
+    summary["manifest"] = manifest.path
+    return summary
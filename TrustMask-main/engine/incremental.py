@@ -0,0 +1,263 @@
+"""
+Artımlı (Oturumlu) Anonimleştirme - Değişen bölgeyi yeniden tarama
+
+Temsilci masaüstü, her yeni mesajdan sonra büyüyen sohbet dökümünün
+tamamını /anonymize'a gönderir; her istekte tüm metni taramak oturum
+boyunca toplam işi karesel büyütür. Oturum durumu (son metin ve
+entity'leri) tutulduğunda yalnızca değişen bölge taranır:
+
+- Eski ve yeni metnin ortak öneki ve soneki bulunur; aradaki kısım
+  değişen bölgedir (sona ekleme en sık durumdur, hızlı yoldan geçer).
+- Yenilenen bölge satır başına / sonuna hizalanır ve her iki yönde
+  context_lines satır genişletilir: PartialDataDetector bir cevabı
+  önceki 4 satırdaki soruyla eşleştirir, değişen satır hem kendinden
+  sonraki cevapları hem de kendinden önceki soruyu etkileyebilir.
+  Sınırına denk gelen eski entity'ler bölgeye dahil edilir.
+- Tarama penceresi yenilenen bölgenin iki yanına context_lines satır
+  daha ekler; bölge başındaki satırlar da kendi bağlamlarıyla taranır.
+  Bu bağlam satırlarındaki tespitler kullanılmaz (streaming.py'deki
+  bağlam bölgesi gibi).
+- Bölge dışındaki eski entity'ler korunur (sonrakiler kaydırılır),
+  bölge içindekilerin yerine yeni tespitler konur.
+
+Detector'lar pencere metni üzerinde çalışır; context_lines satırdan
+uzağa bakan bir bağlam (ör. AI NER'in cümle bağlamı) tam taramadan
+farklı sonuç verebilir. Seçenekler (min_confidence, entity tipleri)
+değişince tüm metin yeniden taranır.
+"""
+
+from typing import Callable, List, Optional, Tuple
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import SESSION_CONTEXT_LINES, SESSION_MAX, SESSION_MAX_MB, SESSION_TTL
+from entities import DetectedEntity
+from engine.result_cache import MemoryCache
+
+
+class SessionState:
+    """Bir oturumun son metni, çakışmaları çözülmüş entity'leri ve seçenekleri"""
+
+    __slots__ = ('text', 'entities', 'options')
+
+    def __init__(self, text: str, entities: List[DetectedEntity], options: tuple):
+        self.text = text
+        self.entities = entities
+        self.options = options
+
+
+class IncrementalUpdate:
+    """incremental_detect sonucu
+
+    entities: yeni metnin tüm entity'leri; added: yeni metinde ilk kez
+    görülenler; removed: eski metinde olup artık olmayanlar (eski metin
+    pozisyonlarıyla); start / end: yeni metinde taranan pencere
+    (bağlam satırları dahil).
+    """
+
+    __slots__ = ('entities', 'added', 'removed', 'start', 'end')
+
+    def __init__(self, entities, added, removed, start, end):
+        self.entities = entities
+        self.added = added
+        self.removed = removed
+        self.start = start
+        self.end = end
+
+
+def common_prefix(old: str, new: str) -> int:
+    """Ortak önek uzunluğu (dilim karşılaştırmalarıyla ikili arama)"""
+    lo, hi = 0, min(len(old), len(new))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[lo:mid] == new[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def common_suffix(old: str, new: str, limit: int) -> int:
+    """En fazla limit uzunluğunda ortak sonek uzunluğu"""
+    lo, hi = 0, limit
+    old_len, new_len = len(old), len(new)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[old_len - mid:old_len - lo] == new[new_len - mid:new_len - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def changed_region(old: str, new: str) -> Tuple[int, int, int]:
+    """(başlangıç, eski metinde bitiş, yeni metinde bitiş)
+
+    old[:başlangıç] ve old[eski bitiş:] yeni metinde aynen korunmuştur.
+    """
+    if new.startswith(old):
+        return len(old), len(old), len(new)
+    prefix = common_prefix(old, new)
+    suffix = common_suffix(old, new, min(len(old), len(new)) - prefix)
+    return prefix, len(old) - suffix, len(new) - suffix
+
+
+def _line_start(text: str, position: int, lines: int) -> int:
+    """position'ın satır başından lines satır geri"""
+    start = text.rfind('\n', 0, position) + 1
+    for _ in range(lines):
+        if start == 0:
+            break
+        start = text.rfind('\n', 0, start - 1) + 1
+    return start
+
+
+def _line_end(text: str, position: int, lines: int) -> int:
+    """position'ın satır sonundan (satır sonu karakteri dahil) lines satır ileri"""
+    end = position
+    for _ in range(lines + 1):
+        newline = text.find('\n', end)
+        if newline == -1:
+            return len(text)
+        end = newline + 1
+    return end
+
+
+def rescan_span(old: str, entities: List[DetectedEntity], new: str,
+                context_lines: int = SESSION_CONTEXT_LINES) -> Tuple[int, int, Tuple[int, int, int]]:
+    """Yeni metinde entity'leri yenilenecek bölge: (başlangıç, bitiş, changed_region)
+
+    Pencereden sonraki eski pozisyonlar len(new) - len(old) kadar kayar.
+    Metin değişmemişse pencere boştur.
+    """
+    region = changed_region(old, new)
+    changed, old_end, new_end = region
+    shift = new_end - old_end
+    if old == new:
+        return changed, changed, region
+    start = _line_start(new, changed, context_lines)
+    end = _line_end(new, new_end, context_lines) if new_end < len(new) else len(new)
+
+    # Bölge sınırını kesen eski entity'ler bölgeye alınır
+    moved = True
+    while moved:
+        moved = False
+        for entity in entities:
+            if entity.start_pos < start < entity.end_pos:
+                start = _line_start(new, entity.start_pos, 0)
+                moved = True
+            if entity.start_pos < end - shift < entity.end_pos:
+                end = _line_end(new, entity.end_pos + shift, 0)
+                moved = True
+    return start, end, region
+
+
+def incremental_detect(old: str, entities: List[DetectedEntity], new: str,
+                       detect: Callable[[str], List[DetectedEntity]],
+                       context_lines: int = SESSION_CONTEXT_LINES) -> IncrementalUpdate:
+    """Eski metnin entity'lerini yeni metne taşır, yalnızca değişen bölgeyi tarar
+
+    Args:
+        old: Oturumun önceki metni
+        entities: old'un çakışmaları çözülmüş entity'leri (başlangıca göre sıralı)
+        new: Yeni metin
+        detect: Metin -> çakışmaları çözülmüş entity listesi
+        context_lines: Değişen bölgenin her iki yanında yeniden taranan satır sayısı
+    """
+    start, end, (changed, changed_old_end, changed_new_end) = rescan_span(old, entities, new, context_lines)
+    shift = changed_new_end - changed_old_end
+    old_end = end - shift
+
+    before, replaced, after = [], [], []
+    for entity in entities:
+        if entity.end_pos <= start:
+            before.append(entity)
+        elif entity.start_pos >= old_end:
+            after.append(entity if shift == 0 else DetectedEntity(
+                entity.entity_type, entity.value, entity.start_pos + shift, entity.end_pos + shift,
+                entity.confidence, entity.context
+            ))
+        else:
+            replaced.append(entity)
+
+    # Bağlam satırları yalnızca taranır; tespitleri bölge içinde kalanlarla sınırlıdır
+    if start == end:
+        scan_start = scan_end = start
+    else:
+        scan_start = _line_start(new, start, context_lines) if start else 0
+        scan_end = _line_end(new, end, context_lines - 1) if end < len(new) and context_lines else end
+    window = new[scan_start:scan_end]
+    found = detect(window) if new[start:end].strip() else []
+    found = [
+        entity if scan_start == 0 else DetectedEntity(
+            entity.entity_type, entity.value, entity.start_pos + scan_start,
+            entity.end_pos + scan_start, entity.confidence, entity.context
+        )
+        for entity in found
+        if start <= entity.start_pos + scan_start and entity.end_pos + scan_start <= end
+    ]
+
+    # Pencerede aynı tip, değer ve konumla yeniden bulunan eski entity'ler delta'ya girmez;
+    # değişen bölgeye dokunan eski entity'lerin yeni metinde karşılığı yoktur
+    previous = {}
+    for entity in replaced:
+        if entity.end_pos <= changed:
+            position = entity.start_pos
+        elif entity.start_pos >= changed_old_end:
+            position = entity.start_pos + shift
+        else:
+            position = None
+        previous[(entity.entity_type, entity.value, position, entity.start_pos)] = entity
+    by_position = {key[:3]: key for key in previous}
+    added = []
+    for entity in found:
+        key = by_position.pop((entity.entity_type, entity.value, entity.start_pos), None)
+        if key is None:
+            added.append(entity)
+        else:
+            del previous[key]
+    removed = list(previous.values())
+    removed.sort(key=lambda entity: entity.start_pos)
+
+    return IncrementalUpdate(before + found + after, added, removed, scan_start, scan_end)
+
+
+class SessionStore:
+    """session_id -> SessionState; kayıt sayısı, TTL ve yaklaşık bayt sınırlı LRU
+
+    DİKKAT: Oturum durumu orijinal metni ve tespit edilen değerleri içerir.
+    """
+
+    def __init__(self, max_sessions: int = SESSION_MAX, ttl: Optional[float] = SESSION_TTL,
+                 max_bytes: Optional[int] = int(SESSION_MAX_MB * 1024 * 1024)):
+        self.memory = MemoryCache(max_sessions, ttl=ttl or None, max_bytes=max_bytes,
+                                  sizeof=estimate_state_size)
+
+    def __len__(self) -> int:
+        return len(self.memory)
+
+    def get(self, session_id: str) -> Optional[SessionState]:
+        return self.memory.get(session_id)
+
+    def put(self, session_id: str, state: SessionState) -> None:
+        self.memory.put(session_id, state)
+
+    def pop(self, session_id: str) -> Optional[SessionState]:
+        return self.memory.pop(session_id)
+
+    def stats(self) -> dict:
+        return {
+            "sessions": len(self.memory),
+            "bytes": self.memory.bytes,
+            "evictions": self.memory.evictions,
+        }
+
+
+def estimate_state_size(state: SessionState) -> int:
+    """Oturum durumunun yaklaşık bellek maliyeti (bayt)"""
+    size = 256 + 2 * len(state.text)
+    for entity in state.entities:
+        size += 200 + 2 * len(entity.value)
+    return size
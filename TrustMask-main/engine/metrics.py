@@ -0,0 +1,430 @@
+"""
+Pipeline Metrikleri - Detector başına süre, aday ve sonuç sayaçları
+
+KVKKAnonymizer her doküman için detector sürelerini ve ürettikleri aday
+entity sayılarını yerel olarak toplar ve belge sonunda tek kilit altında
+kaydeder; üretim ortamında açık bırakılabilecek kadar ucuzdur.
+
+Toplanan metrikler:
+- Detector başına süre histogramı (saniye)
+- Aday sayısı (detector'ın döndürdüğü entity'ler) ve çakışma çözümünden
+  sonra maskelenen entity sayısı
+- Detector hata sayacı
+- Doküman sayısı ve anonymize() süre histogramı (önbellekten dönenler dahil)
+
+Önbellek (sonuç / NER), triage atlama ve bulut NER istemcisi sayaçları
+sahiplerinden okunur. process_state() bir process'teki tüm profillerin
+sayaçlarını pickle'lanabilir tek duruma toplar; batch havuzu worker'ları
+(/anonymize/batch, /anonymize/stream, records) bu durumu her parçanın
+sonucuyla ana process'e gönderir. prometheus_text() ana process'in ve
+worker'ların sayaçlarını toplayıp profil etiketiyle Prometheus metin
+formatında (text/plain; version=0.0.4) yazar.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Saniye; son kova +Inf
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class Histogram:
+    """Sabit kovalı histogram (kümülatif değil, Prometheus çıktısında toplanır)"""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Kova üst sınırına göre yaklaşık yüzdelik (gözlem yoksa None)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float('inf')
+
+    def snapshot(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+
+class DetectorMetrics:
+    __slots__ = ('duration', 'candidates', 'entities', 'errors')
+
+    def __init__(self):
+        self.duration = Histogram()
+        self.candidates = 0
+        self.entities = 0
+        self.errors = 0
+
+
+class PipelineMetrics:
+    """Detector ve doküman metrikleri
+
+    Kullanım:
+        metrics = anonymizer.metrics
+        metrics.snapshot()["detectors"]["NameDetector"]["duration"]["p99"]
+        prometheus_text(anonymizer)
+    """
+
+    def __init__(self, detector_names: Iterable[str]):
+        self.names = list(detector_names)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.detectors = [DetectorMetrics() for _ in self.names]
+            self.documents = 0
+            self.cached_documents = 0
+            self.duration = Histogram()
+
+    def record_detection(self, runs: List[Tuple[int, float, int]], errors: List[int],
+                         surviving: Dict[int, int]) -> None:
+        """Bir metnin detector sonuçları
+
+        runs: [(detector sırası, süre, aday sayısı), ...]
+        errors: hata veren detector sıraları
+        surviving: {detector sırası: çakışma çözümünden sonra kalan entity sayısı}
+        """
+        with self._lock:
+            detectors = self.detectors
+            for index, seconds, candidates in runs:
+                metrics = detectors[index]
+                metrics.duration.observe(seconds)
+                metrics.candidates += candidates
+            for index in errors:
+                detectors[index].errors += 1
+            for index, count in surviving.items():
+                detectors[index].entities += count
+
+    def record_document(self, seconds: float, cached: bool = False) -> None:
+        with self._lock:
+            self.documents += 1
+            if cached:
+                self.cached_documents += 1
+            self.duration.observe(seconds)
+
+    def snapshot(self) -> Dict:
+        """Süreç içi okuma için sözlük (JSON'a çevrilebilir)"""
+        return _snapshot(self._copy())
+
+    def _copy(self) -> Tuple[Histogram, int, List[Tuple[str, DetectorMetrics]]]:
+        """Prometheus çıktısı için tutarlı kopya"""
+        with self._lock:
+            return (_copy_histogram(self.duration), self.cached_documents,
+                    [(name, _copy_detector(metrics)) for name, metrics in zip(self.names, self.detectors)])
+
+
+def _copy_histogram(histogram: Histogram) -> Histogram:
+    copy = Histogram(histogram.buckets)
+    copy.counts = list(histogram.counts)
+    copy.sum = histogram.sum
+    copy.count = histogram.count
+    return copy
+
+
+def _copy_detector(metrics: DetectorMetrics) -> DetectorMetrics:
+    copy = DetectorMetrics()
+    copy.duration = _copy_histogram(metrics.duration)
+    copy.candidates = metrics.candidates
+    copy.entities = metrics.entities
+    copy.errors = metrics.errors
+    return copy
+
+
+def _snapshot(copy) -> Dict:
+    duration, cached, detectors = copy
+    return {
+        "documents": duration.count,
+        "cached_documents": cached,
+        "duration": duration.snapshot(),
+        "detectors": {
+            name: {
+                "duration": metrics.duration.snapshot(),
+                "candidates": metrics.candidates,
+                "entities": metrics.entities,
+                "errors": metrics.errors,
+            }
+            for name, metrics in detectors
+        },
+    }
+
+
+# ---- Process / profil birleştirme ----
+
+_BREAKER_STATES = ('closed', 'half_open', 'open')
+
+
+def _add_histogram(total: Histogram, part: Histogram) -> None:
+    total.counts = [a + b for a, b in zip(total.counts, part.counts)]
+    total.sum += part.sum
+    total.count += part.count
+
+
+def _merge_pipeline(total, part):
+    """_copy() çıktılarını toplar (detector'lar ada göre eşlenir; part değişmez)"""
+    duration, cached, detectors = part
+    if total is None:
+        return (_copy_histogram(duration), cached,
+                [(name, _copy_detector(metrics)) for name, metrics in detectors])
+    total_duration, total_cached, total_detectors = total
+    _add_histogram(total_duration, duration)
+    by_name = dict(total_detectors)
+    for name, metrics in detectors:
+        into = by_name.get(name)
+        if into is None:
+            by_name[name] = _copy_detector(metrics)
+            total_detectors.append((name, by_name[name]))
+            continue
+        _add_histogram(into.duration, metrics.duration)
+        into.candidates += metrics.candidates
+        into.entities += metrics.entities
+        into.errors += metrics.errors
+    return total_duration, total_cached + cached, total_detectors
+
+
+def _merge_triage(total: Optional[Dict], part: Dict) -> Dict:
+    if total is None:
+        return dict(part, skipped=dict(part['skipped']))
+    skipped = dict(total['skipped'])
+    for name, count in part['skipped'].items():
+        skipped[name] = skipped.get(name, 0) + count
+    return {
+        "documents": total['documents'] + part['documents'],
+        "fully_skipped": total['fully_skipped'] + part['fully_skipped'],
+        "skipped": skipped,
+    }
+
+
+def _add_counters(total: Optional[Dict], part: Dict) -> Dict:
+    """Önbellek / istemci stats() sözlüklerini toplar (oranlar yeniden hesaplanır)"""
+    if total is None:
+        return dict(part)
+    merged = dict(total)
+    for key, value in part.items():
+        if key == 'breaker':
+            # En kötü durum: bir process'te devre açıksa açık sayılır
+            merged[key] = max(merged.get(key, 'closed'), value, key=_BREAKER_STATES.index)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            merged[key] = merged.get(key, 0) + value
+    if 'hit_rate' in merged:
+        lookups = merged['hits'] + merged['misses']
+        merged['hit_rate'] = merged['hits'] / lookups if lookups else 0.0
+    return merged
+
+
+def _empty_state() -> Dict:
+    return {"profiles": {}, "result_cache": None, "ner_cache": None, "ner_client": None}
+
+
+def process_state(anonymizers: Iterable) -> Dict:
+    """Bir process'teki anonymizer'ların sayaçları (pickle'lanabilir)
+
+    Detector / doküman metrikleri ve triage sayaçları profil başınadır;
+    profillerin paylaştığı sonuç önbelleği ve AI NER singleton'ı bir kez
+    sayılır.
+    """
+    state = _empty_state()
+    seen = set()
+    for anonymizer in anonymizers:
+        metrics = getattr(anonymizer, 'metrics', None)
+        triage = getattr(anonymizer, 'triage', None)
+        state["profiles"][anonymizer.profile] = {
+            "metrics": metrics._copy() if metrics is not None else None,
+            "triage": triage.stats() if triage is not None else None,
+        }
+        cache = getattr(anonymizer, 'cache', None)
+        if cache is not None and id(cache) not in seen:
+            seen.add(id(cache))
+            state["result_cache"] = _add_counters(state["result_cache"], cache.stats())
+        for detector in getattr(anonymizer, 'detectors', ()):
+            if hasattr(detector, 'cache_stats') and id(detector) not in seen:
+                seen.add(id(detector))
+                state["ner_cache"] = _add_counters(state["ner_cache"], detector.cache_stats())
+                client = getattr(getattr(detector, 'backend', None), 'client', None)
+                if client is not None and hasattr(client, 'stats'):
+                    state["ner_client"] = _add_counters(state["ner_client"], client.stats())
+    return state
+
+
+def merge_states(states: Iterable[Dict]) -> Dict:
+    """process_state() çıktılarını (ana process + worker'lar) profil bazında toplar"""
+    merged = _empty_state()
+    for state in states:
+        for profile, parts in state["profiles"].items():
+            into = merged["profiles"].setdefault(profile, {"metrics": None, "triage": None})
+            if parts["metrics"] is not None:
+                into["metrics"] = _merge_pipeline(into["metrics"], parts["metrics"])
+            if parts["triage"] is not None:
+                into["triage"] = _merge_triage(into["triage"], parts["triage"])
+        for key in ("result_cache", "ner_cache", "ner_client"):
+            if state[key] is not None:
+                merged[key] = _add_counters(merged[key], state[key])
+    return merged
+
+
+def summarize(state: Dict) -> Dict:
+    """Tüm profillerin toplamı (GET /stats): result_cache, ner_cache, triage, metrics"""
+    metrics = triage = None
+    for parts in state["profiles"].values():
+        if parts["metrics"] is not None:
+            metrics = _merge_pipeline(metrics, parts["metrics"])
+        if parts["triage"] is not None:
+            triage = _merge_triage(triage, parts["triage"])
+    return {
+        "result_cache": state["result_cache"],
+        "ner_cache": state["ner_cache"],
+        "triage": triage,
+        "metrics": _snapshot(metrics) if metrics is not None else None,
+    }
+
+
+# ---- Prometheus metin formatı ----
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + '}'
+
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Writer:
+    def __init__(self):
+        self.lines: List[str] = []
+        self._declared = set()
+
+    def declare(self, name: str, kind: str, help_text: str) -> None:
+        if name not in self._declared:
+            self._declared.add(name)
+            self.lines.append(f'# HELP {name} {help_text}')
+            self.lines.append(f'# TYPE {name} {kind}')
+
+    def sample(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        self.lines.append(f'{name}{_labels(labels or {})} {_number(value)}')
+
+    def histogram(self, name: str, histogram: Histogram, labels: Optional[Dict[str, str]] = None) -> None:
+        labels = labels or {}
+        cumulative = 0
+        for bound, count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+            cumulative += count
+            self.sample(f'{name}_bucket', cumulative, dict(labels, le=_number(float(bound))))
+        self.sample(f'{name}_sum', histogram.sum, labels)
+        self.sample(f'{name}_count', histogram.count, labels)
+
+    def text(self) -> str:
+        return '\n'.join(self.lines) + '\n'
+
+
+def prometheus_text(anonymizers, workers: Iterable[Dict] = ()) -> str:
+    """Anonymizer metriklerini Prometheus metin formatında döndürür
+
+    anonymizers: KVKKAnonymizer veya listesi (ör. api._profiles içindekiler)
+    workers: worker process'lerin process_state() çıktıları; sayaçları ana
+        process'inkilere eklenir. Doküman, detector ve triage serileri
+        "profile" etiketi taşır.
+    """
+    if hasattr(anonymizers, 'detectors'):
+        anonymizers = [anonymizers]
+    state = merge_states([process_state(anonymizers), *workers])
+    profiles = sorted(state["profiles"].items())
+    out = _Writer()
+
+    measured = [(profile, parts["metrics"]) for profile, parts in profiles if parts["metrics"] is not None]
+    if measured:
+        out.declare('kvkk_documents_total', 'counter', 'Anonimleştirilen doküman sayısı')
+        for profile, (duration, _, _) in measured:
+            out.sample('kvkk_documents_total', duration.count, {'profile': profile})
+        out.declare('kvkk_documents_cached_total', 'counter', 'Sonuç önbelleğinden dönen doküman sayısı')
+        for profile, (_, cached, _) in measured:
+            out.sample('kvkk_documents_cached_total', cached, {'profile': profile})
+        out.declare('kvkk_anonymize_duration_seconds', 'histogram', 'anonymize() süresi')
+        for profile, (duration, _, _) in measured:
+            out.histogram('kvkk_anonymize_duration_seconds', duration, {'profile': profile})
+
+        out.declare('kvkk_detector_duration_seconds', 'histogram', 'Detector başına çalışma süresi')
+        for profile, (_, _, detectors) in measured:
+            for name, detector in detectors:
+                out.histogram('kvkk_detector_duration_seconds', detector.duration,
+                              {'profile': profile, 'detector': name})
+        for metric, attribute, help_text in (
+            ('kvkk_detector_candidates_total', 'candidates', 'Detector tarafından üretilen aday entity sayısı'),
+            ('kvkk_detector_entities_total', 'entities', 'Çakışma çözümünden sonra kalan entity sayısı'),
+            ('kvkk_detector_errors_total', 'errors', 'Detector hata sayısı'),
+        ):
+            out.declare(metric, 'counter', help_text)
+            for profile, (_, _, detectors) in measured:
+                for name, detector in detectors:
+                    out.sample(metric, getattr(detector, attribute), {'profile': profile, 'detector': name})
+
+    triaged = [(profile, parts["triage"]) for profile, parts in profiles if parts["triage"] is not None]
+    if triaged:
+        out.declare('kvkk_triage_documents_total', 'counter', 'Triage uygulanan doküman sayısı')
+        for profile, stats in triaged:
+            out.sample('kvkk_triage_documents_total', stats['documents'], {'profile': profile})
+        out.declare('kvkk_triage_fully_skipped_total', 'counter', 'Tüm detector\'ları atlanan doküman sayısı')
+        for profile, stats in triaged:
+            out.sample('kvkk_triage_fully_skipped_total', stats['fully_skipped'], {'profile': profile})
+        out.declare('kvkk_detector_skipped_total', 'counter', 'Triage ile atlanan detector çalıştırmaları')
+        for profile, stats in triaged:
+            for name, count in stats['skipped'].items():
+                out.sample('kvkk_detector_skipped_total', count, {'profile': profile, 'detector': name})
+
+    stats = state["result_cache"]
+    if stats is not None:
+        out.declare('kvkk_result_cache_hits_total', 'counter', 'Sonuç önbelleği isabetleri')
+        out.sample('kvkk_result_cache_hits_total', stats['hits'])
+        out.declare('kvkk_result_cache_misses_total', 'counter', 'Sonuç önbelleği ıskalamaları')
+        out.sample('kvkk_result_cache_misses_total', stats['misses'])
+        out.declare('kvkk_result_cache_entries', 'gauge', 'Sonuç önbelleğindeki kayıt sayısı (process toplamı)')
+        out.sample('kvkk_result_cache_entries', stats['entries'])
+
+    stats = state["ner_cache"]
+    if stats is not None:
+        out.declare('kvkk_ner_cache_hits_total', 'counter', 'NER yanıt önbelleği isabetleri')
+        out.sample('kvkk_ner_cache_hits_total', stats['hits'])
+        out.declare('kvkk_ner_cache_misses_total', 'counter', 'NER yanıt önbelleği ıskalamaları')
+        out.sample('kvkk_ner_cache_misses_total', stats['misses'])
+
+    stats = state["ner_client"]
+    if stats is not None:
+        for key in ('requests', 'texts', 'failures', 'skipped'):
+            out.declare(f'kvkk_ner_client_{key}_total', 'counter', f'Bulut NER istemcisi: {key}')
+            out.sample(f'kvkk_ner_client_{key}_total', stats.get(key, 0))
+        out.declare('kvkk_ner_client_breaker_open', 'gauge', 'Devre kesici herhangi bir process\'te açık mı (1/0)')
+        out.sample('kvkk_ner_client_breaker_open', int(stats.get('breaker') == 'open'))
+
+    return out.text()
@@ -0,0 +1,117 @@
+"""
+Çakışma Çözümü - Sweep-line aralık indeksi
+
+Entity'ler başlangıç pozisyonuna göre sıralı işlenir (sweep-line). Kabul
+edilen aralıklar, bitiş pozisyonlarının maksimumunu tutan bir segment
+tree'de saklanır; "ilk çakışan aralık" sorgusu O(log n) sürer. Böylece
+n entity için toplam maliyet sıralama dahil O(n log n) olur.
+"""
+
+from typing import Callable, List, Optional
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities import DetectedEntity
+
+
+_EMPTY = float('-inf')
+
+
+class IntervalIndex:
+    """Kabul edilen aralıklar üzerinde ilk çakışan aralığı bulan indeks
+
+    Aralıklar eklenme sırasına göre indekslenir. Sorgulanan aralığın
+    başlangıcı, kayıtlı tüm aralıkların başlangıcından küçük olmamalıdır
+    (sweep-line sırası). Bu koşul bozulursa sorgu doğrusal taramaya düşer,
+    sonuç yine doğru olur.
+    """
+
+    def __init__(self, capacity: int):
+        size = 1
+        while size < max(capacity, 1):
+            size *= 2
+        self._size = size
+        self._max_end = [_EMPTY] * (2 * size)
+        self._starts = []
+        self._ends = []
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _update(self, index: int, end) -> None:
+        node = index + self._size
+        tree = self._max_end
+        tree[node] = end
+        node //= 2
+        while node:
+            left, right = tree[2 * node], tree[2 * node + 1]
+            tree[node] = left if left > right else right
+            node //= 2
+
+    def append(self, start: int, end: int) -> int:
+        """Aralık ekle, indeksini döndür"""
+        index = len(self._starts)
+        if index >= self._size:
+            self._grow()
+        self._starts.append(start)
+        self._ends.append(end)
+        self._update(index, end)
+        return index
+
+    def replace(self, index: int, start: int, end: int) -> None:
+        """index'teki aralığı yenisiyle değiştir"""
+        self._starts[index] = start
+        self._ends[index] = end
+        self._update(index, end)
+
+    def first_overlap(self, start: int, end: int) -> Optional[int]:
+        """[start, end) ile çakışan ilk (en küçük indeksli) aralık"""
+        tree = self._max_end
+        if not tree[1] > start:
+            return None
+
+        # Bitişi start'tan büyük olan ilk indeks
+        node = 1
+        while node < self._size:
+            node *= 2
+            if not tree[node] > start:
+                node += 1
+        index = node - self._size
+
+        if self._starts[index] < end:
+            return index
+
+        # Sweep-line koşulu dışı (boş aralık vb.) - doğrusal tarama
+        starts, ends = self._starts, self._ends
+        for i in range(index + 1, len(starts)):
+            if start < ends[i] and end > starts[i]:
+                return i
+        return None
+
+    def _grow(self) -> None:
+        """Kapasiteyi iki katına çıkar, ağacı yeniden kur"""
+        size = self._size * 2
+        tree = [_EMPTY] * (2 * size)
+        tree[size:size + len(self._ends)] = self._ends
+        for node in range(size - 1, 0, -1):
+            left, right = tree[2 * node], tree[2 * node + 1]
+            tree[node] = left if left > right else right
+        self._size = size
+        self._max_end = tree
+
+
+def resolve_overlaps(entities: List[DetectedEntity],
+                     key: Callable[[DetectedEntity], object]) -> List[DetectedEntity]:
+    """Entity'leri key sırasıyla gezer, kabul edilenlerle çakışmayanları tutar
+
+    key başlangıç pozisyonu ile başlamalıdır (sweep-line sırası).
+    """
+    result = []
+    index = IntervalIndex(len(entities))
+    for entity in sorted(entities, key=key):
+        if index.first_overlap(entity.start_pos, entity.end_pos) is None:
+            index.append(entity.start_pos, entity.end_pos)
+            result.append(entity)
+    return result
@@ -0,0 +1,343 @@
+"""
+Yapılandırılmış Kayıt Anonimleştirme - JSONL ve CSV
+
+JSONL / CSV export'larında serbest metin yalnızca bazı alanlardadır (not,
+transkript, müşteri yorumu). Dosya tek metin gibi işlenirse kimlik, tarih
+ve tutar kolonları da taranır ve biçim bozulabilir. Bu modül kayıtları
+akış halinde okur ve yalnızca seçilen alanları anonimleştirir:
+
+- JSONL: her satır bir JSON nesnesi; alanlar ad veya noktalı yol
+  ("customer.comment") ile seçilir. Seçilen alanın değeri string ise
+  (string dizisiyse her elemanı) anonimleştirilir.
+- CSV: ilk satır başlıktır, alanlar kolon adıyla seçilir; tırnaklı
+  alanlar ve alan içi satır sonları desteklenir.
+- Satır ham metin üzerinde taranır ve yalnızca değişen değerlerin ham
+  aralığı yeniden yazılır: diğer alanlar, boşluklar, anahtar sırası,
+  tırnaklama ve satır sonları bayt bayt korunur.
+- Kayıtlar parçalar halinde anonymize_many'ye (veya BatchPool'a) verilir;
+  en fazla max_in_flight parça aynı anda işlenir ve parçalar sırayla
+  yazılır. Bellek kullanımı dosya boyutundan bağımsızdır.
+
+Bozuk kayıt (geçersiz JSON, kapanmamış tırnak) işlemi satır numarasıyla
+durdurur; anonimleştirilmemiş kayıt çıktıya geçmez.
+"""
+
+from collections import Counter, deque
+from json.decoder import JSONDecoder, scanstring
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+RECORD_FORMATS = ('jsonl', 'csv')
+DEFAULT_CHUNK_RECORDS = 256
+
+# (başlangıç, bitiş, çözülmüş değer, tırnaklı mı) - ham kayıt içindeki aralık
+Span = Tuple[int, int, str, bool]
+
+_decoder = JSONDecoder()
+_WS = re.compile(r'[ \t\n\r]*')
+
+
+def record_format_for(path: str) -> str:
+    """Dosya uzantısından kayıt formatı (.csv -> csv, diğerleri jsonl)"""
+    return 'csv' if path.lower().endswith('.csv') else 'jsonl'
+
+
+def _split_terminator(raw: str) -> int:
+    """Satır sonu karakterleri hariç uzunluk"""
+    end = len(raw)
+    while end and raw[end - 1] in '\r\n':
+        end -= 1
+    return end
+
+
+# ---- JSONL ----
+
+def field_tree(fields: Iterable[str]) -> dict:
+    """["note", "customer.comment"] -> {"note": True, "customer": {"comment": True}}"""
+    tree = {}
+    for field in fields:
+        node = tree
+        parts = field.split('.')
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is True:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = True
+    return tree
+
+
+def _value_spans(s: str, idx: int, target, out: List[Span]) -> int:
+    """idx'teki JSON değerini geçer, hedef string'lerin aralıklarını out'a ekler"""
+    if target is None:
+        return _decoder.raw_decode(s, idx)[1]
+    char = s[idx]
+    if target is True:
+        if char == '"':
+            value, end = scanstring(s, idx + 1)
+            out.append((idx, end, value, True))
+            return end
+        if char == '[':
+            return _array_spans(s, idx, out)
+    elif char == '{':
+        return _object_spans(s, idx, target, out)
+    return _decoder.raw_decode(s, idx)[1]
+
+
+def _array_spans(s: str, idx: int, out: List[Span]) -> int:
+    idx = _WS.match(s, idx + 1).end()
+    if s[idx] == ']':
+        return idx + 1
+    while True:
+        idx = _value_spans(s, idx, True, out)
+        idx = _WS.match(s, idx).end()
+        if s[idx] == ']':
+            return idx + 1
+        if s[idx] != ',':
+            raise ValueError("',' veya ']' bekleniyordu")
+        idx = _WS.match(s, idx + 1).end()
+
+
+def _object_spans(s: str, idx: int, tree: dict, out: List[Span]) -> int:
+    idx = _WS.match(s, idx + 1).end()
+    if s[idx] == '}':
+        return idx + 1
+    while True:
+        if s[idx] != '"':
+            raise ValueError("anahtar bekleniyordu")
+        key, idx = scanstring(s, idx + 1)
+        idx = _WS.match(s, idx).end()
+        if s[idx] != ':':
+            raise ValueError("':' bekleniyordu")
+        idx = _WS.match(s, idx + 1).end()
+        idx = _value_spans(s, idx, tree.get(key), out)
+        idx = _WS.match(s, idx).end()
+        if s[idx] == '}':
+            return idx + 1
+        if s[idx] != ',':
+            raise ValueError("',' veya '}' bekleniyordu")
+        idx = _WS.match(s, idx + 1).end()
+
+
+def jsonl_spans(line: str, tree: dict) -> List[Span]:
+    """JSON nesnesi satırındaki hedef string değerlerin aralıkları (satır doğrulanır)"""
+    out = []
+    idx = _WS.match(line).end()
+    try:
+        if line[idx] != '{':
+            raise ValueError("JSON nesnesi bekleniyordu")
+        idx = _object_spans(line, idx, tree, out)
+    except IndexError:
+        raise ValueError("satır beklenmedik şekilde bitti")
+    if _WS.match(line, idx).end() != len(line):
+        raise ValueError("nesneden sonra fazladan veri")
+    return out
+
+
+def encode_json(value: str, raw: str) -> str:
+    """JSON string; orijinali yalnızca ASCII kaçışlarıyla yazılmışsa aynı stilde"""
+    return json.dumps(value, ensure_ascii=raw.isascii())
+
+
+def iter_jsonl(lines: Iterable[str], fields: Sequence[str]) -> Iterator[Tuple[str, List[Span]]]:
+    tree = field_tree(fields)
+    for line_no, raw in enumerate(lines, 1):
+        body = raw[:_split_terminator(raw)]
+        if not body.strip():
+            yield raw, []
+            continue
+        try:
+            yield raw, jsonl_spans(body, tree)
+        except ValueError as e:
+            raise ValueError(f"{line_no}. satır geçerli bir JSON nesnesi değil: {e}") from None
+
+
+# ---- CSV ----
+
+def csv_spans(record: str, delimiter: str = ',') -> List[Span]:
+    """CSV kaydındaki (satır sonu hariç) tüm alanların aralıkları"""
+    spans = []
+    i, n = 0, len(record)
+    while True:
+        if i < n and record[i] == '"':
+            j = i + 1
+            while True:
+                k = record.find('"', j)
+                if k == -1:
+                    raise ValueError("kapanmamış tırnak")
+                if k + 1 < n and record[k + 1] == '"':
+                    j = k + 2
+                    continue
+                break
+            spans.append((i, k + 1, record[i + 1:k].replace('""', '"'), True))
+            i = k + 1
+            if i < n and record[i] != delimiter:
+                raise ValueError("kapanan tırnaktan sonra ayırıcı bekleniyordu")
+        else:
+            k = record.find(delimiter, i)
+            end = n if k == -1 else k
+            spans.append((i, end, record[i:end], False))
+            i = end
+        if i >= n:
+            return spans
+        i += 1
+        if i == n:
+            spans.append((n, n, '', False))
+            return spans
+
+
+def encode_csv(value: str, quoted: bool, delimiter: str = ',') -> str:
+    if quoted or any(char in value for char in (delimiter, '"', '\r', '\n')):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _csv_records(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """Fiziksel satırları kayıtlara birleştirir (tırnak içindeki satır sonları)"""
+    parts = []
+    quotes = 0
+    line_no = 0
+    for line in lines:
+        line_no += 1
+        parts.append(line)
+        quotes += line.count('"')
+        if quotes % 2 == 0:
+            yield line_no, ''.join(parts)
+            parts = []
+            quotes = 0
+    if parts:
+        yield line_no, ''.join(parts)
+
+
+def iter_csv(lines: Iterable[str], fields: Sequence[str],
+             delimiter: str = ',') -> Iterator[Tuple[str, List[Span]]]:
+    records = _csv_records(lines)
+    header = next(records, None)
+    if header is None:
+        return
+    line_no, raw = header
+    names = [value for _, _, value, _ in csv_spans(raw[:_split_terminator(raw)].lstrip('\ufeff'), delimiter)]
+    missing = [field for field in fields if field not in names]
+    if missing:
+        raise ValueError(f"CSV başlığında olmayan alan(lar): {', '.join(missing)} (kolonlar: {', '.join(names)})")
+    columns = [i for i, name in enumerate(names) if name in fields]
+    yield raw, []
+
+    for line_no, raw in records:
+        body = raw[:_split_terminator(raw)]
+        if not body:
+            yield raw, []
+            continue
+        try:
+            spans = csv_spans(body, delimiter)
+        except ValueError as e:
+            raise ValueError(f"{line_no}. satırda bozuk CSV kaydı: {e}") from None
+        yield raw, [spans[i] for i in columns if i < len(spans)]
+
+
+# ---- Ortak ----
+
+def splice(raw: str, spans: List[Span], values: List[str], encode) -> str:
+    """Değişen değerlerin ham aralıklarını yeniden yazar, geri kalanı aynen korur"""
+    parts = []
+    cursor = 0
+    for (start, end, original, quoted), value in zip(spans, values):
+        if value == original:
+            continue
+        parts.append(raw[cursor:start])
+        parts.append(encode(value, raw[start:end], quoted))
+        cursor = end
+    if not parts:
+        return raw
+    parts.append(raw[cursor:])
+    return ''.join(parts)
+
+
+def anonymize_records(lines: Iterable[str], write, record_format: str, fields: Sequence[str],
+                      anonymizer=None, pool=None, min_confidence: float = 0.5,
+                      profile: Optional[str] = None, delimiter: str = ',',
+                      chunk_records: int = DEFAULT_CHUNK_RECORDS,
+                      max_in_flight: Optional[int] = None) -> Dict:
+    """Kayıtların seçili alanlarını anonimleştirip çıktıyı girdi sırasıyla yazar
+
+    Args:
+        lines: Girdi satırları (newline='' ile açılmış dosya; satır sonları korunur)
+        write: Çıktı yazma fonksiyonu (ör. dosya.write)
+        record_format: "jsonl" veya "csv"
+        fields: Anonimleştirilecek alanlar (JSONL: noktalı yol, CSV: kolon adı)
+        anonymizer: Aynı process'te kullanılacak KVKKAnonymizer (pool yoksa)
+        pool: BatchPool; verilirse parçalar worker'larda işlenir
+        min_confidence: Minimum güven eşiği (0-1)
+        profile: Worker'larda kullanılacak detector profili (None: varsayılan)
+        delimiter: CSV ayırıcısı
+        chunk_records: Parça başına kayıt sayısı
+        max_in_flight: Aynı anda işlenen en fazla parça (None: worker sayısının 2 katı)
+
+    Returns:
+        {"records", "fields", "changed", "types", "seconds"}
+    """
+    if record_format == 'jsonl':
+        records = iter_jsonl(lines, fields)
+        encode = lambda value, raw, quoted: encode_json(value, raw)
+    elif record_format == 'csv':
+        records = iter_csv(lines, fields, delimiter)
+        encode = lambda value, raw, quoted: encode_csv(value, quoted, delimiter)
+    else:
+        raise ValueError(f"Bilinmeyen kayıt formatı: {record_format!r} (geçerli: {', '.join(RECORD_FORMATS)})")
+    if pool is None and anonymizer is None:
+        raise ValueError("anonymizer veya pool verilmelidir")
+
+    started = time.perf_counter()
+    stats = {"records": 0, "fields": 0, "changed": 0}
+    types = Counter()
+
+    def submit(chunk):
+        texts = [value for _, spans in chunk for _, _, value, _ in spans]
+        if pool is not None:
+            return pool.submit(texts, min_confidence, profile)
+        return [result.to_dict() for result in anonymizer.anonymize_many(texts, min_confidence)]
+
+    def flush(chunk, results):
+        if pool is not None:
+            results = results.result()
+        results = iter(results)
+        for raw, spans in chunk:
+            values = []
+            for _, _, original, _ in spans:
+                result = next(results)
+                values.append(result["sanitized_text"])
+                types.update(result["detected_data_types"])
+                stats["changed"] += result["sanitized_text"] != original
+            stats["fields"] += len(spans)
+            write(splice(raw, spans, values, encode) if spans else raw)
+        stats["records"] += len(chunk)
+
+    limit = max_in_flight or (2 * pool.workers if pool is not None else 1)
+    in_flight = deque()
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_records:
+            in_flight.append((chunk, submit(chunk)))
+            chunk = []
+            if len(in_flight) >= limit:
+                flush(*in_flight.popleft())
+    if chunk:
+        in_flight.append((chunk, submit(chunk)))
+    while in_flight:
+        flush(*in_flight.popleft())
+
+    # Başlık satırı kayıt sayılmaz
+    if record_format == 'csv' and stats["records"]:
+        stats["records"] -= 1
+    stats["types"] = dict(types)
+    stats["seconds"] = time.perf_counter() - started
+    return stats
@@ -0,0 +1,327 @@
+"""
+Sonuç Önbelleği - İçerik adresli LRU/TTL cache
+
+IVR anonsları, temsilci scriptleri ve şablon SMS'ler /anonymize'a birebir
+aynı metinle tekrar tekrar gelir. KVKKAnonymizer sonucu şu anahtarla
+önbelleğe alınır:
+
+    sha256(metin, min_confidence, etkin detector kümesi, konfigürasyon sürümü)
+
+Konfigürasyon sürümü; placeholder'lardan, detector pattern kayıtlarından
+ve NER backend'inden türetilir, bunlardan biri değişince eski kayıtlar
+kendiliğinden geçersiz olur. AI NER'in atlandığı (devre açık, zaman
+aşımı, API hatası) tespitlerin sonuçları eksik olduğundan önbelleğe hiç
+yazılmaz (bkz. AINERDetector.skipped).
+
+İki katman vardır:
+- MemoryCache: process içi, kayıt sayısı ve yaklaşık bayt sınırlı LRU
+- SQLiteCache: opsiyonel paylaşımlı katman (birden fazla process / worker
+  aynı dosyayı kullanır)
+
+DİKKAT: Önbellekteki sonuçlar tespit edilen orijinal değerleri içerir.
+Paylaşımlı SQLite dosyası kişisel veri barındırır; erişimi kısıtlı bir
+yerde tutulmalıdır.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+import hashlib
+import json
+import sys
+import os
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import (
+    EntityType, RESULT_CACHE_MAX_MB, RESULT_CACHE_PATH, RESULT_CACHE_SIZE, RESULT_CACHE_TTL,
+)
+from entities import AnonymizationResult, DetectedEntity
+from engine.substitution import OffsetMap
+
+
+# Kayıt formatı değişirse artırılır
+CACHE_FORMAT = 1
+
+
+def config_fingerprint(detectors: Iterable, placeholders: Dict) -> str:
+    """Sonucu etkileyen konfigürasyonun kısa özeti"""
+    parts = [CACHE_FORMAT, sorted((key.value, value) for key, value in placeholders.items())]
+    for detector in detectors:
+        describe = getattr(detector, 'describe_patterns', None)
+        backend = getattr(detector, 'backend', None)
+        parts.append([
+            detector.name,
+            describe() if describe else None,
+            backend.name if backend is not None else None,
+        ])
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+
+
+def cache_key(text: str, min_confidence: float, detector_names: Iterable[str], config_version: str,
+              entity_types: Optional[Iterable[str]] = None) -> str:
+    """(metin, min_confidence, detector kümesi, konfigürasyon sürümü[, entity tipleri]) özeti"""
+    digest = hashlib.sha256()
+    parts = [text, repr(float(min_confidence)), ",".join(sorted(detector_names)), config_version]
+    if entity_types is not None:
+        parts.append("types:" + ",".join(sorted(entity_types)))
+    for part in parts:
+        digest.update(part.encode('utf-8', 'surrogatepass'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def result_to_record(result: AnonymizationResult) -> str:
+    """AnonymizationResult -> JSON (paylaşımlı katman için)"""
+    return json.dumps({
+        'detected': result.is_personal_data_detected,
+        'types': result.detected_data_types,
+        'sanitized': result.sanitized_text,
+        'entities': [
+            [e.entity_type.value, e.value, e.start_pos, e.end_pos, e.confidence, e.context]
+            for e in result.entities or []
+        ],
+        'offsets': result.offset_map.segments if result.offset_map is not None else None,
+    }, ensure_ascii=False)
+
+
+def record_to_result(record: str) -> AnonymizationResult:
+    data = json.loads(record)
+    return AnonymizationResult(
+        is_personal_data_detected=data['detected'],
+        detected_data_types=data['types'],
+        sanitized_text=data['sanitized'],
+        entities=[
+            DetectedEntity(EntityType(entity_type), value, start, end, confidence, context)
+            for entity_type, value, start, end, confidence, context in data['entities']
+        ],
+        offset_map=OffsetMap([tuple(s) for s in data['offsets']]) if data['offsets'] is not None else None,
+    )
+
+
+def estimate_result_size(result: AnonymizationResult) -> int:
+    """Önbellekteki bir sonucun yaklaşık bellek maliyeti (bayt)"""
+    size = 256 + 2 * len(result.sanitized_text)
+    for entity in result.entities or []:
+        size += 200 + 2 * len(entity.value)
+    if result.offset_map is not None:
+        size += 120 * len(result.offset_map)
+    return size
+
+
+class MemoryCache:
+    """Thread-safe LRU + TTL önbellek
+
+    Kayıt sayısı (max_entries) ve toplam yaklaşık boyut (max_bytes) ile
+    sınırlıdır; sınır aşılınca en eski kullanılan kayıtlar atılır.
+    Döndürülen nesneler paylaşılır, çağıran tarafından değiştirilmemelidir.
+    """
+
+    def __init__(self, max_entries: int, ttl: Optional[float] = None, max_bytes: Optional[int] = None,
+                 sizeof: Callable[[Any], int] = lambda value: 1, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data = OrderedDict()  # key -> (value, size, expires)
+        self.bytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[2] is not None and entry[2] <= self._clock():
+                self._remove(key)
+                return None
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, value: Any) -> None:
+        size = self.sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires = self._clock() + self.ttl if self.ttl else None
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, size, expires)
+            self.bytes += size
+            while self._data and (len(self._data) > self.max_entries
+                                  or (self.max_bytes is not None and self.bytes > self.max_bytes)):
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def pop(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key not in self._data:
+                return None
+            value = self._data[key][0]
+            self._remove(key)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._data.pop(key)
+        self.bytes -= size
+
+
+class SQLiteCache:
+    """Process'ler arası paylaşımlı önbellek (SQLite dosyası, WAL modu)
+
+    Değerler JSON metni olarak saklanır. Kayıt sayısı max_entries'i
+    aşınca en eski kullanılanlar toplu olarak silinir.
+    """
+
+    # Budama kontrolü her N yazmada bir yapılır
+    PRUNE_EVERY = 256
+
+    def __init__(self, path: str, max_entries: int, ttl: Optional[float] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._local = threading.local()
+        self._writes = 0
+        # sqlite3 yalnızca disk önbelleği kurulduğunda yüklenir
+        import sqlite3
+        self._sqlite = sqlite3
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL, accessed REAL NOT NULL)"
+        )
+
+    def _connection(self) -> 'sqlite3.Connection':
+        # sqlite3 bağlantıları thread / process arasında paylaşılmaz
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = self._sqlite.connect(self.path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT value, expires FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= now:
+                connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            connection.execute("UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+            return row[0]
+        except self._sqlite.Error as e:
+            print(f"Warning: result cache read failed: {e}")
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        now = time.time()
+        try:
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires, accessed) VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl if self.ttl else None, now),
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                self.prune()
+        except self._sqlite.Error as e:
+            print(f"Warning: result cache write failed: {e}")
+
+    def prune(self) -> None:
+        connection = self._connection()
+        connection.execute("DELETE FROM cache WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+        connection.execute(
+            "DELETE FROM cache WHERE key IN ("
+            " SELECT key FROM cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM cache")
+
+
+class ResultCache:
+    """AnonymizationResult önbelleği: process içi LRU + opsiyonel paylaşımlı katman
+
+    Kullanım:
+        cache = ResultCache(max_entries=10000, ttl=3600)
+        anonymizer = KVKKAnonymizer(cache=cache)
+        cache.stats()  # {"hits": ..., "misses": ..., ...}
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = 64 * 1024 * 1024, shared: Optional[SQLiteCache] = None):
+        self.memory = MemoryCache(max_entries, ttl=ttl, max_bytes=max_bytes, sizeof=estimate_result_size)
+        self.shared = shared
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls) -> Optional['ResultCache']:
+        """config.RESULT_CACHE_* ayarlarından oluşturur (boyut 0 ise None)"""
+        if RESULT_CACHE_SIZE <= 0:
+            return None
+        shared = SQLiteCache(RESULT_CACHE_PATH, RESULT_CACHE_SIZE, RESULT_CACHE_TTL) if RESULT_CACHE_PATH else None
+        return cls(RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL,
+                   max_bytes=int(RESULT_CACHE_MAX_MB * 1024 * 1024), shared=shared)
+
+    def get(self, key: str) -> Optional[AnonymizationResult]:
+        result = self.memory.get(key)
+        if result is None and self.shared is not None:
+            record = self.shared.get(key)
+            if record is not None:
+                result = record_to_result(record)
+                self.memory.put(key, result)
+                with self._lock:
+                    self.shared_hits += 1
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def put(self, key: str, result: AnonymizationResult) -> None:
+        self.memory.put(key, result)
+        if self.shared is not None:
+            self.shared.put(key, result_to_record(result))
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.memory),
+            "bytes": self.memory.bytes,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "evictions": self.memory.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "shared": self.shared.path if self.shared is not None else None,
+        }
@@ -0,0 +1,143 @@
+"""
+Başlangıç Snapshot'ı - Derlenmiş Pattern'ler ve Sözlük Trie'si
+
+Soğuk başlangıçta (CLI, serverless) sürenin çoğu detector regex'lerinin
+derlenmesine gider: re modülünün ayrıştırıcısı ve optimizer'ı saf
+Python'dur. tools/build_snapshot.py bu işin sonucunu tek bir dosyaya yazar;
+config.SNAPSHOT_PATH (KVKK_SNAPSHOT) verilmişse dosya ilk pattern
+derlemesinde bir kez okunur:
+
+- Pattern'ler: re derleyicisinin ürettiği opcode listesi, (pattern, flags)
+  anahtarıyla. Yüklenirken ayrıştırma atlanır ve _sre.compile doğrudan
+  çağrılır. Opcode formatı Python sürümüne bağlıdır: snapshot farklı bir
+  sürüm / _sre.MAGIC ile üretildiyse hiç kullanılmaz. Snapshot'ta olmayan
+  (sonradan eklenen / değişen) pattern'ler normal yoldan derlenir.
+- Sözlük: kurulmuş Gazetteer ve girdi listelerinin özeti; sözlükler
+  değiştiyse veya derlenmiş sözlük dosyası (KVKK_GAZETTEER) verilmişse
+  snapshot'taki trie kullanılmaz.
+
+Snapshot isteğe bağlıdır, dosya yoksa veya okunamazsa her şey normal yoldan
+kurulur. Dosya pickle formatındadır: yalnızca bu araçla üretilmiş ve yazma
+erişimi kısıtlı dosyalar kullanılmalıdır. Başka bir kullanıcıya ait veya
+grup / herkes tarafından yazılabilen dosyalar açılmadan reddedilir.
+"""
+
+from re import _compiler, _parser
+from typing import Dict, Optional, Pattern, Tuple
+import logging
+import os
+import pickle
+import re
+import sys
+import threading
+
+import _sre
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Dosya formatı değişirse artırılır
+SNAPSHOT_FORMAT = 1
+
+logger = logging.getLogger(__name__)
+
+# (pattern, flags) -> _sre.compile argümanları
+PatternCode = Tuple[str, int, list, int, dict, tuple]
+
+
+def runtime_tag() -> Tuple:
+    """Opcode listesinin geçerli olduğu çalışma ortamı"""
+    return (SNAPSHOT_FORMAT, sys.implementation.name, sys.version_info[:2], _sre.MAGIC, _sre.CODESIZE)
+
+
+def pattern_code(pattern: str, flags: int = 0) -> PatternCode:
+    """re.compile ile aynı adımlar; _sre.compile'a verilecek argümanları döndürür"""
+    flags = int(flags)
+    parsed = _parser.parse(pattern, flags)
+    # Opcode'lar adlı int sabitleridir (pickle edilemez); _sre düz int listesi bekler
+    code = [int(op) for op in _compiler._code(parsed, flags)]
+    groupindex = parsed.state.groupdict
+    indexgroup = [None] * parsed.state.groups
+    for name, index in groupindex.items():
+        indexgroup[index] = name
+    return (pattern, flags | parsed.state.flags, code, parsed.state.groups - 1,
+            dict(groupindex), tuple(indexgroup))
+
+
+def check_owner(path: str, stat: os.stat_result) -> None:
+    """Pickle yüklenmeden önce: dosya bu kullanıcıya ait ve yalnızca onun yazabildiği bir dosya olmalı"""
+    if hasattr(os, 'getuid') and stat.st_uid != os.getuid():
+        raise PermissionError(f"Snapshot dosyası başka bir kullanıcıya ait: {path}")
+    if stat.st_mode & 0o022:
+        raise PermissionError(f"Snapshot dosyası grup / herkes tarafından yazılabilir: {path}")
+
+
+class Snapshot:
+    """Okunmuş snapshot dosyası"""
+
+    __slots__ = ('path', 'patterns', 'gazetteer', 'gazetteer_digest', 'hits')
+
+    def __init__(self, path: str, patterns: Dict[Tuple[str, int], PatternCode],
+                 gazetteer=None, gazetteer_digest: Optional[str] = None):
+        self.path = path
+        self.patterns = patterns
+        self.gazetteer = gazetteer
+        self.gazetteer_digest = gazetteer_digest
+        self.hits = 0
+
+    @classmethod
+    def read(cls, path: str) -> Optional['Snapshot']:
+        """Dosyayı tek okumada yükler; farklı çalışma ortamında üretildiyse None"""
+        with open(path, 'rb') as f:
+            check_owner(path, os.fstat(f.fileno()))
+            data = pickle.load(f)
+        if data.get('runtime') != runtime_tag():
+            logger.warning(f"Snapshot bu Python sürümü için üretilmemiş, kullanılmıyor: {path}")
+            return None
+        return cls(path, data['patterns'], data.get('gazetteer'), data.get('gazetteer_digest'))
+
+    def write(self) -> None:
+        temp = self.path + '.tmp'
+        with open(temp, 'wb') as f:
+            pickle.dump({
+                'runtime': runtime_tag(),
+                'patterns': self.patterns,
+                'gazetteer': self.gazetteer,
+                'gazetteer_digest': self.gazetteer_digest,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # umask ne olursa olsun yalnızca sahibi yazabilir (read() aksi halde reddeder)
+        os.chmod(temp, 0o644)
+        os.replace(temp, self.path)
+
+
+_snapshot = None
+_snapshot_loaded = False
+_snapshot_lock = threading.Lock()
+
+
+def get_snapshot() -> Optional[Snapshot]:
+    """config.SNAPSHOT_PATH'teki snapshot (ilk çağrıda bir kez okunur, yoksa None)"""
+    global _snapshot, _snapshot_loaded
+    if not _snapshot_loaded:
+        with _snapshot_lock:
+            if not _snapshot_loaded:
+                from config import SNAPSHOT_PATH
+
+                if SNAPSHOT_PATH:
+                    try:
+                        _snapshot = Snapshot.read(SNAPSHOT_PATH)
+                    except Exception as e:
+                        logger.warning(f"Snapshot okunamadı, kullanılmıyor ({SNAPSHOT_PATH}): {e}")
+                _snapshot_loaded = True
+    return _snapshot
+
+
+def compile_pattern(pattern: str, flags: int = 0) -> Pattern:
+    """re.compile; pattern snapshot'ta varsa ayrıştırma atlanır"""
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        code = snapshot.patterns.get((pattern, int(flags)))
+        if code is not None:
+            snapshot.hits += 1
+            return _sre.compile(*code)
+    return re.compile(pattern, flags)
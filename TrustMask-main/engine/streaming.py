@@ -0,0 +1,161 @@
+"""
+Akış (Streaming) Anonimleştirme - Kayan pencere
+
+Parça parça gelen metin bir tamponda biriktirilir ve detector'lar
+window_size + overlap uzunluğundaki pencereler üzerinde çalıştırılır.
+
+- Pencerenin son `overlap` karakteri yazılmaz, bir sonraki pencereye
+  devredilir; sınıra denk gelen entity'ler bir sonraki turda tam haliyle
+  görülür.
+- Kesim noktası satır sonuna çekilir ve hiçbir entity'nin ortasına denk
+  gelmez.
+- Yazılmış metnin son `overlap` karakteri (tam satırlar halinde) bir
+  sonraki pencerenin başına bağlam olarak eklenir; PartialDataDetector
+  gibi önceki satırlara bakan detector'lar için. Bu bölgedeki entity'ler
+  zaten yazılmış olduğundan tekrar yazılmaz.
+
+Bellek kullanımı pencere boyutu + gelen en büyük parça ile sınırlıdır.
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities import DetectedEntity
+from engine.substitution import substitute
+
+
+DEFAULT_WINDOW_SIZE = 64 * 1024
+DEFAULT_OVERLAP = 4 * 1024
+
+
+def stream_anonymize(chunks: Iterable[str],
+                     detect: Callable[[str], List[DetectedEntity]],
+                     placeholders: Dict,
+                     window_size: int = DEFAULT_WINDOW_SIZE,
+                     overlap: int = DEFAULT_OVERLAP) -> Iterator[str]:
+    """Metin parçalarını anonimleştirip anonim parçalar üretir
+
+    Args:
+        chunks: Metin parçaları
+        detect: Metin -> çakışmaları çözülmüş entity listesi
+        placeholders: EntityType -> placeholder
+        window_size: Bir seferde yazılan yaklaşık karakter sayısı
+        overlap: Sınırda devredilen ve bağlam olarak tekrar taranan karakter sayısı
+    """
+    if window_size <= 0:
+        raise ValueError("window_size pozitif olmalı")
+    if overlap < 0:
+        raise ValueError("overlap negatif olamaz")
+
+    span = window_size + overlap
+    buffer = ''
+    context = 0   # buffer[context:pending]: yazılmış, sadece bağlam
+    pending = 0   # buffer[pending:]: henüz yazılmamış
+    parts = []
+    parts_len = 0
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parts.append(chunk)
+        parts_len += len(chunk)
+        if len(buffer) - pending + parts_len < span:
+            continue
+
+        buffer = buffer[context:] + ''.join(parts)
+        pending -= context
+        context = 0
+        parts = []
+        parts_len = 0
+
+        while len(buffer) - pending >= span:
+            output, cut = _anonymize_window(
+                buffer[context:pending + span], pending - context,
+                detect, placeholders, overlap, final=False
+            )
+            if output:
+                yield output
+            pending = context + cut
+            context = _context_start(buffer, pending, overlap)
+
+        # Bağlam dışında kalan kısmı bırak
+        buffer = buffer[context:]
+        pending -= context
+        context = 0
+
+    buffer = buffer[context:] + ''.join(parts)
+    pending -= context
+    context = 0
+
+    while len(buffer) - pending >= span:
+        output, cut = _anonymize_window(
+            buffer[context:pending + span], pending - context,
+            detect, placeholders, overlap, final=False
+        )
+        if output:
+            yield output
+        pending = context + cut
+        context = _context_start(buffer, pending, overlap)
+
+    if pending < len(buffer):
+        output, _ = _anonymize_window(
+            buffer[context:], pending - context,
+            detect, placeholders, overlap, final=True
+        )
+        if output:
+            yield output
+
+
+def _anonymize_window(window: str, context_len: int,
+                      detect: Callable[[str], List[DetectedEntity]],
+                      placeholders: Dict, overlap: int,
+                      final: bool) -> Tuple[str, int]:
+    """Pencereyi tara, window[context_len:cut] kısmını anonimleştir
+
+    Returns:
+        (anonim metin, cut) - cut pencereye göre kesim noktası
+    """
+    entities = detect(window) if window[context_len:].strip() else []
+
+    if final:
+        cut = len(window)
+    else:
+        cut = len(window) - overlap
+        # Satır ortasından kesme
+        newline = window.rfind('\n', context_len, cut)
+        if newline >= context_len:
+            cut = newline + 1
+        # Entity ortasından kesme
+        for entity in entities:
+            if entity.start_pos >= context_len and entity.start_pos < cut < entity.end_pos:
+                cut = entity.start_pos if entity.start_pos > context_len else entity.end_pos
+                break
+
+    selected = []
+    for entity in entities:
+        if entity.end_pos <= context_len or entity.start_pos >= cut:
+            continue
+        # Bağlamdan taşan kısım (önceki kesimde görülmemiş entity) yine maskelenir
+        selected.append(DetectedEntity(
+            entity_type=entity.entity_type,
+            value=entity.value,
+            start_pos=max(entity.start_pos, context_len) - context_len,
+            end_pos=min(entity.end_pos, cut) - context_len,
+            confidence=entity.confidence,
+            context=entity.context
+        ))
+
+    output, _ = substitute(window[context_len:cut], selected, placeholders)
+    return output, cut
+
+
+def _context_start(buffer: str, position: int, overlap: int) -> int:
+    """position'dan en fazla overlap geriye, satır başına hizalanmış bağlam başlangıcı"""
+    start = max(position - overlap, 0)
+    if start > 0 and buffer[start - 1] != '\n':
+        newline = buffer.find('\n', start, position)
+        start = newline + 1 if newline != -1 else start
+    return start
@@ -0,0 +1,117 @@
+"""
+Placeholder Yerleştirme - Tek geçişli metin kurucu
+
+Entity'ler başlangıç sırasıyla gezilir; aradaki orijinal metin dilimleri ve
+placeholder'lar bir listeye eklenip tek bir join ile birleştirilir. Maliyet
+metin boyu + entity sayısı ile doğrusaldır.
+
+Yerleştirme sırasında orijinal ve anonim metin arasındaki pozisyon eşlemesi
+(OffsetMap) de çıkarılır.
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities import DetectedEntity
+
+
+DEFAULT_PLACEHOLDER = "[FİLTRELENDİ]"
+
+
+class OffsetMap:
+    """Orijinal metin <-> anonim metin pozisyon eşlemesi
+
+    Her değiştirilen aralık için (orijinal başlangıç, orijinal bitiş,
+    yeni başlangıç, yeni bitiş) tutulur. Değiştirilmiş bir aralığın
+    içindeki pozisyonlar, karşı taraftaki aralığın başına eşlenir.
+    """
+
+    def __init__(self, segments: List[Tuple[int, int, int, int]]):
+        self.segments = segments
+        self._original_starts = [segment[0] for segment in segments]
+        self._sanitized_starts = [segment[2] for segment in segments]
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def to_sanitized(self, position: int) -> int:
+        """Orijinal metindeki pozisyonun anonim metindeki karşılığı"""
+        i = bisect_right(self._original_starts, position) - 1
+        if i < 0:
+            return position
+        start, end, new_start, new_end = self.segments[i]
+        if position < end:
+            return new_start
+        return position + (new_end - end)
+
+    def to_original(self, position: int) -> int:
+        """Anonim metindeki pozisyonun orijinal metindeki karşılığı"""
+        i = bisect_right(self._sanitized_starts, position) - 1
+        if i < 0:
+            return position
+        start, end, new_start, new_end = self.segments[i]
+        if position < new_end:
+            return start
+        return position + (end - new_end)
+
+    def to_list(self) -> List[dict]:
+        return [
+            {
+                "original_start": start,
+                "original_end": end,
+                "sanitized_start": new_start,
+                "sanitized_end": new_end,
+            }
+            for start, end, new_start, new_end in self.segments
+        ]
+
+
+def substitute(text: str, entities: List[DetectedEntity],
+               placeholders: Dict) -> Tuple[str, Optional[OffsetMap]]:
+    """Entity'leri placeholder'larla değiştir, (anonim metin, OffsetMap) döndür
+
+    Entity'ler çakışmıyor olmalıdır (_resolve_overlaps çıktısı). Çakışan,
+    ters aralıklı veya aynı pozisyondan başlayan entity varsa eski sağdan
+    sola yerleştirme kullanılır ve OffsetMap None döner.
+    """
+    if not entities:
+        return text, OffsetMap([])
+
+    ordered = sorted(entities, key=lambda e: e.start_pos)
+
+    parts = []
+    segments = []
+    cursor = 0
+    length = 0
+    for entity in ordered:
+        start, end = entity.start_pos, entity.end_pos
+        # Aynı pozisyondan başlayan entity'lerde eski sıralama korunmalı
+        if start < cursor or end < start or (segments and start == segments[-1][0]):
+            return _splice(text, entities, placeholders), None
+        placeholder = placeholders.get(entity.entity_type, DEFAULT_PLACEHOLDER)
+
+        parts.append(text[cursor:start])
+        length += start - cursor
+        parts.append(placeholder)
+        segments.append((start, end, length, length + len(placeholder)))
+        length += len(placeholder)
+        cursor = end
+
+    parts.append(text[cursor:])
+    return ''.join(parts), OffsetMap(segments)
+
+
+def _splice(text: str, entities: List[DetectedEntity], placeholders: Dict) -> str:
+    """Eski yöntem: sağdan sola dilimleyerek değiştir"""
+    sorted_entities = sorted(entities, key=lambda e: e.start_pos, reverse=True)
+
+    result = text
+    for entity in sorted_entities:
+        placeholder = placeholders.get(entity.entity_type, DEFAULT_PLACEHOLDER)
+        result = result[:entity.start_pos] + placeholder + result[entity.end_pos:]
+
+    return result
@@ -0,0 +1,135 @@
+"""
+Doküman Triage - Detector'lar çalışmadan önce ucuz ön eleme
+
+Trafiğin büyük kısmı ("evet", "teşekkürler", bekletme anonsları, bot
+karşılamaları) hiç kişisel veri içermez. Triage metnin karakter sınıfı
+özelliklerini (rakam, büyük harf, '@', ':') ve anahtar kelimelerini bir kez
+çıkarır; her detector bu özelliklere bakarak (can_match) bu metinde bir
+şey bulmasının mümkün olup olmadığını söyler. Sonuç detector başına bir
+atlama maskesidir.
+
+Regex detector'ları yalnızca eşleşme kesin olarak imkânsızsa atlanır:
+tetikleyiciler detector'ın kendi pattern'lerinden türetilir ve sonuçlar
+triage açık/kapalı aynıdır. AI NER büyük harf içermeyen metinde atlanır;
+isteğe bağlı kayıplı sezgisel için bkz. AINERDetector.can_match. Atlama
+kararları Triage.stats() ile izlenir.
+"""
+
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Sequence
+
+from nlp.gazetteer import fold
+
+
+_DIGIT = re.compile(r'\d')
+_WORD = re.compile(r'\w+')
+
+# re.IGNORECASE'in lower() dışında eşit saydığı Latin harfler
+_IGNORECASE_FOLD = str.maketrans({'ſ': 's'})
+
+
+@lru_cache(maxsize=None)
+def fold_keywords(keywords: tuple) -> tuple:
+    """Anahtar kelimeleri metinle aynı şekilde katlar (detector başına bir kez)"""
+    return tuple(fold(keyword).translate(_IGNORECASE_FOLD) for keyword in keywords)
+
+
+class DocumentFeatures:
+    """Bir metnin triage özellikleri (katlanmış metin ve kelimeler ilk ihtiyaçta hesaplanır)
+
+    has_digits: metinde rakam (\\d) var mı
+    has_upper:  metinde büyük harf var mı
+    """
+
+    __slots__ = ('text', 'has_digits', 'has_upper', '_folded', '_words')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.has_digits = _DIGIT.search(text) is not None
+        self.has_upper = text != text.lower()
+        self._folded = None
+        self._words = None
+
+    @property
+    def folded(self) -> str:
+        """Türkçe'ye duyarlı küçük harfli metin ('İ', 'I', 'ı' -> 'i')"""
+        if self._folded is None:
+            self._folded = fold(self.text).translate(_IGNORECASE_FOLD)
+        return self._folded
+
+    @property
+    def words(self) -> frozenset:
+        """Katlanmış metindeki kelimeler (\\w+)"""
+        if self._words is None:
+            self._words = frozenset(_WORD.findall(self.folded))
+        return self._words
+
+    def has_char(self, chars: str) -> bool:
+        """Karakterlerden herhangi biri metinde geçiyor mu"""
+        return any(char in self.text for char in chars)
+
+    def contains(self, keywords: tuple) -> bool:
+        """Anahtar kelimelerden herhangi biri metinde geçiyor mu (büyük/küçük harf duyarsız alt dize)"""
+        folded = self.folded
+        return any(keyword in folded for keyword in fold_keywords(keywords))
+
+    def has_word(self, words: frozenset) -> bool:
+        """Kelimelerden herhangi biri metinde tam kelime olarak geçiyor mu"""
+        return not words.isdisjoint(self.words)
+
+
+class Triage:
+    """Detector başına atlama maskesi üretir
+
+    Kullanım:
+        triage = Triage(anonymizer.detectors)
+        skip = triage.mask(text)      # (False, True, ...) detector sırasıyla
+        triage.stats()["skipped"]     # {"PhoneDetector": 12, ...}
+    """
+
+    # Kısa metinlerin (bot mesajları, "evet", anonslar) maskesi tekrar kullanılır
+    MEMO_MAX_CHARS = 200
+    MEMO_SIZE = 4096
+
+    def __init__(self, detectors: Sequence):
+        self.detectors = list(detectors)
+        self._checks = [getattr(detector, 'can_match', None) for detector in self.detectors]
+        self._memo: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self.documents = 0
+        self.fully_skipped = 0
+        self._skipped = [0] * len(self.detectors)
+
+    def _compute(self, text: str) -> tuple:
+        doc = DocumentFeatures(text)
+        return tuple(check is not None and not check(doc) for check in self._checks)
+
+    def mask(self, text: str) -> tuple:
+        """Detector sırasıyla atlama maskesi (True = bu metinde çalıştırma)"""
+        skip = self._memo.get(text)
+        if skip is None:
+            skip = self._compute(text)
+            if len(text) <= self.MEMO_MAX_CHARS:
+                if len(self._memo) >= self.MEMO_SIZE:
+                    self._memo.clear()
+                self._memo[text] = skip
+
+        with self._lock:
+            self.documents += 1
+            if all(skip):
+                self.fully_skipped += 1
+            skipped = self._skipped
+            for i, flag in enumerate(skip):
+                if flag:
+                    skipped[i] += 1
+        return skip
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "documents": self.documents,
+                "fully_skipped": self.fully_skipped,
+                "skipped": {detector.name: count for detector, count in zip(self.detectors, self._skipped)},
+            }
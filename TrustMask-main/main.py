@@ -6,6 +6,10 @@ KVKK Veri Anonimleştirme Sistemi - CLI Arayüzü
 Kullanım:
     python main.py --text "Merhaba, ben Ahmet Yılmaz"
     python main.py --file input.txt --output output.txt
+    python main.py --file crm_export.txt --stream
+    python main.py --inputs exports/ "archive/**/*.txt" --output-dir anonymized/ --workers auto
+    python main.py --records tickets.jsonl --fields note,customer.comment
+    python main.py --records survey.csv --fields customer_comment --workers 4
     python main.py --interactive
     
     echo "Test metni" | python main.py --stdin
@@ -20,6 +24,9 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from anonymizer import KVKKAnonymizer, anonymize_text
+from config import DETECTOR_PROFILES
+from engine.file_jobs import DEFAULT_CHUNK_SIZE, process_files
+from engine.records import RECORD_FORMATS, anonymize_records, record_format_for
 
 
 def process_text(text: str, anonymizer: KVKKAnonymizer, format_output: str = "json") -> str:
@@ -72,6 +79,92 @@ def process_file(input_path: str, output_path: str, anonymizer: KVKKAnonymizer)
     print(f"Tespit edilen veri tipleri: {result.detected_data_types}")
 
 
+def process_file_stream(input_path: str, output_path: str, anonymizer: KVKKAnonymizer,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """Büyük dosyaları belleğe almadan parça parça işle"""
+    with open(input_path, 'r', encoding='utf-8') as src, \
+            open(output_path, 'w', encoding='utf-8') as dst:
+        chunks = iter(lambda: src.read(chunk_size), '')
+        for sanitized_chunk in anonymizer.anonymize_stream(chunks):
+            dst.write(sanitized_chunk)
+    
+    print(f"Dosya işlendi (stream): {input_path} -> {output_path}")
+
+
+def process_inputs(args, anonymizer: KVKKAnonymizer) -> int:
+    """Dizin / glob / dosya listesini process havuzunda işle, özet yazdır (çıkış kodu döner)"""
+    def report(result):
+        status = result["status"]
+        if status == "error":
+            print(f"HATA: {result['input']}: {result['error']}", file=sys.stderr)
+        elif status == "done" or args.verbose:
+            print(f"[{status}] {result['input']} -> {result['output']}")
+    
+    summary = process_files(
+        anonymizer, args.inputs, output_dir=args.output_dir, include=args.include,
+        workers=args.workers, manifest_path=args.manifest, min_confidence=args.min_confidence,
+        chunk_size=args.chunk_size, force=args.force, enable_name_detection=not args.no_names,
+        on_result=report,
+    )
+    
+    seconds = summary["seconds"]
+    megabytes = summary["bytes"] / (1024 * 1024)
+    print("=" * 60)
+    print(f"Dosya: {summary['files']} (işlenen {summary['done']}, "
+          f"atlanan {summary['skipped'] + summary['unchanged']}, hatalı {summary['errors']})")
+    print(f"İşlenen veri: {megabytes:.2f} MB, süre {seconds:.2f} s, worker {summary['workers']}")
+    if seconds > 0:
+        print(f"Hız: {megabytes / seconds:.2f} MB/s, {summary['done'] / seconds:.1f} dosya/s")
+    print(f"Manifest: {summary['manifest']}")
+    return 1 if summary["errors"] else 0
+
+
+def process_records(args, anonymizer: KVKKAnonymizer) -> int:
+    """JSONL / CSV dosyasının yalnızca --fields alanlarını anonimleştir (çıkış kodu döner)"""
+    fields = [field.strip() for field in (args.fields or '').split(',') if field.strip()]
+    if not fields:
+        print("HATA: --records için --fields gerekli (ör. --fields note,transcript)", file=sys.stderr)
+        return 2
+    from engine.batch_pool import BatchPool, resolve_worker_count
+
+    record_format = args.record_format or record_format_for(args.records)
+    if not args.output:
+        stem, ext = os.path.splitext(args.records)
+        args.output = f"{stem}_anonymized{ext}"
+    
+    pool = BatchPool(args.workers, enable_name_detection=not args.no_names) \
+        if resolve_worker_count(args.workers) > 1 else None
+    temp = args.output + '.tmp'
+    try:
+        # newline='': satır sonları ve alan içi satır sonları aynen korunur
+        with open(args.records, 'r', encoding='utf-8', newline='') as src, \
+                open(temp, 'w', encoding='utf-8', newline='') as dst:
+            stats = anonymize_records(
+                src, dst.write, record_format, fields, anonymizer=anonymizer, pool=pool,
+                min_confidence=args.min_confidence, profile=args.profile, delimiter=args.delimiter,
+            )
+        os.replace(temp, args.output)
+    except ValueError as e:
+        print(f"HATA: {args.records}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if pool is not None:
+            pool.close()
+        if os.path.exists(temp):
+            os.remove(temp)
+    
+    seconds = stats["seconds"]
+    megabytes = os.path.getsize(args.records) / (1024 * 1024)
+    print(f"Dosya işlendi ({record_format}): {args.records} -> {args.output}")
+    print(f"Kayıt: {stats['records']}, alan: {stats['fields']}, değişen alan: {stats['changed']}")
+    if stats["types"]:
+        print("Tespit edilen veri tipleri: " + ", ".join(f"{t} ({n})" for t, n in sorted(stats["types"].items())))
+    if seconds > 0:
+        print(f"Hız: {megabytes / seconds:.2f} MB/s, {stats['records'] / seconds:.1f} kayıt/s, "
+              f"worker {pool.workers if pool is not None else 1}")
+    return 0
+
+
 def interactive_mode(anonymizer: KVKKAnonymizer) -> None:
     """Interaktif mod"""
     print("="*60)
@@ -115,6 +208,9 @@ def main():
 Örnekler:
   %(prog)s --text "Merhaba, ben Ahmet Yılmaz. TC: 12345678901"
   %(prog)s --file input.txt --output output.txt
+  %(prog)s --file crm_export.txt --stream
+  %(prog)s --inputs exports/ "archive/**/*.txt" --output-dir anonymized/
+  %(prog)s --records tickets.jsonl --fields note,customer.comment
   %(prog)s --interactive
   echo "Test" | %(prog)s --stdin
         """
@@ -124,24 +220,58 @@ def main():
     input_group = parser.add_mutually_exclusive_group(required=True)
     input_group.add_argument('--text', '-t', type=str, help='Anonimleştirilecek metin')
     input_group.add_argument('--file', '-f', type=str, help='Giriş dosyası')
+    input_group.add_argument('--inputs', nargs='+', metavar='YOL',
+                             help='Dizinler, glob kalıpları veya dosyalar (paralel toplu işlem)')
+    input_group.add_argument('--records', type=str, metavar='DOSYA',
+                             help='JSONL / CSV dosyası; yalnızca --fields alanları anonimleştirilir')
     input_group.add_argument('--stdin', action='store_true', help='Stdin\'den oku')
     input_group.add_argument('--interactive', '-i', action='store_true', help='Interaktif mod')
     
     # Çıkış
-    parser.add_argument('--output', '-o', type=str, help='Çıkış dosyası (--file ile kullanılır)')
+    parser.add_argument('--output', '-o', type=str, help='Çıkış dosyası (--file / --records ile kullanılır)')
     parser.add_argument('--format', '-F', choices=['json', 'text', 'detailed'], default='json',
                         help='Çıkış formatı (varsayılan: json)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Dosyayı parça parça işle (büyük dosyalar için, --file ile kullanılır)')
+    
+    # Toplu dosya işleme (--inputs ile kullanılır)
+    parser.add_argument('--output-dir', '-O', type=str,
+                        help='Çıktı kök dizini (varsayılan: girdilerin yanına *_anonymized)')
+    parser.add_argument('--include', type=str, default='*.txt',
+                        help='Dizinlerde işlenecek dosya kalıbı (varsayılan: *.txt)')
+    parser.add_argument('--workers', '-w', default='auto',
+                        help='Worker process sayısı ("auto" = çekirdek sayısı, 1 = tek process)')
+    parser.add_argument('--manifest', type=str,
+                        help='Manifest dosyası (varsayılan: çıktı dizininde veya çalışma dizininde .kvkk_manifest.json)')
+    parser.add_argument('--force', action='store_true',
+                        help='Manifesti yok say, tüm dosyaları yeniden işle')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help='Okuma parçası (karakter; dizin modu ve --stream)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Atlanan dosyaları da listele')
+    
+    # Yapılandırılmış kayıtlar (--records ile kullanılır)
+    parser.add_argument('--fields', type=str,
+                        help='Anonimleştirilecek alanlar, virgülle (JSONL: noktalı yol, CSV: kolon adı)')
+    parser.add_argument('--record-format', choices=RECORD_FORMATS,
+                        help='Kayıt formatı (varsayılan: uzantıdan, .csv dışı jsonl)')
+    parser.add_argument('--delimiter', type=str, default=',',
+                        help='CSV ayırıcısı (varsayılan: ,)')
     
     # Ayarlar
     parser.add_argument('--min-confidence', '-c', type=float, default=0.5,
                         help='Minimum güven eşiği (0-1, varsayılan: 0.5)')
     parser.add_argument('--no-names', action='store_true',
                         help='İsim tespitini devre dışı bırak')
+    parser.add_argument('--profile', '-p', choices=list(DETECTOR_PROFILES),
+                        help='Detector profili (varsayılan: KVKK_DETECTOR_PROFILE veya full)')
     
     args = parser.parse_args()
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size pozitif olmalı")
     
     # Anonymizer oluştur
-    anonymizer = KVKKAnonymizer(enable_name_detection=not args.no_names)
+    anonymizer = KVKKAnonymizer(enable_name_detection=not args.no_names, profile=args.profile)
     
     # İşle
     if args.interactive:
@@ -154,7 +284,16 @@ def main():
     elif args.file:
         if not args.output:
             args.output = args.file.rsplit('.', 1)[0] + '_anonymized.txt'
-        process_file(args.file, args.output, anonymizer)
+        if args.stream:
+            process_file_stream(args.file, args.output, anonymizer, args.chunk_size)
+        else:
+            process_file(args.file, args.output, anonymizer)
+    
+    elif args.inputs:
+        sys.exit(process_inputs(args, anonymizer))
+    
+    elif args.records:
+        sys.exit(process_records(args, anonymizer))
     
     elif args.stdin:
         text = sys.stdin.read()
@@ -1,13 +1,33 @@
 """
 NLP Modülü - Türk İsim ve Soyisim Tespiti
+
+Sözlükler, NameDetector ve AINERDetector paket düzeyinde ilk erişimde
+yüklenir; AI NER backend modülleri yalnızca AINERDetector kurulunca gelir.
 """
 
-from nlp.name_detector import NameDetector
-from nlp.turkish_names_db import TURKISH_FIRST_NAMES, TURKISH_SURNAMES, HONORIFICS
+import importlib
+
+_EXPORTS = {
+    'NameDetector': 'nlp.name_detector',
+    'AINERDetector': 'nlp.ai_ner',
+    'TURKISH_FIRST_NAMES': 'nlp.turkish_names_db',
+    'TURKISH_SURNAMES': 'nlp.turkish_names_db',
+    'HONORIFICS': 'nlp.turkish_names_db',
+}
 
 __all__ = [
     'NameDetector',
+    'AINERDetector',
     'TURKISH_FIRST_NAMES',
     'TURKISH_SURNAMES', 
     'HONORIFICS',
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
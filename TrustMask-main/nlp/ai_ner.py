@@ -1,23 +1,28 @@
+import hashlib
 import logging
-import torch
-from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
-from typing import List, Dict, Any
+import re
+import threading
+from typing import Any, Dict, List, Optional
 
-from config import EntityType
+from config import EntityType, NER_BACKEND, NER_CACHE_SIZE, NER_CACHE_TTL, NER_TRIAGE_HEURISTIC
 from entities import DetectedEntity
+from engine.result_cache import MemoryCache
+from nlp.gazetteer import BANK, CITY, DISTRICT, FIRST_NAME, SURNAME, get_gazetteer
+from nlp.ner_backends import NERBackend, create_backend
 
-# Loglama ayarları
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("AINERDetector")
 
 class AINERDetector:
     """
     BERT tabanlı Named Entity Recognition (NER) dedektörü.
-    Hugging Face transformers kütüphanesini kullanır.
+    Model, config.NER_BACKEND ile seçilen backend üzerinde çalışır
+    (transformers / onnx / numpy / cloud / none - bkz. nlp/ner_backends.py).
     """
     
     _instance = None
-    _model_name = "savasy/bert-base-turkish-ner-cased"
+    
+    # Model etiketlerinin karşılıkları (bkz. _map_entity_type)
+    entity_types = frozenset({EntityType.NAME, EntityType.ADDRESS})
     
     def __new__(cls):
         if cls._instance is None:
@@ -29,50 +34,170 @@ class AINERDetector:
         if self.initialized:
             return
             
-        self.nlp_pipeline = None
+        self.name = self.__class__.__name__
+        self.backend = create_backend(NER_BACKEND)
+        # Ham NER yanıt önbelleği: aynı metin için model / API tekrar çağrılmaz
+        self.response_cache = MemoryCache(NER_CACHE_SIZE, ttl=NER_CACHE_TTL) if NER_CACHE_SIZE > 0 else None
+        # Sayaçlar birden çok thread'den (waitress, asgi I/O havuzu) artırılır
+        self._counters_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Thread başına, NER'in yanıt alınamadan atlandığı detect() sayısı (bkz. skipped)
+        self._skips = threading.local()
         self.initialized = True
-        logger.info("AINERDetector instance oluşturuldu (Henüz model yüklenmedi - Lazy Loading)")
+        logger.info(f"AINERDetector instance oluşturuldu (backend: {self.backend.name}, Lazy Loading)")
 
-    def load_model(self):
-        """Modeli belleğe yükler"""
-        if self.nlp_pipeline is not None:
-            return
+    def set_backend(self, backend) -> None:
+        """Backend'i değiştir (ad veya NERBackend nesnesi)"""
+        self.backend = backend if isinstance(backend, NERBackend) else create_backend(backend)
+
+    def load_model(self) -> bool:
+        """Modeli belleğe yükler (backend yüklüyse tekrar yüklemez)"""
+        return self.backend.load()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """NER yanıt önbelleği sayaçları"""
+        with self._counters_lock:
+            hits, misses = self.cache_hits, self.cache_misses
+        return {
+            "entries": len(self.response_cache) if self.response_cache is not None else 0,
+            "hits": hits,
+            "misses": misses,
+        }
+
+    def _count(self, hits: int = 0, misses: int = 0) -> None:
+        with self._counters_lock:
+            self.cache_hits += hits
+            self.cache_misses += misses
+
+    def skipped(self) -> int:
+        """Bu thread'de NER'in atlandığı detect() çağrısı sayısı
+        
+        Devre açık, zaman aşımı, API veya model hatası nedeniyle tahmin
+        alınamayan çağrılar sayılır; bu çağrıların sonucu eksiktir.
+        KVKKAnonymizer çağrı öncesi ve sonrası değeri karşılaştırır ve
+        eksik sonuçları sonuç önbelleğine koymaz. Model hiç yüklenemiyorsa
+        (ör. torch yok) NER kapalı sayılır, sayılmaz.
+        """
+        return getattr(self._skips, 'count', 0)
+
+    def _mark_skipped(self) -> None:
+        self._skips.count = self.skipped() + 1
+
+    # Triage: büyük harfle başlayan kelimeler
+    _capitalized = re.compile(r'\b[A-ZÇĞİÖŞÜ]\w*')
+    # Bu karakterlerden (veya satır başından) sonra gelen kelime cümle başıdır
+    _sentence_breaks = '.!?:;"\'-\n'
+    
+    def can_match(self, doc) -> bool:
+        """Triage: model çağrısına değer mi?
+        
+        Cased model kişi/yer/kurum adlarını büyük harfle başlayan
+        kelimelerde bulur; büyük harf içermeyen metinde model çağrılmaz.
+        
+        config.NER_TRIAGE_HEURISTIC açıksa (kayıplı) büyük harfli kelimeler
+        yalnızca cümle başındaysa ("Evet, teşekkürler.", "Müşteri: Tamam")
+        ve bunlar isim/soyisim/il/ilçe/banka sözlüğünde geçmiyorsa da
+        çağrılmaz; sözlükte olmayan cümle başı adlar ("Zeynep aradı.")
+        bu durumda maskelenmez.
+        """
+        if not doc.has_upper:
+            return False
+        if not NER_TRIAGE_HEURISTIC:
+            return True
+        text = doc.text
+        known = FIRST_NAME | SURNAME | CITY | DISTRICT | BANK
+        gazetteer = get_gazetteer()
+        for match in self._capitalized.finditer(text):
+            i = match.start() - 1
+            while i >= 0 and text[i] in ' \t':
+                i -= 1
+            if i >= 0 and text[i] not in self._sentence_breaks:
+                return True
+            if gazetteer.lookup(match.group()) & known:
+                return True
+        return False
+
+    def _predict(self, text: str) -> Optional[List[Dict[str, Any]]]:
+        """Backend tahmini; başarılı yanıtlar önbelleğe alınır"""
+        if self.response_cache is None:
+            return self.backend.predict(text)
+
+        key = self._cache_key(text)
+        results = self.response_cache.get(key)
+        if results is not None:
+            self._count(hits=1)
+            return results
+
+        self._count(misses=1)
+        results = self.backend.predict(text)
+        # None: backend yanıt veremedi (ör. devre açık), önbelleğe alınmaz
+        if results is not None:
+            self.response_cache.put(key, results)
+        return results
 
+    def _cache_key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.backend.name}\0{text}".encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def prefetch(self, text: str) -> bool:
+        """I/O backend'lerinde tahmini önceden alıp yanıt önbelleğine koyar
+        
+        Async sunucu (asgi.py) bunu geniş bir I/O thread havuzunda çağırır;
+        ardından CPU havuzunda çalışan detect() yanıtı önbellekten okur ve
+        yavaş bir NER API'si CPU thread'lerini bekletmez. Önbellek kapalıysa
+        veya backend yerel modelse bir şey yapmaz ve False döner.
+        """
+        if not self.backend.io_bound or self.response_cache is None or not self.load_model():
+            return False
         try:
-            logger.info(f"AI Modeli yükleniyor: {self._model_name}...")
-            
-            tokenizer = AutoTokenizer.from_pretrained(self._model_name)
-            model = AutoModelForTokenClassification.from_pretrained(self._model_name)
-            
-            # CPU üzerinde çalıştır (GPU varsa cuda:0 yapılabilir ama serverda garanti değil)
-            device = 0 if torch.cuda.is_available() else -1
-            
-            self.nlp_pipeline = pipeline(
-                "ner", 
-                model=model, 
-                tokenizer=tokenizer, 
-                aggregation_strategy="simple", # Kelime parçalarını birleştirir (B-PER, I-PER -> PER)
-                device=device
-            )
-            
-            logger.info("AI Modeli başarıyla yüklendi!")
-            
+            self._predict(text)
         except Exception as e:
-            logger.error(f"AI Modeli yüklenirken hata oluştu: {str(e)}")
-            self.nlp_pipeline = None
+            logger.error(f"AI analizi sırasında hata: {str(e)}")
+            return False
+        return True
+
+    def prefetch_many(self, texts: List[str]) -> bool:
+        """prefetch()'in toplu hali: önbellekte olmayan metinler backend'e birlikte gönderilir
+        
+        KVKKAnonymizer.anonymize_many parça başına bir kez çağırır. Bulut
+        backend'inde NER_API_MAX_BATCH metinlik istekler, transformers
+        backend'inde toplu pipeline çağrısı yapılır; toplu tahmin
+        desteklemeyen backend'lerde bir şey yapmaz ve False döner.
+        """
+        if not self.backend.batched or self.response_cache is None or not self.load_model():
+            return False
+        missing = {}
+        for text in texts:
+            key = self._cache_key(text)
+            if key not in missing and self.response_cache.get(key) is None:
+                missing[key] = text
+        if not missing:
+            return True
+        self._count(misses=len(missing))
+        try:
+            results = self.backend.predict_many(list(missing.values()))
+        except Exception as e:
+            logger.error(f"AI analizi sırasında hata: {str(e)}")
+            return False
+        for key, result in zip(missing, results):
+            # None: backend yanıt veremedi, detect() tekrar dener
+            if result is not None:
+                self.response_cache.put(key, result)
+        return True
 
     def detect(self, text: str) -> List[DetectedEntity]:
         """Metin içindeki varlıkları AI ile tespit eder"""
         # Model yüklü değilse yükle
-        if self.nlp_pipeline is None:
-            self.load_model()
-            
-        if self.nlp_pipeline is None:
+        if not self.load_model():
             return [] # Model yüklenemediyse boş dön
             
         entities = []
         try:
-            results = self.nlp_pipeline(text)
+            results = self._predict(text)
+            if results is None:
+                # Yanıt yok (devre açık / API hatası): sonuç eksik
+                self._mark_skipped()
+                return entities
             
             for res in results:
                 # Örnek res: {'entity_group': 'PER', 'score': 0.99, 'word': 'Mustafa', 'start': 0, 'end': 7}
@@ -87,11 +212,12 @@ class AINERDetector:
                     start_pos=res['start'],
                     end_pos=res['end'],
                     confidence=float(res['score']),
-                    context="ai_bert_ner"
+                    context=self.backend.context
                 ))
                 
         except Exception as e:
             logger.error(f"AI analizi sırasında hata: {str(e)}")
+            self._mark_skipped()
             
         return entities
 
@@ -99,11 +225,11 @@ class AINERDetector:
         """Model çıktılarını projenin EntityType enumına map eder"""
         group = group.upper()
         
-        if group == 'PER':
+        if 'PER' in group:
             return EntityType.NAME # veya duruma göre FULL_NAME
-        elif group == 'LOC':
+        elif 'LOC' in group:
             return EntityType.ADDRESS
-        elif group == 'ORG':
+        elif 'ORG' in group:
             return EntityType.NAME # Şirket isimlerini de isim gibi maskeleyebiliriz veya yeni tip açabiliriz
         
         return None
@@ -0,0 +1,268 @@
+"""
+Derlenmiş Sözlük - mmap ile açılan ikili gazetteer dosyası
+
+Gazetteer (nlp/gazetteer.py) sözlükleri her process'te Python nesnelerinden
+oluşan bir trie'ye çevirir; nüfus kaydı ölçeğinde isim listeleri ve tüm
+ilçeler bu şekilde worker başına yüzlerce MB tutar. Bu modül aynı trie'yi
+tools/build_gazetteer.py ile üretilen salt okunur bir dosyadan kullanır.
+Dosya mmap ile açılır: sayfalar işletim sisteminin sayfa önbelleğinden
+okunur ve aynı dosyayı açan tüm process'ler (waitress thread'leri, BatchPool
+worker'ları) tek kopyayı paylaşır.
+
+Dosya düzeni (native bayt sırası, 4 bayt hizalı):
+
+    başlık      MAGIC, sürüm, bayt sırası, düğüm sayısı (N), tablo boyu (C),
+                ifade sayısı, anahtar alanı boyu, kaynak sözlük özeti
+    offsets     uint32[N + 1]  sıralı anahtarların anahtar alanındaki başlangıcı
+    info        uint32[N]      türler | alt ağaç türleri << 12 | devam biti
+    hashes      uint32[N]      anahtarın crc32'si
+    slots       uint32[C]      hash tablosu (doğrusal yoklama), düğüm + 1; 0 = boş
+    kind index  KIND_BITS x (başlangıç, adet) + uint32[...]  tür başına ilk kelime düğümleri
+    keys        UTF-8 anahtarlar, sıralı ve art arda
+
+Trie düğümünün anahtarı, düğüme kadar olan katlanmış metindir ("türkiye iş
+bankası"); tarama sırasında folded[başlangıç:kelime sonu] doğrudan aranır,
+böylece sonuçlar Gazetteer.scan ile aynıdır. Sık geçen kelimelerin sonucu
+process içinde sınırlı bir sözlükte tutulur.
+"""
+
+from array import array
+from typing import Dict, Iterable, Tuple
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlp.gazetteer import _WORD, Gazetteer, GazetteerScan, fold
+
+
+MAGIC = b'KVKKGAZ\0'
+FORMAT_VERSION = 1
+# Tür bayrakları için ayrılan bit sayısı (nlp/gazetteer.py FIRST_NAME ... BANK)
+KIND_BITS = 12
+KIND_MASK = (1 << KIND_BITS) - 1
+HAS_CHILDREN = 1 << (2 * KIND_BITS)
+
+# magic, sürüm, bayt sırası, N, C, ifade sayısı, anahtar alanı boyu, özet (32 bayt)
+_HEADER = struct.Struct('=8sIIIIII32s')
+# Process içi arama sonucu önbelleği (anahtar sayısı); dolunca boşaltılır
+MEMO_SIZE = 1 << 16
+_MISSING = -1
+
+
+def _byte_order() -> int:
+    return 1 if sys.byteorder == 'little' else 2
+
+
+def write_gazetteer(path: str, gazetteer: Gazetteer, source_digest: str = '') -> int:
+    """Gazetteer trie'sini ikili dosyaya yazar, düğüm sayısını döndürür
+
+    source_digest: dosyanın üretildiği yerleşik sözlüklerin özeti
+    (nlp.gazetteer.entries_digest); açılırken güncellik kontrolünde kullanılır.
+    """
+    nodes = sorted(gazetteer.iter_nodes())
+    count = len(nodes)
+    if count >= (1 << 32) - 1:
+        raise ValueError("Sözlük dosyası için çok fazla düğüm")
+
+    keys = bytearray()
+    offsets = array('I', [0])
+    info = array('I')
+    hashes = array('I')
+    by_kind = [array('I') for _ in range(KIND_BITS)]
+    for index, (key, kinds, subtree, has_children, root) in enumerate(nodes):
+        if subtree > KIND_MASK:
+            raise ValueError(f"Sözlük türü {KIND_BITS} bite sığmıyor: {subtree}")
+        encoded = key.encode('utf-8')
+        keys += encoded
+        offsets.append(len(keys))
+        info.append(kinds | subtree << KIND_BITS | (HAS_CHILDREN if has_children else 0))
+        hashes.append(zlib.crc32(encoded))
+        if root:
+            for bit in range(KIND_BITS):
+                if subtree >> bit & 1:
+                    by_kind[bit].append(index)
+
+    # Doluluk en fazla %50: aranan kelimelerin çoğu sözlükte yoktur, boş slota hızlı ulaşılmalı
+    capacity = 8
+    while capacity < count * 2:
+        capacity <<= 1
+    slots = array('I', bytes(4 * capacity))
+    mask = capacity - 1
+    for index, value in enumerate(hashes):
+        slot = value & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = index + 1
+
+    kind_table = array('I')
+    kind_nodes = array('I')
+    for nodes_of_kind in by_kind:
+        kind_table.extend((len(kind_nodes), len(nodes_of_kind)))
+        kind_nodes.extend(nodes_of_kind)
+
+    phrases = sum(1 for value in info if value & KIND_MASK)
+    digest = bytes.fromhex(source_digest) if source_digest else bytes(32)
+    temp = path + '.tmp'
+    with open(temp, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, _byte_order(), count, capacity, phrases, len(keys), digest))
+        for section in (offsets, info, hashes, slots, kind_table, kind_nodes):
+            section.tofile(f)
+        f.write(keys)
+    os.replace(temp, path)
+    return count
+
+
+class CompiledGazetteer:
+    """mmap ile açılan salt okunur sözlük (Gazetteer ile aynı arama arayüzü)
+
+    Kullanım:
+        gazetteer = CompiledGazetteer("gazetteer.bin")
+        gazetteer.lookup("İstanbul") & CITY
+        gazetteer.scan(text).hits
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._open_sections()
+        except Exception:
+            self._mm.close()
+            raise
+        self._memo: Dict[str, int] = {}
+
+    def _open_sections(self) -> None:
+        if len(self._mm) < _HEADER.size:
+            raise ValueError(f"Geçersiz sözlük dosyası: {self.path}")
+        magic, version, order, count, capacity, phrases, key_size, digest = _HEADER.unpack_from(self._mm)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Geçersiz veya eski sürüm sözlük dosyası: {self.path}")
+        if order != _byte_order():
+            raise ValueError(f"Sözlük dosyası farklı bayt sırasıyla üretilmiş: {self.path}")
+
+        view = memoryview(self._mm)
+        offset = _HEADER.size
+
+        def section(length: int) -> memoryview:
+            nonlocal offset
+            if offset + 4 * length > len(view):
+                raise ValueError(f"Sözlük dosyası eksik veya bozuk: {self.path}")
+            part = view[offset:offset + 4 * length].cast('I')
+            offset += 4 * length
+            return part
+
+        try:
+            self._offsets = section(count + 1)
+            self._info = section(count)
+            self._hashes = section(count)
+            self._slots = section(capacity)
+            self._kind_table = section(2 * KIND_BITS)
+            self._kind_nodes = section(sum(self._kind_table[2 * bit + 1] for bit in range(KIND_BITS)))
+            self._keys_start = offset
+            if offset + key_size != len(self._mm):
+                raise ValueError(f"Sözlük dosyası eksik veya bozuk: {self.path}")
+        except Exception:
+            # Açık memoryview'lar kalırsa mmap kapatılamaz (BufferError)
+            self._release_sections()
+            view.release()
+            raise
+        self._mask = capacity - 1
+        self._count = count
+        self._phrases = phrases
+        self.source_digest = digest.hex() if any(digest) else ''
+
+    def __len__(self) -> int:
+        return self._phrases
+
+    def close(self) -> None:
+        self._release_sections()
+        self._mm.close()
+
+    def _release_sections(self) -> None:
+        for name in ('_offsets', '_info', '_hashes', '_slots', '_kind_table', '_kind_nodes'):
+            part = getattr(self, name, None)
+            if part is not None:
+                part.release()
+
+    def _key(self, index: int) -> bytes:
+        start = self._keys_start
+        return self._mm[start + self._offsets[index]:start + self._offsets[index + 1]]
+
+    def _find(self, key: str) -> int:
+        """Düğümün info değeri; anahtar sözlükte yoksa _MISSING"""
+        result = self._memo.get(key)
+        if result is not None:
+            return result
+        encoded = key.encode('utf-8')
+        value = zlib.crc32(encoded)
+        slots, hashes = self._slots, self._hashes
+        slot = value & self._mask
+        result = _MISSING
+        while True:
+            index = slots[slot]
+            if not index:
+                break
+            index -= 1
+            if hashes[index] == value and self._key(index) == encoded:
+                result = self._info[index]
+                break
+            slot = (slot + 1) & self._mask
+        if len(self._memo) >= MEMO_SIZE:
+            self._memo.clear()
+        self._memo[key] = result
+        return result
+
+    def first_words(self, kind: int) -> frozenset:
+        """Belirtilen türdeki girdilerin (katlanmış) ilk kelimeleri (bkz. Gazetteer.first_words)"""
+        words = set()
+        for bit in range(KIND_BITS):
+            if kind >> bit & 1:
+                start, length = self._kind_table[2 * bit], self._kind_table[2 * bit + 1]
+                words.update(self._key(index).decode('utf-8')
+                             for index in self._kind_nodes[start:start + length])
+        return frozenset(words)
+
+    def lookup(self, phrase: str) -> int:
+        """Bir kelime / ifadenin sözlük türleri (yoksa 0)"""
+        value = self._find(fold(phrase))
+        return value & KIND_MASK if value != _MISSING else 0
+
+    def phrases(self) -> Iterable[Tuple[str, int]]:
+        """Tüm ifadeler ve türleri, anahtar sırasıyla"""
+        for index in range(self._count):
+            kinds = self._info[index] & KIND_MASK
+            if kinds:
+                yield self._key(index).decode('utf-8'), kinds
+
+    def scan(self, text: str) -> GazetteerScan:
+        """Metindeki tüm sözlük eşleşmeleri (Gazetteer.scan ile aynı sonuç)"""
+        folded = fold(text)
+        matches = list(_WORD.finditer(folded))
+        tokens = [match.span() for match in matches]
+        words = [match.group() for match in matches]
+
+        hits = []
+        find = self._find
+        count = len(words)
+        for i in range(count):
+            value = find(words[i])
+            if value == _MISSING:
+                continue
+            start = tokens[i][0]
+            if value & KIND_MASK:
+                hits.append((start, tokens[i][1], value & KIND_MASK))
+            j = i
+            while value & HAS_CHILDREN and j + 1 < count:
+                value = find(folded[start:tokens[j + 1][1]])
+                if value == _MISSING:
+                    break
+                j += 1
+                if value & KIND_MASK:
+                    hits.append((start, tokens[j][1], value & KIND_MASK))
+
+        return GazetteerScan(text, tokens, hits)
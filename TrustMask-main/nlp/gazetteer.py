@@ -0,0 +1,268 @@
+"""
+Sözlük (Gazetteer) Eşleştirici
+
+İsim, soyisim, yaygın kelime, il, ilçe ve banka sözlüklerini tek bir
+kelime trie'sinde toplar. Metin bir kez kelimelere ayrılır ve her kelime
+başlangıcından trie üzerinde yürünür; çok kelimeli girdiler ("türkiye iş
+bankası", "t.c. ziraat bankası") dahil tüm sözlük eşleşmeleri tek geçişte
+bulunur. Sözlük eşleşmeleri kelime sınırlarında olur (regex `\\b` ile aynı).
+
+Büyük/küçük harf: Türkçe'ye duyarlı katlama kullanılır. 'İ', 'I', 'ı' ve
+'i' aynı harf sayılır ("İstanbul", "ISPARTA", "ING", "Işık" sözlükteki
+küçük harfli karşılıklarıyla eşleşir) ve katlanmış metin orijinal ile aynı
+uzunluktadır, pozisyonlar doğrudan kullanılabilir.
+
+Detector'lar belgeyi kendileri taramak yerine scan_document(text)
+sonucunu kullanır; aynı metin için tarama thread başına bir kez yapılır.
+"""
+
+import hashlib
+import logging
+import re
+import sys
+import os
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Sözlük türleri (bit bayrakları, bir girdi birden fazla türde olabilir)
+FIRST_NAME = 1
+SURNAME = 2
+COMMON_WORD = 4
+CITY = 8
+DISTRICT = 16
+BANK = 32
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r'\w+')
+_FOLD_TABLE = str.maketrans({'İ': 'i', 'I': 'i', 'ı': 'i'})
+
+
+def fold(text: str) -> str:
+    """Türkçe'ye duyarlı, uzunluğu koruyan küçük harf katlama"""
+    folded = text.translate(_FOLD_TABLE).lower()
+    if len(folded) != len(text):
+        # Nadir: lower() ile uzayan karakterler (ör. bazı ligatürler) olduğu gibi kalır
+        folded = ''.join(c if len(c.lower()) != 1 else c.lower() for c in text.translate(_FOLD_TABLE))
+    return folded
+
+
+class _Node:
+    __slots__ = ('kinds', 'next')
+
+    def __init__(self):
+        self.kinds = 0
+        # (ayraç, sonraki kelime) -> _Node
+        self.next = {}
+
+
+class GazetteerScan:
+    """Bir belgenin sözlük tarama sonucu
+
+    tokens: metindeki tüm kelimeler (\\w+ dizileri) [(start, end), ...]
+    hits:   sözlük eşleşmeleri [(start, end, kinds), ...] başlangıç sırasıyla
+    """
+
+    __slots__ = ('text', 'tokens', 'hits', '_word_kinds')
+
+    def __init__(self, text: str, tokens: List[Tuple[int, int]], hits: List[Tuple[int, int, int]]):
+        self.text = text
+        self.tokens = tokens
+        self.hits = hits
+        self._word_kinds = None
+
+    def word_kinds(self, start: int) -> int:
+        """`start`ta başlayan tek kelimelik eşleşmenin türleri (yoksa 0)"""
+        if self._word_kinds is None:
+            token_ends = dict(self.tokens)
+            self._word_kinds = {
+                hit_start: kinds for hit_start, hit_end, kinds in self.hits
+                if token_ends.get(hit_start) == hit_end
+            }
+        return self._word_kinds.get(start, 0)
+
+    def of_kind(self, kind: int) -> List[Tuple[int, int]]:
+        """Belirtilen türdeki eşleşmelerin aralıkları"""
+        return [(start, end) for start, end, kinds in self.hits if kinds & kind]
+
+
+class Gazetteer:
+    """Çok kelimeli, Türkçe'ye duyarlı sözlük eşleştirici (kelime trie'si)
+
+    Kullanım:
+        gazetteer = Gazetteer()
+        gazetteer.add("türkiye iş bankası", BANK)
+        gazetteer.lookup("İstanbul") & CITY
+        gazetteer.scan(text).hits
+    """
+
+    def __init__(self, entries: Optional[Dict[int, Iterable[str]]] = None):
+        self._root: Dict[str, _Node] = {}
+        self._phrases: Dict[str, int] = {}
+        for kind, phrases in (entries or {}).items():
+            for phrase in phrases:
+                self.add(phrase, kind)
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    def add(self, phrase: str, kind: int) -> None:
+        folded = fold(phrase.strip())
+        words = list(_WORD.finditer(folded))
+        if not words:
+            return
+        # Girdi kelime ile başlayıp bitmeli (\b...\b semantiği)
+        if words[0].start() != 0 or words[-1].end() != len(folded):
+            return
+
+        node = self._root.get(words[0].group())
+        if node is None:
+            node = self._root[words[0].group()] = _Node()
+        for previous, word in zip(words, words[1:]):
+            key = (folded[previous.end():word.start()], word.group())
+            child = node.next.get(key)
+            if child is None:
+                child = node.next[key] = _Node()
+            node = child
+        node.kinds |= kind
+        self._phrases[folded] = self._phrases.get(folded, 0) | kind
+
+    def first_words(self, kind: int) -> frozenset:
+        """Belirtilen türdeki girdilerin (katlanmış) ilk kelimeleri
+
+        Bir metinde bu türden eşleşme olabilmesi için bu kelimelerden biri
+        metinde tam kelime olarak geçmelidir (triage için).
+        """
+        return frozenset(word for word, node in self._root.items() if self._has_kind(node, kind))
+
+    @classmethod
+    def _has_kind(cls, node: _Node, kind: int) -> bool:
+        return bool(node.kinds & kind) or any(cls._has_kind(child, kind) for child in node.next.values())
+
+    def lookup(self, phrase: str) -> int:
+        """Bir kelime / ifadenin sözlük türleri (yoksa 0)"""
+        return self._phrases.get(fold(phrase), 0)
+
+    def iter_nodes(self) -> Iterator[Tuple[str, int, int, bool, bool]]:
+        """Trie düğümleri: (anahtar, türler, alt ağaç türleri, devamı var mı, ilk kelime mi)
+
+        Anahtar, düğüme kadar olan katlanmış metindir ("türkiye iş"); tarama
+        sırasında düğüm folded[başlangıç:kelime sonu] ile bulunabilir
+        (nlp/compiled_gazetteer.py).
+        """
+        def walk(key: str, node: _Node, root: bool):
+            subtree = node.kinds
+            children = []
+            for (separator, word), child in node.next.items():
+                child_nodes = list(walk(key + separator + word, child, False))
+                subtree |= child_nodes[-1][2]
+                children.extend(child_nodes)
+            yield from children
+            yield key, node.kinds, subtree, bool(node.next), root
+
+        for word, node in self._root.items():
+            yield from walk(word, node, True)
+
+    def scan(self, text: str) -> GazetteerScan:
+        """Metindeki tüm sözlük eşleşmelerini tek geçişte bulur"""
+        folded = fold(text)
+        matches = list(_WORD.finditer(folded))
+        tokens = [match.span() for match in matches]
+        words = [match.group() for match in matches]
+
+        hits = []
+        root = self._root
+        count = len(words)
+        for i in range(count):
+            node = root.get(words[i])
+            if node is None:
+                continue
+            start = tokens[i][0]
+            if node.kinds:
+                hits.append((start, tokens[i][1], node.kinds))
+            j = i
+            while node.next and j + 1 < count:
+                node = node.next.get((folded[tokens[j][1]:tokens[j + 1][0]], words[j + 1]))
+                if node is None:
+                    break
+                j += 1
+                if node.kinds:
+                    hits.append((start, tokens[j][1], node.kinds))
+
+        return GazetteerScan(text, tokens, hits)
+
+
+_gazetteer = None
+_gazetteer_lock = threading.Lock()
+_last_scan = threading.local()
+
+
+def default_entries() -> Dict[int, Iterable[str]]:
+    """Paylaşılan sözlüğün girdileri: {tür: ifadeler}"""
+    from config import TURKISH_BANKS
+    from detectors.address_detector import ALL_DISTRICTS, TURKEY_CITIES
+    from nlp.turkish_names_db import NAME_LIKE_COMMON_WORDS, TURKISH_FIRST_NAMES, TURKISH_SURNAMES
+
+    return {
+        FIRST_NAME: TURKISH_FIRST_NAMES,
+        SURNAME: TURKISH_SURNAMES,
+        COMMON_WORD: NAME_LIKE_COMMON_WORDS,
+        CITY: TURKEY_CITIES,
+        DISTRICT: ALL_DISTRICTS,
+        BANK: TURKISH_BANKS,
+    }
+
+
+def entries_digest(entries: Dict[int, Iterable[str]]) -> str:
+    """Girdilerin özeti (snapshot'taki trie bu girdilerle mi kuruldu?)"""
+    digest = hashlib.sha256()
+    for kind in sorted(entries):
+        # Kümelerin sırası process'e göre değişir
+        digest.update(f"{kind}\x00{chr(31).join(sorted(entries[kind]))}\x00".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def get_gazetteer():
+    """Paylaşılan sözlük (ilk çağrıda bir kez kurulur)
+
+    config.GAZETTEER_PATH verilmişse derlenmiş sözlük dosyası mmap ile
+    açılır (CompiledGazetteer); yoksa yerleşik listelerden Gazetteer
+    kurulur veya snapshot'tan alınır.
+    """
+    global _gazetteer
+    if _gazetteer is None:
+        with _gazetteer_lock:
+            if _gazetteer is None:
+                from config import GAZETTEER_PATH
+                from engine.snapshot import get_snapshot
+
+                entries = default_entries()
+                digest = entries_digest(entries)
+                snapshot = None if GAZETTEER_PATH else get_snapshot()
+                if GAZETTEER_PATH:
+                    from nlp.compiled_gazetteer import CompiledGazetteer
+
+                    gazetteer = CompiledGazetteer(GAZETTEER_PATH)
+                    if gazetteer.source_digest != digest:
+                        logger.warning(f"Sözlük dosyası yerleşik listelerle güncel değil, "
+                                       f"tools/build_gazetteer.py ile yeniden üretin: {GAZETTEER_PATH}")
+                elif (snapshot is not None and snapshot.gazetteer is not None
+                        and snapshot.gazetteer_digest == digest):
+                    gazetteer = snapshot.gazetteer
+                else:
+                    gazetteer = Gazetteer(entries)
+                _gazetteer = gazetteer
+    return _gazetteer
+
+
+def scan_document(text: str) -> GazetteerScan:
+    """Paylaşılan sözlükle tarama; aynı metin için sonuç thread başına tekrar kullanılır"""
+    last = getattr(_last_scan, 'result', None)
+    if last is not None and last.text is text:
+        return last
+    result = get_gazetteer().scan(text)
+    _last_scan.result = result
+    return result
@@ -0,0 +1,367 @@
+"""
+AI NER Backend'leri
+
+AINERDetector, savasy/bert-base-turkish-ner-cased token sınıflandırmasını
+aşağıdaki backend'lerden biriyle çalıştırır (config.NER_BACKEND):
+
+- transformers: Yerel Hugging Face pipeline (torch gerekir)
+- onnx:         Dışa aktarılmış (quantize) ONNX model, ONNX Runtime ile CPU'da
+- numpy:        Dışa aktarılmış int8 ağırlıklar, saf NumPy ile CPU'da
+- cloud:        Hugging Face Inference API (Vercel / serverless kurulum)
+
+onnx ve numpy backend'leri torch gerektirmez; model dosyaları
+tools/export_ner_model.py ile bir kez üretilir. Her backend aynı formatta
+tahmin döndürür:
+    {'entity_group': 'PER', 'score': 0.99, 'word': 'Mustafa', 'start': 0, 'end': 7}
+"""
+
+from abc import ABC, abstractmethod
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from config import NER_API_TOKEN, NER_API_URL, NER_MODEL_DIR, NER_MODEL_NAME
+
+logger = logging.getLogger("AINERDetector")
+
+
+class NERBackend(ABC):
+    """Backend arayüzü"""
+
+    name = "base"
+    # DetectedEntity.context etiketi
+    context = "ai_ner"
+    # Tahmin ağ beklemesi mi (True) yoksa CPU işi mi; asgi.py I/O backend'lerini
+    # ayrı bir thread havuzunda önceden çağırır (AINERDetector.prefetch)
+    io_bound = False
+    # predict_many tek çağrıda toplu tahmin yapıyor mu (AINERDetector.prefetch_many)
+    batched = False
+
+    def load(self) -> bool:
+        """Modeli hazırla, başarılıysa True döndür"""
+        return True
+
+    @abstractmethod
+    def predict(self, text: str) -> Optional[List[Dict[str, Any]]]:
+        """Tahmin listesi; backend yanıt veremediyse None (sonuç önbelleğe alınmaz)"""
+        pass
+
+    def predict_many(self, texts: List[str]) -> List[Optional[List[Dict[str, Any]]]]:
+        """Metin başına predict() (toplu istek destekleyen backend'ler override eder)"""
+        return [self.predict(text) for text in texts]
+
+
+class TransformersBackend(NERBackend):
+    """Yerel Hugging Face pipeline (torch + transformers)"""
+
+    name = "transformers"
+    context = "ai_bert_ner"
+    batched = True
+    # predict_many: pipeline'a tek seferde verilen metin sayısı
+    batch_size = 16
+
+    def __init__(self, model_name: str = NER_MODEL_NAME):
+        self.model_name = model_name
+        self.nlp_pipeline = None
+        # Yükleme bir kez denenir: torch yoksa her detect() çağrısında import tekrar denenmez
+        self._attempted = False
+
+    def load(self) -> bool:
+        if self.nlp_pipeline is not None or self._attempted:
+            return self.nlp_pipeline is not None
+        self._attempted = True
+
+        try:
+            import torch
+            from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
+
+            logger.info(f"AI Modeli yükleniyor: {self.model_name}...")
+
+            tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            model = AutoModelForTokenClassification.from_pretrained(self.model_name)
+
+            # CPU üzerinde çalıştır (GPU varsa cuda:0 yapılabilir ama serverda garanti değil)
+            device = 0 if torch.cuda.is_available() else -1
+
+            self.nlp_pipeline = pipeline(
+                "ner",
+                model=model,
+                tokenizer=tokenizer,
+                aggregation_strategy="simple",  # Kelime parçalarını birleştirir (B-PER, I-PER -> PER)
+                device=device
+            )
+
+            logger.info("AI Modeli başarıyla yüklendi!")
+
+        except Exception as e:
+            logger.error(f"AI Modeli yüklenirken hata oluştu: {str(e)}")
+            self.nlp_pipeline = None
+
+        return self.nlp_pipeline is not None
+
+    def predict(self, text: str) -> List[Dict[str, Any]]:
+        return self.nlp_pipeline(text)
+
+    def predict_many(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        return list(self.nlp_pipeline(texts, batch_size=self.batch_size))
+
+
+class LocalTokenClassifier(NERBackend):
+    """torch'suz yerel backend'lerin ortak kısmı
+
+    Tokenizasyon `tokenizers` (tokenizer.json) ile yapılır. Uzun metinler
+    512 token sınırına göre kelime sınırlarından pencerelere bölünür.
+    Token skorları Hugging Face pipeline'ının "simple" aggregation
+    stratejisiyle aynı şekilde birleştirilir.
+    """
+
+    context = "ai_local_ner"
+    max_tokens = 510  # [CLS] ve [SEP] hariç
+
+    def __init__(self, model_dir: str = NER_MODEL_DIR):
+        self.model_dir = model_dir
+        self.tokenizer = None
+        self.id2label = None
+        self._ready = None
+
+    @abstractmethod
+    def _load_model(self) -> None:
+        """Model dosyalarını yükle (tokenizer ve etiketler load() içinde hazırlanır)"""
+        pass
+
+    @abstractmethod
+    def _logits(self, input_ids) -> Any:
+        """input_ids: [seq] int64 -> logits [seq, num_labels]"""
+        pass
+
+    def load(self) -> bool:
+        if self._ready is not None:
+            return self._ready
+
+        try:
+            import json
+            from tokenizers import Tokenizer
+
+            logger.info(f"Yerel NER modeli yükleniyor ({self.name}): {self.model_dir}")
+            self.tokenizer = Tokenizer.from_file(os.path.join(self.model_dir, "tokenizer.json"))
+            with open(os.path.join(self.model_dir, "config.json"), 'r', encoding='utf-8') as f:
+                self.config = json.load(f)
+            self.id2label = {int(k): v for k, v in self.config['id2label'].items()}
+            self.cls_id = self.tokenizer.token_to_id("[CLS]")
+            self.sep_id = self.tokenizer.token_to_id("[SEP]")
+            self._load_model()
+            self._ready = True
+            logger.info("Yerel NER modeli yüklendi!")
+
+        except Exception as e:
+            logger.error(f"Yerel NER modeli yüklenemedi: {str(e)}")
+            self._ready = False
+
+        return self._ready
+
+    def predict(self, text: str) -> List[Dict[str, Any]]:
+        import numpy as np
+
+        encoding = self.tokenizer.encode(text, add_special_tokens=False)
+        ids = encoding.ids
+        offsets = encoding.offsets
+        word_ids = encoding.word_ids
+
+        tokens = []  # (label, score, start, end)
+        for lo, hi in self._windows(word_ids):
+            input_ids = np.array([self.cls_id] + ids[lo:hi] + [self.sep_id], dtype=np.int64)
+            logits = np.asarray(self._logits(input_ids), dtype=np.float32)[1:-1]
+            shifted = np.exp(logits - logits.max(axis=-1, keepdims=True))
+            scores = shifted / shifted.sum(axis=-1, keepdims=True)
+            best = scores.argmax(axis=-1)
+            for i, label_id in enumerate(best):
+                start, end = offsets[lo + i]
+                tokens.append((self.id2label[int(label_id)], float(scores[i, label_id]), start, end))
+
+        return self._group_entities(text, tokens)
+
+    def _windows(self, word_ids: List[Optional[int]]):
+        """Token aralıklarını max_tokens sınırında, kelime ortasından bölmeden üretir"""
+        total = len(word_ids)
+        lo = 0
+        while lo < total:
+            hi = min(lo + self.max_tokens, total)
+            if hi < total:
+                cut = hi
+                while cut > lo + 1 and word_ids[cut] is not None and word_ids[cut] == word_ids[cut - 1]:
+                    cut -= 1
+                hi = cut if cut > lo + 1 else hi
+            yield lo, hi
+            lo = hi
+
+    @staticmethod
+    def _split_tag(label: str):
+        if label.startswith("B-"):
+            return "B", label[2:]
+        if label.startswith("I-"):
+            return "I", label[2:]
+        return "I", label
+
+    def _group_entities(self, text: str, tokens) -> List[Dict[str, Any]]:
+        """Ardışık aynı etiketli token'ları birleştirir (pipeline "simple" stratejisi)"""
+        groups = []
+        current = []
+        for token in tokens:
+            if current:
+                bi, tag = self._split_tag(token[0])
+                _, last_tag = self._split_tag(current[-1][0])
+                if tag == last_tag and bi != "B":
+                    current.append(token)
+                    continue
+                groups.append(current)
+            current = [token]
+        if current:
+            groups.append(current)
+
+        results = []
+        for group in groups:
+            entity_group = group[0][0].split("-", 1)[-1]
+            if entity_group == "O":
+                continue
+            start, end = group[0][2], group[-1][3]
+            results.append({
+                'entity_group': entity_group,
+                'score': sum(token[1] for token in group) / len(group),
+                'word': text[start:end],
+                'start': start,
+                'end': end,
+            })
+        return results
+
+
+class OnnxBackend(LocalTokenClassifier):
+    """ONNX Runtime ile CPU çıkarımı (model.onnx)"""
+
+    name = "onnx"
+
+    def _load_model(self) -> None:
+        import onnxruntime
+
+        path = os.path.join(self.model_dir, "model.onnx")
+        self.session = onnxruntime.InferenceSession(path, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+    def _logits(self, input_ids):
+        import numpy as np
+
+        batch = input_ids[None, :]
+        feeds = {"input_ids": batch}
+        if "attention_mask" in self.input_names:
+            feeds["attention_mask"] = np.ones_like(batch)
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.zeros_like(batch)
+        return self.session.run(None, feeds)[0][0]
+
+
+class NumpyBackend(LocalTokenClassifier):
+    """Saf NumPy ile CPU çıkarımı (model_int8.npz)"""
+
+    name = "numpy"
+
+    def _load_model(self) -> None:
+        from nlp.numpy_bert import NumpyBertTokenClassifier
+
+        self.model = NumpyBertTokenClassifier.load(
+            os.path.join(self.model_dir, "model_int8.npz"),
+            os.path.join(self.model_dir, "config.json"),
+        )
+
+    def _logits(self, input_ids):
+        return self.model.logits(input_ids)
+
+
+class CloudBackend(NERBackend):
+    """Hugging Face Inference API ("Serverless" mod)
+
+    HTTP katmanı (bağlantı havuzu, zaman aşımı, devre kesici, istek
+    birleştirme) nlp/ner_client.py içindedir. API erişilemezse NER
+    atlanır ve None döner (sonuç eksik sayılır, önbelleğe alınmaz).
+    """
+
+    name = "cloud"
+    context = "ai_cloud_bert"
+    io_bound = True
+    batched = True
+
+    def __init__(self, api_url: str = NER_API_URL, api_token: Optional[str] = NER_API_TOKEN, client=None):
+        from nlp.ner_client import NERClient
+
+        self.client = client or NERClient(api_url, api_token)
+
+    def predict(self, text: str) -> Optional[List[Dict[str, Any]]]:
+        if not text or len(text.strip()) < 2:
+            return []
+        return self._parse(text, self.client.predict(text))
+
+    def predict_many(self, texts: List[str]) -> List[Optional[List[Dict[str, Any]]]]:
+        """Metinleri client.max_batch'lik `inputs: [...]` istekleriyle gönderir"""
+        results = [[] for _ in texts]
+        pending = [i for i, text in enumerate(texts) if text and len(text.strip()) >= 2]
+        step = max(getattr(self.client, 'max_batch', 1), 1)
+        for offset in range(0, len(pending), step):
+            part = pending[offset:offset + step]
+            responses = self.client.predict_batch([texts[i] for i in part])
+            for i, response in zip(part, responses):
+                results[i] = self._parse(texts[i], response)
+        return results
+
+    def _parse(self, text: str, response) -> Optional[List[Dict[str, Any]]]:
+        """Ham API çıktısını tahmin listesine çevirir"""
+        if response is None:
+            return None  # NER atlandı (devre açık / API hatası)
+        if not isinstance(response, list) or not response:
+            return []
+
+        # Bazen liste içinde liste dönebilir
+        if isinstance(response[0], list):
+            response = response[0]
+
+        results = []
+        for res in response:
+            s_pos = res['start']
+            e_pos = res['end']
+
+            # Word Boundary Check (Parça kelime eşleşmesini önle)
+            # Örneğin "Sınav" kelimesindeki "av" kısmını isim sanmasın
+            if s_pos > 0 and text[s_pos-1].isalnum():
+                continue
+            if e_pos < len(text) and text[e_pos].isalnum():
+                continue
+
+            results.append({
+                # Bazen entity_group yerine entity gelebilir
+                'entity_group': res.get('entity_group', res.get('entity', '')),
+                'score': res['score'],
+                'word': res.get('word', text[s_pos:e_pos]),
+                'start': s_pos,
+                'end': e_pos,
+            })
+        return results
+
+
+class DisabledBackend(NERBackend):
+    """AI NER kapalı"""
+
+    name = "none"
+
+    def predict(self, text: str) -> List[Dict[str, Any]]:
+        return []
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (TransformersBackend, OnnxBackend, NumpyBackend, CloudBackend, DisabledBackend)
+}
+
+
+def create_backend(name: str) -> NERBackend:
+    """Ada göre backend oluşturur"""
+    try:
+        return BACKENDS[name.strip().lower()]()
+    except KeyError:
+        raise ValueError(f"Bilinmeyen NER backend: {name} (seçenekler: {', '.join(BACKENDS)})") from None
@@ -0,0 +1,271 @@
+"""
+Cloud NER İstemcisi
+
+Hugging Face Inference API için istemci katmanı:
+
+- Kalıcı requests.Session ve bağlantı havuzu (her çağrıda yeni TCP+TLS
+  el sıkışması yapılmaz)
+- (bağlantı, okuma) zaman aşımları: asılı kalan soket bir waitress
+  thread'ini sonsuza kadar bloklamaz
+- Devre kesici: servis çöktüğünde uyumak yerine NER atlanır
+- Eşzamanlı metinlerin tek `{"inputs": [...]}` isteğinde birleştirilmesi
+
+Birleştirme için arka plan thread'i yoktur: metni henüz gönderilmemiş
+bir thread "lider" olur, kısa bir pencere boyunca diğer metinleri bekler,
+kuyruktan en fazla max_batch metin alır ve liderliği bırakır; isteği
+atar ve sonuçları dağıtır. Lider istek sürerken kuyruk yeni bir lidere
+geçer, böylece havuz boyu (pool_size) kadar istek aynı anda uçuşta
+olabilir. Process havuzu (fork) ile de güvenle çalışır.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from config import (
+    NER_API_BATCH_WINDOW_MS, NER_API_CONNECT_TIMEOUT, NER_API_MAX_BATCH,
+    NER_API_POOL_SIZE, NER_API_READ_TIMEOUT, NER_BREAKER_FAILURES, NER_BREAKER_RESET,
+)
+
+logger = logging.getLogger("AINERDetector")
+
+
+class CircuitBreaker:
+    """Basit devre kesici (closed -> open -> half_open -> closed)
+
+    Art arda `failure_threshold` hata sonrası devre açılır ve
+    `reset_timeout` saniye boyunca istek yapılmaz. Süre dolunca tek bir
+    deneme isteğine izin verilir; başarılıysa devre kapanır.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = NER_BREAKER_FAILURES,
+                 reset_timeout: float = NER_BREAKER_RESET, clock=time.monotonic):
+        self.failure_threshold = max(int(failure_threshold), 1)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._open_for = reset_timeout
+        self._state = self.CLOSED
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self._open_for:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """İstek yapılabilir mi? (half_open durumunda tek deneme)"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self._open_for:
+                self._state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._open(self.reset_timeout)
+
+    def trip(self, seconds: Optional[float] = None) -> None:
+        """Devreyi hemen aç (ör. 503 'model yükleniyor' yanıtı)"""
+        with self._lock:
+            self._open(self.reset_timeout if seconds is None else seconds)
+
+    def _open(self, seconds: float) -> None:
+        self._state = self.OPEN
+        self._opened_at = self._clock()
+        self._open_for = seconds
+
+
+class _Pending:
+    """Kuyruktaki tek metin"""
+
+    __slots__ = ('text', 'result', 'taken', 'done')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.result = None
+        self.taken = False  # bir liderin isteğine alındı
+        self.done = False
+
+
+class NERClient:
+    """Havuzlu, zaman aşımlı, devre kesicili ve birleştirmeli API istemcisi
+
+    Kullanım:
+        client = NERClient(api_url, api_token)
+        raw = client.predict("Ahmet Yılmaz")  # API ham çıktısı veya None (atlandı)
+    """
+
+    def __init__(self, api_url: str, api_token: Optional[str] = None,
+                 connect_timeout: float = NER_API_CONNECT_TIMEOUT,
+                 read_timeout: float = NER_API_READ_TIMEOUT,
+                 pool_size: int = NER_API_POOL_SIZE,
+                 max_batch: int = NER_API_MAX_BATCH,
+                 batch_window: float = NER_API_BATCH_WINDOW_MS / 1000.0,
+                 breaker: Optional[CircuitBreaker] = None):
+        self.api_url = api_url
+        self.headers = {"Authorization": f"Bearer {api_token}"} if api_token else {}
+        self.timeout = (connect_timeout, read_timeout)
+        self.pool_size = max(int(pool_size), 1)
+        self.max_batch = max(int(max_batch), 1)
+        self.batch_window = batch_window
+        self.breaker = breaker or CircuitBreaker()
+
+        self._session = None
+        self._session_pid = None
+        self._cond = threading.Condition()
+        self._queue: List[_Pending] = []
+        self._collecting = False
+        self._in_flight = 0
+        self._counters_lock = threading.Lock()
+        self.counters = {'requests': 0, 'texts': 0, 'failures': 0, 'skipped': 0}
+
+    @property
+    def session(self):
+        """Process başına tek Session (fork sonrası soketler paylaşılmaz)"""
+        if self._session is None or self._session_pid != os.getpid():
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(self.headers)
+            self._session = session
+            self._session_pid = os.getpid()
+        return self._session
+
+    def stats(self) -> Dict[str, Any]:
+        with self._counters_lock:
+            counters = dict(self.counters)
+        return dict(counters, breaker=self.breaker.state)
+
+    def _count(self, **amounts: int) -> None:
+        with self._counters_lock:
+            for name, amount in amounts.items():
+                self.counters[name] += amount
+
+    def predict(self, text: str) -> Optional[list]:
+        """Tek metin için ham API çıktısı; devre açıksa veya hata olursa None"""
+        item = _Pending(text)
+
+        with self._cond:
+            self._queue.append(item)
+        while True:
+            with self._cond:
+                # Metin başka bir liderin isteğindeyse sonucu, değilse liderliği bekle
+                while not item.done and (item.taken or self._collecting
+                                         or self._in_flight >= self.pool_size):
+                    self._cond.wait()
+                if item.done:
+                    return item.result
+                self._collecting = True
+            # Lider; kuyrukta önde max_batch'ten fazla metin varsa kendi metni
+            # bu isteğe girmeyebilir, o zaman döngü tekrar liderlik bekler
+            self._lead()
+
+    def _lead(self) -> None:
+        """Pencere boyunca gelen metinleri toplar, liderliği bırakıp isteği gönderir"""
+        try:
+            if self.batch_window > 0:
+                time.sleep(self.batch_window)
+        finally:
+            with self._cond:
+                batch = self._queue[:self.max_batch]
+                del self._queue[:self.max_batch]
+                for pending in batch:
+                    pending.taken = True
+                self._collecting = False
+                self._in_flight += 1
+                self._cond.notify_all()
+
+        results = [None] * len(batch)
+        try:
+            results = self.predict_batch([pending.text for pending in batch])
+        finally:
+            with self._cond:
+                for pending, result in zip(batch, results):
+                    pending.result = result
+                    pending.done = True
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def predict_batch(self, texts: List[str]) -> List[Optional[list]]:
+        """Metinleri tek istekte gönderir; her metin için ham çıktı veya None"""
+        if not self.breaker.allow():
+            self._count(skipped=len(texts))
+            return [None] * len(texts)
+
+        self._count(requests=1, texts=len(texts))
+        try:
+            response = self.session.post(self.api_url, json={"inputs": texts}, timeout=self.timeout)
+        except Exception as e:
+            logger.error(f"API İstek Hatası: {e}")
+            return self._failed(texts)
+
+        # Model yükleniyorsa (503) uyumak yerine tahmini süre boyunca devreyi aç
+        if response.status_code == 503:
+            try:
+                estimated_time = float(response.json().get('estimated_time', NER_BREAKER_RESET))
+            except Exception:
+                estimated_time = None
+            logger.info(f"Model uykuda, NER {estimated_time or NER_BREAKER_RESET:.1f}s atlanacak")
+            self._count(failures=1)
+            self.breaker.trip(estimated_time)
+            return [None] * len(texts)
+
+        # Yanıt alınan her yol devre kesiciye bir sonuç yazar; yazılmazsa
+        # half_open denemesine gelen 401 / hata gövdesi devreyi askıda bırakır.
+        # 4xx (geçersiz token, yanlış URL) de sonraki isteklerde tekrarlanacağı
+        # için hata sayılır.
+        if response.status_code != 200:
+            logger.warning(f"API Yanıtı: {response.status_code} - {response.text[:200]}")
+            return self._failed(texts)
+
+        try:
+            data = response.json()
+        except ValueError:
+            return self._failed(texts)
+
+        if isinstance(data, dict) and 'error' in data:
+            logger.warning(f"AI API Hatası: {data['error']}")
+            return self._failed(texts)
+
+        # Tek metinde API düz liste dönebilir
+        if len(texts) == 1 and isinstance(data, list) and (not data or isinstance(data[0], dict)):
+            data = [data]
+        if not isinstance(data, list) or len(data) != len(texts):
+            logger.warning("AI API yanıtı girdi sayısıyla uyuşmuyor")
+            return self._failed(texts)
+
+        self.breaker.record_success()
+        return data
+
+    def _failed(self, texts: List[str]) -> List[None]:
+        self._count(failures=1)
+        self.breaker.record_failure()
+        return [None] * len(texts)
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
@@ -0,0 +1,122 @@
+"""
+NumPy BERT - Token sınıflandırma için torch'suz CPU çıkarımı
+
+tools/export_ner_model.py ile dışa aktarılan ağırlıkları (.npz) yükler ve
+BertForTokenClassification'ın ileri geçişini saf NumPy ile hesaplar.
+
+Büyük lineer katman ağırlıkları dosyada int8 (sütun başına ölçek ile)
+saklanır ve yüklenirken float32'ye açılır; böylece model dosyası ~4 kat
+küçülür, çıkarım float32 matris çarpımlarıyla yapılır.
+"""
+
+import json
+import math
+from typing import Dict
+
+import numpy as np
+
+
+# Abramowitz-Stegun 7.1.26 erf yaklaşımı (maks. hata ~1.5e-7)
+_ERF_P = 0.3275911
+_ERF_A = (0.254829592, -0.284496736, 1.421413741, -1.453152027, 1.061405429)
+
+
+def _erf(x: np.ndarray) -> np.ndarray:
+    sign = np.sign(x)
+    x = np.abs(x)
+    t = 1.0 / (1.0 + _ERF_P * x)
+    a1, a2, a3, a4, a5 = _ERF_A
+    poly = ((((a5 * t + a4) * t + a3) * t + a2) * t + a1) * t
+    return sign * (1.0 - poly * np.exp(-x * x))
+
+
+def _gelu(x: np.ndarray) -> np.ndarray:
+    """BERT'in kullandığı erf tabanlı GELU"""
+    return 0.5 * x * (1.0 + _erf(x / math.sqrt(2.0)))
+
+
+def _layer_norm(x: np.ndarray, gamma: np.ndarray, beta: np.ndarray, eps: float) -> np.ndarray:
+    mean = x.mean(axis=-1, keepdims=True)
+    var = ((x - mean) ** 2).mean(axis=-1, keepdims=True)
+    return (x - mean) / np.sqrt(var + eps) * gamma + beta
+
+
+def _softmax(x: np.ndarray) -> np.ndarray:
+    x = x - x.max(axis=-1, keepdims=True)
+    e = np.exp(x)
+    return e / e.sum(axis=-1, keepdims=True)
+
+
+def quantize_int8(weight: np.ndarray):
+    """[in, out] ağırlığı sütun başına simetrik int8'e çevirir -> (q, scale)"""
+    scale = np.abs(weight).max(axis=0) / 127.0
+    scale[scale == 0] = 1.0
+    q = np.clip(np.round(weight / scale), -127, 127).astype(np.int8)
+    return q, scale.astype(np.float32)
+
+
+class NumpyBertTokenClassifier:
+    """BertForTokenClassification ileri geçişi (tek dizi, padding yok)"""
+
+    def __init__(self, weights: Dict[str, np.ndarray], config: dict):
+        self.num_layers = int(config['num_hidden_layers'])
+        self.num_heads = int(config['num_attention_heads'])
+        self.eps = float(config.get('layer_norm_eps', 1e-12))
+        self.id2label = {int(k): v for k, v in config['id2label'].items()}
+        self.max_positions = int(config.get('max_position_embeddings', 512))
+        self.w = {}
+        for name in weights.files if hasattr(weights, 'files') else weights:
+            if name.endswith('.scale'):
+                continue
+            value = weights[name]
+            if value.dtype == np.int8:
+                value = value.astype(np.float32) * weights[name + '.scale']
+            self.w[name] = value.astype(np.float32, copy=False)
+
+    @classmethod
+    def load(cls, weights_path: str, config_path: str) -> 'NumpyBertTokenClassifier':
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        with np.load(weights_path) as weights:
+            return cls(weights, config)
+
+    def _linear(self, x: np.ndarray, prefix: str) -> np.ndarray:
+        return x @ self.w[prefix + '.weight'] + self.w[prefix + '.bias']
+
+    def logits(self, input_ids: np.ndarray) -> np.ndarray:
+        """input_ids: [seq] -> logits: [seq, num_labels]"""
+        w = self.w
+        seq_len = input_ids.shape[0]
+
+        x = (w['embeddings.word_embeddings'][input_ids]
+             + w['embeddings.position_embeddings'][:seq_len]
+             + w['embeddings.token_type_embeddings'][0])
+        x = _layer_norm(x, w['embeddings.LayerNorm.weight'], w['embeddings.LayerNorm.bias'], self.eps)
+
+        hidden = x.shape[-1]
+        head_dim = hidden // self.num_heads
+        scale = 1.0 / math.sqrt(head_dim)
+
+        for i in range(self.num_layers):
+            p = f'encoder.layer.{i}'
+
+            def heads(t):
+                return t.reshape(seq_len, self.num_heads, head_dim).transpose(1, 0, 2)
+
+            q = heads(self._linear(x, p + '.attention.self.query'))
+            k = heads(self._linear(x, p + '.attention.self.key'))
+            v = heads(self._linear(x, p + '.attention.self.value'))
+
+            attention = _softmax(q @ k.transpose(0, 2, 1) * scale)
+            context = (attention @ v).transpose(1, 0, 2).reshape(seq_len, hidden)
+
+            x = _layer_norm(x + self._linear(context, p + '.attention.output.dense'),
+                            w[p + '.attention.output.LayerNorm.weight'],
+                            w[p + '.attention.output.LayerNorm.bias'], self.eps)
+
+            intermediate = _gelu(self._linear(x, p + '.intermediate.dense'))
+            x = _layer_norm(x + self._linear(intermediate, p + '.output.dense'),
+                            w[p + '.output.LayerNorm.weight'],
+                            w[p + '.output.LayerNorm.bias'], self.eps)
+
+        return self._linear(x, 'classifier')
@@ -2,23 +2,57 @@
 """
 Production Server Başlatıcı
 Bu script projeyi 'Waitress' WSGI sunucusu ile yüksek performansta çalıştırır.
+
+--asgi ile async mod (asgi.py, uvicorn): bağlantılar event loop'ta tutulur,
+yavaş bir bulut NER servisi thread havuzunu tüketmez.
 """
+import os
+import sys
+
+# Production'da toplu işlem havuzu varsayılan olarak tüm çekirdekleri kullanır
+os.environ.setdefault("KVKK_BATCH_WORKERS", "auto")
+
 from waitress import serve
-from api import app
+from api import app, init_batch_pool
 import logging
 
 # Loglama ayarları
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("ProductionServer")
 
+def serve_asgi(host='0.0.0.0', port=5001):
+    """Async mod: asgi.app'i uvicorn ile çalıştırır"""
+    try:
+        import uvicorn
+    except ImportError:
+        sys.exit("Async mod için uvicorn gerekir: pip install uvicorn")
+    from asgi import app as asgi_app
+    
+    print("✅ Durum: Async Mod (ASGI, uvicorn)")
+    print(f"📡 Adres: http://localhost:{port}")
+    pool = init_batch_pool()
+    print(f"🧵 Batch Worker: {pool.workers if pool else 'kapalı'} process")
+    print("="*50 + "\n")
+    uvicorn.run(asgi_app, host=host, port=port, log_level="info")
+
+
 if __name__ == "__main__":
     print("\n" + "="*50)
     print("🚀 KVKK GUARD AI - PRODUCTION SERVER")
     print("="*50)
+    
+    if "--asgi" in sys.argv[1:]:
+        serve_asgi()
+        sys.exit(0)
+    
     print("✅ Durum: Yüksek Performans Modu (WSGI)")
     print("📡 Adres: http://localhost:5001")
     print("💾 Model: Türkçe BERT (Lazy Load)")
     print("⚙️  Thread Sayısı: 8 (Eşzamanlı İşlem)")
+    
+    # Batch worker process'leri sunucu açılmadan önce başlatılır
+    pool = init_batch_pool()
+    print(f"🧵 Batch Worker: {pool.workers if pool else 'kapalı'} process")
     print("="*50 + "\n")
     
     # Waitress ile servisi başlat
@@ -0,0 +1,34 @@
+"""
+Test Ayarları
+
+Testler repo kökünden çalıştırılır:
+    python -m pytest -q
+
+AI NER (yerel model / bulut) testlerde kapalıdır (KVKK_NER_BACKEND=none);
+sonuçlar yalnızca regex ve sözlük tabanlı detector'lara bağlıdır ve model
+indirilmez. Sentetik transkriptler ve diğer test girdileri tests/samples.py'dedir;
+tools/ altındaki derleme / dışa aktarma betikleri de içe aktarılabilir.
+"""
+
+import os
+import sys
+
+os.environ.setdefault("KVKK_NER_BACKEND", "none")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def anonymizer():
+    from anonymizer import KVKKAnonymizer
+    return KVKKAnonymizer()
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    from samples import generate_corpus
+    return generate_corpus(12, 3000, density=0.5, seed=7)
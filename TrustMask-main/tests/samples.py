@@ -0,0 +1,333 @@
+"""
+Test verileri: sentetik transkriptler, kısa mesajlar, rastgele metinler
+
+Testler benchmarks/ altındaki modüllere bağlı değildir; benchmark'ların
+korpusu veya örnek satırları ayarlansa da test girdileri değişmez.
+
+- generate_corpus / generate_document: benchmarks/corpus.py ile aynı
+  üretici (PII yoğunluğu ayarlanabilir, checksum'ı geçerli TC / IBAN / kart)
+- SAMPLE_LINES / build_document: sabit örnek satırlardan transkript
+- TRIVIAL_MESSAGES / FUZZ_TOKENS / edge_text: triage ve toplu işlem için
+  kısa ve rastgele metinler
+- transcript_messages / session_steps: oturumlu anonimleştirme adımları
+- build_records / run_records: JSONL / CSV kayıtları
+- random_entities: örtüşme çözümü için rastgele aday entity'ler
+"""
+
+import csv
+import io
+import json
+import random
+from typing import List
+
+from config import EntityType
+from detectors.address_detector import ALL_DISTRICTS, TURKEY_CITIES
+from detectors.credit_card_detector import CreditCardDetector
+from detectors.iban_detector import IBANDetector
+from detectors.tc_kimlik_detector import TCKimlikDetector
+from entities import DetectedEntity
+from nlp.turkish_names_db import TURKISH_FIRST_NAMES, TURKISH_SURNAMES
+
+
+# ---- Sentetik çağrı merkezi korpusu ----
+
+_TC = TCKimlikDetector()
+_IBAN = IBANDetector()
+_CARD = CreditCardDetector()
+
+FIRST_NAMES = sorted(TURKISH_FIRST_NAMES)
+SURNAMES = sorted(TURKISH_SURNAMES)
+CITIES = sorted(set(TURKEY_CITIES))
+DISTRICTS = sorted(set(ALL_DISTRICTS))
+
+MONTHS = ["Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", "Temmuz",
+          "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık"]
+STREETS = ["Atatürk", "Cumhuriyet", "İnönü", "Gazi", "Barış", "Çiçek", "Lale", "Fatih Sultan"]
+BANKS = ["Garanti", "Ziraat Bankası", "İş Bankası", "Akbank", "Yapı Kredi", "Halkbank"]
+MAIL_DOMAINS = ["gmail.com", "hotmail.com", "yahoo.com", "outlook.com", "firma.com.tr"]
+PLATE_LETTERS = "ABCDEFGHJKLMNPRSTUVYZ"
+
+FILLER_LINES = [
+    "Temsilci: Merhaba, size nasıl yardımcı olabilirim?",
+    "Müşteri: Faturam bu ay neden yüksek geldi anlamadım.",
+    "Temsilci: Paketinizde kalan internet miktarını kontrol ediyorum, lütfen hatta kalın.",
+    "Temsilci: Kampanya koşullarını sizin için tekrar özetleyebilirim.",
+    "Müşteri: Tamam, teşekkür ederim.",
+    "Temsilci: Başka yardımcı olabileceğim bir konu var mı?",
+    "Müşteri: Hayır, bu kadardı. İyi günler.",
+    "Temsilci: Talebiniz ilgili birime iletildi, en kısa sürede dönüş yapılacak.",
+    "Müşteri: Geçen ay da aynı sorunu yaşamıştım, çözülmedi.",
+    "Temsilci: Anlıyorum, kaydınızı kontrol ediyorum.",
+    "Müşteri: Modemin ışıkları yanıp sönüyor, internet kesik.",
+    "Temsilci: Çağrınız kalite standartları gereği kayıt altına alınmaktadır.",
+]
+
+
+def _title(word: str) -> str:
+    head = 'İ' if word[0] == 'i' else word[0].upper()
+    return head + word[1:]
+
+
+def _digits(rng: random.Random, count: int) -> str:
+    return ''.join(rng.choice('0123456789') for _ in range(count))
+
+
+def tc_kimlik(rng: random.Random) -> str:
+    while True:
+        head = rng.choice('123456789') + _digits(rng, 8)
+        for check in range(100):
+            candidate = f"{head}{check:02d}"
+            if _TC.validate(candidate):
+                return candidate
+
+
+def iban(rng: random.Random) -> str:
+    body = _digits(rng, 5) + '0' + _digits(rng, 16)
+    for check in range(100):
+        candidate = f"TR{check:02d}{body}"
+        if _IBAN.validate(candidate):
+            return candidate
+    raise AssertionError("IBAN kontrol hanesi bulunamadı")
+
+
+def card_number(rng: random.Random) -> str:
+    while True:
+        head = rng.choice('3456') + _digits(rng, 14)
+        for check in '0123456789':
+            if _CARD.validate(head + check):
+                return head + check
+
+
+def full_name(rng: random.Random) -> str:
+    return f"{_title(rng.choice(FIRST_NAMES))} {_title(rng.choice(SURNAMES))}"
+
+
+def phone(rng: random.Random) -> str:
+    return f"05{rng.randint(30, 59)} {_digits(rng, 3)} {_digits(rng, 2)} {_digits(rng, 2)}"
+
+
+def email(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)}.{rng.choice(SURNAMES)}{rng.randint(1, 99)}@{rng.choice(MAIL_DOMAINS)}"
+
+
+def address(rng: random.Random) -> str:
+    return (f"{_title(rng.choice(DISTRICTS))} Mahallesi {rng.choice(STREETS)} Caddesi "
+            f"No:{rng.randint(1, 200)} Daire:{rng.randint(1, 30)} {_title(rng.choice(CITIES))}")
+
+
+def plate(rng: random.Random) -> str:
+    letters = ''.join(rng.choice(PLATE_LETTERS) for _ in range(rng.randint(1, 3)))
+    return f"{rng.randint(1, 81):02d} {letters} {rng.randint(10, 9999)}"
+
+
+def birth_date(rng: random.Random) -> str:
+    day, month, year = rng.randint(1, 28), rng.randint(1, 12), rng.randint(1950, 2005)
+    if rng.random() < 0.5:
+        return f"{day:02d}.{month:02d}.{year}"
+    return f"{day} {MONTHS[month - 1]} {year}"
+
+
+PII_LINES = [
+    lambda rng: f"Müşteri: Merhaba, ben {full_name(rng)}.",
+    lambda rng: f"Müşteri: TC kimlik numaram {tc_kimlik(rng)}.",
+    lambda rng: f"Müşteri: Telefon numaram {phone(rng)}, mail adresim {email(rng)}",
+    lambda rng: f"Müşteri: IBAN: {iban(rng)}, bankam {rng.choice(BANKS)}",
+    lambda rng: f"Müşteri: Kart numaram {card_number(rng)}",
+    lambda rng: f"Temsilci: Ev adresiniz: {address(rng)}",
+    lambda rng: f"Müşteri: Plakam {plate(rng)}, doğum tarihim {birth_date(rng)}",
+    lambda rng: f"Temsilci: Müşteri numaranız VOD-{_digits(rng, 9)}, çağrı kayıt no: CR-2024-{_digits(rng, 6)}",
+    lambda rng: f"Müşteri: Annemin adı {_title(rng.choice(FIRST_NAMES))}, babamın adı {_title(rng.choice(FIRST_NAMES))}.",
+    lambda rng: f"Temsilci: Sayın {full_name(rng)}, {_title(rng.choice(CITIES))} şubemize yönlendiriyorum.",
+]
+
+
+def generate_document(rng: random.Random, size: int, density: float = 0.3) -> str:
+    """Yaklaşık `size` karakterlik transkript (density: PII içeren satır oranı, 0-1)"""
+    lines = []
+    length = 0
+    while length < size:
+        line = rng.choice(PII_LINES)(rng) if rng.random() < density else rng.choice(FILLER_LINES)
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+def generate_corpus(docs: int, size: int, density: float = 0.3, seed: int = 42) -> List[str]:
+    rng = random.Random(seed)
+    return [generate_document(rng, size, density) for _ in range(docs)]
+
+
+# ---- Sabit örnek satırlar ----
+
+SAMPLE_LINES = [
+    "Temsilci: Merhaba, ben Ayşe. Size nasıl yardımcı olabilirim?",
+    "Müşteri: Merhaba, ben Ahmet Yılmaz. TC kimlik numaram 32303010429.",
+    "Müşteri: Telefon numaram 0532 123 45 67, mail adresim ahmet@gmail.com",
+    "Temsilci: Doğrulama için TC kimlik numaranızın son 4 hanesini alabilir miyim?",
+    "Müşteri: 0429.",
+    "Müşteri: IBAN: TR330006100519786457841326, Bankam Garanti",
+    "Müşteri: Plakam 34 ABC 123, doğum tarihim 12/03/1988",
+    "Temsilci: Ev adresiniz: Kadıköy Mahallesi Atatürk Caddesi No:15 İstanbul",
+    "Temsilci: Müşteri numaranız VOD-123456789, çağrı kayıt no: CRM-2024-001",
+    "Müşteri: Tamam, teşekkür ederim.",
+    "Temsilci: Paketinizde kalan internet miktarını kontrol ediyorum, lütfen hatta kalın.",
+    "Müşteri: Faturam bu ay neden yüksek geldi anlamadım.",
+]
+
+
+def build_document(size: int, seed: int = 42) -> str:
+    """Yaklaşık `size` karakterlik, SAMPLE_LINES'tan transkript"""
+    rng = random.Random(seed)
+    lines = []
+    length = 0
+    while length < size:
+        line = rng.choice(SAMPLE_LINES)
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+# ---- Kısa ve rastgele mesajlar ----
+
+TRIVIAL_MESSAGES = [
+    "evet", "Evet.", "hayır", "teşekkürler", "Teşekkür ederim, iyi günler.",
+    "tamam", "Anladım.", "bir dakika lütfen", "Hatta kalın lütfen.",
+    "Merhaba, size nasıl yardımcı olabilirim?", "görüşmek üzere",
+    "Çağrınız sıraya alınmıştır, lütfen bekleyiniz.", "olur", "peki",
+    "Başka bir isteğiniz var mı?", "yok, teşekkürler",
+]
+
+# Detector anahtar kelimeleri, isimler, şehirler, bankalar, rakamlar ve ayraçlar
+FUZZ_TOKENS = [
+    "adresim", "mahallesi", "Cad.", "sok", "no", "daire", "il", "ilçe", "Kadıköy", "İSTANBUL",
+    "ankara", "Ataşehir", "/", ",", ".", ":", "@", "at", "dot", "gmail", "mail",
+    "müşteri", "numaram", "abone", "VOD", "TC", "CRM", "tt", "soz", "çağrı", "kayıt",
+    "cinsiyet", "erkek", "KADIN", "bay", "ben", "annem", "anne", "adı", "baba", "kızlık", "soyadı",
+    "banka", "Garanti", "ING", "iş", "bankası", "ziraat", "Ahmet", "Yılmaz", "ahmet", "bey",
+    "hanım", "adım", "Sayın", "dr", "merhaba", "evet", "tamam", "teşekkürler", "fe80::1",
+    "::", "12", "0532", "123", "45", "67", "1990", "12.03.1988", "34", "ABC", "hesap",
+    "ticket", "CR-2024-001234", "ABCD-EFGH", "kart", "son", "hane", "\n",
+]
+
+# Metin başında / sonunda ayırıcıyla etkileşebilecek parçalar
+EDGE_TOKENS = FUZZ_TOKENS + [
+    "Erkek", "hesap bilgileriniz", "müşteri numaranız 12345678", "bankam Ziraat", "  ", " \n",
+    "TR330006100519786457841326", "32303010429", "ev adresim", "çağrı kayıt", "t.c", "no:",
+]
+
+
+def edge_text(rng: random.Random) -> str:
+    text = " ".join(rng.choice(EDGE_TOKENS) for _ in range(rng.randint(1, 6)))
+    return text + rng.choice(["", "", " ", "\n", ".", "  "])
+
+
+def short_messages(count: int, seed: int = 5) -> List[str]:
+    """Korpus satırları ve PII içermeyen mesajlar karışık"""
+    rng = random.Random(seed)
+    lines = [line for doc in generate_corpus(50, 2000, density=0.3, seed=seed) for line in doc.split("\n")]
+    return [rng.choice(lines) if rng.random() < 0.6 else rng.choice(TRIVIAL_MESSAGES) for _ in range(count)]
+
+
+def entity_keys(entities):
+    return [(e.entity_type, e.value, e.start_pos, e.end_pos, e.confidence, e.context) for e in entities]
+
+
+def snapshot(result):
+    """Karşılaştırılan sonuç alanları"""
+    return result.to_dict(include_offsets=True), entity_keys(result.entities)
+
+
+# ---- Oturumlu anonimleştirme ----
+
+# Önceki satırlardaki soruya bağlı cevaplar (PartialDataDetector)
+DIALOGUES = [
+    ["Temsilci: Doğum yılınızı öğrenebilir miyim?", "Müşteri: 1987."],
+    ["Temsilci: TC kimlik numaranızın son 4 hanesini alabilir miyim?", "Müşteri: Bir saniye bakayım.",
+     "Müşteri: 2109."],
+    ["Temsilci: Telefon numaranızın son iki hanesi nedir?", "Müşteri: 45"],
+]
+
+
+def transcript_messages(rng: random.Random, document: str) -> List[str]:
+    """Belgeyi 1-3 satırlık mesajlara böler, araya doğrulama diyalogları ekler"""
+    lines = document.split('\n')
+    messages = []
+    i = 0
+    while i < len(lines):
+        if rng.random() < 0.1:
+            messages.extend(rng.choice(DIALOGUES))
+        step = rng.randint(1, 3)
+        messages.append('\n'.join(lines[i:i + step]))
+        i += step
+    return messages
+
+
+def session_steps(rng: random.Random, messages, edits: float):
+    """Her adımda dökümün tamamı; edits oranında adımda önceki bir satır düzenlenir / silinir"""
+    lines = []
+    for message in messages:
+        lines.extend(message.split('\n'))
+        if len(lines) > 2 and rng.random() < edits:
+            i = rng.randrange(len(lines) - 1)
+            if rng.random() < 0.5:
+                del lines[i]
+            else:
+                lines[i] = rng.choice(messages).split('\n')[0]
+        yield '\n'.join(lines)
+
+
+# ---- Yapılandırılmış kayıtlar ----
+
+def build_records(count: int, seed: int):
+    """(jsonl satırları, csv metni) - aynı kayıtlar iki formatta"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        rows.append({
+            "ticket_id": 100000 + i,
+            "created_at": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "amount": f"{rng.randint(10, 5000)}.{rng.randint(0, 99):02d}",
+            "note": generate_document(rng, rng.randint(80, 600), density=0.5),
+            "customer": {"comment": generate_document(rng, rng.randint(40, 200), density=0.3),
+                         "segment": rng.choice(["bireysel", "kurumsal"])},
+        })
+    jsonl = [json.dumps(row, ensure_ascii=i % 2 == 0) + '\n' for i, row in enumerate(rows)]
+    buffer = io.StringIO(newline='')
+    writer = csv.writer(buffer, lineterminator='\r\n')
+    writer.writerow(["ticket_id", "created_at", "amount", "note", "segment"])
+    for row in rows:
+        writer.writerow([row["ticket_id"], row["created_at"], row["amount"], row["note"],
+                         row["customer"]["segment"]])
+    return jsonl, buffer.getvalue()
+
+
+def run_records(lines, record_format, fields, anonymizer=None, pool=None):
+    """-> (çıktı metni, istatistikler)"""
+    from engine.records import anonymize_records
+
+    out = io.StringIO(newline='')
+    stats = anonymize_records(lines, out.write, record_format, fields, anonymizer=anonymizer, pool=pool)
+    return out.getvalue(), stats
+
+
+# ---- Rastgele aday entity'ler ----
+
+ENTITY_TYPES = list(EntityType)
+CONFIDENCES = [0.5, 0.7, 0.75, 0.85, 0.9, 0.95, 0.98]
+
+
+def random_entities(rng: random.Random, count: int, span: int, types) -> List[DetectedEntity]:
+    """Boş, ters (end < start) ve value uzunluğu aralıkla uyuşmayan adaylar dahil"""
+    entities = []
+    for _ in range(count):
+        start = rng.randrange(span)
+        length = rng.choice([0, 1, 2, 3, 5, 8, 13, 30]) if rng.random() < 0.95 else -rng.randrange(1, 4)
+        value_len = max(0, length) if rng.random() < 0.9 else rng.randrange(0, 20)
+        entities.append(DetectedEntity(
+            entity_type=rng.choice(types),
+            value='x' * value_len,
+            start_pos=start,
+            end_pos=start + length,
+            confidence=rng.choice(CONFIDENCES),
+        ))
+    return entities
@@ -0,0 +1,44 @@
+"""
+İl/ilçe çiftleri (AddressDetector location_format)
+
+Sözlük İ/I/ı/i'yi aynı harf sayar ("İSTANBUL" bir il). Yalnız boşlukla
+ayrılan çiftte iki kelime de il/ilçe olmalı; yoksa komşu kelime span'e
+girer ve GENDER / BANK_NAME gibi entity'leri yutar. "/" ile ayrılan
+çiftte tek il/ilçe yeterlidir.
+"""
+
+import pytest
+
+from config import EntityType
+
+
+def found(anonymizer, text):
+    return [(e.entity_type, e.value.strip()) for e in anonymizer.anonymize(text).entities]
+
+
+@pytest.mark.parametrize("text, kept", [
+    ("İSTANBUL erkek", (EntityType.GENDER, "erkek")),
+    ("Cinsiyet erkek İSTANBUL erkek", (EntityType.GENDER, "erkek")),
+    ("Garanti İSTANBUL", (EntityType.BANK_NAME, "Garanti")),
+    ("Ziraat Bankası İSTANBUL", (EntityType.BANK_NAME, "Ziraat Bankası")),
+])
+def test_neighbour_entities_not_swallowed(anonymizer, text, kept):
+    entities = found(anonymizer, text)
+    assert kept in entities
+    assert not any(entity_type == EntityType.CITY_DISTRICT for entity_type, _ in entities)
+
+
+@pytest.mark.parametrize("text", ["teşekkürler İSTANBUL", "İSTANBUL şubesinde", "Çankaya Merhaba"])
+def test_single_location_word_pair_ignored(anonymizer, text):
+    assert anonymizer.anonymize(text).sanitized_text == text
+
+
+@pytest.mark.parametrize("text", ["Kadıköy İSTANBUL", "Kadıköy/İstanbul", "ISPARTA/Merkez", "İstanbul / Ataşehir"])
+def test_location_pairs(anonymizer, text):
+    assert found(anonymizer, text) == [(EntityType.CITY_DISTRICT, text)]
+
+
+def test_labelled_city_and_district(anonymizer):
+    entities = found(anonymizer, "Posta kodu: 34710, il: Ankara ilçe: Çankaya Merhaba")
+    assert (EntityType.CITY_DISTRICT, "il: Ankara") in entities
+    assert (EntityType.CITY_DISTRICT, "ilçe: Çankaya") in entities
@@ -0,0 +1,152 @@
+"""
+Async (ASGI) API: api.py ile aynı endpoint'ler ve aynı yanıtlar
+
+- JSON endpoint'leri Flask ile aynı durum kodunu ve gövdeyi döner
+- 404 / 405 / bozuk JSON / büyük gövde / CORS preflight / lifespan
+- I/O backend'inde NER tahminleri I/O havuzunda önceden alınır; CPU
+  havuzundaki detect() yanıtı önbellekten okur (backend bir kez çağrılır)
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("flask")
+
+import api
+import asgi
+from nlp.ner_backends import NERBackend
+
+
+async def call(method, path, body=None):
+    sent = []
+    raw = body if isinstance(body, bytes) else (json.dumps(body).encode('utf-8') if body is not None else b'')
+
+    async def receive():
+        return {'type': 'http.request', 'body': raw, 'more_body': False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': b'', 'headers': []}
+    await asgi.app(scope, receive, send)
+    headers = dict(sent[0]['headers'])
+    return sent[0]['status'], headers, b''.join(message.get('body', b'') for message in sent[1:])
+
+
+def asgi_json(method, path, body=None):
+    status, _, raw = asyncio.run(call(method, path, body))
+    return status, json.loads(raw)
+
+
+@pytest.fixture
+def flask_client():
+    return api.app.test_client()
+
+
+@pytest.mark.parametrize("path, body", [
+    ('/anonymize', {"text": "Numaram 0532 123 45 67, TC 10000000146."}),
+    ('/anonymize', {"text": "TC 10000000146", "include_offsets": True, "profile": "contact"}),
+    ('/anonymize', {"text": "TC 10000000146", "entity_types": ["TC_ID"], "min_confidence": 0.9}),
+    ('/anonymize', {"text": ""}),
+    ('/anonymize', {}),
+    ('/anonymize', {"text": "a", "min_confidence": "x"}),
+    ('/anonymize', {"text": "a", "profile": "nope"}),
+    ('/anonymize/batch', {"texts": ["TC 10000000146", 5, "tamam", None, "IBAN TR33 0006 1005 1978 6457 8413 26"]}),
+    ('/anonymize/batch', {"texts": "tek metin"}),
+    ('/stats', {"text": "Ahmet Yılmaz, TC 10000000146"}),
+    ('/stats', {}),
+])
+def test_post_endpoints_match_flask(flask_client, path, body):
+    expected = flask_client.post(path, json=body)
+    assert asgi_json('POST', path, body) == (expected.status_code, expected.json)
+
+
+@pytest.mark.parametrize("path", ['/health', '/info', '/info/'])
+def test_get_endpoints_match_flask(flask_client, path):
+    expected = flask_client.get(path.rstrip('/'))
+    assert asgi_json('GET', path) == (expected.status_code, expected.json)
+
+
+def test_metrics_endpoint():
+    status, headers, body = asyncio.run(call('GET', '/metrics'))
+    assert status == 200 and headers[b'content-type'].startswith(b'text/plain')
+    assert b'kvkk_documents_total' in body
+
+
+def test_errors(monkeypatch):
+    assert asgi_json('GET', '/nope')[0] == 404
+    assert asgi_json('GET', '/anonymize')[0] == 405
+    status, payload = asgi_json('POST', '/anonymize', b'{bozuk')
+    assert status == 400 and payload["error"] == "Invalid JSON body"
+    monkeypatch.setattr(asgi, "ASGI_MAX_BODY", 16)
+    assert asgi_json('POST', '/anonymize', {"text": "x" * 32})[0] == 413
+
+
+def test_cors_preflight():
+    status, headers, body = asyncio.run(call('OPTIONS', '/anonymize'))
+    assert status == 200 and body == b''
+    assert headers[b'access-control-allow-methods'] == b'POST, OPTIONS'
+    assert headers[b'access-control-allow-origin'] == b'*'
+
+
+def test_lifespan(monkeypatch):
+    shutdowns = []
+    monkeypatch.setattr(asgi.cpu_executor, "shutdown", lambda wait: shutdowns.append("cpu"))
+    monkeypatch.setattr(asgi.io_executor, "shutdown", lambda wait: shutdowns.append("io"))
+    messages = iter([{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}])
+    sent = []
+
+    async def receive():
+        return next(messages)
+
+    async def send(message):
+        sent.append(message['type'])
+
+    asyncio.run(asgi.app({'type': 'lifespan'}, receive, send))
+    assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
+    assert shutdowns == ["cpu", "io"]
+
+
+class SlowCloudBackend(NERBackend):
+    """Ağ gecikmesini taklit eden I/O backend'i; çağrıldığı thread'leri kaydeder"""
+
+    name = "slow-cloud"
+    io_bound = True
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.threads = []
+
+    def predict(self, text):
+        with self.lock:
+            self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        start = text.index("Zeynep")
+        return [{"entity_group": "PER", "word": "Zeynep", "start": start, "end": start + 6, "score": 0.99}]
+
+
+def test_ner_prefetched_on_io_threads(monkeypatch):
+    if asgi._ner is None:
+        pytest.skip("AI NER kapalı")
+    backend = SlowCloudBackend(delay=0.3)
+    monkeypatch.setattr(asgi._ner, "backend", backend)
+    texts = [f"Müşteri Zeynep aradı, dosya {i}." for i in range(8)]
+
+    async def run():
+        return await asyncio.gather(*(call('POST', '/anonymize', {"text": text}) for text in texts))
+
+    started = time.perf_counter()
+    responses = asyncio.run(run())
+    elapsed = time.perf_counter() - started
+
+    for status, _, raw in responses:
+        assert status == 200 and "Zeynep" not in json.loads(raw)["sanitized_text"]
+    # Her metin için tek tahmin (detect() önbellekten okur), hepsi I/O havuzunda ve eşzamanlı
+    assert len(backend.threads) == len(texts)
+    assert all(name.startswith('kvkk-io') for name in backend.threads)
+    assert elapsed < backend.delay * len(texts) / 2
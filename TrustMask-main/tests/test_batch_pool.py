@@ -0,0 +1,96 @@
+"""
+Toplu işlem process havuzu
+
+- BatchPool sonuçları tek process anonymize() ile aynı ve girdi sırasında
+- /anonymize/batch havuz açıkken aynı yanıtı verir (geçersiz öğeler dahil)
+- Worker ölürse havuz yeniden kurulur; yine çökerse parça ana process'te işlenir
+"""
+
+import os
+import signal
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from engine.batch_pool import BatchPool, resolve_worker_count
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = BatchPool(workers=2)
+    yield pool
+    pool.close()
+
+
+def test_results_in_input_order(anonymizer, pool, corpus):
+    texts = [line for doc in corpus[:4] for line in doc.split("\n")] + ["", "tamam"]
+    expected = [anonymizer.anonymize(text).to_dict() for text in texts]
+    assert pool.anonymize_batch(texts) == expected
+    assert pool.anonymize_batch([]) == []
+
+
+def test_profile_and_types_in_workers(anonymizer, pool):
+    texts = ["Numaram 0532 123 45 67, TC 10000000146."] * 5
+    results = pool.anonymize_batch(texts, 0.5, "contact")
+    assert all("10000000146" in r["sanitized_text"] and "0532" not in r["sanitized_text"] for r in results)
+    results = pool.anonymize_batch(texts, 0.5, None, ["TC_ID"])
+    assert results == [anonymizer.anonymize(text, 0.5, ["TC_ID"]).to_dict() for text in texts]
+
+
+def test_submit_returns_chunk(anonymizer, pool):
+    assert pool.submit(["TC 10000000146"]).result() == [anonymizer.anonymize("TC 10000000146").to_dict()]
+
+
+def test_resolve_worker_count():
+    assert resolve_worker_count("auto") == (os.cpu_count() or 1)
+    assert resolve_worker_count(None) == (os.cpu_count() or 1)
+    assert resolve_worker_count("3") == 3
+    assert resolve_worker_count(-2) == 0
+    with pytest.raises(ValueError):
+        BatchPool(workers=0)
+
+
+def test_batch_endpoint_uses_pool(pool, monkeypatch):
+    pytest.importorskip("flask")
+    import api
+
+    texts = ["TC 10000000146", 5, "IBAN TR33 0006 1005 1978 6457 8413 26", None, "tamam", "evet"]
+    client = api.app.test_client()
+    expected = client.post('/anonymize/batch', json={"texts": texts}).json
+    monkeypatch.setattr(api, "batch_pool", pool)
+    monkeypatch.setattr(api, "BATCH_POOL_MIN_TEXTS", 2)
+    assert api.use_batch_pool([t for t in texts if isinstance(t, str)])
+    assert client.post('/anonymize/batch', json={"texts": texts}).json == expected
+
+
+def test_killed_worker_rebuilds_pool(anonymizer):
+    texts = ["TC 10000000146", "Numaram 0532 123 45 67", "tamam"] * 3
+    expected = [anonymizer.anonymize(text).to_dict() for text in texts]
+    pool = BatchPool(workers=1)
+    try:
+        broken = pool._executor
+        os.kill(broken.submit(os.getpid).result(), signal.SIGKILL)
+        assert pool.anonymize_batch(texts) == expected
+        assert pool._executor is not broken
+        assert pool.anonymize_batch(texts) == expected
+    finally:
+        pool.close()
+
+
+class BrokenExecutor:
+    def submit(self, *args):
+        raise BrokenProcessPool("worker öldü")
+
+    def shutdown(self, wait=True):
+        pass
+
+
+def test_broken_again_runs_in_process(anonymizer, monkeypatch):
+    texts = ["TC 10000000146", "Numaram 0532 123 45 67"]
+    pool = BatchPool(workers=1)
+    pool.close()
+    monkeypatch.setattr(pool, "_executor", BrokenExecutor())
+    monkeypatch.setattr(pool, "_new_executor", BrokenExecutor)
+    assert pool.anonymize_batch(texts) == [anonymizer.anonymize(text).to_dict() for text in texts]
+    assert pool.anonymize_batch(texts, 0.5, "contact")[0]["sanitized_text"] == "TC 10000000146"
+    assert list(pool._states) == [os.getpid()]
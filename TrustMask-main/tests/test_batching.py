@@ -0,0 +1,45 @@
+"""
+Toplu anonimleştirme: anonymize_many her metin için anonymize() ile aynı
+sonucu (maskeli metin, entity'ler, ofset haritası) vermeli
+
+Metin başına / sonuna denk gelen eşleşmeler (ayırıcıyla etkileşim), boş ve
+uzun metinler, triage açık / kapalı, profil ve tip filtresi kapsanır.
+"""
+
+import random
+
+import pytest
+
+from anonymizer import KVKKAnonymizer
+from samples import SAMPLE_LINES, TRIVIAL_MESSAGES, build_document, edge_text, short_messages, snapshot
+
+
+@pytest.fixture(scope="module")
+def texts(corpus):
+    rng = random.Random(11)
+    texts = (short_messages(300) + SAMPLE_LINES + TRIVIAL_MESSAGES + corpus[:4]
+             + [edge_text(rng) for _ in range(800)] + ["", "   ", build_document(6000, seed=3)])
+    rng.shuffle(texts)
+    return texts
+
+
+def check(anonymizer, texts, **options):
+    expected = [snapshot(anonymizer.anonymize(text, **options)) for text in texts]
+    actual = [snapshot(result) for result in anonymizer.anonymize_many(texts, **options)]
+    for text, want, got in zip(texts, expected, actual):
+        assert got == want, text
+    assert len(actual) == len(texts)
+
+
+@pytest.mark.parametrize("triage", [True, False])
+def test_many_matches_single(texts, triage):
+    check(KVKKAnonymizer(triage=triage), texts)
+
+
+def test_many_with_filters(texts):
+    check(KVKKAnonymizer(profile="contact"), texts, min_confidence=0.7)
+    check(KVKKAnonymizer(), texts, entity_types=["TC_ID", "BANK_INFO"])
+
+
+def test_many_empty():
+    assert KVKKAnonymizer().anonymize_many([]) == []
@@ -0,0 +1,76 @@
+"""
+Sütunlu aday tamponu: CandidateBuffer.select, KVKKAnonymizer._resolve_overlaps
+ile aynı entity'leri aynı sırada seçmeli
+
+Hazır nesnelerle (extend) eklenen adaylarda aynı nesneler, nesnesiz (add)
+eklenenlerde aynı alanlar döner; güven eşiği ve tip filtresi çözümden önce
+uygulanır.
+"""
+
+import random
+
+import pytest
+
+from engine.candidates import CandidateBuffer
+from samples import ENTITY_TYPES, random_entities
+
+
+def fields(entity):
+    return (entity.entity_type, entity.value, entity.start_pos, entity.end_pos, entity.confidence, entity.context)
+
+
+def random_rounds(seed, rounds):
+    rng = random.Random(seed)
+    for _ in range(rounds):
+        count = rng.choice([0, 1, 2, 5, 20, 100, 400])
+        span = rng.choice([10, 50, 500, 5000])
+        yield rng, random_entities(rng, count, span, ENTITY_TYPES), rng.choice([0.0, 0.5, 0.8])
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_select_matches_resolve_overlaps(anonymizer, seed):
+    for rng, entities, min_confidence in random_rounds(seed, 300):
+        expected = anonymizer._resolve_overlaps([e for e in entities if e.confidence >= min_confidence])
+        candidates = CandidateBuffer()
+        candidates.extend(entities)
+        actual = candidates.entities(anonymizer._select_candidates(candidates, min_confidence))
+        assert len(actual) == len(expected)
+        assert all(x is y for x, y in zip(expected, actual))
+
+
+@pytest.mark.parametrize("seed", range(2))
+def test_select_without_objects(anonymizer, seed):
+    for rng, entities, min_confidence in random_rounds(seed, 200):
+        expected = anonymizer._resolve_overlaps([e for e in entities if e.confidence >= min_confidence])
+        candidates = CandidateBuffer()
+        for e in entities:
+            candidates.add(e.entity_type, e.value, e.start_pos, e.end_pos, e.confidence, e.context)
+        actual = candidates.entities(anonymizer._select_candidates(candidates, min_confidence))
+        assert [fields(e) for e in actual] == [fields(e) for e in expected]
+
+
+def test_select_type_filter(anonymizer):
+    rng = random.Random(5)
+    for _ in range(200):
+        entities = random_entities(rng, rng.choice([5, 50, 200]), 500, ENTITY_TYPES)
+        types = frozenset(rng.sample(ENTITY_TYPES, 3))
+        expected = anonymizer._resolve_overlaps([e for e in entities if e.entity_type in types])
+        candidates = CandidateBuffer()
+        candidates.extend(entities)
+        actual = candidates.entities(anonymizer._select_candidates(candidates, 0.0, types))
+        assert all(x is y for x, y in zip(expected, actual)) and len(actual) == len(expected)
+
+
+def test_copy_from_and_truncate(anonymizer):
+    rng = random.Random(9)
+    entities = random_entities(rng, 100, 500, ENTITY_TYPES)
+    source = CandidateBuffer()
+    source.extend(entities)
+    candidates = CandidateBuffer()
+    candidates.copy_from(source, range(60), source=1)
+    candidates.extend(random_entities(rng, 30, 500, ENTITY_TYPES), source=2)
+    candidates.truncate(60)
+    assert len(candidates) == 60
+    actual = candidates.entities(anonymizer._select_candidates(candidates, 0.0))
+    expected = anonymizer._resolve_overlaps(entities[:60])
+    assert all(x is y for x, y in zip(expected, actual)) and len(actual) == len(expected)
@@ -0,0 +1,157 @@
+"""
+Derlenmiş sözlük dosyası (tools/build_gazetteer.py -> nlp/compiled_gazetteer.py)
+
+- Dosyadan açılan sözlük, aynı girdilerle bellekte kurulan Gazetteer ile
+  aynı ifadeleri, türleri, ilk kelimeleri ve tarama sonuçlarını verir
+- Ek listeler (sıklık kolonu, --min-count, başlık / yorum satırları) eklenir
+- Bozuk / eksik dosyalar reddedilir; KVKK_GAZETTEER ile açılan dosyayla
+  anonimleştirme sonuçları değişmez
+"""
+
+import logging
+import os
+import subprocess
+import sys
+
+import pytest
+
+from nlp import compiled_gazetteer, gazetteer as gazetteer_module
+from nlp.compiled_gazetteer import CompiledGazetteer, write_gazetteer
+from nlp.gazetteer import (
+    BANK, CITY, COMMON_WORD, DISTRICT, FIRST_NAME, SURNAME,
+    Gazetteer, default_entries, entries_digest,
+)
+from samples import snapshot
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KINDS = (FIRST_NAME, SURNAME, COMMON_WORD, CITY, DISTRICT, BANK)
+
+EXTRA_NAMES = "ad,sayi\n# nüfus kaydı örneği\nZorbey,120\nNadirad,3\n\nİlkay Su,75\n"
+EXTRA_DISTRICTS = "Yeniköy Merkez\n"
+
+TEXTS = [
+    "Müşteri Zorbey Yılmaz İstanbul Kadıköy'den aradı, Türkiye İş Bankası hesabı.",
+    "ILKAY SU ve ilkay su, Nadirad Kaya; Yeniköy Merkez mahallesi, ANKARA / Çankaya",
+    "",
+    "rakam 123 ve ıııı İİİİ",
+]
+
+
+def builtin_entries(extra=False):
+    entries = {kind: list(phrases) for kind, phrases in default_entries().items()}
+    if extra:
+        entries[FIRST_NAME] += ["Zorbey", "İlkay Su"]
+        entries[DISTRICT] += ["Yeniköy Merkez"]
+    return entries
+
+
+@pytest.fixture(scope="module")
+def built(tmp_path_factory):
+    """CLI ile ek listelerle üretilmiş dosya (betik kendi doğrulamasını da yapar)"""
+    folder = tmp_path_factory.mktemp("gazetteer")
+    names = folder / "adlar.csv"
+    names.write_text(EXTRA_NAMES, encoding="utf-8")
+    districts = folder / "ilceler.txt"
+    districts.write_text(EXTRA_DISTRICTS, encoding="utf-8")
+    path = folder / "gazetteer.bin"
+    output = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "tools", "build_gazetteer.py"), "-o", str(path),
+         "--first-names", str(names), "--districts", str(districts), "--min-count", "50"],
+        capture_output=True, text=True, check=True).stdout
+    assert f"{names}: 2 girdi" in output and f"{districts}: 1 girdi" in output
+    compiled = CompiledGazetteer(str(path))
+    yield compiled, Gazetteer(builtin_entries(extra=True))
+    compiled.close()
+
+
+def test_same_phrases_and_kinds(built):
+    compiled, reference = built
+    assert len(compiled) == len(reference)
+    assert dict(compiled.phrases()) == reference._phrases
+    for phrase, kinds in reference._phrases.items():
+        assert compiled.lookup(phrase) == kinds, phrase
+    for kind in KINDS + (CITY | DISTRICT, FIRST_NAME | SURNAME):
+        assert compiled.first_words(kind) == reference.first_words(kind)
+
+
+def test_extra_lists_and_folding(built):
+    compiled, _ = built
+    assert compiled.lookup("Zorbey") == FIRST_NAME
+    assert compiled.lookup("İLKAY SU") == compiled.lookup("ilkay su") & FIRST_NAME == FIRST_NAME
+    assert compiled.lookup("Nadirad") == 0  # sıklık --min-count altında
+    assert compiled.lookup("ad") == 0  # başlık satırı
+    assert compiled.lookup("Yeniköy Merkez") & DISTRICT
+    assert compiled.lookup("ISTANBUL") == compiled.lookup("istanbul") and compiled.lookup("İstanbul") & CITY
+    assert compiled.lookup("") == compiled.lookup("olmayankelime") == 0
+    assert compiled.source_digest == entries_digest(default_entries())
+
+
+def test_scan_matches_gazetteer(built, corpus, monkeypatch):
+    compiled, reference = built
+    texts = TEXTS + corpus[:4]
+    for text in texts:
+        expected = reference.scan(text)
+        actual = compiled.scan(text)
+        assert actual.tokens == expected.tokens and actual.hits == expected.hits
+    # Arama önbelleği dolup boşaltılınca da sonuçlar aynı
+    monkeypatch.setattr(compiled_gazetteer, "MEMO_SIZE", 8)
+    compiled._memo.clear()
+    for text in texts:
+        assert compiled.scan(text).hits == reference.scan(text).hits
+    assert len(compiled._memo) <= 8
+
+
+def test_write_gazetteer_roundtrip(tmp_path):
+    reference = Gazetteer({BANK: ["Türkiye İş Bankası", "İş Yatırım"], CITY: ["İzmir"], SURNAME: ["İş"]})
+    path = str(tmp_path / "small.bin")
+    write_gazetteer(path, reference)
+    compiled = CompiledGazetteer(path)
+    try:
+        assert compiled.source_digest == ""
+        assert dict(compiled.phrases()) == reference._phrases
+        text = "Türkiye İş Bankası İzmir şubesi, İŞ YATIRIM"
+        assert compiled.scan(text).hits == reference.scan(text).hits
+        assert compiled.scan(text).of_kind(BANK) == [(0, 18), (33, 43)]
+    finally:
+        compiled.close()
+
+
+def test_rejects_invalid_files(tmp_path, built):
+    compiled, _ = built
+    with open(compiled.path, "rb") as f:
+        data = f.read()
+    cases = {"bos.bin": b"", "magic.bin": b"XXXXXXXX" + data[8:], "eksik.bin": data[:-3], "fazla.bin": data + b"\0"}
+    for name, content in cases.items():
+        path = tmp_path / name
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            CompiledGazetteer(str(path))
+
+
+def test_anonymize_with_compiled_file(built, anonymizer, corpus, monkeypatch, tmp_path, caplog):
+    from anonymizer import KVKKAnonymizer
+
+    # Yerleşik listelerle derlenmiş dosya: sonuçlar bellekteki sözlükle aynı
+    path = str(tmp_path / "builtin.bin")
+    entries = default_entries()
+    write_gazetteer(path, Gazetteer(entries), entries_digest(entries))
+    expected = [snapshot(anonymizer.anonymize(text)) for text in corpus[:4] + TEXTS]
+
+    monkeypatch.setattr("config.GAZETTEER_PATH", path)
+    monkeypatch.setattr(gazetteer_module, "_gazetteer", None)
+    monkeypatch.setattr(gazetteer_module._last_scan, "result", None, raising=False)
+    with caplog.at_level(logging.WARNING):
+        compiled_anonymizer = KVKKAnonymizer()
+    assert isinstance(gazetteer_module.get_gazetteer(), CompiledGazetteer)
+    assert not [r for r in caplog.records if "güncel değil" in r.getMessage()]
+    assert [snapshot(compiled_anonymizer.anonymize(text)) for text in corpus[:4] + TEXTS] == expected
+
+    # Ek listelerle (veya eski listelerle) üretilmiş dosya uyarıyla açılır
+    stale = str(tmp_path / "stale.bin")
+    write_gazetteer(stale, Gazetteer(builtin_entries(extra=True)), "00" * 32)
+    monkeypatch.setattr("config.GAZETTEER_PATH", stale)
+    monkeypatch.setattr(gazetteer_module, "_gazetteer", None)
+    with caplog.at_level(logging.WARNING):
+        assert gazetteer_module.get_gazetteer().lookup("Zorbey") == FIRST_NAME
+    assert any("güncel değil" in r.getMessage() for r in caplog.records)
+    gazetteer_module.get_gazetteer().close()
@@ -0,0 +1,75 @@
+"""
+Rakam dizisi indeksi
+
+- DigitIndex zincirleri, dizileri ve kalan rakam sayılarını doğru tutar
+- Sayısal detector'ların indeksli taraması (BaseDetector.scan) her
+  pattern'i tüm metinde re.finditer ile çalıştıran referansla aynı
+  eşleşmeleri üretir
+"""
+
+import random
+import re
+
+import pytest
+
+from detectors.digit_runs import DigitIndex, match_at, max_digits, scan_digits
+
+
+FUZZ_ALPHABET = "0123456789" * 4 + " -./*:()+\n" + "TRabcIPtckimlikkart"
+
+
+def signature(tables):
+    return {group: [(match.span(), match.groups()) for match in matches] for group, matches in tables.items()}
+
+
+def reference_scan(detector, text):
+    return {
+        group: [match for compiled in compiled_list for match in compiled.finditer(text)]
+        for group, compiled_list in detector.compiled_patterns.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def digit_detectors(anonymizer):
+    detectors = [d for d in anonymizer.detectors if getattr(d, "digit_groups", None)]
+    assert detectors
+    return detectors
+
+
+def test_index_chains_and_runs():
+    text = "Tel 0532 123-45.67, doğum 12/03/1988 ve 7"
+    index = DigitIndex(text)
+    assert [(text[s:e], digits) for s, e, digits in index.chains] == [
+        ("0532 123-45.67", "05321234567"), ("12/03/1988", "12031988"), ("7", "7")]
+    assert [(text[s:e], remaining) for s, e, remaining in index.runs] == [
+        ("0532", 11), ("123", 7), ("45", 4), ("67", 2),
+        ("12", 8), ("03", 6), ("1988", 4), ("7", 1)]
+    assert index.max_digits == max_digits(text) == 11
+    assert [text[s:s + 2] for s in index.starts(7)] == ["05", "12", "12"]
+    assert not DigitIndex("rakam yok").has_digits and max_digits("rakam yok") == 0
+
+
+def test_scan_digits_reuses_index_per_text():
+    text = "TC 10000000146"
+    assert scan_digits(text) is scan_digits(text)
+    assert scan_digits(text + " ") is not scan_digits(text)
+
+
+def test_match_at_matches_finditer():
+    compiled = re.compile(r'\b\d{2}(?:[\s\-]?\d{2}){1,3}\b')
+    rng = random.Random(3)
+    for _ in range(300):
+        text = ''.join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(0, 60)))
+        starts = DigitIndex(text).starts(1)
+        expected = [m.span() for m in compiled.finditer(text)]
+        assert [m.span() for m in match_at(compiled, text, starts)] == expected
+
+
+def test_indexed_scan_matches_reference(digit_detectors, corpus):
+    rng = random.Random(11)
+    texts = [''.join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(5, 80))) for _ in range(400)]
+    texts += corpus[:3] + ["Paketinizi kontrol ediyorum, lütfen hatta kalın.", ""]
+    for text in texts:
+        for detector in digit_detectors:
+            assert signature(detector.scan(text)) == signature(reference_scan(detector, text)), \
+                (detector.name, text[:80])
@@ -0,0 +1,128 @@
+"""
+Dizin / glob toplu dosya işleme ve manifest
+
+- Çıktılar anonymize() ile aynı, dizin yapısı --output-dir altında korunur
+- Manifest: boyut ve mtime aynıysa dosya atlanır ("skipped"), yalnızca mtime
+  değiştiyse içerik özetiyle "unchanged", içerik / ayar değiştiyse veya
+  çıktı silindiyse yeniden işlenir
+- Yarıda kesilen çalıştırmada bitmiş dosyalar manifestte kalır; sonraki
+  çalıştırma kaldığı yerden devam eder. Hatalı dosya diğerlerini durdurmaz.
+"""
+
+import os
+
+import pytest
+
+from engine.file_jobs import MANIFEST_NAME, expand_inputs, process_files
+
+
+@pytest.fixture
+def tree(tmp_path, corpus):
+    root = tmp_path / "exports"
+    files = {
+        "a.txt": corpus[0],
+        "b.txt": corpus[1][:500],
+        "sub/c.txt": corpus[2],
+        "sub/deep/d.txt": "TC kimlik numaram 10000000146.",
+        "notes.md": "Ahmet Yılmaz",
+    }
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return root, tmp_path / "out"
+
+
+def run(anonymizer, root, out, **kwargs):
+    results = {}
+    summary = process_files(anonymizer, [str(root)], output_dir=str(out), workers=1,
+                            on_result=lambda r: results.__setitem__(os.path.relpath(r["input"], root), r["status"]),
+                            **kwargs)
+    return summary, results
+
+
+def test_outputs_and_manifest(anonymizer, tree):
+    root, out = tree
+    summary, results = run(anonymizer, root, out)
+    assert results == {"a.txt": "done", "b.txt": "done", os.path.join("sub", "c.txt"): "done",
+                       os.path.join("sub", "deep", "d.txt"): "done"}
+    assert summary["files"] == summary["done"] == 4 and summary["errors"] == 0
+    for relative in results:
+        text = (root / relative).read_text(encoding="utf-8")
+        assert (out / relative).read_text(encoding="utf-8") == anonymizer.anonymize(text).sanitized_text
+    assert summary["manifest"] == str(out / MANIFEST_NAME) and (out / MANIFEST_NAME).exists()
+
+
+def test_manifest_skips_and_detects_changes(anonymizer, tree):
+    root, out = tree
+    run(anonymizer, root, out)
+    summary, results = run(anonymizer, root, out)
+    assert set(results.values()) == {"skipped"} and summary["skipped"] == 4
+
+    # Yalnızca mtime değişti: içerik özeti aynı, çıktı yeniden yazılmaz
+    output = out / "a.txt"
+    written = output.stat().st_mtime_ns
+    os.utime(root / "a.txt", ns=(1, 1))
+    # İçerik değişti
+    (root / "b.txt").write_text("Numaram 0532 123 45 67", encoding="utf-8")
+    # Çıktı silindi
+    os.remove(out / "sub" / "c.txt")
+    summary, results = run(anonymizer, root, out)
+    assert results["a.txt"] == "unchanged" and output.stat().st_mtime_ns == written
+    assert results["b.txt"] == "done" and (out / "b.txt").read_text(encoding="utf-8") == "Numaram [CEP_TELEFONU]"
+    assert results[os.path.join("sub", "c.txt")] == "done"
+    assert results[os.path.join("sub", "deep", "d.txt")] == "skipped"
+
+    # Sonucu etkileyen ayar değişti / force
+    assert set(run(anonymizer, root, out, min_confidence=0.9)[1].values()) == {"done"}
+    assert set(run(anonymizer, root, out, min_confidence=0.9)[1].values()) == {"skipped"}
+    assert set(run(anonymizer, root, out, min_confidence=0.9, force=True)[1].values()) == {"done"}
+
+
+def test_interrupted_run_resumes(anonymizer, tree):
+    root, out = tree
+    seen = []
+
+    def stop_after_two(result):
+        seen.append(result["input"])
+        if len(seen) == 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        process_files(anonymizer, [str(root)], output_dir=str(out), workers=1, on_result=stop_after_two)
+    summary, results = run(anonymizer, root, out)
+    finished = {os.path.relpath(path, root) for path in seen}
+    assert {name for name, status in results.items() if status == "skipped"} == finished
+    assert {name for name, status in results.items() if status == "done"} == set(results) - finished
+
+
+def test_error_does_not_stop_others(anonymizer, tree):
+    root, out = tree
+    (root / "bozuk.txt").write_bytes(b"\xff\xfe ge\xe7ersiz")
+    summary, results = run(anonymizer, root, out)
+    assert results["bozuk.txt"] == "error" and summary["errors"] == 1 and summary["done"] == 4
+    assert not (out / "bozuk.txt").exists()
+    # Hatalı dosya manifeste yazılmaz, bir sonraki çalıştırmada tekrar denenir
+    assert run(anonymizer, root, out)[1]["bozuk.txt"] == "error"
+
+
+def test_workers_match_single_process(anonymizer, tree, tmp_path):
+    root, out = tree
+    run(anonymizer, root, out)
+    summary = process_files(anonymizer, [str(root)], output_dir=str(tmp_path / "pool"), workers=2)
+    assert summary["workers"] == 2 and summary["done"] == 4
+    for path in out.rglob("*.txt"):
+        assert (tmp_path / "pool" / path.relative_to(out)).read_text(encoding="utf-8") == path.read_text(encoding="utf-8")
+
+
+def test_expand_inputs(tree):
+    root, _ = tree
+    (root / "a_anonymized.txt").write_text("eski çıktı", encoding="utf-8")
+    (root / MANIFEST_NAME).write_text("{}", encoding="utf-8")
+    relative = [rel for _, rel in expand_inputs([str(root)])]
+    assert relative == ["a.txt", "b.txt", os.path.join("sub", "c.txt"), os.path.join("sub", "deep", "d.txt")]
+    assert [rel for _, rel in expand_inputs([str(root / "sub" / "**" / "*.txt")])] == [
+        "c.txt", os.path.join("deep", "d.txt")]
+    assert [rel for _, rel in expand_inputs([str(root)], include="*.md")] == ["notes.md"]
+    with pytest.raises(FileNotFoundError):
+        expand_inputs([str(root / "yok.txt")])
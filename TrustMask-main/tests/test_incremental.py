@@ -0,0 +1,89 @@
+"""
+Oturumlu (artımlı) anonimleştirme
+
+- anonymize_incremental her adımda anonymize() ile aynı sonucu vermeli
+  (eklemeler, önceki satır düzenlemeleri / silmeleri, doğrulama diyalogları)
+- Oturum kimliğini sunucu verir; bilinmeyen, bitmiş veya başka profille
+  açılmış kimlikler reddedilir
+"""
+
+import random
+
+import pytest
+
+from samples import entity_keys, generate_corpus, session_steps, transcript_messages
+
+
+@pytest.fixture(scope="module")
+def sessions():
+    rng = random.Random(42)
+    documents = generate_corpus(4, 4000, density=0.4, seed=42)
+    return [list(session_steps(rng, transcript_messages(rng, document), edits))
+            for document, edits in zip(documents, (0.0, 0.05, 0.2, 0.5))]
+
+
+@pytest.mark.parametrize("min_confidence", [0.5, 0.8])
+def test_incremental_matches_full(anonymizer, sessions, min_confidence):
+    for session in sessions:
+        state = None
+        for text in session:
+            result, state, update = anonymizer.anonymize_incremental(text, state, min_confidence)
+            expected = anonymizer.anonymize(text, min_confidence)
+            assert result.to_dict(include_offsets=True) == expected.to_dict(include_offsets=True)
+            assert entity_keys(result.entities) == entity_keys(expected.entities)
+            assert set(entity_keys(update.added)) <= set(entity_keys(result.entities))
+
+
+def test_option_change_rescans(anonymizer, sessions):
+    text = sessions[0][-1]
+    _, state, _ = anonymizer.anonymize_incremental(text, None, 0.5)
+    result, _, update = anonymizer.anonymize_incremental(text, state, 0.5, ["TC_ID"])
+    assert update.start == 0
+    assert result.sanitized_text == anonymizer.anonymize(text, 0.5, ["TC_ID"]).sanitized_text
+
+
+# ---- API oturumları ----
+
+@pytest.fixture
+def client():
+    pytest.importorskip("flask")
+    import api
+    return api.app.test_client()
+
+
+def test_session_ids_are_issued_by_server(client):
+    first = client.post('/anonymize', json={"text": "Merhaba", "session": True})
+    assert first.status_code == 200
+    session_id = first.json["session"]["id"]
+    assert len(session_id) >= 20
+
+    text = "Merhaba\nTC kimlik numaram 10000000146."
+    second = client.post('/anonymize', json={"text": text, "session_id": session_id})
+    assert second.status_code == 200
+    assert second.json["session"]["id"] == session_id
+    assert [a["entity_type"] for a in second.json["session"]["added"]] == ["TC_ID"]
+
+    other = client.post('/anonymize', json={"text": "Merhaba", "session": True}).json["session"]["id"]
+    assert other != session_id
+
+
+@pytest.mark.parametrize("body", [
+    {"session_id": "call-42"},
+    {"session_id": "x", "session": True},
+    {"session": "yes"},
+])
+def test_invalid_sessions_rejected(client, body):
+    response = client.post('/anonymize', json=dict(body, text="Merhaba"))
+    assert response.status_code == 400
+    assert "session" in response.json["error"]
+
+
+def test_session_bound_to_profile_and_end(client):
+    session_id = client.post('/anonymize', json={"text": "Merhaba", "session": True}).json["session"]["id"]
+    other_profile = client.post('/anonymize', json={"text": "Merhaba", "session_id": session_id,
+                                                    "profile": "contact"})
+    assert other_profile.status_code == 400
+
+    ended = client.post('/anonymize', json={"text": "Merhaba", "session_id": session_id, "end_session": True})
+    assert ended.status_code == 200 and ended.json["session"]["ended"]
+    assert client.post('/anonymize', json={"text": "Merhaba", "session_id": session_id}).status_code == 400
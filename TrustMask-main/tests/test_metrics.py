@@ -0,0 +1,104 @@
+"""
+Metrikler: /metrics ve /stats tüm profilleri ve batch worker'larını kapsamalı
+
+- Profil başına seriler "profile" etiketi taşır
+- Worker process'lerin sayaçları ana process'inkilere eklenir
+- Paylaşılan sonuç önbelleği profil sayısı kadar tekrar sayılmaz
+- NER yanıt önbelleği sayaçları eşzamanlı çağrılarda kaybolmaz
+"""
+
+import re
+import sys
+import threading
+
+from anonymizer import KVKKAnonymizer
+from engine.batch_pool import BatchPool
+from engine.metrics import merge_states, process_state, prometheus_text, summarize
+from engine.result_cache import MemoryCache, ResultCache
+from nlp.ai_ner import AINERDetector
+from nlp.ner_backends import NERBackend
+
+
+TEXTS = ["TC kimlik numaram 10000000146.", "IBAN TR33 0006 1005 1978 6457 8413 26", "tamam"]
+
+
+def sample(text, name, **labels):
+    wanted = ','.join(f'{key}="{value}"' for key, value in labels.items())
+    match = re.search(rf'^{name}(?:\{{{wanted}\}})? (\S+)$', text, re.M)
+    assert match, (name, labels)
+    return float(match.group(1))
+
+
+def test_profiles_are_labelled_and_cache_counted_once():
+    cache = ResultCache(max_entries=100)
+    full = KVKKAnonymizer(cache=cache)
+    financial = KVKKAnonymizer(cache=cache, profile="financial")
+    for text in TEXTS:
+        full.anonymize(text)
+    financial.anonymize(TEXTS[1])
+    financial.anonymize(TEXTS[1])
+
+    text = prometheus_text([full, financial])
+    assert sample(text, 'kvkk_documents_total', profile="full") == 3
+    assert sample(text, 'kvkk_documents_total', profile="financial") == 2
+    assert sample(text, 'kvkk_documents_cached_total', profile="financial") == 1
+    assert sample(text, 'kvkk_result_cache_hits_total') == 1
+    assert sample(text, 'kvkk_result_cache_misses_total') == 4
+
+    totals = summarize(merge_states([process_state([full, financial])]))
+    assert totals["metrics"]["documents"] == 5
+    assert totals["triage"]["documents"] == full.triage.stats()["documents"] + financial.triage.stats()["documents"]
+
+
+def test_worker_counters_are_added():
+    local = KVKKAnonymizer()
+    local.anonymize(TEXTS[0])
+    pool = BatchPool(workers=1)
+    try:
+        results = pool.anonymize_batch(TEXTS * 4)
+        assert [r["sanitized_text"] for r in results] == [local.anonymize(t).sanitized_text for t in TEXTS * 4]
+        pool.anonymize_batch(TEXTS[:1], profile="financial")
+        workers = pool.worker_states()
+    finally:
+        pool.close()
+
+    assert len(workers) == 1
+    text = prometheus_text(local, workers)
+    assert sample(text, 'kvkk_documents_total', profile="full") == local.metrics.snapshot()["documents"] + 12
+    assert sample(text, 'kvkk_documents_total', profile="financial") == 1
+    entities = summarize(merge_states([process_state([local]), *workers]))["metrics"]["detectors"]
+    assert entities["TCKimlikDetector"]["entities"] >= 5
+
+
+class EchoBackend(NERBackend):
+    name = "echo"
+
+    def predict(self, text):
+        return [{"entity_group": "PER", "word": text, "start": 0, "end": len(text), "score": 0.9}]
+
+
+def test_ner_cache_counters_are_thread_safe(monkeypatch):
+    ner = AINERDetector()
+    monkeypatch.setattr(ner, "backend", EchoBackend())
+    monkeypatch.setattr(ner, "response_cache", MemoryCache(64))
+    monkeypatch.setattr(ner, "cache_hits", 0)
+    monkeypatch.setattr(ner, "cache_misses", 0)
+    # Sık thread geçişi: kilitsiz "+= 1" artışları kaybolur
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def work():
+        for i in range(2000):
+            ner._predict(f"Ahmet {i % 50}")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    stats = ner.cache_stats()
+    assert stats["hits"] + stats["misses"] == 8 * 2000
+    assert stats["misses"] >= 50 and stats["entries"] == 50
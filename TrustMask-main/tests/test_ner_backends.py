@@ -0,0 +1,242 @@
+"""
+torch'suz NER backend'leri, küçük rastgele bir BERT fikstürüyle
+
+- NumpyBertTokenClassifier, bağımsız (döngülü, tam erf'li) bir referans
+  ileri geçişle aynı logit'leri vermeli
+- tools/export_ner_model.export_numpy: state_dict -> int8 .npz; yüklenen
+  model float32 referansa yakın, etiketler aynı
+- NumpyBackend: tokenizer.json + config.json + model_int8.npz klasöründen
+  yüklenir, uzun metinleri kelime ortasından bölmeden pencereler ve
+  token'ları pipeline "simple" stratejisiyle birleştirir
+"""
+
+import json
+import math
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from nlp.ner_backends import LocalTokenClassifier, NumpyBackend
+from nlp.numpy_bert import NumpyBertTokenClassifier, _gelu, quantize_int8
+
+
+LABELS = {0: "O", 1: "B-PER", 2: "I-PER", 3: "B-LOC", 4: "I-LOC"}
+WORDS = ["merhaba", "ben", "ahmet", "yılmaz", "istanbul", "kadıköy", "oturuyorum", "evet", "ayşe"]
+VOCAB = {token: i for i, token in enumerate(["[PAD]", "[UNK]", "[CLS]", "[SEP]"] + WORDS)}
+CONFIG = {
+    "num_hidden_layers": 2, "num_attention_heads": 2, "hidden_size": 8, "intermediate_size": 16,
+    "max_position_embeddings": 64, "layer_norm_eps": 1e-12, "id2label": {str(k): v for k, v in LABELS.items()},
+}
+
+
+class FakeTensor:
+    """torch.Tensor yerine (export_numpy yalnızca detach().cpu().numpy() çağırır)"""
+
+    def __init__(self, array):
+        self.array = array
+
+    def detach(self):
+        return self
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.array
+
+
+class FakeModel:
+    def __init__(self, state):
+        self.state = state
+
+    def state_dict(self):
+        return {key: FakeTensor(value) for key, value in self.state.items()}
+
+
+def hf_state_dict(seed=0):
+    """BertForTokenClassification state_dict'i ([out, in] lineer ağırlıklar)"""
+    rng = np.random.default_rng(seed)
+    hidden, inter = CONFIG["hidden_size"], CONFIG["intermediate_size"]
+
+    def linear(name, out_dim, in_dim):
+        state[name + ".weight"] = rng.normal(0, 0.5, (out_dim, in_dim)).astype(np.float32)
+        state[name + ".bias"] = rng.normal(0, 0.1, out_dim).astype(np.float32)
+
+    def norm(name):
+        state[name + ".weight"] = (1 + rng.normal(0, 0.1, hidden)).astype(np.float32)
+        state[name + ".bias"] = rng.normal(0, 0.1, hidden).astype(np.float32)
+
+    state = {
+        "bert.embeddings.word_embeddings.weight": rng.normal(0, 1, (len(VOCAB), hidden)).astype(np.float32),
+        "bert.embeddings.position_embeddings.weight": rng.normal(0, 0.2, (64, hidden)).astype(np.float32),
+        "bert.embeddings.token_type_embeddings.weight": rng.normal(0, 0.2, (2, hidden)).astype(np.float32),
+        "bert.embeddings.position_ids": np.arange(64)[None, :],
+    }
+    norm("bert.embeddings.LayerNorm")
+    for i in range(CONFIG["num_hidden_layers"]):
+        p = f"bert.encoder.layer.{i}"
+        for part in ("query", "key", "value"):
+            linear(f"{p}.attention.self.{part}", hidden, hidden)
+        linear(f"{p}.attention.output.dense", hidden, hidden)
+        norm(f"{p}.attention.output.LayerNorm")
+        linear(f"{p}.intermediate.dense", inter, hidden)
+        linear(f"{p}.output.dense", hidden, inter)
+        norm(f"{p}.output.LayerNorm")
+    linear("bert.pooler.dense", hidden, hidden)
+    linear("classifier", len(LABELS), hidden)
+    return state
+
+
+def reference_logits(state, input_ids):
+    """Bağımsız referans: float64, baş başına döngü, tam erf GELU"""
+    s = {key: np.asarray(value, dtype=np.float64) for key, value in state.items()}
+    heads = CONFIG["num_attention_heads"]
+    eps = CONFIG["layer_norm_eps"]
+
+    def norm(x, name):
+        mean = x.mean(-1, keepdims=True)
+        var = x.var(-1, keepdims=True)
+        return (x - mean) / np.sqrt(var + eps) * s[name + ".weight"] + s[name + ".bias"]
+
+    def linear(x, name):
+        return x @ s[name + ".weight"].T + s[name + ".bias"]
+
+    gelu = np.vectorize(lambda v: 0.5 * v * (1 + math.erf(v / math.sqrt(2))))
+    n = len(input_ids)
+    x = (s["bert.embeddings.word_embeddings.weight"][input_ids]
+         + s["bert.embeddings.position_embeddings.weight"][:n]
+         + s["bert.embeddings.token_type_embeddings.weight"][0])
+    x = norm(x, "bert.embeddings.LayerNorm")
+    for i in range(CONFIG["num_hidden_layers"]):
+        p = f"bert.encoder.layer.{i}"
+        q, k, v = (linear(x, f"{p}.attention.self.{part}") for part in ("query", "key", "value"))
+        dim = x.shape[1] // heads
+        context = np.zeros_like(x)
+        for h in range(heads):
+            cols = slice(h * dim, (h + 1) * dim)
+            scores = q[:, cols] @ k[:, cols].T / math.sqrt(dim)
+            weights = np.exp(scores - scores.max(-1, keepdims=True))
+            weights /= weights.sum(-1, keepdims=True)
+            context[:, cols] = weights @ v[:, cols]
+        x = norm(x + linear(context, f"{p}.attention.output.dense"), f"{p}.attention.output.LayerNorm")
+        x = norm(x + linear(gelu(linear(x, f"{p}.intermediate.dense")), f"{p}.output.dense"),
+                 f"{p}.output.LayerNorm")
+    return linear(x, "classifier")
+
+
+def float_weights(state):
+    """state_dict -> NumpyBertTokenClassifier ağırlıkları (quantize edilmemiş)"""
+    weights = {}
+    for key, value in state.items():
+        if key.startswith("bert.pooler.") or key.endswith("position_ids"):
+            continue
+        name = key[len("bert."):] if key.startswith("bert.") else key
+        if name.startswith("embeddings.") and "LayerNorm" not in name:
+            weights[name[:-len(".weight")]] = value
+        elif value.ndim == 2:
+            weights[name] = np.ascontiguousarray(value.T)
+        else:
+            weights[name] = value
+    return weights
+
+
+@pytest.fixture(scope="module")
+def state():
+    return hf_state_dict()
+
+
+@pytest.fixture(scope="module")
+def model_dir(tmp_path_factory, state):
+    tokenizers = pytest.importorskip("tokenizers")
+    from export_ner_model import export_numpy
+
+    path = tmp_path_factory.mktemp("ner")
+    tokenizer = tokenizers.Tokenizer(tokenizers.models.WordLevel(VOCAB, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+    tokenizer.save(str(path / "tokenizer.json"))
+    with open(path / "config.json", "w", encoding="utf-8") as f:
+        json.dump(CONFIG, f)
+    export_numpy(FakeModel(state), str(path))
+    return str(path)
+
+
+def test_gelu_and_quantize():
+    x = np.linspace(-6, 6, 101)
+    exact = np.array([0.5 * v * (1 + math.erf(v / math.sqrt(2))) for v in x])
+    assert np.abs(_gelu(x) - exact).max() < 1e-6
+    weight = np.random.default_rng(1).normal(0, 1, (16, 4)).astype(np.float32)
+    weight[:, 3] = 0
+    q, scale = quantize_int8(weight)
+    assert q.dtype == np.int8 and np.abs(q).max() <= 127
+    assert np.abs(q * scale - weight).max() <= scale.max() / 2 + 1e-7
+
+
+def test_numpy_forward_matches_reference(state):
+    model = NumpyBertTokenClassifier(float_weights(state), CONFIG)
+    for ids in ([2, 4, 5, 6, 3], [2, 3], list(range(2, 13))):
+        ids = np.array(ids, dtype=np.int64)
+        assert np.allclose(model.logits(ids), reference_logits(state, ids), atol=1e-4)
+
+
+def test_exported_int8_model(state, model_dir):
+    with np.load(os.path.join(model_dir, "model_int8.npz")) as weights:
+        assert weights["embeddings.word_embeddings"].dtype == np.int8
+        assert weights["encoder.layer.0.attention.self.query.weight"].dtype == np.int8
+        assert weights["classifier.weight"].dtype == np.float32
+        assert not any(name.startswith("pooler") for name in weights.files)
+    model = NumpyBertTokenClassifier.load(os.path.join(model_dir, "model_int8.npz"),
+                                          os.path.join(model_dir, "config.json"))
+    ids = np.array([2] + list(range(4, 13)) + [3], dtype=np.int64)
+    expected = reference_logits(state, ids)
+    actual = model.logits(ids)
+    assert np.abs(actual - expected).max() < 0.25
+    assert (actual.argmax(-1) == expected.argmax(-1)).mean() >= 0.8
+
+
+def test_numpy_backend_predicts(model_dir):
+    backend = NumpyBackend(model_dir)
+    assert backend.load()
+    text = "merhaba ben ahmet yılmaz istanbul kadıköy oturuyorum"
+    predictions = backend.predict(text)
+    for prediction in predictions:
+        assert prediction["entity_group"] in {"PER", "LOC"}
+        assert text[prediction["start"]:prediction["end"]] == prediction["word"]
+        assert 0 <= prediction["score"] <= 1
+    assert not NumpyBackend(os.path.dirname(model_dir)).load()
+
+
+class ScriptedClassifier(LocalTokenClassifier):
+    """Logit'leri token kimliğinden üreten backend (pencereleme / birleştirme testi)"""
+
+    name = "scripted"
+    labels = {"ahmet": 1, "yılmaz": 2, "ayşe": 1, "istanbul": 3, "kadıköy": 4}
+
+    def __init__(self, model_dir, max_tokens):
+        super().__init__(model_dir)
+        self.max_tokens = max_tokens
+        self.windows = []
+
+    def _load_model(self):
+        by_id = {VOCAB[word]: label for word, label in self.labels.items()}
+        self.table = np.full((len(VOCAB), len(LABELS)), -5.0, dtype=np.float32)
+        self.table[:, 0] = 5.0
+        for token_id, label in by_id.items():
+            self.table[token_id] = -5.0
+            self.table[token_id, label] = 5.0
+
+    def _logits(self, input_ids):
+        self.windows.append(len(input_ids) - 2)
+        return self.table[input_ids]
+
+
+@pytest.mark.parametrize("max_tokens", [510, 3, 1])
+def test_token_grouping_and_windows(model_dir, max_tokens):
+    backend = ScriptedClassifier(model_dir, max_tokens)
+    assert backend.load()
+    text = "merhaba ahmet yılmaz ayşe ben istanbul kadıköy evet ahmet"
+    predictions = backend.predict(text)
+    assert [(p["entity_group"], p["word"]) for p in predictions] == [
+        ("PER", "ahmet yılmaz"), ("PER", "ayşe"), ("LOC", "istanbul kadıköy"), ("PER", "ahmet")]
+    assert sum(backend.windows) == len(text.split()) and max(backend.windows) <= max_tokens
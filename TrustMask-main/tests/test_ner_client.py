@@ -0,0 +1,119 @@
+"""
+Cloud NER istemcisi ve devre kesici (sahte Session ve saat ile, ağsız)
+
+- Yanıt alınan her yol devre kesiciye sonuç yazar: half_open denemesine
+  401 veya {"error": ...} gövdesi gelirse devre yeniden açılır, askıda
+  kalmaz; süre dolunca gelen başarılı deneme devreyi kapatır
+- Devre açıkken istek yapılmaz, metinler atlanır
+"""
+
+import os
+
+import pytest
+
+from nlp.ner_client import CircuitBreaker, NERClient
+
+
+ENTITY = [{"entity_group": "PER", "word": "Ahmet", "start": 0, "end": 5, "score": 0.99}]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class StubResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.body = body
+        self.text = str(body)
+
+    def json(self):
+        return self.body
+
+
+class StubSession:
+    """Sıradaki yanıtı döner; gönderilen istekleri kaydeder"""
+
+    def __init__(self):
+        self.responses = []
+        self.posts = []
+
+    def post(self, url, json=None, timeout=None):
+        self.posts.append(json["inputs"])
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def setup():
+    clock = Clock()
+    client = NERClient("http://ner.invalid/models/stub", batch_window=0,
+                       breaker=CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock))
+    session = StubSession()
+    client._session = session
+    client._session_pid = os.getpid()
+    return client, session, clock
+
+
+def open_breaker(client, session):
+    session.responses += [StubResponse(500, "down"), StubResponse(500, "down")]
+    assert client.predict_batch(["Ahmet"]) == [None]
+    assert client.predict_batch(["Ahmet"]) == [None]
+    assert client.breaker.state == CircuitBreaker.OPEN
+
+
+@pytest.mark.parametrize("probe", [
+    StubResponse(401, {"error": "Invalid credentials"}),
+    StubResponse(404, "not found"),
+    StubResponse(200, {"error": "Model is overloaded"}),
+])
+def test_failed_probe_reopens_then_recovers(setup, probe):
+    client, session, clock = setup
+    open_breaker(client, session)
+
+    # Devre açıkken istek gitmez
+    assert client.predict_batch(["Ahmet"]) == [None]
+    assert len(session.posts) == 2 and client.stats()["skipped"] == 1
+
+    clock.now = 10
+    assert client.breaker.state == CircuitBreaker.HALF_OPEN
+    session.responses.append(probe)
+    assert client.predict_batch(["Ahmet"]) == [None]
+    assert client.breaker.state == CircuitBreaker.OPEN
+    assert client.predict_batch(["Ahmet"]) == [None]
+    assert len(session.posts) == 3
+
+    clock.now = 20
+    session.responses.append(StubResponse(200, ENTITY))
+    assert client.predict_batch(["Ahmet"]) == [ENTITY]
+    assert client.breaker.state == CircuitBreaker.CLOSED
+    assert client.stats()["failures"] == 3
+
+
+@pytest.mark.parametrize("response", [
+    StubResponse(400, "bad request"),
+    StubResponse(429, "rate limited"),
+    StubResponse(200, {"error": "Model is overloaded"}),
+    StubResponse(200, [ENTITY]),  # iki metne tek sonuç
+])
+def test_error_responses_count_as_failures(setup, response):
+    client, session, _ = setup
+    session.responses += [response, response]
+    client.predict_batch(["Ahmet", "Yılmaz"])
+    client.predict_batch(["Ahmet", "Yılmaz"])
+    assert client.breaker.state == CircuitBreaker.OPEN
+    assert client.stats()["failures"] == 2
+
+
+def test_model_loading_trips_for_estimated_time(setup):
+    client, session, clock = setup
+    session.responses += [StubResponse(503, {"estimated_time": 30}), StubResponse(200, ENTITY)]
+    assert client.predict_batch(["Ahmet"]) == [None]
+    clock.now = 20
+    assert client.breaker.state == CircuitBreaker.OPEN
+    clock.now = 30
+    assert client.predict("Ahmet") == ENTITY
+    assert client.breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,130 @@
+"""
+Çakışma çözümü: sweep-line sürümleri eski O(n²) döngülerle aynı sonucu vermeli
+
+KVKKAnonymizer._resolve_overlaps ve NameDetector._remove_duplicates rastgele
+entity kümelerinde (boş / ters aralıklar, value uzunluğu aralıktan farklı
+entity'ler dahil) eski sürümlerle aynı entity'leri aynı sırada döndürmeli.
+"""
+
+import random
+
+import pytest
+
+from config import EntityType
+from entities import DetectedEntity
+from nlp.name_detector import NameDetector
+
+
+# ---- Eski (O(n²)) sürümler - referans olarak birebir korunmuştur ----
+
+def legacy_resolve_overlaps(entities, entity_key):
+    sorted_entities = sorted(entities, key=entity_key)
+
+    result = []
+    used_ranges = []
+
+    for entity in sorted_entities:
+        overlap = False
+        for (start, end) in used_ranges:
+            if entity.start_pos < end and entity.end_pos > start:
+                overlap = True
+                break
+
+        if not overlap:
+            result.append(entity)
+            used_ranges.append((entity.start_pos, entity.end_pos))
+
+    return result
+
+
+def legacy_remove_duplicates(entities):
+    if not entities:
+        return entities
+
+    entities.sort(key=lambda e: (e.start_pos, -e.confidence, -len(e.value)))
+
+    result = []
+    for entity in entities:
+        overlaps_with_better = False
+
+        for i, existing in enumerate(result):
+            if (entity.start_pos < existing.end_pos and
+                    entity.end_pos > existing.start_pos):
+                if existing.entity_type == EntityType.FULL_NAME:
+                    overlaps_with_better = True
+                    break
+                elif entity.entity_type == EntityType.FULL_NAME:
+                    result[i] = entity
+                    overlaps_with_better = True
+                    break
+                else:
+                    if existing.confidence >= entity.confidence:
+                        overlaps_with_better = True
+                        break
+                    else:
+                        result[i] = entity
+                        overlaps_with_better = True
+                        break
+
+        if not overlaps_with_better:
+            result.append(entity)
+
+    return result
+
+
+# ---- Rastgele entity üretimi ----
+
+ENTITY_TYPES = list(EntityType)
+NAME_TYPES = [EntityType.NAME, EntityType.SURNAME, EntityType.FULL_NAME]
+CONFIDENCES = [0.5, 0.7, 0.75, 0.85, 0.9, 0.95, 0.98]
+
+
+def random_entities(rng: random.Random, count: int, span: int, types) -> list:
+    entities = []
+    for _ in range(count):
+        start = rng.randrange(span)
+        length = rng.choice([0, 1, 2, 3, 5, 8, 13, 30]) if rng.random() < 0.95 else -rng.randrange(1, 4)
+        end = start + length
+        # value uzunluğu her zaman aralık uzunluğuna eşit olmayabilir
+        value_len = max(0, length) if rng.random() < 0.9 else rng.randrange(0, 20)
+        entities.append(DetectedEntity(
+            entity_type=rng.choice(types),
+            value='x' * value_len,
+            start_pos=start,
+            end_pos=end,
+            confidence=rng.choice(CONFIDENCES),
+        ))
+    return entities
+
+
+def random_rounds(seed: int, rounds: int):
+    """(entity sayısı, metin uzunluğu) çiftleri"""
+    rng = random.Random(seed)
+    for _ in range(rounds):
+        yield rng, rng.choice([0, 1, 2, 5, 20, 100, 400]), rng.choice([10, 50, 500, 5000])
+
+
+def assert_same(expected, actual):
+    assert len(expected) == len(actual)
+    assert all(x is y for x, y in zip(expected, actual))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_resolve_overlaps_matches_legacy(anonymizer, seed):
+    def entity_key(e):
+        prio = anonymizer.priority_order.get(e.entity_type, 99)
+        return (e.start_pos, -len(e.value), -e.confidence, prio)
+
+    for rng, count, span in random_rounds(seed, 300):
+        entities = random_entities(rng, count, span, ENTITY_TYPES)
+        assert_same(legacy_resolve_overlaps(list(entities), entity_key),
+                    anonymizer._resolve_overlaps(list(entities)))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_remove_duplicates_matches_legacy(seed):
+    detector = NameDetector()
+    for rng, count, span in random_rounds(seed, 300):
+        entities = random_entities(rng, count, span, NAME_TYPES)
+        assert_same(legacy_remove_duplicates(list(entities)),
+                    detector._remove_duplicates(list(entities)))
@@ -0,0 +1,99 @@
+"""
+Kısmi veri (doğrulama cevapları) ve diyalog indeksi
+
+- Cevap satırı, önceki en fazla 4 satırdaki soruya göre etiketlenir
+- Uzun transkriptte her blok, tek başına taranmış haliyle aynı entity'leri
+  (kaydırılmış ofsetlerle) verir
+- Tarama süresi satır sayısıyla doğrusal büyür
+"""
+
+import time
+
+import pytest
+
+from config import EntityType
+from detectors.dialogue_index import DialogueIndex, scan_dialogue
+from detectors.partial_data_detector import PartialDataDetector
+
+
+DIALOGUES = [
+    ("Temsilci: Doğum yılınızı öğrenebilir miyim?\nMüşteri: 1987.",
+     [(EntityType.BIRTH_YEAR, "1987", "birth_year_answer")]),
+    ("Temsilci: TC kimlik numaranızın son 4 hanesini alabilir miyim?\nMüşteri: Bir saniye bakayım.\nMüşteri: 2109.",
+     [(EntityType.TC_ID, "2109", "tc_partial_answer")]),
+    ("Temsilci: TC kimlik numaranızın son 4 hanesi?\r\nMüşteri: 2031?\r",
+     [(EntityType.TC_ID, "2031", "tc_partial_answer")]),
+    ("Temsilci: Doğum yılınız?\nA\nB\nC\nMüşteri: 1987",
+     [(EntityType.BIRTH_YEAR, "1987", "birth_year_answer")]),
+    ("Müşteri: 1985 doğumluyum", [(EntityType.BIRTH_YEAR, "1985", "birth_year_inline")]),
+    ("Doğum yılı: 1975 olarak kayıtlı", [(EntityType.BIRTH_YEAR, "1975", "birth_year_inline")]),
+    # Soru 4 satırdan uzakta veya hiç yok: cevap sayılmaz
+    ("Temsilci: Doğum yılınız?\nA\nB\nC\nD\nMüşteri: 1987", []),
+    ("Temsilci: Paketinizi kontrol ediyorum.\nMüşteri: 45", []),
+    ("Müşteri: Faturam 250 TL geldi", []),
+    ("Temsilci: Hattınız kimin adına kayıtlı?\nMüşteri: tamam", []),
+]
+
+FILLER = "\n".join(["Temsilci: Paketinizi kontrol ediyorum."] * 4)
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return PartialDataDetector()
+
+
+def found(detector, text, offset=0):
+    return [(e.entity_type, e.value, e.start_pos - offset, e.end_pos - offset, e.context)
+            for e in detector.detect(text)]
+
+
+@pytest.mark.parametrize("text, expected", DIALOGUES)
+def test_dialogue_answers(detector, text, expected):
+    entities = found(detector, text)
+    assert [(t, v, c) for t, v, _, _, c in entities] == expected
+    for _, value, start, end, _ in entities:
+        assert text[start:end] == value
+
+
+def test_long_transcript_matches_blocks(detector):
+    blocks = [text for text, _ in DIALOGUES] * 40
+    transcript = ""
+    expected = []
+    for block in blocks:
+        transcript += FILLER + "\n"
+        offset = len(transcript)
+        expected += [(t, v, s + offset, e + offset, c) for t, v, s, e, c in found(detector, block)]
+        transcript += block + "\n"
+    assert found(detector, transcript) == expected
+    assert len(expected) == 40 * 6
+
+
+def test_scan_time_grows_linearly(detector):
+    block = "\n".join(text for text, _ in DIALOGUES) + "\n" + FILLER + "\n"
+
+    def best(lines):
+        text = block * (lines // block.count("\n"))
+        timings = []
+        for _ in range(3):
+            started = time.perf_counter()
+            detector.detect(text + " ")
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    small, large = best(2_000), best(20_000)
+    # Karesel tarama 10 kat satırda ~100 kat sürer
+    assert large < small * 30
+
+
+def test_dialogue_index():
+    text = "Temsilci: Merhaba\nnasılsınız\nMüşteri: İyiyim\n\nOPERATÖR : Tamam"
+    index = DialogueIndex(text)
+    assert len(index) == 5
+    assert [text[start:start + len(line)] for start, line in zip(index.starts, index.lines)] == index.lines
+    assert list(index.starts) == [0, 18, 29, 45, 46]
+    assert [index.line_of(p) for p in (0, 17, 18, len(text) - 1)] == [0, 0, 1, 4]
+    assert index.previous_lower(2, 4) == ["nasılsınız", "temsilci: merhaba"]
+    assert [index.speaker(i) for i in range(5)] == ["agent", "agent", "customer", "customer", "agent"]
+    assert [index.turn_of(i) for i in range(5)] == [1, 1, 2, 2, 3]
+    assert DialogueIndex("nasılsın\nMüşteri: 1").speaker(0) is None
+    assert scan_dialogue(text) is scan_dialogue(text)
@@ -0,0 +1,80 @@
+"""
+Yapılandırılmış kayıtlar (JSONL / CSV): seçilen alanlar anonymize(değer) ile
+aynı olmalı, diğer alanlar, tırnaklama ve satır sonları bayt bayt korunmalı
+
+Küçük parçalar (chunk_records) ve tek worker'lı BatchPool da aynı çıktıyı
+vermeli; bozuk kayıt işlemi satır numarasıyla durdurur.
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from engine.batch_pool import BatchPool
+from engine.records import anonymize_records
+from samples import build_records, run_records
+
+
+@pytest.fixture(scope="module")
+def records():
+    return build_records(60, seed=3)
+
+
+def test_jsonl_fields(anonymizer, records):
+    lines, _ = records
+    output, stats = run_records(lines, 'jsonl', ["note", "customer.comment"], anonymizer=anonymizer)
+    out_lines = output.splitlines(keepends=True)
+    assert len(out_lines) == len(lines) == stats["records"]
+    for raw, new in zip(lines, out_lines):
+        before, after = json.loads(raw), json.loads(new)
+        pairs = ((before["note"], after["note"]), (before["customer"]["comment"], after["customer"]["comment"]))
+        restored = new
+        for old, value in pairs:
+            assert value == anonymizer.anonymize(old).sanitized_text
+            restored = restored.replace(json.dumps(value, ensure_ascii=raw.isascii()),
+                                        json.dumps(old, ensure_ascii=raw.isascii()), 1)
+        # Seçilen değerler geri konunca satır bayt bayt aynı
+        assert restored == raw
+
+
+def test_csv_fields(anonymizer, records):
+    _, text = records
+    output, _ = run_records(text.splitlines(keepends=True), 'csv', ["note"], anonymizer=anonymizer)
+    before = list(csv.reader(io.StringIO(text, newline='')))
+    after = list(csv.reader(io.StringIO(output, newline='')))
+    assert len(before) == len(after) and before[0] == after[0]
+    note = before[0].index("note")
+    for old, new in zip(before[1:], after[1:]):
+        assert new[note] == anonymizer.anonymize(old[note]).sanitized_text
+        assert old[:note] + old[note + 1:] == new[:note] + new[note + 1:]
+    assert output.count('\r\n') >= len(after)
+
+
+def test_chunking_and_pool_match(anonymizer, records):
+    lines, _ = records
+    fields = ["note", "customer.comment"]
+    expected, _ = run_records(lines, 'jsonl', fields, anonymizer=anonymizer)
+
+    out = io.StringIO()
+    anonymize_records(lines, out.write, 'jsonl', fields, anonymizer=anonymizer, chunk_records=7, max_in_flight=2)
+    assert out.getvalue() == expected
+
+    pool = BatchPool(workers=1)
+    try:
+        assert run_records(lines, 'jsonl', fields, pool=pool)[0] == expected
+    finally:
+        pool.close()
+
+
+@pytest.mark.parametrize("record_format, lines, fields", [
+    ('jsonl', ['{"note": "a"}\n', '{"note": \n'], ["note"]),
+    ('csv', ['note,id\n', '"kapanmamış,1\n'], ["note"]),
+    ('csv', ['note,id\n', 'a,1\n'], ["yorum"]),
+])
+def test_invalid_records_rejected(anonymizer, record_format, lines, fields):
+    written = []
+    with pytest.raises(ValueError):
+        anonymize_records(lines, written.append, record_format, fields, anonymizer=anonymizer)
+    assert not any("kapanmamış" in chunk for chunk in written)
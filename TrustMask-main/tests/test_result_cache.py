@@ -0,0 +1,94 @@
+"""
+Sonuç önbelleği: AI NER atlandığında üretilen eksik sonuçlar önbelleğe alınmamalı
+
+Kesinti sırasında (devre açık, zaman aşımı, API hatası) isim maskelenmeden
+dönen sonuç, servis düzeldikten sonra aynı metin için tekrar kullanılmamalı.
+"""
+
+import pytest
+
+from anonymizer import KVKKAnonymizer
+from engine.result_cache import ResultCache
+from nlp.ai_ner import AINERDetector
+from nlp.ner_backends import NERBackend
+
+
+TEXT = "Bugün Xolvar Brintepe aradı, kaydı kapattım."
+
+
+class FlakyBackend(NERBackend):
+    """available False iken yanıt vermeyen (None) stub backend"""
+
+    name = "flaky"
+
+    def __init__(self):
+        self.available = False
+        self.calls = 0
+
+    def predict(self, text):
+        self.calls += 1
+        if not self.available:
+            return None
+        start = text.find("Xolvar")
+        return [{'entity_group': 'PER', 'score': 0.99, 'word': text[start:start + 6],
+                 'start': start, 'end': start + 6}]
+
+
+@pytest.fixture
+def backend():
+    ner = AINERDetector()
+    original = ner.backend
+    flaky = FlakyBackend()
+    ner.set_backend(flaky)
+    if ner.response_cache is not None:
+        ner.response_cache.clear()
+    yield flaky
+    ner.set_backend(original)
+    if ner.response_cache is not None:
+        ner.response_cache.clear()
+
+
+def test_result_computed_without_ner_is_not_cached(backend):
+    cache = ResultCache(max_entries=100)
+    anonymizer = KVKKAnonymizer(cache=cache)
+
+    degraded = anonymizer.anonymize(TEXT)
+    assert "Xolvar" in degraded.sanitized_text
+    assert cache.stats()["entries"] == 0
+
+    backend.available = True
+    recovered = anonymizer.anonymize(TEXT)
+    assert "Xolvar" not in recovered.sanitized_text
+    assert cache.stats()["entries"] == 1
+
+    # Tam sonuç önbellekten döner, backend tekrar çağrılmaz
+    backend.available = False
+    calls = backend.calls
+    assert anonymizer.anonymize(TEXT).sanitized_text == recovered.sanitized_text
+    assert backend.calls == calls
+
+
+def test_anonymize_many_skips_degraded_results(backend):
+    cache = ResultCache(max_entries=100)
+    anonymizer = KVKKAnonymizer(cache=cache)
+    texts = [TEXT, "Merhaba, TC kimlik numaram 10000000146."]
+
+    anonymizer.anonymize_many(texts)
+    assert cache.stats()["entries"] == 0
+
+    backend.available = True
+    results = anonymizer.anonymize_many(texts)
+    assert "Xolvar" not in results[0].sanitized_text
+    assert cache.stats()["entries"] == 2
+
+
+def test_incremental_state_rescans_after_ner_outage(backend):
+    anonymizer = KVKKAnonymizer()
+    _, state, _ = anonymizer.anonymize_incremental(TEXT)
+    assert state.options is None
+
+    backend.available = True
+    result, state, update = anonymizer.anonymize_incremental(TEXT + "\nTeşekkürler.", state)
+    assert "Xolvar" not in result.sanitized_text
+    assert update.start == 0
+    assert state.options is not None
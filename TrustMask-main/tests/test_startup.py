@@ -0,0 +1,98 @@
+"""
+Başlangıç: pattern derleme zamanı ve lazy yükleme
+
+- Snapshot yoksa pattern'ler sınıf tanımında derlenir (ilk istek ödemez)
+- anonymizer import edilince detector / AI NER modülleri yüklenmez; isim
+  tespiti kapalıysa AI NER ve NER backend'leri hiç import edilmez
+- Snapshot (pickle) başka kullanıcıya ait veya grup / herkes tarafından
+  yazılabilir ise açılmadan reddedilir
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from detectors.base_detector import BaseDetector
+from engine.snapshot import Snapshot, get_snapshot
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+NER_MODULES = {'nlp.ai_ner', 'nlp.ner_backends', 'nlp.ner_client', 'transformers', 'torch', 'onnxruntime'}
+
+
+def loaded_modules(code):
+    """Temiz bir yorumlayıcıda code çalıştırıldıktan sonra yüklü modüller"""
+    script = f"import json, sys\n{code}\nprint(json.dumps(sorted(sys.modules)))"
+    env = dict(os.environ, KVKK_NER_BACKEND='transformers', KVKK_SNAPSHOT='')
+    output = subprocess.run([sys.executable, '-c', script], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+
+def test_patterns_compiled_at_class_definition():
+    import detectors.phone_detector  # noqa: F401 (sınıfı kayda ekler)
+
+    for cls in BaseDetector.registry.values():
+        compiled = cls.__dict__['compiled_patterns']
+        assert isinstance(compiled, dict), cls.__name__
+        assert all(isinstance(p, re.Pattern) for group in compiled.values() for p in group)
+        assert set(compiled) == set(cls.patterns)
+
+
+def test_import_loads_no_detectors():
+    modules = loaded_modules("import anonymizer")
+    assert not modules & NER_MODULES
+    assert not any(name.startswith('detectors.') and name.endswith('_detector') for name in modules)
+
+
+def test_name_detection_disabled_skips_ner():
+    modules = loaded_modules("import anonymizer\nanonymizer.KVKKAnonymizer(enable_name_detection=False)")
+    assert 'detectors.tc_kimlik_detector' in modules
+    assert not modules & NER_MODULES
+    assert 'nlp.name_detector' not in modules
+
+
+def test_snapshot_roundtrip(tmp_path):
+    path = str(tmp_path / "startup.snapshot")
+    old = os.umask(0o002)
+    try:
+        Snapshot(path, {}).write()
+    finally:
+        os.umask(old)
+    assert os.stat(path).st_mode & 0o777 == 0o644
+    assert isinstance(Snapshot.read(path), Snapshot)
+
+
+@pytest.mark.parametrize("mode", [0o664, 0o646, 0o666])
+def test_snapshot_rejects_writable_by_others(tmp_path, mode):
+    path = str(tmp_path / "startup.snapshot")
+    Snapshot(path, {}).write()
+    os.chmod(path, mode)
+    with pytest.raises(PermissionError, match="yazılabilir"):
+        Snapshot.read(path)
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason="POSIX sahiplik bilgisi yok")
+def test_snapshot_rejects_other_owner(tmp_path, monkeypatch):
+    path = str(tmp_path / "startup.snapshot")
+    Snapshot(path, {}).write()
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(path).st_uid + 1)
+    with pytest.raises(PermissionError, match="başka bir kullanıcıya"):
+        Snapshot.read(path)
+
+
+def test_rejected_snapshot_is_not_used(tmp_path, monkeypatch):
+    import config
+    from engine import snapshot
+
+    path = str(tmp_path / "startup.snapshot")
+    Snapshot(path, {}).write()
+    os.chmod(path, 0o666)
+    monkeypatch.setattr(config, "SNAPSHOT_PATH", path)
+    monkeypatch.setattr(snapshot, "_snapshot", None)
+    monkeypatch.setattr(snapshot, "_snapshot_loaded", False)
+    assert get_snapshot() is None
@@ -0,0 +1,89 @@
+"""
+NDJSON akış: "profile" / "entity_types" satırda veya sorguda verildiğinde
+/anonymize ile aynı sonucu vermeli (Flask ve ASGI), geçersizse 400 / satır hatası
+"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("flask")
+
+import api
+import asgi
+
+
+TEXT = "Numaram 0532 123 45 67, TC 10000000146."
+
+LINES = [
+    {"text": TEXT, "id": 1},
+    {"text": TEXT, "id": 2, "profile": "contact"},
+    {"text": TEXT, "id": 3, "entity_types": ["TC_ID"]},
+    {"text": TEXT, "id": 4, "profile": "nope"},
+    {"text": TEXT, "id": 5, "entity_types": ["NOPE"]},
+    TEXT,
+]
+
+
+def expected(line, defaults=None):
+    client = api.app.test_client()
+    body = dict(defaults or {}, text=line) if isinstance(line, str) else dict(defaults or {}, **line)
+    body.pop("id", None)
+    response = client.post('/anonymize', json=body)
+    return response.status_code, response.json
+
+
+def run_asgi(body, query=b''):
+    sent = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'method': 'POST', 'path': '/anonymize/stream', 'query_string': query, 'headers': []}
+    asyncio.run(asgi.app(scope, receive, send))
+    status = sent[0]['status']
+    return status, b''.join(message.get('body', b'') for message in sent[1:])
+
+
+def check(output, defaults=None):
+    rows = [json.loads(line) for line in output.splitlines()]
+    assert len(rows) == len(LINES)
+    for row, line in zip(rows, LINES):
+        status, payload = expected(line, defaults)
+        row.pop('line')
+        row.pop('id', None)
+        if status == 200:
+            assert row == payload
+        else:
+            assert row == {"error": payload["error"]}
+
+
+BODY = b''.join((json.dumps(line) + "\n").encode() for line in LINES)
+
+
+def test_stream_line_options():
+    flask_output = api.app.test_client().post('/anonymize/stream', data=BODY).data
+    status, asgi_output = run_asgi(BODY)
+    assert status == 200
+    assert flask_output == asgi_output
+    check(flask_output)
+    assert "0532" in json.loads(flask_output.splitlines()[2])["sanitized_text"]
+
+
+def test_stream_query_defaults():
+    query = "profile=contact&entity_types=PHONE,TC_ID"
+    flask_output = api.app.test_client().post(f'/anonymize/stream?{query}', data=BODY).data
+    status, asgi_output = run_asgi(BODY, query.encode())
+    assert status == 200
+    assert flask_output == asgi_output
+    check(flask_output, {"profile": "contact", "entity_types": ["PHONE", "TC_ID"]})
+
+
+@pytest.mark.parametrize("query", ["profile=nope", "entity_types=PHONE,NOPE", "min_confidence=2"])
+def test_stream_rejects_invalid_query(query):
+    assert api.app.test_client().post(f'/anonymize/stream?{query}', data=BODY).status_code == 400
+    assert run_asgi(BODY, query.encode())[0] == 400
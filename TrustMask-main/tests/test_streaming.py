@@ -0,0 +1,36 @@
+"""
+Akış modu: parça parça anonimleştirme tüm metni tek seferde işlemekle aynı çıktıyı vermeli
+
+Parça boyutu, pencere ve overlap değerleri sınırlara denk gelen entity'leri
+(IBAN, adres, çok satırlı doğrulama diyalogları) ve tek karakterlik
+parçaları kapsayacak şekilde seçilmiştir.
+"""
+
+import pytest
+
+from samples import build_document
+
+
+@pytest.mark.parametrize("size, window_size, overlap, chunk_size", [
+    (20_000, 2_000, 400, 37),
+    (20_000, 1_000, 300, 5_000),
+    (30_000, 4_096, 1_024, 1),
+    (3_000, 100_000, 4_096, 100),
+])
+def test_stream_matches_full_text(anonymizer, size, window_size, overlap, chunk_size):
+    text = build_document(size, seed=size + window_size)
+    chunks = (text[i:i + chunk_size] for i in range(0, len(text), chunk_size))
+    streamed = ''.join(anonymizer.anonymize_stream(chunks, window_size=window_size, overlap=overlap))
+    assert streamed == anonymizer.anonymize(text).sanitized_text
+
+
+def test_stream_corpus_documents(anonymizer, corpus):
+    for text in corpus:
+        chunks = (text[i:i + 97] for i in range(0, len(text), 97))
+        streamed = ''.join(anonymizer.anonymize_stream(chunks, window_size=1_500, overlap=500))
+        assert streamed == anonymizer.anonymize(text).sanitized_text
+
+
+def test_stream_rejects_invalid_window(anonymizer):
+    with pytest.raises(ValueError):
+        list(anonymizer.anonymize_stream(["metin"], window_size=0))
@@ -0,0 +1,99 @@
+"""
+Tek geçişli yerleştirme ve OffsetMap
+
+- substitute eski sağdan sola dilimleme ile aynı metni üretmeli
+- OffsetMap: entity dışındaki her pozisyon iki yönde birebir eşlenir,
+  entity içindeki pozisyonlar karşı aralığın başına düşer
+- Akış çıktısı tam metnin ofset haritasıyla orijinale geri eşlenebilmeli
+"""
+
+import random
+
+import pytest
+
+from config import EntityType
+from engine.substitution import DEFAULT_PLACEHOLDER, OffsetMap, _splice, substitute
+from entities import DetectedEntity
+from samples import build_document
+
+
+PLACEHOLDERS = {EntityType.PHONE: "[TEL]", EntityType.NAME: "[İSİM_SOYİSİM]", EntityType.EMAIL: ""}
+
+
+def random_spans(rng, length):
+    entities = []
+    position = 0
+    while True:
+        position += rng.randint(1, 40)
+        end = position + rng.randint(1, 25)
+        if end > length:
+            return entities
+        entities.append(DetectedEntity(rng.choice(list(PLACEHOLDERS) + [EntityType.BANK_INFO]),
+                                       "x", position, end))
+        position = end
+
+
+def check_roundtrip(original, sanitized, offset_map):
+    covered = set()
+    for start, end, new_start, new_end in offset_map.segments:
+        covered.update(range(start, end))
+        assert offset_map.to_sanitized(start) == new_start
+        for position in range(start, end):
+            assert offset_map.to_sanitized(position) == new_start
+        for position in range(new_start, new_end):
+            assert offset_map.to_original(position) == start
+    for position in range(len(original) + 1):
+        if position in covered:
+            continue
+        mapped = offset_map.to_sanitized(position)
+        assert offset_map.to_original(mapped) == position
+        if position < len(original):
+            assert sanitized[mapped] == original[position]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_substitute_matches_splice(seed):
+    rng = random.Random(seed)
+    text = "".join(rng.choice("abc çşğ\n0123") for _ in range(600))
+    entities = random_spans(rng, len(text))
+    rng.shuffle(entities)
+    sanitized, offset_map = substitute(text, entities, PLACEHOLDERS)
+    assert sanitized == _splice(text, entities, PLACEHOLDERS)
+    assert len(offset_map) == len(entities)
+    check_roundtrip(text, sanitized, offset_map)
+
+
+def test_overlapping_entities_fall_back():
+    text = "0532 123 45 67 ahmet"
+    entities = [DetectedEntity(EntityType.PHONE, "x", 0, 14), DetectedEntity(EntityType.NAME, "x", 10, 20)]
+    sanitized, offset_map = substitute(text, entities, PLACEHOLDERS)
+    assert offset_map is None
+    assert sanitized == _splice(text, entities, PLACEHOLDERS)
+
+
+def test_empty_and_default_placeholder():
+    sanitized, offset_map = substitute("metin", [], PLACEHOLDERS)
+    assert sanitized == "metin" and len(offset_map) == 0
+    sanitized, _ = substitute("TR33", [DetectedEntity(EntityType.BANK_INFO, "TR33", 0, 4)], PLACEHOLDERS)
+    assert sanitized == DEFAULT_PLACEHOLDER
+    assert OffsetMap([]).to_original(7) == OffsetMap([]).to_sanitized(7) == 7
+
+
+def test_result_offsets_roundtrip(anonymizer):
+    text = build_document(8000, seed=4)
+    result = anonymizer.anonymize(text)
+    assert result.offset_map is not None and len(result.offset_map) == len(result.entities)
+    check_roundtrip(text, result.sanitized_text, result.offset_map)
+    for entity, segment in zip(sorted(result.entities, key=lambda e: e.start_pos), result.to_dict(
+            include_offsets=True)["offset_map"]):
+        assert (entity.start_pos, entity.end_pos) == (segment["original_start"], segment["original_end"])
+        placeholder = result.sanitized_text[segment["sanitized_start"]:segment["sanitized_end"]]
+        assert placeholder == anonymizer.placeholders.get(entity.entity_type, DEFAULT_PLACEHOLDER)
+
+
+def test_stream_output_maps_back_to_original(anonymizer):
+    text = build_document(12000, seed=8)
+    chunks = (text[i:i + 113] for i in range(0, len(text), 113))
+    streamed = ''.join(anonymizer.anonymize_stream(chunks, window_size=1_000, overlap=300))
+    result = anonymizer.anonymize(text)
+    check_roundtrip(text, streamed, result.offset_map)
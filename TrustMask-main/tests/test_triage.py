@@ -0,0 +1,49 @@
+"""
+Triage: yalnızca bir şey bulması imkânsız olan detector'lar atlanmalı
+
+- Atlanan her regex detector'ı o metinde gerçekten boş dönmeli
+- AI NER büyük harf içeren her metinde çağrılmalı (sözlükte olmayan cümle
+  başı adlar dahil); kayıplı sezgisel yalnızca açıkça istenirse çalışır
+"""
+
+import random
+
+import pytest
+
+from engine.triage import DocumentFeatures, Triage
+from nlp.ai_ner import AINERDetector
+from samples import FUZZ_TOKENS, SAMPLE_LINES, TRIVIAL_MESSAGES
+
+
+def test_skipped_regex_detectors_find_nothing(anonymizer):
+    rng = random.Random(12)
+    texts = TRIVIAL_MESSAGES + SAMPLE_LINES + [
+        " ".join(rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(1, 8))) for _ in range(1500)
+    ]
+    triage = Triage(anonymizer.detectors)
+    skipped = 0
+    for text in texts:
+        for detector, skip in zip(anonymizer.detectors, triage.mask(text)):
+            if skip and not isinstance(detector, AINERDetector):
+                skipped += 1
+                assert detector.detect(text) == [], (detector.name, text)
+    assert skipped > 0
+
+
+@pytest.mark.parametrize("text", ["Zeynep aradı.", "Müşteri: Xolvar geldi", "Evet, teşekkürler."])
+def test_ner_runs_on_any_uppercase_text(text):
+    assert AINERDetector().can_match(DocumentFeatures(text))
+
+
+@pytest.mark.parametrize("text", ["evet", "tamam, teşekkürler", "0532 123 45 67"])
+def test_ner_skips_text_without_uppercase(text):
+    assert not AINERDetector().can_match(DocumentFeatures(text))
+
+
+def test_ner_heuristic_is_opt_in(monkeypatch):
+    import nlp.ai_ner
+
+    monkeypatch.setattr(nlp.ai_ner, "NER_TRIAGE_HEURISTIC", True)
+    detector = AINERDetector()
+    assert not detector.can_match(DocumentFeatures("Evet, teşekkürler."))
+    assert detector.can_match(DocumentFeatures("Merhaba, ben Ahmet"))
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Derlenmiş Sözlük Dosyası Üretme
+
+Yerleşik isim, soyisim, yaygın kelime, il, ilçe ve banka listelerinden
+(nlp/turkish_names_db.py, detectors/address_detector.py, config.py) ve
+isteğe bağlı ek listelerden mmap ile açılan ikili sözlük dosyası üretir
+(bkz. nlp/compiled_gazetteer.py). Dosya KVKK_GAZETTEER ile kullanılır;
+yerleşik listeler değiştiğinde yeniden üretilmelidir.
+
+Ek liste dosyaları UTF-8, satır başına bir girdi. Nüfus kaydı gibi sıklık
+listeleri için satır "AD,SAYI" veya "AD<TAB>SAYI" olabilir; ilk kolon girdi,
+ikinci kolon --min-count ile filtrelenen sıklıktır. Boş satırlar ve '#' ile
+başlayan satırlar atlanır.
+
+Kullanım:
+    python tools/build_gazetteer.py -o gazetteer.bin
+    python tools/build_gazetteer.py -o gazetteer.bin --first-names adlar.csv \\
+        --surnames soyadlar.csv --districts ilceler.txt --min-count 50
+    KVKK_GAZETTEER=gazetteer.bin python main.py --file transcript.txt
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlp.compiled_gazetteer import CompiledGazetteer, write_gazetteer
+from nlp.gazetteer import (
+    BANK, CITY, COMMON_WORD, DISTRICT, FIRST_NAME, SURNAME,
+    Gazetteer, default_entries, entries_digest,
+)
+
+
+# Komut satırı seçeneği -> sözlük türü
+LIST_OPTIONS = {
+    'first_names': FIRST_NAME,
+    'surnames': SURNAME,
+    'common_words': COMMON_WORD,
+    'cities': CITY,
+    'districts': DISTRICT,
+    'banks': BANK,
+}
+
+_COLUMNS = re.compile(r'[,;\t]')
+
+
+def read_list(path: str, min_count: int = 0):
+    """Liste dosyasının girdileri (sıklık kolonu min_count'tan küçük olanlar hariç)"""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            columns = _COLUMNS.split(line)
+            if min_count and len(columns) > 1:
+                try:
+                    if int(columns[1].strip()) < min_count:
+                        continue
+                except ValueError:
+                    # Başlık satırı ("ad,sayi") veya sayısal olmayan kolon
+                    if number == 1:
+                        continue
+                    raise ValueError(f"{path}:{number}: sıklık kolonu sayı değil: {columns[1]!r}")
+            yield columns[0].strip()
+
+
+def verify(gazetteer: Gazetteer, path: str) -> None:
+    """Dosyadan açılan sözlük bellekteki trie ile aynı sonuçları vermeli"""
+    compiled = CompiledGazetteer(path)
+    try:
+        for phrase, kinds in gazetteer._phrases.items():
+            if compiled.lookup(phrase) != kinds:
+                sys.exit(f"HATA: {phrase!r} dosyada farklı türlerle bulundu")
+        for kind in LIST_OPTIONS.values():
+            if compiled.first_words(kind) != gazetteer.first_words(kind):
+                sys.exit(f"HATA: {kind} türünün ilk kelimeleri farklı")
+    finally:
+        compiled.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Derlenmiş sözlük dosyası üret")
+    parser.add_argument('--output', '-o', default='gazetteer.bin', help='Sözlük dosyası')
+    for option in LIST_OPTIONS:
+        parser.add_argument('--' + option.replace('_', '-'), dest=option, action='append', default=[],
+                            metavar='DOSYA', help='Ek liste (tekrarlanabilir)')
+    parser.add_argument('--min-count', type=int, default=0,
+                        help='Sıklık kolonu bu değerden küçük girdileri alma')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    builtin = default_entries()
+    entries = {kind: list(phrases) for kind, phrases in builtin.items()}
+    for option, kind in LIST_OPTIONS.items():
+        for path in getattr(args, option):
+            before = len(entries[kind])
+            entries[kind].extend(read_list(path, args.min_count))
+            print(f"{path}: {len(entries[kind]) - before} girdi")
+
+    gazetteer = Gazetteer(entries)
+    nodes = write_gazetteer(args.output, gazetteer, entries_digest(builtin))
+    verify(gazetteer, args.output)
+    elapsed = time.perf_counter() - started
+
+    print(f"Sözlük dosyası yazıldı: {args.output} ({os.path.getsize(args.output) / (1024 * 1024):.2f} MB)")
+    print(f"{len(gazetteer)} ifade, {nodes} düğüm, {elapsed:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Başlangıç Snapshot'ı Üretme
+
+Tüm detector sınıflarının pattern'lerini (patterns + extra_patterns) re
+derleyicisinden geçirip opcode listelerini ve kurulmuş sözlük trie'sini tek
+dosyaya yazar (bkz. engine/snapshot.py). Dosya, çalışacağı Python sürümüyle
+üretilmelidir (ör. Docker imajı / Vercel build adımında); pattern veya
+sözlük değiştiğinde yeniden üretilir, eski dosya yalnızca değişmeyen
+kısımlar için kullanılır.
+
+Kullanım:
+    python tools/build_snapshot.py -o kvkk_snapshot.pkl
+    KVKK_SNAPSHOT=kvkk_snapshot.pkl python main.py --file transcript.txt
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import _sre
+import re
+
+
+def collect_patterns() -> dict:
+    """Kayıtlı tüm detector sınıflarının (pattern, flags) -> opcode kaydı"""
+    import anonymizer  # noqa: F401 - tüm detector sınıflarını BaseDetector.registry'ye kaydeder
+    from detectors.base_detector import BaseDetector
+    from engine.snapshot import pattern_code
+
+    patterns = {}
+    for cls in BaseDetector.registry.values():
+        for groups in (cls.patterns, cls.extra_patterns):
+            for pattern_list, flags in groups.values():
+                for pattern in pattern_list:
+                    key = (pattern, int(flags))
+                    if key not in patterns:
+                        patterns[key] = pattern_code(pattern, flags)
+    return patterns
+
+
+def verify(patterns: dict) -> None:
+    """Snapshot'tan kurulan pattern'ler re.compile ile aynı olmalı"""
+    for (pattern, flags), code in patterns.items():
+        restored, expected = _sre.compile(*code), re.compile(pattern, flags)
+        if (restored.pattern, restored.flags, restored.groups, restored.groupindex) != \
+                (expected.pattern, expected.flags, expected.groups, expected.groupindex):
+            sys.exit(f"HATA: pattern snapshot'tan farklı kuruldu: {pattern!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Başlangıç snapshot'ı üret")
+    parser.add_argument('--output', '-o', default='kvkk_snapshot.pkl', help='Snapshot dosyası')
+    args = parser.parse_args()
+
+    logging.getLogger('AINERDetector').setLevel(logging.CRITICAL)
+    from engine.snapshot import Snapshot
+    from nlp.gazetteer import Gazetteer, default_entries, entries_digest
+
+    patterns = collect_patterns()
+    verify(patterns)
+    entries = default_entries()
+    Snapshot(args.output, patterns, Gazetteer(entries), entries_digest(entries)).write()
+
+    start = time.perf_counter()
+    loaded = Snapshot.read(args.output)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Snapshot yazıldı: {args.output} ({os.path.getsize(args.output) / 1024:.0f} KB)")
+    print(f"{len(loaded.patterns)} pattern, {len(loaded.gazetteer)} sözlük girdisi, okuma {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+NER Modeli Dışa Aktarma
+
+savasy/bert-base-turkish-ner-cased modelini torch'suz yerel backend'ler
+(KVKK_NER_BACKEND=onnx / numpy) için dışa aktarır. Sadece bu script torch
+ve transformers gerektirir; bir kez geliştirme makinesinde çalıştırılır.
+
+Çıktı klasörü:
+    tokenizer.json   - `tokenizers` ile yüklenen hızlı tokenizer
+    config.json      - model konfigürasyonu (id2label, katman sayısı...)
+    model.onnx       - ONNX model (varsayılan: dinamik int8 quantize)
+    model_int8.npz   - NumPy backend ağırlıkları (int8 + sütun ölçekleri)
+
+Kullanım:
+    python tools/export_ner_model.py
+    python tools/export_ner_model.py --output models/ner --no-onnx
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from config import NER_MODEL_DIR, NER_MODEL_NAME
+from nlp.numpy_bert import NumpyBertTokenClassifier, quantize_int8
+
+
+SAMPLE_TEXT = "Merhaba, ben Ahmet Yılmaz. İstanbul Kadıköy'de oturuyorum, Garanti Bankası müşterisiyim."
+
+
+def export_tokenizer_and_config(tokenizer, model, output_dir: str) -> None:
+    tokenizer.backend_tokenizer.save(os.path.join(output_dir, "tokenizer.json"))
+    with open(os.path.join(output_dir, "config.json"), 'w', encoding='utf-8') as f:
+        json.dump(model.config.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+def export_onnx(tokenizer, model, output_dir: str, quantize: bool) -> None:
+    import torch
+
+    encoded = tokenizer(SAMPLE_TEXT, return_tensors="pt")
+    fp32_path = os.path.join(output_dir, "model_fp32.onnx")
+    final_path = os.path.join(output_dir, "model.onnx")
+
+    torch.onnx.export(
+        model,
+        (encoded["input_ids"], encoded["attention_mask"], encoded["token_type_ids"]),
+        fp32_path,
+        input_names=["input_ids", "attention_mask", "token_type_ids"],
+        output_names=["logits"],
+        dynamic_axes={
+            "input_ids": {0: "batch", 1: "sequence"},
+            "attention_mask": {0: "batch", 1: "sequence"},
+            "token_type_ids": {0: "batch", 1: "sequence"},
+            "logits": {0: "batch", 1: "sequence"},
+        },
+        opset_version=14,
+    )
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        quantize_dynamic(fp32_path, final_path, weight_type=QuantType.QInt8)
+        os.remove(fp32_path)
+    else:
+        os.replace(fp32_path, final_path)
+    print(f"ONNX model: {final_path} ({os.path.getsize(final_path) / 1e6:.1f} MB)")
+
+
+def export_numpy(model, output_dir: str) -> None:
+    """state_dict'i NumpyBertTokenClassifier formatına çevirir"""
+    arrays = {}
+    for key, tensor in model.state_dict().items():
+        if key.startswith("bert.pooler.") or key.endswith("position_ids"):
+            continue
+        name = key[len("bert."):] if key.startswith("bert.") else key
+        value = tensor.detach().cpu().numpy().astype(np.float32)
+
+        if name.startswith("embeddings.") and "LayerNorm" not in name:
+            # embeddings.word_embeddings.weight -> embeddings.word_embeddings
+            name = name[:-len(".weight")]
+            if name == "embeddings.word_embeddings":
+                arrays[name], arrays[name + ".scale"] = quantize_int8(value)
+            else:
+                arrays[name] = value
+        elif value.ndim == 2:
+            # Lineer katman: [out, in] -> [in, out]
+            weight = np.ascontiguousarray(value.T)
+            if name.startswith("classifier."):
+                arrays[name] = weight
+            else:
+                arrays[name], arrays[name + ".scale"] = quantize_int8(weight)
+        else:
+            arrays[name] = value
+
+    path = os.path.join(output_dir, "model_int8.npz")
+    np.savez_compressed(path, **arrays)
+    print(f"NumPy ağırlıkları: {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+
+def verify_numpy(tokenizer, model, output_dir: str) -> None:
+    """NumPy çıktısını torch çıktısıyla karşılaştırır"""
+    import torch
+
+    encoded = tokenizer(SAMPLE_TEXT, return_tensors="pt")
+    with torch.no_grad():
+        expected = model(**encoded).logits[0].numpy()
+
+    numpy_model = NumpyBertTokenClassifier.load(
+        os.path.join(output_dir, "model_int8.npz"),
+        os.path.join(output_dir, "config.json"),
+    )
+    actual = numpy_model.logits(encoded["input_ids"][0].numpy())
+    agreement = (expected.argmax(-1) == actual.argmax(-1)).mean()
+    print(f"NumPy doğrulama: maks. logit farkı {np.abs(expected - actual).max():.4f}, "
+          f"etiket uyumu %{agreement * 100:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NER modelini ONNX / NumPy formatına aktar")
+    parser.add_argument('--model', default=NER_MODEL_NAME, help='Hugging Face model adı veya klasörü')
+    parser.add_argument('--output', default=NER_MODEL_DIR, help='Çıktı klasörü')
+    parser.add_argument('--no-onnx', action='store_true', help='ONNX çıktısı üretme')
+    parser.add_argument('--no-numpy', action='store_true', help='NumPy çıktısı üretme')
+    parser.add_argument('--no-quantize', action='store_true', help='ONNX modelini quantize etme')
+    args = parser.parse_args()
+
+    from transformers import AutoModelForTokenClassification, AutoTokenizer
+
+    os.makedirs(args.output, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(args.model)
+    model = AutoModelForTokenClassification.from_pretrained(args.model)
+    model.eval()
+
+    export_tokenizer_and_config(tokenizer, model, args.output)
+    if not args.no_onnx:
+        export_onnx(tokenizer, model, args.output, quantize=not args.no_quantize)
+    if not args.no_numpy:
+        export_numpy(model, args.output)
+        verify_numpy(tokenizer, model, args.output)
+
+
+if __name__ == "__main__":
+    main()